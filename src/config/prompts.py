@@ -86,12 +86,99 @@ JSON format:
     "confidence_score": 0.0-1.0 arasi,
     "visual_data": {{
         "function": "<fonksiyon_ifadesi>",
+        "functions": ["<f1>", "<f2>", ...] (ayni grafikte birden fazla 2d fonksiyon icin opsiyonel),
+        "highlight_points": [{{"x": <sayi>, "name": "<etiket>", "function": "<fonksiyon>"}}] (opsiyonel),
         "x_range": [min, max],
         "y_range": [min, max] (opsiyonel),
+        "t_range": [min, max] (parametric/polar icin opsiyonel),
         "plot_type": "2d/3d/parametric/polar"
     }},
 }}
 
+function bicimi: 2d icin f(x), 3d icin f(x, y), parametric icin "x(t), y(t)",
+polar icin r(theta). Birden fazla 2d fonksiyon istenirse hepsini "functions" listesine yaz;
+"highlight_points" icinde "function" verilmezse nokta her egri uzerinde isaretlenir.
+
 Ifade: {expression}
 """
 
+
+BATCH_PROMPT = """
+Asagida ayni gorev icin {count} ayri ifade var. Her ifadeyi digerlerinden bagimsiz olarak coz.
+Gorev tanimi:
+{task_prompt}
+
+Ifadeler:
+{expressions}
+
+Yaniti SADECE bir JSON dizisi olarak dondur. Dizi tam olarak {count} eleman icermeli;
+i. eleman i. ifadenin sonucu olmali ve gorev tanimindaki JSON formatinda bir obje olmali:
+[{{...}}, {{...}}]
+"""
+
+
+# JSON_MODE acikken modullerin yanit semalari (Gemini response_schema alt kumesi)
+BASIC_MATH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "result": {"type": "number", "nullable": True},
+        "steps": {"type": "array", "items": {"type": "string"}},
+        "visualization_needed": {"type": "boolean"},
+        "domain": {"type": "string"},
+        "confidence_score": {"type": "number"},
+    },
+    "required": ["result", "steps"],
+}
+
+STATISTICS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "data": {"type": "array", "items": {"type": "number"}},
+        "operation": {
+            "type": "string",
+            "enum": [
+                "mean", "median", "mode", "std", "variance", "min", "max", "sum",
+                "skewness", "kurtosis", "describe",
+            ],
+        },
+        "explanation": {"type": "string"},
+    },
+    "required": ["data", "operation"],
+}
+
+GRAPH_PLOTTER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "result": {"type": "string"},
+        "steps": {"type": "array", "items": {"type": "string"}},
+        "visualization_needed": {"type": "boolean"},
+        "domain": {"type": "string"},
+        "confidence_score": {"type": "number"},
+        "visual_data": {
+            "type": "object",
+            "properties": {
+                "function": {"type": "string"},
+                "functions": {"type": "array", "items": {"type": "string"}, "nullable": True},
+                "highlight_points": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "x": {"type": "number"},
+                            "name": {"type": "string", "nullable": True},
+                            "function": {"type": "string", "nullable": True},
+                        },
+                        "required": ["x"],
+                    },
+                    "nullable": True,
+                },
+                "x_range": {"type": "array", "items": {"type": "number"}},
+                "y_range": {"type": "array", "items": {"type": "number"}, "nullable": True},
+                "t_range": {"type": "array", "items": {"type": "number"}, "nullable": True},
+                "plot_type": {"type": "string", "enum": ["2d", "3d", "parametric", "polar"]},
+            },
+            "required": ["function", "x_range"],
+        },
+    },
+    "required": ["result", "steps", "visual_data"],
+}
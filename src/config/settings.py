@@ -7,6 +7,17 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _parse_float_map(raw: str) -> Dict[str, float]:
+    """"key=deger,key2=deger2" formatindaki env degerini dict'e cevirir"""
+    result: Dict[str, float] = {}
+    for item in raw.split(","):
+        if "=" not in item:
+            continue
+        key, value = item.split("=", 1)
+        result[key.strip()] = float(value)
+    return result
+
+
 class Settings:
     """Uygulama ayarlari"""
     
@@ -14,19 +25,135 @@ class Settings:
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
     GEMINI_MODEL: str = os.getenv("GEMINI_MODEL", "gemini-flash-latest")
    
+    # LLM Backend: "gemini" (varsayilan) veya "local" (deterministik, network'suz)
+    LLM_BACKEND: str = os.getenv("LLM_BACKEND", "gemini").lower()
+    LOCAL_BACKEND_LATENCY_MS: float = float(os.getenv("LOCAL_BACKEND_LATENCY_MS", "50"))
+    # uniform icin +/- saniye, lognormal icin sigma
+    LOCAL_BACKEND_LATENCY_JITTER: float = float(os.getenv("LOCAL_BACKEND_LATENCY_JITTER", "0"))
+    LOCAL_BACKEND_LATENCY_DISTRIBUTION: str = os.getenv(
+        "LOCAL_BACKEND_LATENCY_DISTRIBUTION", "fixed"
+    )
+    LOCAL_BACKEND_ERROR_RATE: float = float(os.getenv("LOCAL_BACKEND_ERROR_RATE", "0"))
+    LOCAL_BACKEND_QUOTA_ERROR_RATE: float = float(
+        os.getenv("LOCAL_BACKEND_QUOTA_ERROR_RATE", "0")
+    )
+    LOCAL_BACKEND_SEED: int = int(os.getenv("LOCAL_BACKEND_SEED", "0"))
+    
+    # Record/replay cassette: "off", "record" veya "replay"
+    LLM_CASSETTE_MODE: str = os.getenv("LLM_CASSETTE_MODE", "off").lower()
+    LLM_CASSETTE_PATH: str = os.getenv("LLM_CASSETTE_PATH", "cassettes/gemini.jsonl")
+    # Replay gecikmesi: "recorded" (kayittaki sure) veya "zero"
+    LLM_CASSETTE_LATENCY: str = os.getenv("LLM_CASSETTE_LATENCY", "recorded").lower()
+    
     
     # Rate Limiting
     RATE_LIMIT_CALLS_PER_MINUTE: int = int(
         os.getenv("RATE_LIMIT_CALLS_PER_MINUTE", "60")
     )
+    # Token bucket kapasitesi: beklemeden yapilabilecek ardisik cagri sayisi
+    RATE_LIMIT_BURST: int = int(os.getenv("RATE_LIMIT_BURST", "5"))
+    # Eszamanli API cagrisi limiti (0 = limitsiz)
+    MAX_CONCURRENT_REQUESTS: int = int(os.getenv("MAX_CONCURRENT_REQUESTS", "8"))
+    # Kota hatasi bekleme suresi belirtmediginde kullanilan sure (saniye)
+    RATE_LIMIT_DEFAULT_RETRY_AFTER: float = float(
+        os.getenv("RATE_LIMIT_DEFAULT_RETRY_AFTER", "5")
+    )
     
 
     TEMPERATURE: float = float(os.getenv("TEMPERATURE", "0.1"))
     TOP_P: float = float(os.getenv("TOP_P", "0.95"))
     MAX_OUTPUT_TOKENS: int = int(os.getenv("MAX_OUTPUT_TOKENS", "2048"))
+    # JSON isteyen cagrilarda yapilandirilmis cikti (response_mime_type/schema) ister
+    JSON_MODE: bool = os.getenv("JSON_MODE", "true").lower() == "true"
 
     MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
     RETRY_BACKOFF_BASE: int = int(os.getenv("RETRY_BACKOFF_BASE", "2"))
+    RETRY_BACKOFF_MAX: float = float(os.getenv("RETRY_BACKOFF_MAX", "30"))
+    # Limiter beklemesi + tum retry'lari kapsayan istek suresi limiti (0 = limitsiz)
+    REQUEST_TIMEOUT_SECONDS: float = float(os.getenv("REQUEST_TIMEOUT_SECONDS", "60"))
+    
+    # Hedged requests: ilk deneme p95 gecikmeyi asarsa ikinci deneme baslatilir
+    HEDGE_ENABLED: bool = os.getenv("HEDGE_ENABLED", "false").lower() == "true"
+    HEDGE_PERCENTILE: float = float(os.getenv("HEDGE_PERCENTILE", "95"))
+    HEDGE_MIN_SAMPLES: int = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+    HEDGE_MIN_DELAY_MS: float = float(os.getenv("HEDGE_MIN_DELAY_MS", "50"))
+    
+
+    # Adaptif eszamanlilik (AIMD); ust sinir MAX_CONCURRENT_REQUESTS (0 ise CONCURRENCY_MAX)
+    ADAPTIVE_CONCURRENCY_ENABLED: bool = os.getenv("ADAPTIVE_CONCURRENCY_ENABLED", "true").lower() == "true"
+    CONCURRENCY_MIN: int = int(os.getenv("CONCURRENCY_MIN", "1"))
+    CONCURRENCY_MAX: int = int(os.getenv("CONCURRENCY_MAX", "64"))
+    CONCURRENCY_DECREASE_FACTOR: float = float(os.getenv("CONCURRENCY_DECREASE_FACTOR", "0.5"))
+    # Taban gecikmenin bu katini asan yanit gecikme sicramasi sayilir
+    CONCURRENCY_LATENCY_TOLERANCE: float = float(os.getenv("CONCURRENCY_LATENCY_TOLERANCE", "2.0"))
+    
+    # Circuit breaker: ardisik hatalarda backend'e gitmeden hizli hata
+    CIRCUIT_BREAKER_ENABLED: bool = os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"
+    CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_RECOVERY_SECONDS: float = float(os.getenv("CIRCUIT_RECOVERY_SECONDS", "30"))
+    CIRCUIT_HALF_OPEN_CALLS: int = int(os.getenv("CIRCUIT_HALF_OPEN_CALLS", "1"))
+    
+
+    # Response Cache (GeminiAgent.generate_json_response)
+    CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+    CACHE_TTL_SECONDS: float = float(os.getenv("CACHE_TTL_SECONDS", "3600"))
+    # Domain bazli TTL'ler; deterministik domain'ler daha uzun tutulur, 0 = cache'leme
+    CACHE_DOMAIN_TTLS: Dict[str, float] = {
+        "basic_math": 86400.0,
+        "calculus": 86400.0,
+        "linear_algebra": 86400.0,
+        "equation_solver": 86400.0,
+        "statistics": 86400.0,
+        "graph_plotter": 86400.0,
+        "financial": 3600.0,
+        **_parse_float_map(os.getenv("CACHE_DOMAIN_TTLS", "")),
+    }
+    
+
+    # Micro-batching (ayni modul prompt'una gelen ifadeleri tek cagrida toplar)
+    BATCH_ENABLED: bool = os.getenv("BATCH_ENABLED", "false").lower() == "true"
+    BATCH_WINDOW_MS: float = float(os.getenv("BATCH_WINDOW_MS", "20"))
+    BATCH_MAX_SIZE: int = int(os.getenv("BATCH_MAX_SIZE", "8"))
+    
+
+    # Local Engines: deterministik isler yerel olarak cozulur, LLM yalnizca yedek
+    LOCAL_ENGINES_ENABLED: bool = os.getenv("LOCAL_ENGINES_ENABLED", "true").lower() == "true"
+    # Yerel motor bu sureyi asarsa (ornek: zor integral) LLM'e dusulur
+    LOCAL_ENGINE_TIMEOUT_SECONDS: float = float(os.getenv("LOCAL_ENGINE_TIMEOUT_SECONDS", "10"))
+    # Yerel motor havuzu boyutu; zaman asimina ugrayan isler bitene kadar slot tutar
+    LOCAL_ENGINE_WORKERS: int = int(os.getenv("LOCAL_ENGINE_WORKERS", "4"))
+    # Parse edilmis ifade ve sonuc cache'i boyutu (kalkulus ve denklem motorlari)
+    CALCULUS_CACHE_SIZE: int = int(os.getenv("CALCULUS_CACHE_SIZE", "512"))
+    # LU/QR/ozdeger ayrisim cache'i boyutu (lineer cebir motoru)
+    LINALG_CACHE_SIZE: int = int(os.getenv("LINALG_CACHE_SIZE", "128"))
+    # Istatistik modulunun CSV/NPY dosyasi okuyabilecegi kok dizin
+    STATISTICS_DATA_DIR: str = os.getenv("STATISTICS_DATA_DIR", "data")
+    # Dosyalar bu kadar satirlik parcalar halinde okunur
+    STATISTICS_CHUNK_SIZE: int = int(os.getenv("STATISTICS_CHUNK_SIZE", "65536"))
+    # Bu sayiya kadar deger icin medyan/persentil tam, sonrasinda sketch ile hesaplanir
+    STATISTICS_EXACT_QUANTILE_LIMIT: int = int(os.getenv("STATISTICS_EXACT_QUANTILE_LIMIT", "1000000"))
+    
+
+    # Graph Plotting
+    # 2D grafiklerde egri basina degerlendirilecek en fazla nokta (uyarlamali ornekleme butcesi)
+    PLOT_MAX_POINTS: int = int(os.getenv("PLOT_MAX_POINTS", "2000"))
+    # Grafik cizimi yapan isci surec sayisi (0 ise event loop disindaki thread havuzu)
+    PLOT_RENDER_WORKERS: int = int(os.getenv("PLOT_RENDER_WORKERS", "2"))
+    # Tek bir grafik cizimi bu sureyi asarsa iptal edilir (saniye)
+    PLOT_RENDER_TIMEOUT_SECONDS: float = float(os.getenv("PLOT_RENDER_TIMEOUT_SECONDS", "20"))
+    # 3D/parametrik/polar grafiklerde ifade degerlendirmesine ayrilan sure; cozunurluk buna gore secilir
+    PLOT_LOD_TIME_BUDGET_SECONDS: float = float(os.getenv("PLOT_LOD_TIME_BUDGET_SECONDS", "0.5"))
+    # 3D yuzey izgarasinin eksen basina en fazla nokta sayisi
+    PLOT_MAX_SURFACE_GRID: int = int(os.getenv("PLOT_MAX_SURFACE_GRID", "150"))
+    # Varsayilan grafik ciktisi: "png", "data" (istemci tarafinda cizilecek veri) veya "both"
+    PLOT_OUTPUT: str = os.getenv("PLOT_OUTPUT", "png").lower()
+    # "data" ciktisinda egri basina gonderilecek nokta sayisi (LTTB ile seyreltilir)
+    PLOT_DATA_TARGET_POINTS: int = int(os.getenv("PLOT_DATA_TARGET_POINTS", "1000"))
+    # Grafik cache dizini (surecler ve yeniden baslatmalar arasinda paylasilir)
+    PLOT_CACHE_DIR: str = os.getenv("PLOT_CACHE_DIR", "cache/plots")
+    # Grafik cache'inin bayt butcesi; asilirsa en eski kullanilan grafikler silinir
+    PLOT_CACHE_MAX_BYTES: int = int(os.getenv("PLOT_CACHE_MAX_BYTES", str(100 * 1024 * 1024)))
     
 
     SAFETY_SETTINGS: Dict[str, str] = {
@@ -45,7 +172,8 @@ class Settings:
     @classmethod
     def validate(cls) -> bool:
         """Ayarlarin gecerli olup olmadigini kontrol eder"""
-        if not cls.GEMINI_API_KEY:
+        needs_api_key = cls.LLM_BACKEND == "gemini" and cls.LLM_CASSETTE_MODE != "replay"
+        if needs_api_key and not cls.GEMINI_API_KEY:
             raise ValueError("GEMINI_API_KEY environment variable gerekli")
         return True
 
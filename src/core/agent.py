@@ -1,124 +1,391 @@
 """Gemini API communication layer"""
 
 import asyncio
-import json
+import copy
+import random
 import re
-from typing import Any, Dict, Optional
+import time
+from collections import deque
+from contextlib import AsyncExitStack, asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Optional, Tuple
 
-import google.generativeai as genai
 from src.config.settings import settings
-from src.utils.exceptions import GeminiAPIError
+from src.core.backends import LLMBackend, create_backend
+from src.core.batcher import MicroBatcher
+from src.core.cache import ResponseCache
+from src.core.resilience import AdaptiveConcurrencyLimiter, CircuitBreaker
+from src.core.singleflight import SingleFlight
+from src.utils.exceptions import CircuitOpenError, GeminiAPIError
+from src.utils.helpers import extract_completed_steps, parse_json_response, percentile
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
 
 
+class _BackendCalls:
+    """Bir istegin backend cagrilarini izler
+
+    Deadline doldugunda zaman asiminin backend'de mi yoksa limiter
+    kuyrugunda/backoff'ta mi gectigini ayirt etmek icin kullanilir.
+    """
+
+    __slots__ = ("in_flight", "last_end")
+
+    def __init__(self):
+        self.in_flight = 0
+        self.last_end = 0.0
+
+    def busy_at(self, deadline: float) -> bool:
+        """Deadline aninda bir backend cagrisi suruyor muydu?"""
+        # Deadline'in iptal ettigi cagri deadline'dan once bitemez
+        return self.in_flight > 0 or self.last_end >= deadline
+
+
+# Retry/hedge gorevleri baglami kopyaladigindan ayni nesneyi paylasir
+_backend_calls: ContextVar[Optional[_BackendCalls]] = ContextVar("backend_calls", default=None)
+
+
 class RateLimiter:
-    """Basit rate limiter"""
+    """Token bucket rate limiter
+    
+    Dakikadaki cagri hizinda dolan bir kova kullanir; kova kapasitesi (burst)
+    kadar cagri beklemeden baslayabilir. Bekleme, lock tutulurken degil
+    token rezerve edildikten sonra yapilir, boylece cagiranlar birbirini
+    seri hale getirmez. Ayrica eszamanli calisan cagri sayisini sinirlayan
+    bir semaphore ve backend'in kota hatasi bildirdigi durumlar icin
+    gecici durdurma (Retry-After) destegi vardir.
+    """
     
-    def __init__(self, calls_per_minute: int):
+    def __init__(
+        self,
+        calls_per_minute: int,
+        burst: int = 1,
+        max_in_flight: Optional[int] = None,
+        wait_window: int = 1000
+    ):
+        """Rate limiter'i baslatir
+        
+        Args:
+            calls_per_minute: Dakikadaki ortalama cagri hizi
+            burst: Kova kapasitesi (beklemeden yapilabilecek ardisik cagri)
+            max_in_flight: Eszamanli cagri limiti (None = limitsiz)
+            wait_window: Yuzdelik hesabi icin saklanan son bekleme sayisi
+        """
         self.calls_per_minute = calls_per_minute
-        self.min_interval = 60.0 / calls_per_minute
-        self.last_call_time = 0.0
+        self.rate = calls_per_minute / 60.0
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.blocked_until = 0.0
         self.lock = asyncio.Lock()
+        self.max_in_flight = max_in_flight
+        self.semaphore = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+        self.in_flight = 0
+        
+        self.acquired = 0
+        self.throttled = 0
+        self.penalties = 0
+        self._waits: Deque[float] = deque(maxlen=wait_window)
     
-    async def acquire(self) -> None:
-        """Rate limit kontrolu yapar"""
+    def _refill(self, now: float) -> None:
+        """Gecen sureye gore kovaya token ekler"""
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.last_refill = now
+    
+    async def acquire(self) -> float:
+        """Bir token alir, gerekirse token uretilene kadar bekler
+        
+        Returns:
+            Kuyrukta beklenen sure (saniye)
+        """
         async with self.lock:
-            current_time = asyncio.get_event_loop().time()
-            time_since_last_call = current_time - self.last_call_time
-            
-            if time_since_last_call < self.min_interval:
-                wait_time = self.min_interval - time_since_last_call
+            now = time.monotonic()
+            self._refill(now)
+            # Token'i simdiden rezerve et (negatife dusebilir), beklemeyi lock disinda yap
+            self.tokens -= 1
+            wait_time = max(0.0, -self.tokens / self.rate, self.blocked_until - now)
+        
+        if wait_time > 0:
+            self.throttled += 1
+            try:
                 await asyncio.sleep(wait_time)
+            except asyncio.CancelledError:
+                self.tokens += 1
+                raise
+        
+        self.acquired += 1
+        return wait_time
+    
+    @asynccontextmanager
+    async def slot(self, timeout: Optional[float] = None) -> AsyncIterator[float]:
+        """Token + eszamanlilik slotu alir, cikista slotu birakir
+        
+        Args:
+            timeout: Token ve slot icin toplam bekleme limiti (saniye)
             
-            self.last_call_time = asyncio.get_event_loop().time()
+        Yields:
+            Token ve slot icin toplam bekleme suresi (saniye)
+            
+        Raises:
+            asyncio.TimeoutError: Limit icinde slot alinamadi
+        """
+        start = time.monotonic()
+        await asyncio.wait_for(self.acquire(), timeout)
+        if self.semaphore is not None:
+            remaining = None if timeout is None else max(0.0, timeout - (time.monotonic() - start))
+            await asyncio.wait_for(self.semaphore.acquire(), remaining)
+        wait_time = time.monotonic() - start
+        self._waits.append(wait_time)
+        self.in_flight += 1
+        try:
+            yield wait_time
+        finally:
+            self.in_flight -= 1
+            if self.semaphore is not None:
+                self.semaphore.release()
+    
+    def penalize(self, delay: float) -> None:
+        """Backend kota asimi bildirdiginde yeni cagrilari geciktirir
+        
+        Args:
+            delay: Yeni cagrilarin baslamadan once bekleyecegi sure (saniye)
+        """
+        self.penalties += 1
+        self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+        # Biriken burst'u da bosalt ki durdurma sonrasi ani yuk olusmasin
+        self.tokens = min(self.tokens, 0.0)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Limiter sayaclarini ve kuyruk bekleme yuzdeliklerini dondurur"""
+        waits = list(self._waits)
+        return {
+            "rate_per_second": self.rate,
+            "burst": self.capacity,
+            "tokens": round(self.tokens, 3),
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "penalties": self.penalties,
+            "queue_wait_ms": {
+                "p50": percentile(waits, 50) * 1000,
+                "p95": percentile(waits, 95) * 1000,
+                "p99": percentile(waits, 99) * 1000,
+                "max": max(waits, default=0.0) * 1000,
+            },
+        }
+
+
+def _get_retry_after(error: Exception) -> Optional[float]:
+    """Kota hatasindan (429 / ResourceExhausted) bekleme suresini cikarir
+    
+    Args:
+        error: Backend'den gelen hata
+        
+    Returns:
+        Saniye cinsinden bekleme suresi, kota hatasi degilse None
+    """
+    message = str(error)
+    is_quota_error = (
+        getattr(error, "code", None) == 429
+        or type(error).__name__ in ("ResourceExhausted", "TooManyRequests")
+        or "quota" in message.lower()
+        or "resource has been exhausted" in message.lower()
+    )
+    if not is_quota_error:
+        return None
+    
+    for pattern in (
+        r"retry_delay\s*\{\s*seconds:\s*(\d+(?:\.\d+)?)",
+        r"retry in\s*(\d+(?:\.\d+)?)\s*s",
+        r"retry-after:?\s*(\d+(?:\.\d+)?)",
+    ):
+        match = re.search(pattern, message, re.IGNORECASE)
+        if match:
+            return float(match.group(1))
+    
+    return float(settings.RATE_LIMIT_DEFAULT_RETRY_AFTER)
 
 
 class GeminiAgent:
-    """Gemini API ile iletisim sinifi"""
+    """LLM backend'i ile iletisim sinifi
+    
+    Rate limiting, adaptif eszamanlilik, circuit breaker, retry, cache,
+    coalescing ve batching bu katmanda yapilir;
+    ham cagrilar takilabilir bir LLMBackend'e (varsayilan Gemini) devredilir.
+    """
     
     def __init__(
         self,
         api_key: Optional[str] = None,
-        model_name: Optional[str] = None
+        model_name: Optional[str] = None,
+        backend: Optional[LLMBackend] = None
     ):
         """Gemini agent'i baslatir
         
         Args:
             api_key: Gemini API anahtari
             model_name: Model adi
+            backend: Kullanilacak backend (None ise LLM_BACKEND ayarindan olusturulur)
         """
-        self.api_key = api_key or settings.GEMINI_API_KEY
-        self.model_name = model_name or settings.GEMINI_MODEL
-        
-        if not self.api_key:
-            raise ValueError("GEMINI_API_KEY gerekli")
-        
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel(
-            self.model_name,
-            safety_settings=self._get_safety_settings()
+        self.backend = backend or create_backend(api_key=api_key, model_name=model_name)
+        self.model_name = self.backend.model_name
+        self.rate_limiter = RateLimiter(
+            settings.RATE_LIMIT_CALLS_PER_MINUTE,
+            burst=settings.RATE_LIMIT_BURST,
+            max_in_flight=settings.MAX_CONCURRENT_REQUESTS or None,
         )
-        self.rate_limiter = RateLimiter(settings.RATE_LIMIT_CALLS_PER_MINUTE)
+        self.concurrency: Optional[AdaptiveConcurrencyLimiter] = None
+        if settings.ADAPTIVE_CONCURRENCY_ENABLED:
+            self.concurrency = AdaptiveConcurrencyLimiter(
+                max_limit=settings.MAX_CONCURRENT_REQUESTS or settings.CONCURRENCY_MAX,
+                min_limit=settings.CONCURRENCY_MIN,
+                decrease_factor=settings.CONCURRENCY_DECREASE_FACTOR,
+                latency_tolerance=settings.CONCURRENCY_LATENCY_TOLERANCE,
+            )
+        self.circuit_breaker: Optional[CircuitBreaker] = None
+        if settings.CIRCUIT_BREAKER_ENABLED:
+            self.circuit_breaker = CircuitBreaker(
+                failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+                recovery_timeout=settings.CIRCUIT_RECOVERY_SECONDS,
+                half_open_max_calls=settings.CIRCUIT_HALF_OPEN_CALLS,
+                # Kota hatalari limiter tarafinda (Retry-After) ele alinir
+                is_failure=lambda error: _get_retry_after(error) is None,
+            )
+        self.response_cache: Optional[ResponseCache] = None
+        if settings.CACHE_ENABLED:
+            self.response_cache = ResponseCache(
+                max_entries=settings.CACHE_MAX_ENTRIES,
+                default_ttl=settings.CACHE_TTL_SECONDS,
+                domain_ttls=settings.CACHE_DOMAIN_TTLS,
+            )
+        self.single_flight = SingleFlight()
+        self.batcher: Optional[MicroBatcher] = None
+        if settings.BATCH_ENABLED:
+            self.batcher = MicroBatcher(
+                self,
+                window_seconds=settings.BATCH_WINDOW_MS / 1000.0,
+                max_batch_size=settings.BATCH_MAX_SIZE,
+            )
+        # Basarili cagri gecikmeleri (hedge esigi icin)
+        self._latencies: Deque[float] = deque(maxlen=500)
+        self.timeouts = 0
+        self.hedged = 0
+        self.hedge_wins = 0
     
-    def _get_safety_settings(self) -> list:
-        """Gemini guvenlik ayarlarini dondurur"""
-        import google.generativeai.types as genai_types
+    def _get_generation_config(
+        self,
+        json_output: bool = False,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Gemini generation config'ini dondurur
         
-        return [
-            {
-                "category": genai_types.HarmCategory.HARM_CATEGORY_HARASSMENT,
-                "threshold": genai_types.HarmBlockThreshold.BLOCK_NONE,
-            },
-            {
-                "category": genai_types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
-                "threshold": genai_types.HarmBlockThreshold.BLOCK_NONE,
-            },
-            {
-                "category": genai_types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
-                "threshold": genai_types.HarmBlockThreshold.BLOCK_NONE,
-            },
-            {
-                "category": genai_types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
-                "threshold": genai_types.HarmBlockThreshold.BLOCK_NONE,
+        Args:
+            json_output: True ise (JSON_MODE acikken) JSON MIME tipi istenir
+            response_schema: JSON modunda istenecek yanit semasi
+        """
+        config: Dict[str, Any] = {
+            "temperature": settings.TEMPERATURE,
+            "top_p": settings.TOP_P,
+            "max_output_tokens": settings.MAX_OUTPUT_TOKENS,
+        }
+        if json_output and settings.JSON_MODE:
+            config["response_mime_type"] = "application/json"
+            if response_schema is not None:
+                config["response_schema"] = response_schema
+        return config
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Agent katmanindaki sayaclari dondurur"""
+        return {
+            "cache": self.response_cache.stats() if self.response_cache else None,
+            "single_flight": self.single_flight.stats(),
+            "rate_limiter": self.rate_limiter.stats(),
+            "concurrency": self.concurrency.stats() if self.concurrency else None,
+            "circuit_breaker": self.circuit_breaker.stats() if self.circuit_breaker else None,
+            "batcher": self.batcher.stats() if self.batcher else None,
+            "backend": self.backend.name,
+            "latency_ms": {
+                "p50": percentile(self._latencies, 50) * 1000,
+                "p95": percentile(self._latencies, 95) * 1000,
+                "p99": percentile(self._latencies, 99) * 1000,
             },
-        ]
+            "timeouts": self.timeouts,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+        }
     
     async def generate_with_retry(
         self,
         prompt: str,
-        max_retries: Optional[int] = None
+        max_retries: Optional[int] = None,
+        timeout: Optional[float] = None,
+        generation_config: Optional[Dict[str, Any]] = None
     ) -> str:
-        """Rate limiting ve retry mekanizmasi ile Gemini cagrisi
+        """Rate limiting, retry ve deadline ile Gemini cagrisi
+        
+        Deadline limiter beklemesini ve tum denemeleri kapsar. Caller iptal
+        edilirse (veya deadline dolarsa) devam eden tum denemeler iptal edilir.
         
         Args:
             prompt: Gonderilecek prompt
             max_retries: Maksimum deneme sayisi
+            timeout: Toplam sure limiti (saniye, None ise REQUEST_TIMEOUT_SECONDS,
+                0 ise limitsiz)
+            generation_config: Generation config (None ise varsayilan)
             
         Returns:
             Gemini'den donen metin
             
         Raises:
-            GeminiAPIError: API hatasi
+            GeminiAPIError: API hatasi veya zaman asimi
         """
+        timeout = settings.REQUEST_TIMEOUT_SECONDS if timeout is None else timeout
+        calls = _BackendCalls()
+        token = _backend_calls.set(calls)
+        started = time.monotonic()
+        try:
+            return await asyncio.wait_for(
+                self._generate_with_retry(prompt, max_retries, generation_config),
+                timeout or None
+            )
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            # Iptal edilen backend cagrisi sonucsuz kaldi; zaman asimini hata olarak say.
+            # Sure limiter kuyrugunda veya backoff'ta dolduysa bu yerel sikisikliktir,
+            # backend hatasi degil: sigorta ve eszamanlilik limiti etkilenmez.
+            if calls.busy_at(started + timeout):
+                if self.concurrency is not None:
+                    self.concurrency.on_error()
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+            logger.error(f"Gemini istegi zaman asimina ugradi ({timeout}s)")
+            raise GeminiAPIError(f"Istek zaman asimina ugradi ({timeout}s)")
+        finally:
+            _backend_calls.reset(token)
+    
+    async def _generate_with_retry(
+        self,
+        prompt: str,
+        max_retries: Optional[int] = None,
+        generation_config: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Jitter'li exponential backoff ile retry dongusu"""
         max_retries = max_retries or settings.MAX_RETRIES
-        await self.rate_limiter.acquire()
+        generation_config = generation_config or self._get_generation_config()
         
         for attempt in range(max_retries):
             try:
-                generation_config = {
-                    "temperature": settings.TEMPERATURE,
-                    "top_p": settings.TOP_P,
-                    "max_output_tokens": settings.MAX_OUTPUT_TOKENS,
-                }
-                
-                response = await self.model.generate_content_async(prompt, generation_config=generation_config)
-                
-                if not response.text:
-                    raise GeminiAPIError("Bos yanit alindi")
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.check()
+                return await self._attempt(prompt, generation_config)
                 
-                return response.text
+            except CircuitOpenError:
+                logger.warning("Circuit breaker acik, istek beklemeden reddedildi")
+                raise
                 
             except Exception as e:
                 logger.error(
@@ -128,38 +395,383 @@ class GeminiAgent:
                 if attempt == max_retries - 1:
                     raise GeminiAPIError(f"API hatasi: {e}")
                 
-                await asyncio.sleep(2 ** attempt)
+                retry_after = _get_retry_after(e)
+                if retry_after is not None:
+                    # Kota asimi: limiter tum cagiranlari yavaslatir, ek uyku gerekmez
+                    logger.warning(f"Kota asimi, {retry_after}s bekleniyor")
+                    self.rate_limiter.penalize(retry_after)
+                else:
+                    await asyncio.sleep(self._backoff_delay(attempt))
+    
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """RETRY_BACKOFF_BASE ** attempt ust sinirli, jitter'li bekleme suresi"""
+        ceiling = min(settings.RETRY_BACKOFF_MAX, settings.RETRY_BACKOFF_BASE ** attempt)
+        return random.uniform(ceiling / 2, ceiling)
+    
+    def _hedge_delay(self) -> Optional[float]:
+        """Hedge isteginin baslatilacagi gecikme (hedging kapaliysa None)"""
+        if not settings.HEDGE_ENABLED or len(self._latencies) < settings.HEDGE_MIN_SAMPLES:
+            return None
+        return max(
+            percentile(self._latencies, settings.HEDGE_PERCENTILE),
+            settings.HEDGE_MIN_DELAY_MS / 1000.0
+        )
+    
+    @asynccontextmanager
+    async def _call_slot(self, timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """Rate limit + adaptif eszamanlilik slotu alir, cagriyi sigortayla sarar
+        
+        Sigorta slotlardan once sorulur: reddedilen cagri token harcamaz ve
+        eszamanlilik limitine hata olarak yansimaz. Token eszamanlilik
+        slotundan once alinir; kota beklemesi ve bekleme zaman asimi adaptif
+        limite gecikme sicramasi veya hata olarak yansimaz. Slot beklerken
+        dolan sure sigortaya sayilmaz; yalnizca backend cagrisinin sonucu sayilir.
+        
+        Args:
+            timeout: Slotlar icin toplam bekleme limiti (saniye)
+            
+        Raises:
+            asyncio.TimeoutError: Limit icinde slot alinamadi
+            CircuitOpenError: Devre acik
+        """
+        start = time.monotonic()
+        
+        def remaining() -> Optional[float]:
+            return None if timeout is None else max(0.0, timeout - (time.monotonic() - start))
+        
+        breaker = self.circuit_breaker
+        async with AsyncExitStack() as stack:
+            if breaker is not None:
+                breaker.before_call()
+            try:
+                await stack.enter_async_context(self.rate_limiter.slot(timeout=remaining()))
+                if self.concurrency is not None:
+                    await stack.enter_async_context(self.concurrency.slot(timeout=remaining()))
+            except BaseException:
+                # Cagri hic yapilmadi; yari acik durumdaki deneme hakki geri verilir
+                if breaker is not None:
+                    breaker.release_probe()
+                raise
+            if breaker is not None:
+                await stack.enter_async_context(breaker.guard(admitted=True))
+            yield
+    
+    async def _timed_call(self, prompt: str, generation_config: Dict[str, Any]) -> str:
+        """Limiter slot'u icinde tek backend cagrisi yapar ve gecikmeyi kaydeder"""
+        # Her deneme (retry ve hedge'ler dahil) limiter'lardan ve sigortadan gecer
+        async with self._call_slot():
+            calls = _backend_calls.get()
+            if calls is not None:
+                calls.in_flight += 1
+            start = time.monotonic()
+            try:
+                text = await self.backend.generate_text(prompt, generation_config)
+            finally:
+                if calls is not None:
+                    calls.in_flight -= 1
+                    calls.last_end = time.monotonic()
+            self._latencies.append(time.monotonic() - start)
+            return text
+    
+    async def _attempt(self, prompt: str, generation_config: Dict[str, Any]) -> str:
+        """Tek bir deneme; ilk cagri p95 gecikmeyi asarsa ikinci (hedge) cagri baslatir
+        
+        Hangisi once basariyla donerse onun sonucu kullanilir, digeri iptal edilir.
+        """
+        hedge_delay = self._hedge_delay()
+        primary = asyncio.ensure_future(self._timed_call(prompt, generation_config))
+        pending = {primary}
+        
+        try:
+            if hedge_delay is not None:
+                done, pending = await asyncio.wait(pending, timeout=hedge_delay)
+                if not done:
+                    self.hedged += 1
+                    pending.add(asyncio.ensure_future(self._timed_call(prompt, generation_config)))
+                else:
+                    pending = done
+            
+            last_error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedge_wins += 1
+                        return task.result()
+                    last_error = task.exception()
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
     
+    async def stream_with_retry(
+        self,
+        prompt: str,
+        max_retries: Optional[int] = None,
+        timeout: Optional[float] = None,
+        generation_config: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """Gemini yanitini parca parca (streaming) dondurur
+        
+        Retry yalnizca ilk parca gelmeden once yapilir; parca yayinlandiktan
+        sonra olusan hata dogrudan GeminiAPIError olarak iletilir. Deadline
+        tum denemeleri ve tum parcalari kapsar.
+        
+        Args:
+            prompt: Gonderilecek prompt
+            max_retries: Maksimum deneme sayisi
+            timeout: Toplam sure limiti (saniye, None ise REQUEST_TIMEOUT_SECONDS,
+                0 ise limitsiz)
+            generation_config: Generation config (None ise varsayilan)
+            
+        Yields:
+            Gelen metin parcalari
+            
+        Raises:
+            GeminiAPIError: API hatasi veya zaman asimi
+        """
+        max_retries = max_retries or settings.MAX_RETRIES
+        timeout = settings.REQUEST_TIMEOUT_SECONDS if timeout is None else timeout
+        generation_config = generation_config or self._get_generation_config()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+        
+        def remaining() -> Optional[float]:
+            if deadline is None:
+                return None
+            left = deadline - loop.time()
+            if left <= 0:
+                raise asyncio.TimeoutError()
+            return left
+        
+        for attempt in range(max_retries):
+            received_any = False
+            try:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.check()
+                async with self._call_slot(timeout=remaining()):
+                    stream = self.backend.stream_text(prompt, generation_config)
+                    try:
+                        while True:
+                            try:
+                                text = await asyncio.wait_for(stream.__anext__(), remaining())
+                            except StopAsyncIteration:
+                                break
+                            received_any = True
+                            yield text
+                    finally:
+                        await stream.aclose()
+                
+                if not received_any:
+                    raise GeminiAPIError("Bos yanit alindi")
+                return
+                
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                logger.error(f"Gemini streaming zaman asimina ugradi ({timeout}s)")
+                raise GeminiAPIError(f"Istek zaman asimina ugradi ({timeout}s)")
+                
+            except CircuitOpenError:
+                logger.warning("Circuit breaker acik, streaming istegi reddedildi")
+                raise
+                
+            except Exception as e:
+                logger.error(
+                    f"Gemini streaming hatasi (deneme {attempt + 1}/{max_retries}): {e}"
+                )
+                
+                if received_any or attempt == max_retries - 1:
+                    raise GeminiAPIError(f"API hatasi: {e}")
+                
+                retry_after = _get_retry_after(e)
+                if retry_after is not None:
+                    self.rate_limiter.penalize(retry_after)
+                else:
+                    await asyncio.sleep(self._backoff_delay(attempt))
     
     async def generate_json_response(
         self,
         prompt: str,
-        max_retries: Optional[int] = None
+        max_retries: Optional[int] = None,
+        use_cache: bool = True,
+        domain: Optional[str] = None,
+        response_schema: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """JSON formatinda yanit alir
         
+        Ayni model, generation config ve normalize prompt icin daha once
+        alinmis yanit cache'ten dondurulur; rate limit kotasi harcanmaz.
+        Ayni anda gelen ozdes istekler tek bir API cagrisini paylasir.
+        
         Args:
             prompt: Gonderilecek prompt
             max_retries: Maksimum deneme sayisi
+            use_cache: False ise cache atlanir (okuma ve yazma)
+            domain: Cache TTL secimi icin modul domain'i
+            response_schema: JSON modunda istenecek yanit semasi
             
         Returns:
             Parse edilmis JSON dict
         """
-        response_text = await self.generate_with_retry(prompt, max_retries)
+        generation_config = self._get_generation_config(True, response_schema)
+        request_key = ResponseCache.make_key(self.model_name, generation_config, prompt)
+        use_cache = use_cache and self.response_cache is not None
         
-        # JSON extract
-        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(0)
-            try:
-                parsed_json = json.loads(json_str)
-                return parsed_json
-            except json.JSONDecodeError:
-                logger.warning("JSON parse hatasi, raw text donduruluyor")
+        if use_cache:
+            cached = self.response_cache.get(request_key)
+            if cached is not None:
+                logger.info("Gemini yaniti cache'ten donduruldu")
+                return cached
         
-        # Fallback: structured response
-        return {
-            "result": response_text,
-            "steps": [response_text],
-            "confidence_score": 0.95,
-        }
+        response, parsed = await self.single_flight.do(
+            request_key,
+            lambda: self._request_json(prompt, max_retries, generation_config)
+        )
+        
+        if use_cache and self._is_cacheable(response, parsed):
+            self.response_cache.set(request_key, response, domain)
+        
+        # Birlesen cagrilar ayni dict'i paylasmasin
+        return copy.deepcopy(response)
+    
+    async def generate_json_batched(
+        self,
+        template: str,
+        expression: str,
+        use_cache: bool = True,
+        domain: Optional[str] = None,
+        response_schema: Optional[Dict[str, Any]] = None,
+        **prompt_kwargs
+    ) -> Dict[str, Any]:
+        """Ifadeyi micro-batcher uzerinden JSON yanit olarak alir
+        
+        Batching kapaliysa generate_json_response ile ayni davranir. Cache
+        ifade bazinda kontrol edilir; yalnizca cache'te olmayanlar batch'e girer.
+        
+        Args:
+            template: Modul prompt template'i ({expression} icerir)
+            expression: Hesaplanacak ifade
+            use_cache: False ise cache atlanir
+            domain: Cache TTL secimi icin modul domain'i
+            response_schema: JSON modunda tek bir ifadenin yanit semasi
+            **prompt_kwargs: Template'e gonderilecek ek parametreler
+            
+        Returns:
+            Parse edilmis JSON dict
+        """
+        prompt = template.format(expression=expression, **prompt_kwargs)
+        if self.batcher is None:
+            return await self.generate_json_response(
+                prompt, use_cache=use_cache, domain=domain, response_schema=response_schema
+            )
+        
+        use_cache = use_cache and self.response_cache is not None
+        request_key = ResponseCache.make_key(
+            self.model_name, self._get_generation_config(True, response_schema), prompt
+        )
+        if use_cache:
+            cached = self.response_cache.get(request_key)
+            if cached is not None:
+                return cached
+        
+        response = await self.batcher.submit(
+            template, expression, domain, response_schema, **prompt_kwargs
+        )
+        if use_cache and self._is_cacheable(response, True):
+            self.response_cache.set(request_key, response, domain)
+        return copy.deepcopy(response)
+    
+    async def stream_json_response(
+        self,
+        prompt: str,
+        on_step: Callable[[str], Any],
+        use_cache: bool = True,
+        domain: Optional[str] = None,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """JSON yaniti streaming ile alir, tamamlanan adimlari aninda bildirir
+        
+        Args:
+            prompt: Gonderilecek prompt
+            on_step: "steps" dizisindeki her tamamlanan adim icin cagrilir
+            use_cache: False ise cache atlanir
+            domain: Cache TTL secimi icin modul domain'i
+            response_schema: JSON modunda istenecek yanit semasi
+            
+        Returns:
+            Parse edilmis JSON dict
+        """
+        use_cache = use_cache and self.response_cache is not None
+        generation_config = self._get_generation_config(True, response_schema)
+        request_key = ResponseCache.make_key(self.model_name, generation_config, prompt)
+        
+        if use_cache:
+            cached = self.response_cache.get(request_key)
+            if cached is not None:
+                for step in cached.get("steps", []):
+                    on_step(str(step))
+                return cached
+        
+        response_text = ""
+        emitted = 0
+        async for chunk in self.stream_with_retry(prompt, generation_config=generation_config):
+            response_text += chunk
+            steps = extract_completed_steps(response_text)
+            for step in steps[emitted:]:
+                on_step(step)
+            emitted = max(emitted, len(steps))
+        
+        response, parsed = self._parse_json_text(response_text)
+        # Parca sinirlarinda kacirilmis adim kalmasin
+        for step in response.get("steps", [])[emitted:]:
+            on_step(str(step))
+        
+        if use_cache and self._is_cacheable(response, parsed):
+            self.response_cache.set(request_key, response, domain)
+        return response
+    
+    async def _request_json(
+        self,
+        prompt: str,
+        max_retries: Optional[int] = None,
+        generation_config: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Gemini'yi cagirir ve yanittan JSON cikarir
+        
+        Args:
+            prompt: Gonderilecek prompt
+            max_retries: Maksimum deneme sayisi
+            generation_config: Generation config (None ise varsayilan)
+            
+        Returns:
+            (yanit dict'i, JSON basariyla parse edildi mi) tuple'i
+        """
+        response_text = await self.generate_with_retry(
+            prompt, max_retries, generation_config=generation_config
+        )
+        return self._parse_json_text(response_text)
+    
+    @staticmethod
+    def _parse_json_text(response_text: str) -> Tuple[Dict[str, Any], bool]:
+        """Model metninden JSON objesini cikarir
+        
+        Args:
+            response_text: Gemini'den donen metin
+            
+        Returns:
+            (yanit dict'i, JSON basariyla parse edildi mi) tuple'i
+        """
+        response, parsed = parse_json_response(response_text)
+        if not parsed:
+            logger.warning("JSON parse hatasi, raw text donduruluyor")
+        elif not GeminiAgent._is_cacheable(response, parsed):
+            logger.warning("Kesik JSON yaniti onarildi")
+        return response, parsed
+    
+    @staticmethod
+    def _is_cacheable(response: Dict[str, Any], parsed: bool) -> bool:
+        """Yalnizca eksiksiz parse edilmis yanitlar cache'lenir (onarilmislar degil)"""
+        metadata = response.get("metadata")
+        return parsed and not (isinstance(metadata, dict) and metadata.get("json_repaired"))
@@ -0,0 +1,378 @@
+"""Pluggable LLM backends for GeminiAgent"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from src.config.settings import settings
+from src.utils.exceptions import GeminiAPIError
+from src.utils.helpers import parse_json_response
+
+
+class LLMBackend(ABC):
+    """LLM backend arayuzu
+
+    Backend'ler yalnizca tek bir ham cagriyi yapar; rate limiting, retry,
+    cache ve coalescing GeminiAgent katmaninda kalir.
+    """
+
+    name: str = "base"
+    model_name: str = ""
+
+    @abstractmethod
+    async def generate_text(
+        self,
+        prompt: str,
+        generation_config: Dict[str, Any]
+    ) -> str:
+        """Prompt icin tam metin yaniti dondurur
+
+        Args:
+            prompt: Gonderilecek prompt
+            generation_config: Generation config dict'i
+
+        Returns:
+            Model yaniti
+        """
+        pass
+
+    @abstractmethod
+    def stream_text(
+        self,
+        prompt: str,
+        generation_config: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """Prompt icin yaniti parca parca dondurur
+
+        Args:
+            prompt: Gonderilecek prompt
+            generation_config: Generation config dict'i
+
+        Yields:
+            Metin parcalari
+        """
+        pass
+
+    async def generate_json(
+        self,
+        prompt: str,
+        generation_config: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Prompt icin JSON yaniti dondurur
+
+        Args:
+            prompt: Gonderilecek prompt
+            generation_config: Generation config dict'i
+
+        Returns:
+            Parse edilmis JSON dict
+
+        Raises:
+            GeminiAPIError: Yanit JSON degil
+        """
+        response, parsed = parse_json_response(
+            await self.generate_text(prompt, generation_config)
+        )
+        if not parsed:
+            raise GeminiAPIError("Backend yaniti JSON degil")
+        return response
+
+
+class GeminiBackend(LLMBackend):
+    """google.generativeai uzerinden Gemini backend'i"""
+
+    name = "gemini"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model_name: Optional[str] = None
+    ):
+        """Gemini modelini yapilandirir
+
+        Args:
+            api_key: Gemini API anahtari
+            model_name: Model adi
+        """
+        import google.generativeai as genai
+
+        self.api_key = api_key or settings.GEMINI_API_KEY
+        self.model_name = model_name or settings.GEMINI_MODEL
+
+        if not self.api_key:
+            raise ValueError("GEMINI_API_KEY gerekli")
+
+        genai.configure(api_key=self.api_key)
+        self.model = genai.GenerativeModel(
+            self.model_name,
+            safety_settings=self._get_safety_settings()
+        )
+
+    def _get_safety_settings(self) -> list:
+        """Gemini guvenlik ayarlarini dondurur"""
+        import google.generativeai.types as genai_types
+
+        return [
+            {
+                "category": genai_types.HarmCategory.HARM_CATEGORY_HARASSMENT,
+                "threshold": genai_types.HarmBlockThreshold.BLOCK_NONE,
+            },
+            {
+                "category": genai_types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
+                "threshold": genai_types.HarmBlockThreshold.BLOCK_NONE,
+            },
+            {
+                "category": genai_types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
+                "threshold": genai_types.HarmBlockThreshold.BLOCK_NONE,
+            },
+            {
+                "category": genai_types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
+                "threshold": genai_types.HarmBlockThreshold.BLOCK_NONE,
+            },
+        ]
+
+    async def generate_text(
+        self,
+        prompt: str,
+        generation_config: Dict[str, Any]
+    ) -> str:
+        """Gemini'den tam yanit alir"""
+        response = await self.model.generate_content_async(
+            prompt, generation_config=generation_config
+        )
+
+        if not response.text:
+            raise GeminiAPIError("Bos yanit alindi")
+
+        return response.text
+
+    async def stream_text(
+        self,
+        prompt: str,
+        generation_config: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """Gemini streaming modunda yanit parcalarini dondurur"""
+        response = await self.model.generate_content_async(
+            prompt,
+            generation_config=generation_config,
+            stream=True
+        )
+        async for chunk in response:
+            try:
+                text = chunk.text
+            except ValueError:
+                # Icerik parcasi olmayan chunk (ornek: sadece finish_reason)
+                continue
+            if text:
+                yield text
+
+
+class SimulatedBackendError(Exception):
+    """LocalBackend tarafindan uretilen yapay hata"""
+    pass
+
+
+class SimulatedQuotaError(SimulatedBackendError):
+    """LocalBackend tarafindan uretilen yapay kota (429) hatasi"""
+
+    code = 429
+
+
+def default_local_responder(prompt: str) -> str:
+    """Prompt tipine gore deterministik, modullerin parse edebilecegi JSON uretir
+
+    Args:
+        prompt: Gelen prompt
+
+    Returns:
+        JSON metni
+    """
+    expression_match = re.search(
+        r"(?:Ifade|Kullanici Girdisi):\s*\"?([^\n]*?)\"?\s*$", prompt, re.M
+    )
+    expression = expression_match.group(1).strip() if expression_match else prompt.strip()
+    digest = int(hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8], 16)
+
+    count_match = re.search(r"ayni gorev icin (\d+) ayri ifade", prompt)
+    if count_match:
+        # Micro-batch prompt'u: her ifade icin bir eleman
+        items = [
+            {"result": (digest + i) % 1000, "steps": [f"Yerel backend: ifade {i + 1}"]}
+            for i in range(int(count_match.group(1)))
+        ]
+        return json.dumps(items)
+
+    if '"operation"' in prompt:
+        numbers = [float(n) for n in re.findall(r"-?\d+(?:\.\d+)?", expression)]
+        return json.dumps({"data": numbers, "operation": "mean", "explanation": "Yerel backend"})
+
+    response: Dict[str, Any] = {
+        "result": digest % 1000,
+        "steps": [f"Yerel backend: ifade alindi ({expression})", "Yerel backend: sonuc uretildi"],
+        "confidence_score": 1.0,
+    }
+    if '"visual_data"' in prompt:
+        response["visual_data"] = {"function": expression, "x_range": [-10, 10], "plot_type": "2d"}
+    return json.dumps(response, ensure_ascii=False)
+
+
+class LocalBackend(LLMBackend):
+    """Ayarlanabilir gecikme ve hata dagilimli deterministik yerel backend
+
+    Network erisimi olmadan yuk testi, rate limit ve retry yollarini
+    denemek icin kullanilir. Ayni prompt'un n. cagrisi her kosuda ayni
+    gecikmeyi ve ayni hata/yanit kararini uretir.
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        latency_jitter: float = 0.0,
+        latency_distribution: str = "fixed",
+        error_rate: float = 0.0,
+        quota_error_rate: float = 0.0,
+        seed: int = 0,
+        responder: Optional[Callable[[str], str]] = None,
+        chunk_size: int = 32,
+        model_name: str = "local-deterministic"
+    ):
+        """Yerel backend'i baslatir
+
+        Args:
+            latency: Ortalama gecikme (saniye)
+            latency_jitter: Dagilim genisligi (uniform: +/- saniye, lognormal: sigma)
+            latency_distribution: "fixed", "uniform" veya "lognormal"
+            error_rate: Genel hata olasiligi (0-1)
+            quota_error_rate: Kota (429) hatasi olasiligi (0-1)
+            seed: Deterministik rastgelelik tohumu
+            responder: Prompt'tan yanit metni ureten fonksiyon
+            chunk_size: Streaming'de parca basina karakter sayisi
+            model_name: Cache anahtarinda kullanilan model adi
+        """
+        if latency_distribution not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"Bilinmeyen gecikme dagilimi: {latency_distribution}")
+
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.latency_distribution = latency_distribution
+        self.error_rate = error_rate
+        self.quota_error_rate = quota_error_rate
+        self.seed = seed
+        self.responder = responder or default_local_responder
+        self.chunk_size = max(1, chunk_size)
+        self.model_name = model_name
+        self._call_counts: Dict[str, int] = {}
+
+        self.calls = 0
+        self.errors = 0
+
+    @classmethod
+    def from_settings(cls) -> "LocalBackend":
+        """Ayarlardan yerel backend olusturur"""
+        return cls(
+            latency=settings.LOCAL_BACKEND_LATENCY_MS / 1000.0,
+            latency_jitter=settings.LOCAL_BACKEND_LATENCY_JITTER,
+            latency_distribution=settings.LOCAL_BACKEND_LATENCY_DISTRIBUTION,
+            error_rate=settings.LOCAL_BACKEND_ERROR_RATE,
+            quota_error_rate=settings.LOCAL_BACKEND_QUOTA_ERROR_RATE,
+            seed=settings.LOCAL_BACKEND_SEED,
+        )
+
+    def _rng_for(self, prompt: str) -> random.Random:
+        """Prompt ve cagri sirasina bagli deterministik RNG dondurur"""
+        count = self._call_counts.get(prompt, 0)
+        self._call_counts[prompt] = count + 1
+        self.calls += 1
+        return random.Random(f"{self.seed}:{count}:{prompt}")
+
+    def _sample_latency(self, rng: random.Random) -> float:
+        """Secili dagilimdan gecikme ornekler"""
+        if self.latency_distribution == "uniform":
+            return max(0.0, rng.uniform(self.latency - self.latency_jitter, self.latency + self.latency_jitter))
+        if self.latency_distribution == "lognormal" and self.latency > 0:
+            return rng.lognormvariate(0.0, self.latency_jitter) * self.latency
+        return self.latency
+
+    def _maybe_fail(self, rng: random.Random, latency: float) -> None:
+        """Ayarlanan olasiliklarla yapay hata firlatir"""
+        roll = rng.random()
+        if roll < self.quota_error_rate:
+            self.errors += 1
+            raise SimulatedQuotaError(f"Quota exceeded, please retry in {max(latency, 0.01):.2f}s.")
+        if roll < self.quota_error_rate + self.error_rate:
+            self.errors += 1
+            raise SimulatedBackendError("Simule edilmis backend hatasi")
+
+    async def generate_text(
+        self,
+        prompt: str,
+        generation_config: Dict[str, Any]
+    ) -> str:
+        """Gecikme ve hata simulasyonu ile deterministik yanit dondurur"""
+        rng = self._rng_for(prompt)
+        latency = self._sample_latency(rng)
+        await asyncio.sleep(latency)
+        self._maybe_fail(rng, latency)
+        return self.responder(prompt)
+
+    async def stream_text(
+        self,
+        prompt: str,
+        generation_config: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """Yaniti parcalara bolup gecikmeyi parcalara yayarak dondurur"""
+        rng = self._rng_for(prompt)
+        latency = self._sample_latency(rng)
+        text = self.responder(prompt)
+        chunks = [text[i:i + self.chunk_size] for i in range(0, len(text), self.chunk_size)]
+
+        # Gecikmenin yarisi ilk parcaya kadar, kalani parcalar arasinda
+        await asyncio.sleep(latency / 2)
+        self._maybe_fail(rng, latency)
+        for chunk in chunks:
+            yield chunk
+            await asyncio.sleep(latency / 2 / max(1, len(chunks)))
+
+    def stats(self) -> Dict[str, int]:
+        """Cagri sayaclarini dondurur"""
+        return {"calls": self.calls, "errors": self.errors}
+
+
+def create_backend(
+    api_key: Optional[str] = None,
+    model_name: Optional[str] = None
+) -> LLMBackend:
+    """LLM_BACKEND ve LLM_CASSETTE_* ayarlarina gore backend olusturur
+
+    Args:
+        api_key: Gemini API anahtari (sadece gemini backend'i icin)
+        model_name: Model adi (sadece gemini backend'i icin)
+
+    Returns:
+        LLMBackend instance'i
+    """
+    from src.core.cassette import CassetteBackend
+
+    if settings.LLM_CASSETTE_MODE == "replay":
+        return CassetteBackend(
+            settings.LLM_CASSETTE_PATH,
+            mode="replay",
+            latency_mode=settings.LLM_CASSETTE_LATENCY,
+        )
+
+    if settings.LLM_BACKEND == "local":
+        backend: LLMBackend = LocalBackend.from_settings()
+    elif settings.LLM_BACKEND == "gemini":
+        backend = GeminiBackend(api_key=api_key, model_name=model_name)
+    else:
+        raise ValueError(f"Bilinmeyen LLM_BACKEND: {settings.LLM_BACKEND}")
+
+    if settings.LLM_CASSETTE_MODE == "record":
+        return CassetteBackend(settings.LLM_CASSETTE_PATH, mode="record", inner=backend)
+    return backend
@@ -0,0 +1,240 @@
+"""Micro-batching of module prompts into a single Gemini call"""
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+from src.config.prompts import BATCH_PROMPT
+from src.utils.json_extract import extract_json
+from src.utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    from src.core.agent import GeminiAgent
+
+logger = setup_logger()
+
+
+class _BatchItem:
+    """Batch'i bekleyen tek bir ifade"""
+
+    def __init__(self, expression: str, future: "asyncio.Future[Dict[str, Any]]"):
+        self.expression = expression
+        self.future = future
+
+
+class _PendingBatch:
+    """Ayni prompt template'i icin toplanan ifadeler"""
+
+    def __init__(
+        self,
+        template: str,
+        domain: Optional[str],
+        response_schema: Optional[Dict[str, Any]],
+        prompt_kwargs: Dict[str, Any]
+    ):
+        self.template = template
+        self.domain = domain
+        self.response_schema = response_schema
+        self.prompt_kwargs = prompt_kwargs
+        self.items: List[_BatchItem] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class MicroBatcher:
+    """Kisa bir pencerede gelen ifadeleri tek bir Gemini cagrisinda toplar
+
+    Ayni modul prompt'u (ve ayni prompt parametreleri) icin gelen ifadeler
+    `window_seconds` boyunca veya `max_batch_size` dolana kadar biriktirilir,
+    JSON dizisi isteyen tek bir prompt ile gonderilir ve yanit elemanlari
+    cagiranlara dagitilir. Yanit bozuksa her ifade tek tek sorulur; yanit
+    kesilmisse yalnizca tamamlanmamis ifadeler tek tek sorulur.
+    """
+
+    def __init__(
+        self,
+        agent: "GeminiAgent",
+        window_seconds: float,
+        max_batch_size: int
+    ):
+        """Batcher'i baslatir
+
+        Args:
+            agent: Cagrilari yapacak Gemini agent
+            window_seconds: Ifadelerin biriktirilecegi sure
+            max_batch_size: Bir batch'teki maksimum ifade sayisi
+        """
+        self.agent = agent
+        self.window_seconds = window_seconds
+        self.max_batch_size = max(1, max_batch_size)
+        self._pending: Dict[str, _PendingBatch] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+        self.batches = 0
+        self.batched_items = 0
+        self.fallbacks = 0
+        self.partial = 0
+
+    async def submit(
+        self,
+        template: str,
+        expression: str,
+        domain: Optional[str] = None,
+        response_schema: Optional[Dict[str, Any]] = None,
+        **prompt_kwargs
+    ) -> Dict[str, Any]:
+        """Ifadeyi bir sonraki batch'e ekler ve kendi sonucunu bekler
+
+        Args:
+            template: Modul prompt template'i ({expression} icerir)
+            expression: Hesaplanacak ifade
+            domain: Cache TTL secimi icin modul domain'i
+            response_schema: JSON modunda tek bir ifadenin yanit semasi
+            **prompt_kwargs: Template'e gonderilecek ek parametreler
+
+        Returns:
+            Ifadeye ait parse edilmis JSON dict
+        """
+        loop = asyncio.get_running_loop()
+        key = json.dumps([template, response_schema, prompt_kwargs], sort_keys=True, default=str)
+
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = _PendingBatch(template, domain, response_schema, prompt_kwargs)
+            self._pending[key] = batch
+            batch.timer = loop.call_later(self.window_seconds, self._flush, key)
+
+        future: "asyncio.Future[Dict[str, Any]]" = loop.create_future()
+        batch.items.append(_BatchItem(expression, future))
+
+        if len(batch.items) >= self.max_batch_size:
+            self._flush(key)
+
+        return await future
+
+    def _flush(self, key: str) -> None:
+        """Bekleyen batch'i gonderime cikarir"""
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+
+        task = asyncio.ensure_future(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: _PendingBatch) -> None:
+        """Batch'i tek cagriyla gonderir ve sonuclari dagitir"""
+        # Iptal edilmis bekleyenleri gonderme
+        items = [item for item in batch.items if not item.future.done()]
+        if not items:
+            return
+
+        try:
+            if len(items) == 1:
+                await self._dispatch_single(batch, items)
+                return
+
+            prompt = BATCH_PROMPT.format(
+                count=len(items),
+                task_prompt=batch.template.format(
+                    expression="(asagidaki ifadeler)", **batch.prompt_kwargs
+                ),
+                expressions="\n".join(
+                    f"{i}. {item.expression}" for i, item in enumerate(items, 1)
+                ),
+            )
+            array_schema = None
+            if batch.response_schema is not None:
+                array_schema = {"type": "array", "items": batch.response_schema}
+            response_text = await self.agent.generate_with_retry(
+                prompt,
+                generation_config=self.agent._get_generation_config(True, array_schema)
+            )
+            responses = self._parse_batch_response(response_text, len(items))
+
+            if responses is None:
+                logger.warning(
+                    f"Batch yaniti gecersiz ({len(items)} ifade), tek tek sorulacak"
+                )
+                self.fallbacks += 1
+                await self._dispatch_single(batch, items)
+                return
+
+            self.batches += 1
+            self.batched_items += len(responses)
+            for item, response in zip(items, responses):
+                if not item.future.done():
+                    item.future.set_result(response)
+
+            if len(responses) < len(items):
+                # Kesik yanit: kalan ifadeler tek tek sorulur
+                logger.warning(
+                    f"Batch yaniti kesik ({len(responses)}/{len(items)}), kalanlar tek tek sorulacak"
+                )
+                self.partial += 1
+                await self._dispatch_single(batch, items[len(responses):])
+
+        except Exception as e:
+            for item in items:
+                if not item.future.done():
+                    item.future.set_exception(e)
+
+    async def _dispatch_single(self, batch: _PendingBatch, items: List[_BatchItem]) -> None:
+        """Ifadeleri ayri ayri (eszamanli) sorar"""
+
+        async def run(item: _BatchItem) -> None:
+            prompt = batch.template.format(expression=item.expression, **batch.prompt_kwargs)
+            try:
+                response = await self.agent.generate_json_response(
+                    prompt, domain=batch.domain, response_schema=batch.response_schema
+                )
+            except Exception as e:
+                if not item.future.done():
+                    item.future.set_exception(e)
+                return
+            if not item.future.done():
+                item.future.set_result(response)
+
+        await asyncio.gather(*[run(item) for item in items])
+
+    @staticmethod
+    def _parse_batch_response(
+        response_text: str,
+        expected_count: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Batch yanitindan JSON dizisini cikarir
+
+        Yanit kesilmisse (onarilan dizi) son eleman eksik olabilecegi icin
+        atilir ve yalnizca tamamlanmis elemanlar dondurulur.
+
+        Args:
+            response_text: Gemini'den donen metin
+            expected_count: Beklenen eleman sayisi
+
+        Returns:
+            Dict listesi (kesik yanitta beklenenden kisa), yanit gecersizse None
+        """
+        parsed, repaired = extract_json(response_text, list)
+        if parsed is None:
+            return None
+
+        if repaired:
+            parsed = parsed[:-1]
+            if not parsed or len(parsed) >= expected_count:
+                return None
+        elif len(parsed) != expected_count:
+            return None
+        if not all(isinstance(entry, dict) for entry in parsed):
+            return None
+        return parsed
+
+    def stats(self) -> Dict[str, int]:
+        """Batch sayaclarini dondurur"""
+        return {
+            "batches": self.batches,
+            "batched_items": self.batched_items,
+            "fallbacks": self.fallbacks,
+            "partial": self.partial,
+            "pending": sum(len(batch.items) for batch in self._pending.values()),
+        }
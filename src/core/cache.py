@@ -0,0 +1,378 @@
+"""In-process response cache for Gemini calls and persistent plot cache"""
+
+import copy
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Cache anahtari icin prompt'u normalize eder
+
+    Bastaki/sondaki bosluklar silinir ve ardisik bosluklar tek bosluga indirilir.
+    Buyuk/kucuk harf korunur (degisken isimleri anlamli olabilir).
+
+    Args:
+        prompt: Ham prompt metni
+
+    Returns:
+        Normalize edilmis prompt
+    """
+    return re.sub(r"\s+", " ", prompt).strip()
+
+
+class ResponseCache:
+    """LRU eviction ve domain bazli TTL destekli bellek ici cache"""
+
+    def __init__(
+        self,
+        max_entries: int,
+        default_ttl: float,
+        domain_ttls: Optional[Dict[str, float]] = None
+    ):
+        """Cache'i baslatir
+
+        Args:
+            max_entries: Maksimum kayit sayisi (asilirsa en eski kullanilan silinir)
+            default_ttl: Varsayilan yasam suresi (saniye)
+            domain_ttls: Domain bazli yasam sureleri (saniye, 0 = cache'leme)
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.domain_ttls = domain_ttls or {}
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(
+        model_name: str,
+        generation_config: Dict[str, Any],
+        prompt: str
+    ) -> str:
+        """Model, generation config ve normalize prompt'tan cache anahtari uretir
+
+        Args:
+            model_name: Model adi
+            generation_config: Generation config dict'i
+            prompt: Gonderilecek prompt
+
+        Returns:
+            SHA-256 hex anahtar
+        """
+        payload = json.dumps(
+            {
+                "model": model_name,
+                "config": generation_config,
+                "prompt": normalize_prompt(prompt),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, domain: Optional[str]) -> float:
+        """Domain icin gecerli TTL'i dondurur"""
+        if domain and domain in self.domain_ttls:
+            return self.domain_ttls[domain]
+        return self.default_ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cache'den deger okur
+
+        Args:
+            key: Cache anahtari
+
+        Returns:
+            Kayitli degerin kopyasi veya None (yok/suresi dolmus)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any, domain: Optional[str] = None) -> None:
+        """Cache'e deger yazar
+
+        Args:
+            key: Cache anahtari
+            value: Saklanacak deger (kopyasi saklanir)
+            domain: TTL secimi icin domain adi
+        """
+        ttl = self.ttl_for(domain)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Tum kayitlari siler (sayaclar korunur)"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache sayaclarini dondurur"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class PlotCache:
+    """Icerik adresli, diskte kalici ve bayt butceli grafik cache'i
+
+    Her grafik `<anahtar>.png` olarak, sonucu (result, steps, visual_data)
+    yanindaki `<anahtar>.json` dosyasinda saklanir (yalnizca veri ureten
+    grafiklerde PNG olmaz); anahtar grafigi
+    belirleyen icerigin SHA-256 ozetidir. `index.json` boyutlari, son
+    kullanim zamanlarini ve istek metni -> anahtar eslemelerini (alias)
+    tutar; atomik olarak yazilir ve baska bir surec degistirdiginde
+    yeniden okunur, boylece dosyalar yeniden baslatmalar ve surecler
+    arasinda paylasilir.
+
+    Toplam boyut `max_bytes`'i asarsa en uzun suredir kullanilmayan
+    grafikler silinir; yeni eklenen grafik tek basina butceyi assa bile
+    tutulur. Dizinde indekste olmayan dosyalar (eski surumlerin UUID
+    PNG'leri) benimsenip ayni eviction'a tabi tutulur.
+    """
+
+    INDEX_NAME = "index.json"
+
+    def __init__(self, directory: str, max_bytes: int):
+        """Cache'i baslatir ve indeksi diskle uzlastirir
+
+        Args:
+            directory: Grafiklerin yazildigi dizin
+            max_bytes: Toplam bayt butcesi
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._index_path = self.directory / self.INDEX_NAME
+        self._entries: Dict[str, Dict[str, float]] = {}
+        self._aliases: Dict[str, str] = {}
+        self._index_mtime: Optional[int] = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        with self._lock:
+            self._load_index()
+            self._reconcile()
+            self._evict()
+            self._save_index()
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Grafigi belirleyen parcalardan icerik anahtari uretir
+
+        Returns:
+            SHA-256 hex anahtar
+        """
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        """Anahtarin PNG dosya yolu (mutlak)"""
+        return (self.directory / f"{key}.png").absolute()
+
+    def get(self, key: str, alias: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Kayitli sonucu okur
+
+        Args:
+            key: Icerik anahtari
+            alias: Bulunursa bu anahtara eslenecek istek anahtari
+
+        Returns:
+            Saklanan sonuc dict'i veya None
+        """
+        with self._lock:
+            self._refresh()
+            payload = self._read_payload(key)
+            if payload is None:
+                self.misses += 1
+                self._entries.pop(key, None)
+                return None
+            self.hits += 1
+            self._touch(key)
+            if alias:
+                self._aliases[alias] = key
+            self._save_index()
+            return payload
+
+    def lookup(self, alias: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Istek anahtarindan (alias) kayitli sonucu bulur
+
+        Returns:
+            (icerik anahtari, sonuc) tuple'i veya None
+        """
+        with self._lock:
+            self._refresh()
+            key = self._aliases.get(alias)
+        if key is None:
+            return None
+        payload = self.get(key)
+        return (key, payload) if payload is not None else None
+
+    def put(self, key: str, payload: Dict[str, Any], alias: Optional[str] = None) -> None:
+        """Grafigin sonucunu kaydeder (PNG varsa `path_for(key)`'e yazilmis olmali)
+
+        Args:
+            key: Icerik anahtari
+            payload: JSON'a cevrilebilir sonuc dict'i
+            alias: Bu anahtara eslenecek istek anahtari
+        """
+        sidecar = self.directory / f"{key}.json"
+        temporary = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(payload, default=str), encoding="utf-8")
+        os.replace(temporary, sidecar)
+
+        with self._lock:
+            self._refresh()
+            self._touch(key)
+            if alias:
+                self._aliases[alias] = key
+            self._evict(keep=key)
+            self._save_index()
+
+    def _touch(self, key: str) -> None:
+        """Kaydin boyutunu ve son kullanim zamanini gunceller"""
+        size = sum(
+            path.stat().st_size
+            for path in (self.directory / f"{key}.png", self.directory / f"{key}.json")
+            if path.exists()
+        )
+        self._entries[key] = {"size": size, "last_used": time.time()}
+
+    def _read_payload(self, key: str) -> Optional[Dict[str, Any]]:
+        """Sonucu okur; sonuc bir PNG'ye isaret ediyorsa PNG'nin varligini dogrular"""
+        try:
+            payload = json.loads((self.directory / f"{key}.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        plot_paths = (payload.get("visual_data") or {}).get("plot_paths") or {}
+        if plot_paths.get("png") and not (self.directory / f"{key}.png").exists():
+            return None
+        return payload
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """Bayt butcesi asilmissa en eski kullanilan kayitlari siler"""
+        total = sum(entry["size"] for entry in self._entries.values())
+        for key in sorted(self._entries, key=lambda name: self._entries[name]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= self._entries.pop(key)["size"]
+            for suffix in (".png", ".json"):
+                try:
+                    (self.directory / f"{key}{suffix}").unlink()
+                except FileNotFoundError:
+                    pass
+            self.evictions += 1
+        self._aliases = {alias: key for alias, key in self._aliases.items() if key in self._entries}
+
+    def _reconcile(self) -> None:
+        """Dosyalari silinmis kayitlari atar, indekste olmayan dosyalari benimser"""
+        for key in list(self._entries):
+            if not any((self.directory / f"{key}{suffix}").exists() for suffix in (".png", ".json")):
+                del self._entries[key]
+        for path in [*self.directory.glob("*.png"), *self.directory.glob("*.json")]:
+            if path.name == self.INDEX_NAME or path.stem in self._entries:
+                continue
+            files = [path.with_suffix(suffix) for suffix in (".png", ".json")]
+            self._entries[path.stem] = {
+                "size": sum(file.stat().st_size for file in files if file.exists()),
+                "last_used": path.stat().st_mtime,
+            }
+
+    def _load_index(self) -> None:
+        """Indeksi diskten okur (bozuksa bos baslar)"""
+        try:
+            self._index_mtime = self._index_path.stat().st_mtime_ns
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Plot cache index unreadable, rebuilding: {e}")
+            return
+        for key, entry in data.get("entries", {}).items():
+            current = self._entries.get(key)
+            if current is None or entry.get("last_used", 0) > current["last_used"]:
+                self._entries[key] = {"size": entry.get("size", 0), "last_used": entry.get("last_used", 0)}
+        self._aliases.update(data.get("aliases", {}))
+
+    def _refresh(self) -> None:
+        """Baska bir surec indeksi degistirdiyse kayitlari birlestirir"""
+        try:
+            mtime = self._index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime != self._index_mtime:
+            self._load_index()
+            self._reconcile()
+
+    def _save_index(self) -> None:
+        """Indeksi atomik olarak yazar"""
+        temporary = self._index_path.with_name(f"{self.INDEX_NAME}.{os.getpid()}.tmp")
+        temporary.write_text(
+            json.dumps({"entries": self._entries, "aliases": self._aliases}, sort_keys=True),
+            encoding="utf-8",
+        )
+        os.replace(temporary, self._index_path)
+        self._index_mtime = self._index_path.stat().st_mtime_ns
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache sayaclarini dondurur"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "bytes": sum(entry["size"] for entry in self._entries.values()),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,203 @@
+"""Record/replay cassette backend for reproducible LLM traffic"""
+
+import asyncio
+import gzip
+import json
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, IO, List, Optional
+
+from src.core.backends import LLMBackend
+from src.core.cache import ResponseCache
+from src.utils.exceptions import CassetteMissError, GeminiAPIError
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+CASSETTE_VERSION = 1
+
+
+def _open_cassette(path: Path, mode: str) -> IO[str]:
+    """Cassette dosyasini acar (.gz uzantisinda gzip ile)"""
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class CassetteBackend(LLMBackend):
+    """Prompt -> yanit ciftlerini kaydeden veya kayittan oynatan backend
+
+    Record modunda her cagri ic backend'e iletilir; yanit (veya hata),
+    toplam sure ve ilk parcaya kadar gecen sure JSON Lines olarak dosyaya
+    eklenir. Replay modunda ayni istek anahtari icin kayitlar sirayla
+    (dongusel) oynatilir; gecikme kayittaki sure veya sifir olabilir.
+    Anahtar normalize prompt ve generation config'ten uretilir.
+    """
+
+    name = "cassette"
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        inner: Optional[LLMBackend] = None,
+        latency_mode: str = "recorded"
+    ):
+        """Cassette backend'ini baslatir
+
+        Args:
+            path: Cassette dosya yolu (.jsonl veya .jsonl.gz)
+            mode: "record" veya "replay"
+            inner: Record modunda gercek cagrilari yapacak backend
+            latency_mode: Replay gecikmesi, "recorded" veya "zero"
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Bilinmeyen cassette modu: {mode}")
+        if mode == "record" and inner is None:
+            raise ValueError("Record modu icin ic backend gerekli")
+        if latency_mode not in ("recorded", "zero"):
+            raise ValueError(f"Bilinmeyen cassette gecikme modu: {latency_mode}")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.inner = inner
+        self.latency_mode = latency_mode
+        self.model_name = inner.model_name if inner else "cassette"
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._positions: Dict[str, int] = {}
+
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+
+        if mode == "replay":
+            self._load()
+
+    @staticmethod
+    def make_key(prompt: str, generation_config: Dict[str, Any]) -> str:
+        """Istek anahtari uretir (model adindan bagimsiz)"""
+        return ResponseCache.make_key("", generation_config, prompt)
+
+    def _load(self) -> None:
+        """Cassette dosyasini bellege yukler"""
+        if not self.path.exists():
+            raise FileNotFoundError(f"Cassette bulunamadi: {self.path}")
+
+        with _open_cassette(self.path, "r") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if "cassette" in entry:
+                    self.model_name = entry.get("model", self.model_name)
+                    continue
+                self._entries.setdefault(entry["key"], []).append(entry)
+
+        logger.info(f"Cassette yuklendi: {self.path} ({len(self._entries)} istek)")
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        """Kaydi dosyaya ekler (yeni dosyada once baslik yazilir)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not self.path.exists() or self.path.stat().st_size == 0
+        with _open_cassette(self.path, "a") as handle:
+            if is_new:
+                header = {"cassette": CASSETTE_VERSION, "model": self.model_name}
+                handle.write(json.dumps(header) + "\n")
+            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._entries.setdefault(entry["key"], []).append(entry)
+        self.recorded += 1
+
+    def _next_entry(self, prompt: str, generation_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Replay icin istegin siradaki kaydini dondurur"""
+        key = self.make_key(prompt, generation_config)
+        entries = self._entries.get(key)
+        if not entries:
+            self.misses += 1
+            raise CassetteMissError(f"Cassette'te kayit yok (anahtar {key[:12]})")
+
+        position = self._positions.get(key, 0)
+        self._positions[key] = position + 1
+        self.replayed += 1
+        return entries[position % len(entries)]
+
+    async def _sleep(self, seconds: float) -> None:
+        """Replay gecikmesini uygular"""
+        if self.latency_mode == "recorded" and seconds > 0:
+            await asyncio.sleep(seconds)
+
+    async def generate_text(
+        self,
+        prompt: str,
+        generation_config: Dict[str, Any]
+    ) -> str:
+        """Kaydederek veya kayittan yanit dondurur"""
+        if self.mode == "replay":
+            entry = self._next_entry(prompt, generation_config)
+            await self._sleep(entry.get("latency", 0.0))
+            if "error" in entry:
+                raise GeminiAPIError(entry["error"])
+            return entry["text"]
+
+        key = self.make_key(prompt, generation_config)
+        start = time.perf_counter()
+        try:
+            text = await self.inner.generate_text(prompt, generation_config)
+        except Exception as e:
+            self._append({"key": key, "error": str(e), "latency": time.perf_counter() - start})
+            raise
+        latency = time.perf_counter() - start
+        self._append({"key": key, "text": text, "latency": latency, "ttft": latency})
+        return text
+
+    async def stream_text(
+        self,
+        prompt: str,
+        generation_config: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """Kaydederek veya kayittan yaniti parca parca dondurur"""
+        if self.mode == "replay":
+            entry = self._next_entry(prompt, generation_config)
+            latency = entry.get("latency", 0.0)
+            ttft = entry.get("ttft", latency)
+            await self._sleep(ttft)
+            if "error" in entry:
+                raise GeminiAPIError(entry["error"])
+
+            text = entry["text"]
+            chunk_count = max(1, entry.get("chunks", 1))
+            chunk_size = max(1, -(-len(text) // chunk_count))
+            for i in range(0, len(text), chunk_size):
+                yield text[i:i + chunk_size]
+                await self._sleep((latency - ttft) / chunk_count)
+            return
+
+        key = self.make_key(prompt, generation_config)
+        start = time.perf_counter()
+        ttft: Optional[float] = None
+        chunks: List[str] = []
+        try:
+            async for chunk in self.inner.stream_text(prompt, generation_config):
+                if ttft is None:
+                    ttft = time.perf_counter() - start
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            self._append({"key": key, "error": str(e), "latency": time.perf_counter() - start})
+            raise
+        latency = time.perf_counter() - start
+        self._append({
+            "key": key,
+            "text": "".join(chunks),
+            "latency": latency,
+            "ttft": ttft if ttft is not None else latency,
+            "chunks": len(chunks),
+        })
+
+    def stats(self) -> Dict[str, Any]:
+        """Cassette sayaclarini dondurur"""
+        return {
+            "mode": self.mode,
+            "recorded": self.recorded,
+            "replayed": self.replayed,
+            "misses": self.misses,
+        }
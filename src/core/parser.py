@@ -104,7 +104,11 @@ class CommandParser:
         # Statistics keywords
         stats_keywords = [
             "mean", "median", "mode", "std", "variance", "average",
-            "ortalama", "medyan", "mod", "standart sapma", "varyans"
+            "ortalama", "medyan", "mod", "standart sapma", "varyans",
+            "percentile", "persentil", "yuzdelik", ".csv", ".tsv", ".npy",
+            "describe", "ozet", "özet", "korelasyon", "correlation", "kovaryans",
+            "covariance", "regresyon", "regression", "carpiklik", "çarpıklık",
+            "basiklik", "basıklık", "skewness", "kurtosis", "ceyrek", "çeyrek", "quartile"
         ]
         if any(keyword in text_lower for keyword in stats_keywords):
             return "statistics"
@@ -0,0 +1,310 @@
+"""Adaptive concurrency limiting and circuit breaking for backend calls"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Optional
+
+from src.utils.exceptions import CircuitOpenError
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD (additive increase / multiplicative decrease) eszamanlilik limiti
+
+    Her basarili cagri limiti 1/limit kadar artirir (yaklasik her tam
+    "pencere" basina +1); hata veya gecikme sicramasi (taban gecikmenin
+    `latency_tolerance` katini asan yanit) limiti `decrease_factor` ile
+    carpar. Ayni anda dusen bir grup hata limiti tek bir kez dusursun diye
+    azaltmalar en fazla taban gecikme basina bir kez yapilir. Limit dolunca
+    yeni cagrilar siraya girer.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: Optional[int] = None,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.1
+    ):
+        """Limiter'i baslatir
+
+        Args:
+            max_limit: Limitin ust siniri
+            min_limit: Limitin alt siniri
+            initial_limit: Baslangic limiti (None ise max_limit)
+            decrease_factor: Hata/gecikme sicramasinda limit carpani
+            latency_tolerance: Taban gecikmeye gore sicrama esigi (kat)
+            smoothing: Taban gecikme EWMA katsayisi
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = float(min(self.max_limit, initial_limit or self.max_limit))
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.baseline_latency: Optional[float] = None
+        self.in_flight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._last_decrease = 0.0
+
+        self.successes = 0
+        self.errors = 0
+        self.latency_spikes = 0
+        self.decreases = 0
+
+    def _wake(self) -> None:
+        """Limit izin verdigi kadar bekleyeni uyandirir"""
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    async def acquire(self) -> None:
+        """Limit altinda bir slot alir, gerekirse siraya girer"""
+        if not self._waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return
+
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot verildikten hemen sonra iptal edildi: slotu geri birak
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Slotu birakir ve siradakileri uyandirir"""
+        self.in_flight -= 1
+        self._wake()
+
+    def on_success(self, latency: float) -> None:
+        """Basarili cagriyi kaydeder; gecikme sicramasinda limiti dusurur"""
+        if self.baseline_latency is not None and latency > self.baseline_latency * self.latency_tolerance:
+            self.latency_spikes += 1
+            self._decrease("gecikme sicramasi")
+            return
+
+        self.successes += 1
+        if self.baseline_latency is None:
+            self.baseline_latency = latency
+        else:
+            self.baseline_latency += self.smoothing * (latency - self.baseline_latency)
+        self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+        self._wake()
+
+    def on_error(self) -> None:
+        """Hatali (veya zaman asimina ugrayan) cagriyi kaydeder ve limiti dusurur"""
+        self.errors += 1
+        self._decrease("hata")
+
+    def _decrease(self, reason: str) -> None:
+        """Limiti carpimsal olarak dusurur (taban gecikme basina en fazla bir kez)"""
+        now = time.monotonic()
+        if now - self._last_decrease < (self.baseline_latency or 0.0):
+            return
+        self._last_decrease = now
+        previous = int(self.limit)
+        self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+        self.decreases += 1
+        if int(self.limit) != previous:
+            logger.warning(f"Eszamanlilik limiti dusuruldu ({reason}): {previous} -> {int(self.limit)}")
+
+    @asynccontextmanager
+    async def slot(self, timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """Slot alir; cikista sonucu (basari/hata/gecikme) limite yansitir
+
+        Iptal edilen cagrilar (hedge kaybeden, deadline) sonucu etkilemez.
+
+        Args:
+            timeout: Slot icin bekleme limiti (saniye)
+
+        Raises:
+            asyncio.TimeoutError: Limit icinde slot alinamadi
+        """
+        await asyncio.wait_for(self.acquire(), timeout)
+        start = time.monotonic()
+        try:
+            yield
+        except Exception:
+            self.on_error()
+            raise
+        else:
+            self.on_success(time.monotonic() - start)
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Limit durumunu ve sayaclari dondurur"""
+        return {
+            "limit": int(self.limit),
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "queued": sum(1 for waiter in self._waiters if not waiter.done()),
+            "baseline_latency_ms": (self.baseline_latency or 0.0) * 1000,
+            "successes": self.successes,
+            "errors": self.errors,
+            "latency_spikes": self.latency_spikes,
+            "decreases": self.decreases,
+        }
+
+
+class CircuitBreaker:
+    """Ardisik hatalarda backend'i gecici olarak devre disi birakan sigorta
+
+    closed: cagrilar normal akar, ardisik hatalar sayilir.
+    open: `failure_threshold` ardisik hatadan sonra `recovery_timeout` boyunca
+        cagrilar beklemeden CircuitOpenError ile reddedilir.
+    half_open: sure dolunca en fazla `half_open_max_calls` deneme cagrisina
+        izin verilir; basarili olursa devre kapanir, hata olursa tekrar acilir.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        is_failure: Optional[Callable[[BaseException], bool]] = None
+    ):
+        """Sigortayi baslatir
+
+        Args:
+            failure_threshold: Devreyi acan ardisik hata sayisi
+            recovery_timeout: Acik kalma suresi (saniye)
+            half_open_max_calls: Yari acik durumda eszamanli deneme cagrisi
+            is_failure: Hatanin sigortaya sayilip sayilmayacagi (None ise hepsi)
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self.is_failure = is_failure or (lambda error: True)
+        self._state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._probes = 0
+
+        self.rejected = 0
+        self.opened = 0
+
+    @property
+    def state(self) -> str:
+        """Guncel durum (acik sure dolduysa half_open)"""
+        if self._state == self.OPEN and time.monotonic() - self.opened_at >= self.recovery_timeout:
+            self._transition(self.HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: str) -> None:
+        """Durum degistirir ve loglar"""
+        if state == self._state:
+            return
+        logger.warning(f"Circuit breaker: {self._state} -> {state}")
+        self._state = state
+        if state == self.OPEN:
+            self.opened += 1
+            self.opened_at = time.monotonic()
+        if state != self.HALF_OPEN:
+            self._probes = 0
+
+    def retry_in(self) -> float:
+        """Devrenin yeniden denenmesine kalan sure (saniye)"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.recovery_timeout - (time.monotonic() - self.opened_at))
+
+    def check(self) -> None:
+        """Devre aciksa beklemeden reddeder (deneme hakki tuketmez)
+
+        Raises:
+            CircuitOpenError: Devre acik
+        """
+        if self.state == self.OPEN:
+            self.rejected += 1
+            raise CircuitOpenError(
+                f"Backend gecici olarak devre disi ({self.retry_in():.1f}s sonra tekrar denenecek)"
+            )
+
+    def before_call(self) -> None:
+        """Cagriya izin verir veya CircuitOpenError ile reddeder
+
+        Raises:
+            CircuitOpenError: Devre acik veya deneme kotasi dolu
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return
+        if state == self.HALF_OPEN and self._probes < self.half_open_max_calls:
+            self._probes += 1
+            return
+        self.rejected += 1
+        raise CircuitOpenError(
+            f"Backend gecici olarak devre disi ({self.retry_in():.1f}s sonra tekrar denenecek)"
+        )
+
+    def record_success(self) -> None:
+        """Basarili cagriyi kaydeder"""
+        self.consecutive_failures = 0
+        if self._state == self.HALF_OPEN:
+            self._transition(self.CLOSED)
+
+    def record_failure(self, error: Optional[BaseException] = None) -> None:
+        """Hatali cagriyi kaydeder; esik asilirsa devreyi acar"""
+        if error is not None and not self.is_failure(error):
+            self.release_probe()
+            return
+        self.consecutive_failures += 1
+        if self._state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self._transition(self.OPEN)
+
+    def release_probe(self) -> None:
+        """Sonucsuz kalan (iptal/sayilmayan hata) deneme cagrisinin hakkini geri verir"""
+        if self._state == self.HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    @asynccontextmanager
+    async def guard(self, admitted: bool = False) -> AsyncIterator[None]:
+        """Cagriyi sigorta ile sarar
+
+        Args:
+            admitted: Cagriya `before_call` ile zaten izin verildi (slot
+                beklemeden once kabul edilen cagrilar icin)
+
+        Raises:
+            CircuitOpenError: Devre acik
+        """
+        if not admitted:
+            self.before_call()
+        try:
+            yield
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        except BaseException:
+            # Iptal / generator kapanisi: sonucsuz cagri
+            self.release_probe()
+            raise
+        else:
+            self.record_success()
+
+    def stats(self) -> Dict[str, Any]:
+        """Sigorta durumunu ve sayaclari dondurur"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+            "retry_in": round(self.retry_in(), 3),
+        }
@@ -0,0 +1,71 @@
+"""Single-flight coalescing of identical in-flight requests"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class _InFlightCall:
+    """Devam eden paylasimli cagri"""
+
+    def __init__(self, task: "asyncio.Future[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Ayni anahtarla eszamanli gelen cagrilari tek bir future'da birlestirir
+
+    Ilk gelen cagri isi baslatir, ayni anahtarla gelen digerleri ayni
+    sonucu bekler. Bekleyenlerden birinin iptal edilmesi paylasimli cagriyi
+    iptal etmez; cagri yalnizca tum bekleyenler ayrildiginda iptal edilir.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, _InFlightCall] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Anahtar icin devam eden cagriya katilir veya yenisini baslatir
+
+        Args:
+            key: Cagriyi tanimlayan anahtar
+            factory: Yeni cagri gerektiginde coroutine ureten fonksiyon
+
+        Returns:
+            Paylasimli cagrinin sonucu
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _InFlightCall(asyncio.ensure_future(factory()))
+            self._calls[key] = call
+            self.executions += 1
+            call.task.add_done_callback(
+                lambda task, k=key, c=call: self._forget(k, c, task)
+            )
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+
+    def _forget(self, key: str, call: _InFlightCall, task: "asyncio.Future[Any]") -> None:
+        """Tamamlanan cagriyi tablodan siler"""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        # Bekleyen kalmadiysa "exception was never retrieved" uyarisini engelle
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Birlestirme sayaclarini dondurur"""
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls),
+        }
@@ -0,0 +1,8 @@
+"""Local calculation engines for Calculator Agent"""
+
+from .arithmetic import ArithmeticEngine, safe_divide
+
+__all__ = [
+    "ArithmeticEngine",
+    "safe_divide",
+]
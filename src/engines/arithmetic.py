@@ -0,0 +1,451 @@
+"""Safe AST-whitelisted arithmetic evaluator"""
+
+import ast
+import math
+import re
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from src.utils.exceptions import (
+    CalculationError,
+    EvaluationLimitError,
+    UnsupportedExpressionError,
+)
+
+Number = Union[int, float]
+
+_TOKEN_RE = re.compile(
+    r"\s*(?:"
+    r"(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)"
+    r"|(?P<name>[A-Za-z_πτ][A-Za-z_0-9]*)"
+    r"|(?P<op>\*\*|//|[-+*/%^(),!√])"
+    r")"
+)
+
+# Unicode operatorlerin ASCII karsiliklari
+_SYMBOLS = {"×": "*", "·": "*", "÷": "/", "−": "-", "–": "-"}
+
+# Operator gosterimleri (adimlar icin)
+_OPERATOR_SYMBOLS = {
+    ast.Add: "+",
+    ast.Sub: "-",
+    ast.Mult: "*",
+    ast.Div: "/",
+    ast.FloorDiv: "//",
+    ast.Mod: "%",
+    ast.Pow: "^",
+}
+
+
+def safe_divide(a: Number, b: Number) -> float:
+    """Güvenli bölme işlemi
+
+    Args:
+        a: Bölünen
+        b: Bölen
+
+    Returns:
+        Bölüm sonucu
+
+    Raises:
+        CalculationError: Sifira bolme
+    """
+    if b == 0:
+        raise CalculationError("Sifira bolme hatasi")
+    return a / b
+
+
+def _cbrt(x: Number) -> float:
+    """Kup kok (negatif sayilar icin de)"""
+    return math.copysign(abs(x) ** (1.0 / 3.0), x)
+
+
+def _log(x: Number, base: Number = math.e) -> float:
+    """Logaritma (varsayilan dogal logaritma)"""
+    return math.log(x, base)
+
+
+class ArithmeticEngine:
+    """Temel matematik ifadelerini LLM'e gitmeden guvenli sekilde hesaplar
+
+    Ifade token'lara ayrilir (`^` us, `2x`/`2(3+4)` gibi ortuk carpma, `5!`
+    faktoriyel, `√` karekok desteklenir), Python AST'sine cevrilir ve
+    yalnizca izin verilen dugumler (sayi, bilinen sabitler, aritmetik
+    operatorler, beyaz listedeki fonksiyonlar) degerlendirilir. Us buyuklugu,
+    tamsayi bit uzunlugu, faktoriyel argumani ve ic ice derinlik sinirlidir;
+    `9^9^9` gibi girisler hesaplanmaya calisilmadan reddedilir.
+
+    Taninmayan kelime veya sozdizimi iceren girisler (dogal dil)
+    UnsupportedExpressionError ile LLM'e birakilir.
+    """
+
+    FUNCTIONS: Dict[str, Callable[..., Number]] = {
+        "sqrt": math.sqrt,
+        "cbrt": _cbrt,
+        "abs": abs,
+        "exp": math.exp,
+        "log": _log,
+        "ln": math.log,
+        "log10": math.log10,
+        "log2": math.log2,
+        "sin": math.sin,
+        "cos": math.cos,
+        "tan": math.tan,
+        "asin": math.asin,
+        "acos": math.acos,
+        "atan": math.atan,
+        "arcsin": math.asin,
+        "arccos": math.acos,
+        "arctan": math.atan,
+        "sinh": math.sinh,
+        "cosh": math.cosh,
+        "tanh": math.tanh,
+        "floor": math.floor,
+        "ceil": math.ceil,
+        "round": round,
+        "factorial": math.factorial,
+        "gcd": math.gcd,
+        "min": min,
+        "max": max,
+        "degrees": math.degrees,
+        "radians": math.radians,
+    }
+
+    CONSTANTS: Dict[str, float] = {
+        "pi": math.pi,
+        "π": math.pi,
+        "e": math.e,
+        "tau": math.tau,
+        "τ": math.tau,
+    }
+
+    def __init__(
+        self,
+        max_int_bits: int = 10000,
+        max_factorial: int = 1000,
+        max_depth: int = 200,
+        max_steps: int = 50
+    ):
+        """Motoru baslatir
+
+        Args:
+            max_int_bits: Ara/son tamsayi sonuclarin maksimum bit uzunlugu
+            max_factorial: Faktoriyel argumaninin ust siniri
+            max_depth: Maksimum ic ice parantez / AST derinligi
+            max_steps: Kaydedilecek maksimum cozum adimi
+        """
+        self.max_int_bits = max_int_bits
+        self.max_factorial = max_factorial
+        self.max_depth = max_depth
+        self.max_steps = max_steps
+
+    def evaluate(self, expression: str) -> Tuple[Number, List[str]]:
+        """Ifadeyi hesaplar
+
+        Args:
+            expression: Hesaplanacak ifade (ornek: "25 * 4 + 10", "2^10", "3sin(pi/2)")
+
+        Returns:
+            (sonuc, cozum adimlari) tuple'i
+
+        Raises:
+            UnsupportedExpressionError: Ifade yerel olarak ayristirilamadi
+            EvaluationLimitError: Us/derinlik/buyukluk limiti asildi
+            CalculationError: Sifira bolme veya tanim kumesi hatasi
+        """
+        source = self.to_python(expression)
+        try:
+            tree = ast.parse(source, mode="eval")
+        except (SyntaxError, ValueError, RecursionError):
+            raise UnsupportedExpressionError(f"Ifade ayristirilamadi: {expression}")
+
+        steps: List[str] = []
+        value = self._eval(tree.body, steps, 0)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise UnsupportedExpressionError(f"Sayisal olmayan sonuc: {expression}")
+        if isinstance(value, float) and not math.isfinite(value):
+            raise EvaluationLimitError("Sonuc sonlu bir sayi degil")
+
+        if len(steps) > self.max_steps:
+            steps = steps[:self.max_steps] + [f"... ({len(steps) - self.max_steps} adim daha)"]
+        steps.append(f"Sonuc: {self.format_number(value)}")
+        return value, steps
+
+    def to_python(self, expression: str) -> str:
+        """Ifadeyi Python sozdizimine cevirir (`^` -> `**`, ortuk carpma, `!`)
+
+        Raises:
+            UnsupportedExpressionError: Taninmayan karakter veya kelime
+        """
+        text = expression.strip()
+        for symbol, replacement in _SYMBOLS.items():
+            text = text.replace(symbol, replacement)
+
+        tokens: List[Tuple[str, str]] = []
+        pos = 0
+        text = text.rstrip()
+        while pos < len(text):
+            match = _TOKEN_RE.match(text, pos)
+            if not match or match.end() == pos:
+                raise UnsupportedExpressionError(f"Taninmayan karakter: {text[pos:pos + 10]!r}")
+            pos = match.end()
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == "name" and value not in self.FUNCTIONS and value not in self.CONSTANTS:
+                raise UnsupportedExpressionError(f"Taninmayan ifade: {value}")
+            tokens.append((kind, value))
+
+        if not tokens:
+            raise UnsupportedExpressionError("Bos ifade")
+
+        output: List[Tuple[str, str]] = []
+        depth = 0
+        # √16 gibi parantezsiz karekokte bir sonraki atomdan sonra ")" eklenir
+        close_after_atom = False
+        for index, (kind, value) in enumerate(tokens):
+            if value == "(":
+                depth += 1
+                if depth > self.max_depth:
+                    raise EvaluationLimitError("Ifade cok derin ic ice")
+            elif value == ")":
+                depth -= 1
+
+            if value == "!":
+                self._wrap_factorial(output)
+                continue
+
+            if value == "√":
+                if output and self._implicit_multiplication(output[-1], ("name", "sqrt")):
+                    output.append(("op", "*"))
+                output.append(("name", "sqrt"))
+                if index + 1 < len(tokens) and tokens[index + 1][1] != "(":
+                    output.append(("op", "("))
+                    close_after_atom = True
+                continue
+
+            if output and self._implicit_multiplication(output[-1], (kind, value)):
+                output.append(("op", "*"))
+            output.append((kind, "**" if value == "^" else value))
+
+            if close_after_atom and kind in ("number", "name"):
+                output.append(("op", ")"))
+                close_after_atom = False
+
+        if close_after_atom:
+            raise UnsupportedExpressionError(f"Ifade ayristirilamadi: {expression}")
+        return " ".join(value for _, value in output)
+
+    def _implicit_multiplication(self, previous: Tuple[str, str], current: Tuple[str, str]) -> bool:
+        """Iki token arasina ortuk `*` eklenmeli mi (2x, 2(3), (1)(2), 2pi)"""
+        prev_kind, prev_value = previous
+        kind, value = current
+        left_operand = (
+            prev_kind == "number"
+            or prev_value == ")"
+            or (prev_kind == "name" and prev_value in self.CONSTANTS)
+        )
+        right_operand = kind in ("number", "name") or value == "("
+        if prev_kind == "number" and kind == "number":
+            return False
+        return left_operand and right_operand
+
+    def _wrap_factorial(self, output: List[Tuple[str, str]]) -> None:
+        """Son operandi factorial(...) cagrisina sarar (postfix `!`)"""
+        if not output:
+            raise UnsupportedExpressionError("Faktoriyel icin operand yok")
+
+        if output[-1][1] == ")":
+            depth = 0
+            start = len(output) - 1
+            while start >= 0:
+                if output[start][1] == ")":
+                    depth += 1
+                elif output[start][1] == "(":
+                    depth -= 1
+                    if depth == 0:
+                        break
+                start -= 1
+            if start < 0:
+                raise UnsupportedExpressionError("Parantezler dengesiz")
+            if start > 0 and output[start - 1][1] in self.FUNCTIONS:
+                start -= 1
+        elif output[-1][0] in ("number", "name"):
+            start = len(output) - 1
+        else:
+            raise UnsupportedExpressionError("Faktoriyel icin operand yok")
+
+        operand = output[start:]
+        del output[start:]
+        output.extend([("name", "factorial"), ("op", "(")] + operand + [("op", ")")])
+
+    def _eval(self, node: ast.AST, steps: List[str], depth: int) -> Number:
+        """Izin verilen AST dugumlerini ozyinelemeli olarak degerlendirir"""
+        if depth > self.max_depth:
+            raise EvaluationLimitError("Ifade cok derin ic ice")
+
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+                raise UnsupportedExpressionError("Sayisal olmayan sabit")
+            return node.value
+
+        if isinstance(node, ast.Name):
+            if node.id in self.CONSTANTS:
+                return self.CONSTANTS[node.id]
+            raise UnsupportedExpressionError(f"Taninmayan ifade: {node.id}")
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+            operand = self._eval(node.operand, steps, depth + 1)
+            return -operand if isinstance(node.op, ast.USub) else operand
+
+        if isinstance(node, ast.BinOp) and type(node.op) in _OPERATOR_SYMBOLS:
+            left = self._eval(node.left, steps, depth + 1)
+            right = self._eval(node.right, steps, depth + 1)
+            result = self._apply(node.op, left, right)
+            steps.append(
+                f"{self.format_number(left)} {_OPERATOR_SYMBOLS[type(node.op)]} "
+                f"{self.format_number(right)} = {self.format_number(result)}"
+            )
+            return result
+
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in self.FUNCTIONS
+            and not node.keywords
+            and node.args
+        ):
+            args = [self._eval(arg, steps, depth + 1) for arg in node.args]
+            result = self._call(node.func.id, args)
+            rendered = ", ".join(self.format_number(arg) for arg in args)
+            steps.append(f"{node.func.id}({rendered}) = {self.format_number(result)}")
+            return result
+
+        raise UnsupportedExpressionError(f"Desteklenmeyen ifade: {type(node).__name__}")
+
+    def _apply(self, op: ast.operator, left: Number, right: Number) -> Number:
+        """Ikili operatoru limit kontrolleriyle uygular"""
+        try:
+            if isinstance(op, ast.Add):
+                result = left + right
+            elif isinstance(op, ast.Sub):
+                result = left - right
+            elif isinstance(op, ast.Mult):
+                result = self._multiply(left, right)
+            elif isinstance(op, ast.Div):
+                result = safe_divide(left, right)
+            elif isinstance(op, ast.FloorDiv):
+                if right == 0:
+                    raise CalculationError("Sifira bolme hatasi")
+                result = left // right
+            elif isinstance(op, ast.Mod):
+                if right == 0:
+                    raise CalculationError("Sifira bolme hatasi")
+                result = left % right
+            else:
+                result = self._power(left, right)
+        except OverflowError:
+            raise EvaluationLimitError("Sonuc cok buyuk")
+        return self._check(result)
+
+    def _multiply(self, left: Number, right: Number) -> Number:
+        """Carpma (tamsayi sonucun bit uzunlugu once tahmin edilir)"""
+        if isinstance(left, int) and isinstance(right, int):
+            if left.bit_length() + right.bit_length() > self.max_int_bits + 1:
+                raise EvaluationLimitError("Sonuc cok buyuk")
+        return left * right
+
+    def _power(self, base: Number, exponent: Number) -> Number:
+        """Us alma; sonuc buyuklugu hesaplanmadan once tahmin edilir"""
+        if isinstance(base, int) and isinstance(exponent, int):
+            if exponent < 0:
+                if base == 0:
+                    raise CalculationError("Sifira bolme hatasi")
+                return float(base) ** exponent
+            if abs(base) > 1 and exponent * (abs(base).bit_length() - 1) > self.max_int_bits:
+                raise EvaluationLimitError(
+                    f"Us cok buyuk: {self.format_number(base)}^{self.format_number(exponent)}"
+                )
+            return base ** exponent
+
+        if base == 0 and exponent < 0:
+            raise CalculationError("Sifira bolme hatasi")
+        if base < 0 and not float(exponent).is_integer():
+            raise CalculationError("Negatif sayinin kesirli kuvveti reel degil")
+        if abs(base) > 1 and abs(exponent) * math.log2(abs(base)) > 1024:
+            if exponent > 0:
+                raise EvaluationLimitError("Sonuc cok buyuk")
+            return 0.0
+        return math.pow(base, exponent)
+
+    def _call(self, name: str, args: List[Number]) -> Number:
+        """Beyaz listedeki fonksiyonu tanim kumesi kontrolleriyle cagirir"""
+        if name == "factorial":
+            if len(args) != 1:
+                raise CalculationError("factorial tek arguman alir")
+            value = args[0]
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
+            if not isinstance(value, int) or value < 0:
+                raise CalculationError("Faktoriyel yalnizca negatif olmayan tamsayilar icin tanimli")
+            if value > self.max_factorial:
+                raise EvaluationLimitError(f"Faktoriyel argumani cok buyuk (en fazla {self.max_factorial})")
+        if name == "gcd" and not all(isinstance(arg, int) for arg in args):
+            raise CalculationError("gcd yalnizca tamsayilar icin tanimli")
+
+        try:
+            result = self.FUNCTIONS[name](*args)
+        except TypeError:
+            raise CalculationError(f"{name} icin gecersiz arguman sayisi")
+        except ValueError:
+            raise CalculationError(f"{name} tanim kumesi disinda")
+        except ZeroDivisionError:
+            raise CalculationError("Sifira bolme hatasi")
+        except OverflowError:
+            raise EvaluationLimitError("Sonuc cok buyuk")
+        return self._check(result)
+
+    def _check(self, value: Number) -> Number:
+        """Ara sonucun buyukluk limitini kontrol eder"""
+        if isinstance(value, int) and value.bit_length() > self.max_int_bits:
+            raise EvaluationLimitError("Sonuc cok buyuk")
+        if isinstance(value, float) and math.isinf(value):
+            raise EvaluationLimitError("Sonuc cok buyuk")
+        return value
+
+    @staticmethod
+    def format_number(value: Number) -> str:
+        """Sayiyi adimlarda gosterilecek bicime cevirir"""
+        if isinstance(value, float):
+            if value.is_integer() and abs(value) < 1e16:
+                return str(int(value))
+            return f"{value:.15g}"
+        return str(value)
+
+    @staticmethod
+    def to_result(value: Number) -> Union[float, str]:
+        """Sonucu CalculationResult'a uygun tipe cevirir
+
+        Kayan nokta gurultusu (0.1 + 0.2) 15 anlamli basamakta temizlenir;
+        float'a sigmayan veya 2^53'ten buyuk tamsayilar tam basamaklariyla
+        string olarak dondurulur.
+        """
+        if isinstance(value, int):
+            if abs(value) <= 2 ** 53:
+                return value
+            return str(value)
+        return float(f"{value:.15g}")
+
+    def to_response(self, expression: str, domain: str = "basic_math") -> Dict[str, Any]:
+        """Ifadeyi hesaplayip Gemini yaniti formatinda dondurur
+
+        Raises:
+            UnsupportedExpressionError: Ifade yerel olarak ayristirilamadi
+        """
+        value, steps = self.evaluate(expression)
+        return {
+            "result": self.to_result(value),
+            "steps": steps,
+            "visualization_needed": False,
+            "domain": domain,
+            "confidence_score": 1.0,
+            "metadata": {"engine": "local"},
+        }
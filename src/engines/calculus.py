@@ -0,0 +1,569 @@
+"""SymPy-backed symbolic calculus engine"""
+
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from src.utils.exceptions import CalculationError, UnsupportedExpressionError
+
+_TURKISH_CHARS = str.maketrans("çğıöşüÇĞİÖŞÜ", "cgiosuCGIOSU")
+
+DERIVATIVE = "derivative"
+INTEGRAL = "integral"
+LIMIT = "limit"
+SERIES = "series"
+
+# Islem anahtar kelimeleri (CommandParser ile ayni EN/TR kelimeler); sira onemli
+_OPERATION_PATTERNS: List[Tuple[str, "re.Pattern[str]"]] = [
+    (SERIES, re.compile(r"\b(?:taylor|maclaurin|series|seri(?:si|sini)?|acilim(?:i|ini)?)\b")),
+    (LIMIT, re.compile(r"\b(?:limit(?:i|ini)?|lim)\b")),
+    (INTEGRAL, re.compile(r"\b(?:integral(?:i|ini)?|integrate|antiderivative)\b")),
+    (DERIVATIVE, re.compile(r"\b(?:derivative|differentiate|diff|turev(?:i|ini)?)\b|\bd/d[a-z]\b")),
+]
+
+_VALUE = r"[-+]?[\w.*/^()]+"
+_INFINITY_WORDS = {"oo": "oo", "inf": "oo", "infinity": "oo", "sonsuz": "oo", "sonsuza": "oo"}
+
+_FILLER_PATTERNS = [
+    r"\bd/d[a-z]\b",
+    r"\b(?:the|of|find|compute|calculate|evaluate|what|is|hesapla|bul|nedir|fonksiyonu(?:nun)?|ifadesi(?:nin)?)\b",
+    r"\b(?:first|birinci|second|2nd|ikinci|third|3rd|ucuncu|order|mertebe(?:den)?|derece(?:den)?)\b",
+    r"'(?:n?[iu]n|n?[iu]|n?[ae]|d[ae]|t[ae])\b",
+    r"[?:]",
+]
+
+
+class CalculusQuery(NamedTuple):
+    """Kullanici girdisinden cikarilan kalkulus islemi"""
+
+    operation: str
+    expression: str
+    variable: Optional[str] = None
+    point: Optional[str] = None
+    lower: Optional[str] = None
+    upper: Optional[str] = None
+    order: Optional[int] = None
+    direction: str = "+-"
+
+
+def _get_sympy():
+    """İlk çağrıda sympy import eder"""
+    if 'sympy' in globals():
+        return globals()['sympy']
+    import sympy
+    globals()['sympy'] = sympy
+    return sympy
+
+
+class CalculusEngine:
+    """Turev, integral, limit ve Taylor serisini SymPy ile yerel olarak hesaplar
+
+    Girdi once anahtar kelimelerle (EN/TR) bir CalculusQuery'ye ayrilir,
+    kalan ifade yalnizca beyaz listedeki fonksiyon/sabit ve tek harfli
+    degiskenlerden olusuyorsa SymPy ile parse edilir. Parse edilen ifadeler
+    ve hesaplanan yanitlar sinirli LRU cache'lerde tutulur; `sympify` ve
+    `integrate` pahali oldugu icin ayni ifade tekrar islenmez.
+
+    Taninmayan girisler ve SymPy'nin kapali formda cozemedigi islemler
+    UnsupportedExpressionError ile LLM'e birakilir.
+    """
+
+    FUNCTIONS = {
+        "sin", "cos", "tan", "cot", "sec", "csc", "asin", "acos", "atan",
+        "arcsin", "arccos", "arctan", "sinh", "cosh", "tanh", "exp", "log",
+        "ln", "sqrt", "abs",
+    }
+    CONSTANTS = {"pi", "e", "oo", "inf", "infinity"}
+
+    def __init__(self, cache_size: int = 512, default_series_order: int = 6, max_order: int = 20):
+        """Motoru baslatir
+
+        Args:
+            cache_size: Parse ve sonuc cache'lerinin maksimum eleman sayisi
+            default_series_order: Derece verilmezse Taylor serisi derecesi
+            max_order: Turev/seri derecesi ust siniri
+        """
+        self.cache_size = cache_size
+        self.default_series_order = default_series_order
+        self.max_order = max_order
+        self._parse_cached = lru_cache(maxsize=cache_size)(self._parse_expression)
+        # Ham girdi -> (sorgu, anahtar); tekrar eden girdide regex/parse atlanir
+        self._query_key_cached = lru_cache(maxsize=cache_size)(self._query_key)
+        self._results: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Girdi ayristirma
+    # ------------------------------------------------------------------
+
+    def parse_query(self, text: str) -> CalculusQuery:
+        """Kullanici girdisinden islem, ifade ve parametreleri cikarir
+
+        Args:
+            text: Kullanici girdisi (ornek: "derivative x^3 at x=2", "x^2 turevi")
+
+        Returns:
+            CalculusQuery
+
+        Raises:
+            UnsupportedExpressionError: Islem veya ifade taninmadi
+        """
+        t = text.translate(_TURKISH_CHARS).lower()
+        t = t.replace("→", "->").replace("∞", "oo").replace("∫", " integral ").replace("π", "pi")
+        # "f(x) = ..." / "y = ..." on ekleri nokta (x=2) ile karismasin
+        t = re.sub(r"^\s*(?:[fgy]\s*\(\s*[a-z]\s*\)|y)\s*=", " ", t)
+
+        operation = next((op for op, pattern in _OPERATION_PATTERNS if pattern.search(t)), None)
+        if operation is None:
+            raise UnsupportedExpressionError("Kalkulus islemi taninmadi")
+
+        params: Dict[str, Any] = {}
+
+        def take(pattern: str, flags: int = 0) -> Optional["re.Match[str]"]:
+            nonlocal t
+            match = re.search(pattern, t, flags)
+            if match:
+                t = t[:match.start()] + " " + t[match.end():]
+            return match
+
+        match = take(r"\bwith respect to\s+([a-z])\b") or take(r"\b([a-z])'?(?:y?[ae])\s+gore\b")
+        if match:
+            params["variable"] = match.group(1)
+        match = re.search(r"\bd/d([a-z])\b", t)
+        if match:
+            params.setdefault("variable", match.group(1))
+
+        if operation == LIMIT:
+            if take(r"\b(?:from the right|sagdan)\b"):
+                params["direction"] = "+"
+            elif take(r"\b(?:from the left|soldan)\b"):
+                params["direction"] = "-"
+            match = take(
+                rf"\b(?:as\s+)?([a-z])\s*(?:->|\bto\b|\btowards\b|\bapproaches\b)\s*({_VALUE}?)([+-])?(?=\s|$|,)"
+                rf"(?:\s*(?:iken|icin))?"
+            ) or take(rf"\b([a-z])\s+({_VALUE}?)'?(?:y?[ae])?\s+(?:giderken|yaklasirken)()")
+            if not match:
+                raise UnsupportedExpressionError("Limit noktasi bulunamadi")
+            params["variable"] = match.group(1)
+            params["point"] = _INFINITY_WORDS.get(match.group(2), match.group(2))
+            if match.group(3):
+                params["direction"] = match.group(3)
+
+        if operation == INTEGRAL:
+            match = (
+                take(rf"\bfrom\s+({_VALUE})\s+to\s+({_VALUE})")
+                or take(rf"\bbetween\s+({_VALUE})\s+and\s+({_VALUE})")
+                or take(rf"({_VALUE})\s+ile\s+({_VALUE})\s+arasinda(?:ki)?")
+                or take(r"([-+]?[\d.]+|pi|oo)'?(?:d[ae]n|t[ae]n)\s+([-+]?[\d.]+|pi|oo)'?(?:y?[ae])\b")
+            )
+            if match:
+                params["lower"] = _INFINITY_WORDS.get(match.group(1), match.group(1))
+                params["upper"] = _INFINITY_WORDS.get(match.group(2), match.group(2))
+            match = take(r"\bd([a-z])\s*$")
+            if match:
+                params.setdefault("variable", match.group(1))
+
+        if operation in (DERIVATIVE, SERIES):
+            match = (
+                take(r"\b(?:at|around|about|near)\s+([a-z])\s*=\s*([^\s,']+)")
+                or take(r"\b([a-z])\s*=\s*([^\s,']+)(?:'?\s*(?:(?:d[ae]|t[ae]|noktasinda|etrafinda|civarinda)(?:ki)?|icin)\b)?")
+            )
+            if match:
+                params.setdefault("variable", match.group(1))
+                params["point"] = match.group(2)
+            else:
+                match = take(r"\b(?:around|about|at)\s+([-+]?[\w.]+)")
+                if match:
+                    params["point"] = match.group(1)
+
+        if operation == DERIVATIVE:
+            for pattern, order in ((r"\b(?:second|2nd|ikinci)\b", 2), (r"\b(?:third|3rd|ucuncu)\b", 3)):
+                if re.search(pattern, t):
+                    params["order"] = order
+            match = take(r"\b(\d+)(?:st|nd|rd|th|\.)\s*(?:order\s+)?(?=derivative|turev)")
+            if match:
+                params["order"] = int(match.group(1))
+
+        if operation == SERIES:
+            match = (
+                take(r"\b(?:order|degree|derece(?:den)?|mertebe(?:den)?|terms?)\s*(\d+)")
+                or take(r"\b(\d+)\s*(?:\.|th)?\s*(?:order|dereceden|mertebeden|terim(?:li)?)\b")
+            )
+            if match:
+                params["order"] = int(match.group(1))
+
+        for _, pattern in _OPERATION_PATTERNS:
+            t = pattern.sub(" ", t)
+        for pattern in _FILLER_PATTERNS:
+            t = re.sub(pattern, " ", t)
+        expression = " ".join(t.split()).strip(" ,.;")
+
+        if not expression:
+            raise UnsupportedExpressionError("Kalkulus ifadesi bulunamadi")
+        order = params.get("order")
+        if order is not None and not 0 < order <= self.max_order:
+            raise CalculationError(f"Derece 1 ile {self.max_order} arasinda olmali")
+
+        return CalculusQuery(operation=operation, expression=expression, **params)
+
+    def _check_tokens(self, text: str) -> None:
+        """Ifadede yalnizca izin verilen karakter ve isimler oldugunu dogrular"""
+        if not re.fullmatch(r"[0-9a-z\s+\-*/^().,]*", text):
+            raise UnsupportedExpressionError(f"Desteklenmeyen karakter: {text}")
+        if re.search(r"[a-z)]\s*\.|\.\s*[a-z(]", text):
+            raise UnsupportedExpressionError(f"Desteklenmeyen ifade: {text}")
+        for name in re.findall(r"[a-z]+", text):
+            if len(name) > 1 and name not in self.FUNCTIONS and name not in self.CONSTANTS:
+                raise UnsupportedExpressionError(f"Taninmayan ifade: {name}")
+
+    def _parse_expression(self, text: str) -> Any:
+        """Metni SymPy ifadesine cevirir (lru_cache ile sarilir)"""
+        sympy = _get_sympy()
+        from sympy.parsing.sympy_parser import (
+            convert_xor,
+            implicit_multiplication_application,
+            parse_expr,
+            standard_transformations,
+        )
+
+        self._check_tokens(text)
+        local_dict: Dict[str, Any] = {
+            letter: sympy.Symbol(letter) for letter in "abcdfghjklmnopqrstuvwxyz"
+        }
+        local_dict.update({
+            "e": sympy.E,
+            "pi": sympy.pi,
+            "oo": sympy.oo,
+            "inf": sympy.oo,
+            "infinity": sympy.oo,
+            "ln": sympy.log,
+            "arcsin": sympy.asin,
+            "arccos": sympy.acos,
+            "arctan": sympy.atan,
+            "abs": sympy.Abs,
+        })
+        try:
+            return parse_expr(
+                text,
+                local_dict=local_dict,
+                transformations=standard_transformations + (implicit_multiplication_application, convert_xor),
+            )
+        except Exception:
+            raise UnsupportedExpressionError(f"Ifade ayristirilamadi: {text}")
+
+    def parse_expression(self, text: str) -> Any:
+        """Metni cache'li olarak SymPy ifadesine cevirir
+
+        Raises:
+            UnsupportedExpressionError: Ifade ayristirilamadi
+        """
+        return self._parse_cached(text.strip())
+
+    # ------------------------------------------------------------------
+    # Hesaplama
+    # ------------------------------------------------------------------
+
+    def solve(self, text: str) -> Dict[str, Any]:
+        """Girdiyi hesaplayip Gemini yaniti formatinda dondurur
+
+        Args:
+            text: Kullanici girdisi
+
+        Returns:
+            result, steps, confidence_score ve metadata iceren dict
+
+        Raises:
+            UnsupportedExpressionError: Girdi veya islem yerel olarak cozulemedi
+            CalculationError: Tanimsiz sonuc veya gecersiz parametre
+        """
+        query, key = self._query_key_cached(text)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        expr, variable = key[1], key[2]
+
+        handler = {
+            DERIVATIVE: self._derivative,
+            INTEGRAL: self._integral,
+            LIMIT: self._limit,
+            SERIES: self._series,
+        }[query.operation]
+        value, exact, steps = handler(expr, variable, key[3], key[4], key[5], query.order, query.direction)
+
+        response = {
+            "result": value,
+            "steps": steps,
+            "visualization_needed": False,
+            "domain": "calculus",
+            "confidence_score": 1.0,
+            "metadata": {"engine": "local", "operation": query.operation, "exact": exact},
+        }
+        with self._lock:
+            self._results[key] = response
+            while len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+        return _copy_response(response)
+
+    def lookup(self, text: str) -> Optional[Dict[str, Any]]:
+        """Girdi icin cache'te hazir yanit varsa hesaplama yapmadan dondurur
+
+        Returns:
+            Cache'teki yanitin kopyasi veya None (girdi taninmasa da None)
+        """
+        try:
+            _, key = self._query_key_cached(text)
+        except CalculationError:
+            return None
+        return self._lookup(key, count_miss=False)
+
+    def _query_key(self, text: str) -> Tuple[CalculusQuery, Tuple[Any, ...]]:
+        """Girdiyi ayristirir ve sonuc cache anahtarini uretir
+
+        Anahtar parse edilmis SymPy ifadesinden uretilir; "x^2" ve "x**2"
+        ayni sonucu paylasir.
+        """
+        query = self.parse_query(text)
+        expr = self.parse_expression(query.expression)
+        _check_defined(expr)
+        key = (
+            query.operation,
+            expr,
+            self._variable(expr, query.variable),
+            self._parse_value(query.point),
+            self._parse_value(query.lower),
+            self._parse_value(query.upper),
+            query.order,
+            query.direction,
+        )
+        return query, key
+
+    def _lookup(self, key: Tuple[Any, ...], count_miss: bool = True) -> Optional[Dict[str, Any]]:
+        """Sonuc cache'inden okur (LRU sirasini gunceller)"""
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is None:
+                if count_miss:
+                    self.misses += 1
+                return None
+            self._results.move_to_end(key)
+            self.hits += 1
+            return _copy_response(cached)
+
+    def _variable(self, expr: Any, name: Optional[str]) -> Any:
+        """Islem degiskenini secer (verilmediyse x, yoksa tek serbest sembol)"""
+        sympy = _get_sympy()
+        if name:
+            return sympy.Symbol(name)
+        symbols = sorted(expr.free_symbols, key=lambda symbol: symbol.name)
+        if not symbols or sympy.Symbol("x") in expr.free_symbols:
+            return sympy.Symbol("x")
+        if len(symbols) == 1:
+            return symbols[0]
+        raise UnsupportedExpressionError("Degisken belirsiz (ornek: 'with respect to y')")
+
+    def _parse_value(self, text: Optional[str]) -> Any:
+        """Nokta/sinir degerini sayisal SymPy ifadesine cevirir"""
+        if text is None:
+            return None
+        value = self.parse_expression(text)
+        if value.free_symbols:
+            raise UnsupportedExpressionError(f"Sayisal olmayan deger: {text}")
+        _check_defined(value)
+        return value
+
+    def _derivative(self, expr, variable, point, lower, upper, order, direction):
+        """Turev (istenirse bir noktada degeri)"""
+        sympy = _get_sympy()
+        order = order or 1
+        name = "f" + "'" * order if order <= 3 else f"f^({order})"
+        steps = [f"f({variable}) = {_show(expr)}"]
+        steps.extend(_derivative_rules(expr, variable))
+
+        derivative = expr
+        for k in range(1, order + 1):
+            derivative = sympy.diff(derivative, variable)
+            if order > 1:
+                steps.append(f"{k}. turev: {_show(derivative)}")
+        simplified = _tidy(derivative)
+        steps.append(f"{name}({variable}) = {_show(simplified)}")
+
+        if point is None:
+            return _as_result(simplified), _show(simplified), steps
+
+        value = _tidy(simplified.subs(variable, point))
+        if value.has(sympy.zoo, sympy.nan, sympy.oo, -sympy.oo):
+            raise CalculationError(f"{name}({_show(point)}) tanimsiz (turev bu noktada yok)")
+        steps.append(f"{name}({_show(point)}) = {_show(value)}{_approx(value)}")
+        return _as_result(value), _show(value), steps
+
+    def _integral(self, expr, variable, point, lower, upper, order, direction):
+        """Belirsiz veya belirli integral"""
+        sympy = _get_sympy()
+        steps = [f"f({variable}) = {_show(expr)}"]
+        if isinstance(expr, sympy.Add):
+            steps.append("Toplam kurali: her terimin integrali ayri alinir")
+            for term in expr.args:
+                term_integral = sympy.integrate(term, variable)
+                if term_integral.has(sympy.Integral):
+                    raise UnsupportedExpressionError("Kapali formda integral bulunamadi")
+                steps.append(f"∫ {_show(term)} d{variable} = {_show(term_integral)}")
+
+        antiderivative = sympy.integrate(expr, variable)
+        if antiderivative.has(sympy.Integral):
+            raise UnsupportedExpressionError("Kapali formda integral bulunamadi")
+        steps.append(f"F({variable}) = ∫ {_show(expr)} d{variable} = {_show(antiderivative)} + C")
+
+        if lower is None or upper is None:
+            return _show(antiderivative) + " + C", _show(antiderivative) + " + C", steps
+
+        value = sympy.integrate(expr, (variable, lower, upper))
+        if value.has(sympy.Integral):
+            raise UnsupportedExpressionError("Belirli integral kapali formda bulunamadi")
+        value = _tidy(value)
+        if value.has(sympy.nan):
+            raise CalculationError("Integral tanimsiz")
+        steps.append(
+            f"F({_show(upper)}) - F({_show(lower)}) = {_show(value)}{_approx(value)}"
+        )
+        return _as_result(value), _show(value), steps
+
+    def _limit(self, expr, variable, point, lower, upper, order, direction):
+        """Limit (dogrudan yerine koyma, olmazsa SymPy limit algoritmasi)"""
+        sympy = _get_sympy()
+        side = {"+": " (sagdan)", "-": " (soldan)"}.get(direction, "")
+        steps = [f"lim {variable}->{_show(point)}{side} {_show(expr)}"]
+
+        if point.is_finite:
+            direct = _tidy(expr.subs(variable, point))
+            if direct.is_finite and direct.is_number and not direct.has(sympy.nan, sympy.zoo):
+                steps.append(f"Dogrudan yerine koyma: {_show(direct)}{_approx(direct)}")
+                return _as_result(direct), _show(direct), steps
+            steps.append("Dogrudan yerine koyma belirsiz form veriyor (0/0, ∞/∞ vb.)")
+
+        try:
+            if point.is_finite:
+                value = sympy.limit(expr, variable, point, direction)
+            else:
+                value = sympy.limit(expr, variable, point)
+        except ValueError:
+            # SymPy iki yonlu limitte sol/sag limitler farkliysa ValueError verir
+            raise CalculationError("Limit yok (sol ve sag limitler farkli)")
+        if isinstance(value, sympy.Limit) or value.has(sympy.nan):
+            raise UnsupportedExpressionError("Limit kapali formda bulunamadi")
+        if value.has(sympy.zoo):
+            raise CalculationError("Limit yok (sol ve sag limitler farkli sonsuzluklara gidiyor)")
+        if isinstance(value, sympy.AccumBounds):
+            raise CalculationError("Limit yok (deger salinimli)")
+        value = _tidy(value)
+        steps.append(f"Limit degeri: {_show(value)}{_approx(value)}")
+        return _as_result(value), _show(value), steps
+
+    def _series(self, expr, variable, point, lower, upper, order, direction):
+        """Taylor serisi (point etrafinda, order dereceye kadar)"""
+        sympy = _get_sympy()
+        center = point if point is not None else sympy.Integer(0)
+        order = order or self.default_series_order
+        if not center.is_finite:
+            raise UnsupportedExpressionError("Sonsuz etrafinda seri desteklenmiyor")
+
+        steps = [
+            f"f({variable}) = {_show(expr)}, {variable} = {_show(center)} etrafinda {order}. dereceye kadar",
+            f"Taylor formulu: sum f^(k)({_show(center)}) / k! * ({variable} - {_show(center)})^k",
+        ]
+        derivative = expr
+        for k in range(order + 1):
+            coefficient = _tidy(derivative.subs(variable, center))
+            if not coefficient.is_finite:
+                raise UnsupportedExpressionError("Fonksiyon merkezde analitik degil")
+            steps.append(f"f^({k})({_show(center)}) = {_show(coefficient)}")
+            derivative = sympy.diff(derivative, variable)
+
+        series = sympy.series(expr, variable, center, order + 1).removeO()
+        steps.append(f"Seri: {_show(series)}")
+        return _show(series), _show(series), steps
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache sayaclarini dondurur"""
+        parse_info = self._parse_cached.cache_info()
+        query_info = self._query_key_cached.cache_info()
+        return {
+            "query_cache": {"hits": query_info.hits, "misses": query_info.misses, "size": query_info.currsize},
+            "parse_cache": {"hits": parse_info.hits, "misses": parse_info.misses, "size": parse_info.currsize},
+            "result_cache": {"hits": self.hits, "misses": self.misses, "size": len(self._results)},
+        }
+
+
+def _copy_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Cache'teki yanitin cagirana verilecek kopyasi"""
+    return {
+        **response,
+        "steps": list(response["steps"]),
+        "metadata": dict(response["metadata"]),
+    }
+
+
+def _check_defined(expr: Any) -> None:
+    """Ayristirilan ifade tanimsiz deger (1/0 -> zoo, 0/0 -> nan) iceriyorsa hata verir"""
+    sympy = _get_sympy()
+    if expr.has(sympy.zoo, sympy.nan):
+        raise CalculationError("Ifade tanimsiz (sifira bolme veya belirsiz form)")
+
+
+def _show(expr: Any) -> str:
+    """SymPy ifadesini kullanici gosterimine cevirir (** -> ^)"""
+    sympy = _get_sympy()
+    return re.sub(r"(?<![a-z])oo\b", "∞", sympy.sstr(expr).replace("**", "^"))
+
+
+def _tidy(expr: Any) -> Any:
+    """Ucuz sadelestirme (tam simplify yerine; throughput icin)"""
+    sympy = _get_sympy()
+    if expr.is_number:
+        return expr if expr.is_Float else sympy.simplify(expr)
+    if sympy.count_ops(expr) <= 40:
+        return sympy.cancel(expr) if expr.is_rational_function() else sympy.powsimp(expr)
+    return expr
+
+
+def _approx(value: Any) -> str:
+    """Tam sayi olmayan sayisal degerler icin yaklasik degeri ekler"""
+    if value.is_number and not value.is_Integer and value.is_finite and value.is_real:
+        return f" ≈ {float(value.evalf()):.10g}"
+    return ""
+
+
+def _as_result(value: Any) -> Any:
+    """Sonucu CalculationResult'a uygun tipe cevirir (sayisal ise float)"""
+    if value.is_number and value.is_finite and value.is_real:
+        return float(value.evalf())
+    return _show(value)
+
+
+def _derivative_rules(expr: Any, variable: Any) -> List[str]:
+    """Ifadenin ust yapisina gore uygulanan turev kuralini aciklar"""
+    sympy = _get_sympy()
+    if isinstance(expr, sympy.Add):
+        steps = ["Toplam kurali: her terimin turevi ayri alinir"]
+        for term in expr.args:
+            steps.append(f"d/d{variable} [{_show(term)}] = {_show(sympy.diff(term, variable))}")
+        return steps
+    if isinstance(expr, sympy.Mul):
+        factors = [arg for arg in expr.args if arg.has(variable)]
+        if len(factors) >= 2:
+            return ["Carpim kurali: (uv)' = u'v + uv'"]
+        return ["Sabit carpan kurali: sabit disari alinir"]
+    if isinstance(expr, sympy.Pow):
+        base, exponent = expr.args
+        if not exponent.has(variable):
+            rule = f"Kuvvet kurali: d/d{variable} [u^n] = n*u^(n-1)*u'"
+            if base != variable:
+                rule += " (zincir kurali ile)"
+            return [rule]
+        return ["Us fonksiyonu: d/dx [a^u] = a^u * ln(a) * u'"]
+    if isinstance(expr, sympy.Function) and expr.args and expr.args[0] != variable:
+        return ["Zincir kurali: d/dx f(g(x)) = f'(g(x)) * g'(x)"]
+    return []
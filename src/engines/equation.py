@@ -0,0 +1,542 @@
+"""Local polynomial and nonlinear equation solver"""
+
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from src.engines.calculus import CalculusEngine, _copy_response, _get_sympy, _show
+from src.utils.exceptions import CalculationError, UnsupportedExpressionError
+
+_TURKISH_CHARS = str.maketrans("çğıöşüÇĞİÖŞÜ", "cgiosuCGIOSU")
+
+_NUMBER = r"[-+]?(?:\d+(?:\.\d*)?|\.\d+|pi)"
+# Arama araligi: "in [0, 5]", "between 0 and 5", "0 ile 5 arasinda"
+_INTERVAL_PATTERNS = [
+    rf"\b(?:for\s+[a-z]\s+)?(?:in|on|over)\s*[\[(]\s*({_NUMBER})\s*,\s*({_NUMBER})\s*[\])]",
+    rf"\bbetween\s+({_NUMBER})\s+and\s+({_NUMBER})",
+    rf"[\[(]\s*({_NUMBER})\s*,\s*({_NUMBER})\s*[\])]\s*(?:araliginda|icin)",
+    rf"({_NUMBER})\s+ile\s+({_NUMBER})\s+arasinda(?:ki)?",
+]
+_FILLER_PATTERNS = [
+    r"\b(?:solve|find|the|roots?|zeros?|of|for|equation|what|is|are|real|solutions?)\b",
+    r"\b(?:coz(?:un|unuz)?|denklem(?:i|ini|inin)?|kok(?:u|leri|lerini)?|bul|hesapla|nedir|cozum(?:u|leri)?)\b",
+    r"'(?:n?[iu]n|n?[iu]|n?[ae]|d[ae]|t[ae])\b",
+    r"[?:;]",
+]
+
+
+class Equation(NamedTuple):
+    """Kullanici girdisinden cikarilan denklem"""
+
+    left: str
+    right: str
+    lower: Optional[str] = None
+    upper: Optional[str] = None
+
+
+class EquationEngine:
+    """Tek degiskenli denklemleri ag cagrisi yapmadan cozer
+
+    Katmanlar:
+        1. Sembolik: derecesi <= 4 olan ve kokleri rasyonel/kuadratik
+           carpanlardan bulunabilen polinomlar (rasyonel denklemlerde pay)
+           SymPy `roots` ile tam cozulur.
+        2. Polinom: her dereceden polinomun kokleri companion matrisin
+           ozdegerleri olarak (NumPy) bulunur, vektorize Newton adimiyla
+           iyilestirilir.
+        3. Transandantal: fonksiyon aralik uzerinde vektorize orneklenir,
+           isaret degisimi olan tum araliklar ayni anda (NumPy dizileriyle)
+           ikiye bolme ile daraltilir; isaret degistirmeyen (teget) kokler
+           icin yerel minimumlardan Newton baslatilir.
+
+    Her kok denkleme geri konularak dogrulanir; dogrulanamayan adaylar
+    (ornek: tan(x)'in kutuplari) atilir. Ifade ayristirma kalkulus
+    motorunun beyaz listeli parser'ini kullanir.
+    """
+
+    def __init__(
+        self,
+        cache_size: int = 512,
+        search_range: float = 10.0,
+        samples: int = 4001,
+        max_degree: int = 500
+    ):
+        """Motoru baslatir
+
+        Args:
+            cache_size: Sonuc cache'inin maksimum eleman sayisi
+            search_range: Aralik verilmezse sayisal aramanin yaricapi
+            samples: Sayisal aramada aralik basina ornek sayisi
+            max_degree: Companion matris yontemi icin en buyuk derece
+        """
+        self.cache_size = cache_size
+        self.search_range = search_range
+        self.samples = samples
+        self.max_degree = max_degree
+        self.parser = CalculusEngine(cache_size=cache_size)
+        self._query_key_cached = lru_cache(maxsize=cache_size)(self._query_key)
+        self._results: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Girdi ayristirma
+    # ------------------------------------------------------------------
+
+    def parse_equation(self, text: str) -> Equation:
+        """Girdiden denklemin iki tarafini ve arama araligini cikarir
+
+        Args:
+            text: Kullanici girdisi (ornek: "solve x^2 - 4 = 0", "sin(x) = x/2 between 0 and 5")
+
+        Returns:
+            Equation
+
+        Raises:
+            UnsupportedExpressionError: Denklem taninmadi
+        """
+        t = text.translate(_TURKISH_CHARS).lower()
+        t = t.replace("π", "pi").replace("−", "-").replace("==", "=")
+
+        lower = upper = None
+        for pattern in _INTERVAL_PATTERNS:
+            match = re.search(pattern, t)
+            if match:
+                lower, upper = match.group(1), match.group(2)
+                t = t[:match.start()] + " " + t[match.end():]
+                break
+
+        for pattern in _FILLER_PATTERNS:
+            t = re.sub(pattern, " ", t)
+        t = " ".join(t.split()).strip(" ,.")
+
+        sides = t.split("=")
+        if len(sides) > 2 or "," in t:
+            raise UnsupportedExpressionError("Tek denklem bekleniyor (sistemler desteklenmiyor)")
+        left, right = (sides[0], sides[1]) if len(sides) == 2 else (sides[0], "0")
+        if not left.strip() or not right.strip():
+            raise UnsupportedExpressionError("Denklem bulunamadi")
+        return Equation(left.strip(), right.strip(), lower, upper)
+
+    def _query_key(self, text: str) -> Tuple[Any, ...]:
+        """Girdiyi ayristirir ve sonuc cache anahtarini uretir (f, degisken, aralik)"""
+        sympy = _get_sympy()
+        equation = self.parse_equation(text)
+        expr = self.parser.parse_expression(equation.left) - self.parser.parse_expression(equation.right)
+
+        symbols = sorted(expr.free_symbols, key=lambda symbol: symbol.name)
+        if len(symbols) > 1:
+            raise UnsupportedExpressionError("Birden fazla bilinmeyen desteklenmiyor")
+        variable = symbols[0] if symbols else sympy.Symbol("x")
+
+        interval = None
+        if equation.lower is not None:
+            lower = float(self.parser.parse_expression(equation.lower))
+            upper = float(self.parser.parse_expression(equation.upper))
+            if not lower < upper:
+                raise CalculationError("Arama araliginin alt siniri ust sinirdan kucuk olmali")
+            interval = (lower, upper)
+        return expr, variable, interval
+
+    # ------------------------------------------------------------------
+    # Hesaplama
+    # ------------------------------------------------------------------
+
+    def solve(self, text: str) -> Dict[str, Any]:
+        """Denklemi cozup Gemini yaniti formatinda dondurur
+
+        Args:
+            text: Kullanici girdisi
+
+        Returns:
+            result, steps, confidence_score ve metadata iceren dict
+
+        Raises:
+            UnsupportedExpressionError: Denklem yerel olarak cozulemedi
+            CalculationError: Gecersiz parametre
+        """
+        key = self._query_key_cached(text)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        expr, variable, interval = key
+
+        sympy = _get_sympy()
+        steps = [f"Denklem f({variable}) = 0 formuna getirildi: {_show(expr)} = 0"]
+        numerator, denominator = sympy.fraction(sympy.together(expr))
+        try:
+            poly = sympy.Poly(numerator, variable)
+            polynomial = all(coefficient.is_number for coefficient in poly.all_coeffs())
+        except sympy.PolynomialError:
+            polynomial = False
+
+        if polynomial:
+            if denominator.has(variable):
+                steps.append(f"Payda {_show(denominator)} ≠ 0 olmali; pay sifira esitlendi: {_show(numerator)} = 0")
+            roots, method, exact = self._polynomial_roots(poly, variable, steps)
+            roots = self._exclude_poles(roots, denominator, variable, steps)
+            if interval:
+                roots = [root for root in roots if root[0].imag == 0 and interval[0] <= root[0].real <= interval[1]]
+                steps.append(f"[{interval[0]:g}, {interval[1]:g}] araligindaki reel kokler secildi")
+        else:
+            roots, method, exact = self._numeric_roots(expr, variable, interval, steps)
+
+        real = sorted((root for root in roots if root[0].imag == 0), key=lambda root: root[0].real)
+        complex_roots = sorted(
+            (root for root in roots if root[0].imag != 0), key=lambda root: (root[0].real, -root[0].imag)
+        )
+        shown = [_root_text(root) for root in real + complex_roots]
+        if shown:
+            steps.append("Kokler: " + ", ".join(f"{variable} = {text}" for text in shown))
+        else:
+            steps.append("Denklemin (reel) cozumu yok")
+
+        if complex_roots:
+            result: Any = {
+                "real": [_clean(root[0].real) for root in real],
+                "complex": [_root_text(root, with_multiplicity=False) for root in complex_roots],
+            }
+        else:
+            result = [_clean(root[0].real) for root in real]
+
+        response = {
+            "result": result,
+            "steps": steps,
+            "visualization_needed": False,
+            "domain": "equation_solver",
+            "confidence_score": 1.0,
+            "metadata": {
+                "engine": "local",
+                "method": method,
+                "exact": exact,
+                "verified": True,
+                **({"interval": list(interval)} if interval else {}),
+            },
+        }
+        with self._lock:
+            self._results[key] = response
+            while len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+        return _copy_response(response)
+
+    def lookup(self, text: str) -> Optional[Dict[str, Any]]:
+        """Girdi icin cache'te hazir yanit varsa hesaplama yapmadan dondurur
+
+        Returns:
+            Cache'teki yanitin kopyasi veya None (girdi taninmasa da None)
+        """
+        try:
+            key = self._query_key_cached(text)
+        except CalculationError:
+            return None
+        return self._lookup(key, count_miss=False)
+
+    def _lookup(self, key: Tuple[Any, ...], count_miss: bool = True) -> Optional[Dict[str, Any]]:
+        """Sonuc cache'inden okur (LRU sirasini gunceller)"""
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is None:
+                if count_miss:
+                    self.misses += 1
+                return None
+            self._results.move_to_end(key)
+            self.hits += 1
+            return _copy_response(cached)
+
+    # ------------------------------------------------------------------
+    # Polinomlar
+    # ------------------------------------------------------------------
+
+    def _polynomial_roots(self, poly: Any, variable: Any, steps: List[str]) -> Tuple[List["Root"], str, bool]:
+        """Polinom koklerini bulur (sembolik, olmazsa companion matris)"""
+        sympy = _get_sympy()
+        degree = poly.degree()
+        if degree <= 0:
+            if poly.is_zero:
+                raise UnsupportedExpressionError("Denklem her deger icin saglaniyor (ozdeslik)")
+            steps.append(f"Sabit denklem: {_show(poly.as_expr())} = 0 saglanamaz")
+            return [], "symbolic", True
+
+        coefficients = poly.all_coeffs()
+        steps.append(f"{degree}. dereceden polinom, katsayilar: [{', '.join(_show(c) for c in coefficients)}]")
+
+        rational = all(coefficient.is_Rational for coefficient in coefficients)
+        if degree <= 2 or (degree <= 4 and rational):
+            if degree == 2:
+                a, b, c = coefficients
+                discriminant = sympy.simplify(b ** 2 - 4 * a * c)
+                steps.append(f"Diskriminant: Δ = b^2 - 4ac = {_show(discriminant)}")
+                steps.append(f"Kok formulu: {variable} = (-b ± √Δ) / 2a")
+            elif degree == 1:
+                a, b = coefficients
+                steps.append(f"Dogrusal denklem: {variable} = -b / a = {_show(-b / a)}")
+            roots = sympy.roots(poly, cubics=False, quartics=False)
+            if sum(roots.values()) == degree:
+                verified = []
+                for root, multiplicity in roots.items():
+                    if sympy.expand(poly.as_expr().subs(variable, root)) != 0:
+                        break
+                    verified.append(Root(complex(root.evalf()), multiplicity, _show(root).replace("*I", "i").replace("I", "i")))
+                else:
+                    steps.append(f"Dogrulama: {len(verified)} kok denklemde yerine konuldu, f = 0 ✓")
+                    return verified, "symbolic", True
+
+        if degree > self.max_degree:
+            raise UnsupportedExpressionError(f"Polinom derecesi cok yuksek ({degree})")
+        values = np.array([complex(coefficient) for coefficient in coefficients])
+        return self._companion_roots(values, steps), "companion_matrix", False
+
+    @staticmethod
+    def _companion_roots(coefficients: np.ndarray, steps: List[str]) -> List["Root"]:
+        """Companion matrisin ozdegerlerinden kokler (+ Newton iyilestirme ve dogrulama)"""
+        degree = len(coefficients) - 1
+        # Sondaki sifir katsayilar x = 0 kokleridir; dogrudan ayrilir
+        zero_count = degree - len(np.trim_zeros(coefficients, "b")) + 1
+        trimmed = np.trim_zeros(coefficients, "b")
+        n = len(trimmed) - 1
+
+        candidates = np.zeros(0, dtype=complex)
+        if n > 0:
+            companion = np.zeros((n, n), dtype=complex)
+            companion[0, :] = -trimmed[1:] / trimmed[0]
+            companion[1:, :-1] += np.eye(n - 1)
+            candidates = np.linalg.eigvals(companion)
+            steps.append(f"Companion matris ({n}x{n}) ozdegerleri hesaplandi")
+
+            derivative = np.polyder(trimmed)
+            for _ in range(3):
+                slope = np.polyval(derivative, candidates)
+                safe = np.abs(slope) > 1e-12 * np.abs(trimmed).max()
+                step = np.where(safe, np.polyval(trimmed, candidates) / np.where(safe, slope, 1), 0)
+                candidates = candidates - step
+            steps.append("Kokler Newton adimlariyla iyilestirildi")
+
+        # Dogrulama: geri hata |p(r)| / sum |c_i| |r|^i
+        powers = np.abs(candidates)[:, None] ** np.arange(n, -1, -1)
+        scale = powers @ np.abs(trimmed) if n > 0 else np.zeros(0)
+        residual = np.abs(np.polyval(trimmed, candidates))
+        verified = residual <= 1e-8 * np.maximum(scale, 1e-300)
+        if not np.all(verified):
+            raise UnsupportedExpressionError("Polinom kokleri sayisal olarak dogrulanamadi")
+        steps.append(f"Dogrulama: {n + zero_count} kok icin |p(x)| / Σ|c_i||x|^i ≤ 1e-8 ✓")
+
+        roots = [Root(0j, zero_count, None)] if zero_count else []
+        return roots + _cluster(candidates)
+
+    @staticmethod
+    def _exclude_poles(roots: List["Root"], denominator: Any, variable: Any, steps: List[str]) -> List["Root"]:
+        """Paydayi sifir yapan kokleri atar (rasyonel denklemler)"""
+        if not denominator.has(variable):
+            return roots
+        kept = []
+        for root in roots:
+            value = complex(denominator.subs(variable, root[0]).evalf())
+            if abs(value) <= 1e-12:
+                steps.append(f"{variable} = {_root_text(root, with_multiplicity=False)} paydayi sifir yapiyor, atildi")
+            else:
+                kept.append(root)
+        return kept
+
+    # ------------------------------------------------------------------
+    # Transandantal denklemler
+    # ------------------------------------------------------------------
+
+    def _numeric_roots(
+        self,
+        expr: Any,
+        variable: Any,
+        interval: Optional[Tuple[float, float]],
+        steps: List[str]
+    ) -> Tuple[List["Root"], str, bool]:
+        """Aralikta vektorize cok baslangicli kok arama
+
+        Aralik verilmediyse [-R, R], kok yoksa [-10R, 10R] ve [-100R, 100R]
+        denenir; hala kok yoksa LLM'e birakilir.
+        """
+        sympy = _get_sympy()
+        ranges = [interval] if interval else [
+            (-self.search_range * k, self.search_range * k) for k in (1, 10, 100)
+        ]
+        try:
+            function = sympy.lambdify(variable, expr, "numpy")
+            derivative = sympy.lambdify(variable, sympy.diff(expr, variable), "numpy")
+            precise = sympy.lambdify(variable, expr, "mpmath")
+            for lower, upper in ranges:
+                roots = _scan(function, derivative, lower, upper, self.samples, precise)
+                if roots or interval:
+                    break
+        except Exception as e:
+            # Abs/Piecewise turevleri gibi NumPy'ye cevrilemeyen ifadeler LLM'e birakilir
+            raise UnsupportedExpressionError(f"Sayisal kok aramasi yapilamadi: {type(e).__name__}")
+
+        steps.append(
+            f"Kapali form yok; [{lower:g}, {upper:g}] araligi {self.samples} noktada orneklendi, "
+            f"isaret degisimleri ve |f| minimumlari baslangic noktasi secildi"
+        )
+        if not roots and not interval:
+            raise UnsupportedExpressionError("Sayisal aramada kok bulunamadi")
+        steps.append(f"Tum araliklar paralel olarak (vektorize) ikiye bolme ile daraltildi: {len(roots)} kok")
+        if roots:
+            steps.append("Dogrulama: her kokte |f(x)| ≈ 0 ✓ (kutuplar ve sahte isaret degisimleri atildi)")
+        return [Root(complex(root), 1, None) for root in roots], "bracketed_multistart", False
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache sayaclarini dondurur"""
+        query_info = self._query_key_cached.cache_info()
+        return {
+            "query_cache": {"hits": query_info.hits, "misses": query_info.misses, "size": query_info.currsize},
+            "result_cache": {"hits": self.hits, "misses": self.misses, "size": len(self._results)},
+        }
+
+
+class Root(NamedTuple):
+    """Kok degeri, katliligi ve (varsa) tam gosterimi"""
+
+    value: complex
+    multiplicity: int
+    exact: Optional[str]
+
+
+def _evaluate(function: Any, points: np.ndarray) -> np.ndarray:
+    """Fonksiyonu noktalarda degerlendirir; reel olmayan/tanimsiz degerler NaN"""
+    with np.errstate(all="ignore"):
+        values = np.asarray(function(points))
+    values = np.broadcast_to(values, points.shape)
+    if np.iscomplexobj(values):
+        values = np.where(np.abs(values.imag) <= 1e-12 * np.abs(values.real).clip(1), values.real, np.nan)
+    return np.asarray(values, dtype=float)
+
+
+def _scan(
+    function: Any,
+    derivative: Any,
+    lower: float,
+    upper: float,
+    samples: int,
+    precise: Optional[Any] = None
+) -> List[float]:
+    """Aralikta isaret degisimi ve teget kokleri bulur, dogrulanmis kokleri dondurur
+
+    Isaret degisimi araligindan gelmeyen adaylar (tam sifir izgara
+    noktalari, Newton noktalari) float alt tasmasi da olabilir:
+    exp(-1000) float'ta 0'dir. Bu adaylar `precise` (mpmath) ile
+    yuksek hassasiyette yeniden degerlendirilir.
+    """
+    grid = np.linspace(lower, upper, samples)
+    values = _evaluate(function, grid)
+    finite = np.isfinite(values)
+    if not finite.any():
+        return []
+    scale = max(1.0, float(np.median(np.abs(values[finite]))))
+
+    step = (upper - lower) / max(samples - 1, 1)
+    found = [grid[values == 0]]
+
+    # Isaret degisimi olan tum araliklar ayni anda ikiye bolunur
+    left = values[:-1]
+    right = values[1:]
+    brackets = np.flatnonzero(finite[:-1] & finite[1:] & (np.sign(left) * np.sign(right) < 0))
+    low, high, f_low = grid[brackets], grid[brackets + 1], left[brackets]
+    for _ in range(200):
+        if not low.size:
+            break
+        middle = 0.5 * (low + high)
+        f_middle = _evaluate(function, middle)
+        move_low = np.sign(f_middle) == np.sign(f_low)
+        low = np.where(move_low, middle, low)
+        f_low = np.where(move_low, f_middle, f_low)
+        high = np.where(move_low, high, middle)
+        if np.all(high - low <= 4 * np.finfo(float).eps * np.maximum(np.abs(low), 1.0)):
+            break
+    bracketed = 0.5 * (low + high)
+
+    # Isaret degistirmeyen kokler (x^2 = 0 gibi): |f|'nin kucuk yerel minimumlarindan Newton
+    magnitude = np.where(finite, np.abs(values), np.inf)
+    interior = np.arange(1, samples - 1)
+    minima = interior[
+        (magnitude[interior] <= magnitude[interior - 1])
+        & (magnitude[interior] <= magnitude[interior + 1])
+        & (magnitude[interior] < 1e-2 * scale)
+        & (np.sign(values[interior - 1]) == np.sign(values[interior + 1]))
+    ]
+    if minima.size:
+        points = grid[minima]
+        for _ in range(100):
+            slope = _evaluate(derivative, points)
+            safe = np.isfinite(slope) & (slope != 0)
+            points = np.where(safe, points - _evaluate(function, points) / np.where(safe, slope, 1), points)
+        found.append(points[(points >= lower) & (points <= upper)])
+
+    unbracketed = np.concatenate(found)
+    if precise is not None and unbracketed.size:
+        unbracketed = unbracketed[[_isolated_zero(precise, point, step) for point in unbracketed]]
+    candidates = np.concatenate([bracketed, unbracketed])
+    residual = np.abs(_evaluate(function, candidates))
+    verified = np.sort(candidates[np.isfinite(residual) & (residual <= 1e-9 * scale)])
+
+    roots: List[float] = []
+    for root in verified:
+        if not roots or abs(root - roots[-1]) > 1e-7 * max(1.0, abs(root)):
+            roots.append(float(root))
+    return roots
+
+
+def _isolated_zero(precise: Any, point: float, step: float) -> bool:
+    """Adayin gercek bir kok mu yoksa float alt tasmasi mi oldugunu ayirt eder
+
+    Gercek kokte |f| iki komsu noktadan cok daha kucuktur; alt tasmada
+    (exp(x), x -> -inf) komsular da ayni buyukluktedir veya daha kucuktur.
+    """
+    import mpmath
+
+    with mpmath.workdps(50):
+        try:
+            center, left, right = (
+                abs(precise(mpmath.mpf(x))) for x in (point, point - step, point + step)
+            )
+        except (ArithmeticError, TypeError, ValueError):
+            return False
+        neighbour = min(left, right)
+        return bool(neighbour > 0 and center <= mpmath.mpf("1e-6") * neighbour)
+
+
+def _cluster(candidates: np.ndarray) -> List[Root]:
+    """Birbirine cok yakin (katli) kokleri birlestirir; reel kokleri ayirir"""
+    roots: List[Root] = []
+    used = np.zeros(len(candidates), dtype=bool)
+    for i in np.argsort(candidates.real):
+        if used[i]:
+            continue
+        close = ~used & (np.abs(candidates - candidates[i]) <= 1e-5 * max(1.0, abs(candidates[i])))
+        used |= close
+        value = candidates[close].mean()
+        if abs(value.imag) <= 1e-9 * max(1.0, abs(value)):
+            value = complex(value.real, 0.0)
+        roots.append(Root(complex(value), int(close.sum()), None))
+    return roots
+
+
+def _clean(x: float) -> float:
+    """Float gurultusunu temizler (12 anlamli basamak, -0.0 -> 0.0)"""
+    return float(f"{x:.12g}") + 0.0
+
+
+def _root_text(root: Root, with_multiplicity: bool = True) -> str:
+    """Koku gosterir (tam form varsa yaklasik degerle, katliligi ile)"""
+    value = root.value
+    if value.imag == 0:
+        approx = f"{_clean(value.real):.10g}"
+    else:
+        real, imag = _clean(value.real), _clean(value.imag)
+        approx = f"{real:.10g} {'+' if imag > 0 else '-'} {abs(imag):.10g}i"
+    text = approx
+    if root.exact is not None and root.exact.replace(" ", "") != approx.replace(" ", ""):
+        text = f"{root.exact} ≈ {approx}"
+    if with_multiplicity and root.multiplicity > 1:
+        text += f" ({root.multiplicity} katli)"
+    return text
@@ -0,0 +1,633 @@
+"""Decimal financial engine (NPV, IRR, PMT, FV, PV) with a vectorized scenario mode"""
+
+import re
+from decimal import ROUND_HALF_UP, Context, Decimal, InvalidOperation, Overflow, localcontext
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.utils.exceptions import CalculationError, UnsupportedExpressionError
+
+_TURKISH_CHARS = str.maketrans("çğıöşüÇĞİÖŞÜ₺", "cgiosuCGIOSU$")
+
+NPV = "npv"
+IRR = "irr"
+PMT = "pmt"
+FV = "fv"
+PV = "pv"
+
+# Islem anahtar kelimeleri (EN/TR); sira onemli (kredi + faiz -> PMT)
+_OPERATION_PATTERNS: List[Tuple[str, "re.Pattern[str]"]] = [
+    (NPV, re.compile(r"\b(?:npv|net present value|net bugunku deger\w*|nbd)\b")),
+    (IRR, re.compile(r"\b(?:irr|internal rate of return|ic verim\w*|ivo|ic karlilik\w*)\b")),
+    (PV, re.compile(r"\b(?:pv|present value|bugunku deger\w*)\b")),
+    (PMT, re.compile(r"\b(?:pmt|payments?|installments?|taksit\w*|odeme\w*|loan|mortgage|kredi\w*|konut kredisi)\b")),
+    (FV, re.compile(r"\b(?:fv|future value|gelecek deger\w*|birikim\w*|faiz\w*|interest|compound\w*|bilesik|getiri\w*|mevduat\w*|deposit)\b")),
+]
+
+_NUM = r"\d+(?:[.,]\d+)*"
+# "%N" (Turkce yazim) oncelikli: "1000 %10" icinde oran 10'dur, 1000 degil
+_PERCENT = re.compile(rf"%({_NUM})|({_NUM})\s*%(?!\d)|%\s+({_NUM})")
+_PERCENT_RANGE = re.compile(
+    rf"(?:%\s*({_NUM})|({_NUM})\s*%(?!\d))\s*(?:-|to|ile|ila)\s*(?:%\s*({_NUM})|({_NUM})\s*%(?!\d))"
+    rf"(?:\s*(?:arasi\w*))?(?:\s*(?:step|adim\w*)\s*(?:%\s*({_NUM})|({_NUM})\s*%?)"
+    rf"|\s*(?:%\s*({_NUM})|({_NUM})\s*%(?!\d))\s*(?:step|adim\w*))?"
+)
+_TERM = re.compile(rf"({_NUM})\s*(ay|months?|yil|years?|yr)\b")
+_MONTHLY = re.compile(r"\b(?:aylik|monthly|per month|ayda|/ay|/month)\b|/ay\b|/month\b")
+_ANNUAL = re.compile(r"\b(?:yillik|annual(?:ly)?|per year|yilda)\b|/yil\b|/year\b")
+_AMOUNT = re.compile(rf"\$?\s*({_NUM})\s*(bin|thousand|k|milyon|million|m)?\b\s*(?:tl|try|usd|eur|dolar|euro|lira|\$)?")
+_SCALE = {"bin": 1000, "thousand": 1000, "k": 1000, "milyon": 10 ** 6, "million": 10 ** 6, "m": 10 ** 6}
+
+
+class FinancialQuery(NamedTuple):
+    """Kullanici girdisinden cikarilan finansal islem"""
+
+    operation: str
+    amounts: List[Decimal]
+    rates: List[Decimal]
+    periods: Optional[Decimal] = None
+    periods_per_year: int = 1
+    cash_flows: List[List[Decimal]] = []
+    payment: Decimal = Decimal(0)
+    simple: bool = False
+    quoted_rates: List[str] = []
+
+
+class FinancialEngine:
+    """NPV, IRR, kredi taksiti (PMT), gelecek deger (FV) ve bugunku degeri (PV) hesaplar
+
+    Tek senaryolu islemler `Decimal` (28 basamak) ile yapilir; tutarlar
+    kurus hassasiyetinde (ROUND_HALF_UP) yuvarlanir. IRR Newton-Raphson ile
+    bulunur, yakinsamazsa isaret degisimi olan aralikta ikiye bolmeye gecilir.
+
+    Birden fazla oran (liste veya "%5-%15" araligi), tutar ya da nakit akisi
+    satiri verilirse senaryo modu kullanilir: tum senaryolar NumPy ile tek
+    seferde (broadcast) hesaplanir. Ayni fonksiyonlar (`npv_many`,
+    `irr_many`, `pmt_many`, `fv_many`, `pv_many`) oran izgaralari ve kredi
+    portfoyleri icin dogrudan da kullanilabilir.
+
+    Islem, tutar, oran veya vade belirlenemezse UnsupportedExpressionError
+    ile yorum LLM'e birakilir.
+    """
+
+    def __init__(self, precision: int = 28, max_irr_iterations: int = 100):
+        """Motoru baslatir
+
+        Args:
+            precision: Decimal hassasiyeti (basamak)
+            max_irr_iterations: IRR icin en fazla Newton/ikiye bolme adimi
+        """
+        self.precision = precision
+        self.max_irr_iterations = max_irr_iterations
+
+    # ------------------------------------------------------------------
+    # Girdi ayristirma
+    # ------------------------------------------------------------------
+
+    def parse_query(self, text: str) -> FinancialQuery:
+        """Girdiden islem, tutar, oran, vade ve nakit akislarini cikarir
+
+        Args:
+            text: Kullanici girdisi (ornek: "1000 TL anapara %10 faiz 1 yil")
+
+        Returns:
+            FinancialQuery
+
+        Raises:
+            UnsupportedExpressionError: Islem veya parametreler belirsiz
+        """
+        t = text.translate(_TURKISH_CHARS).lower()
+
+        def cut(match: "re.Match[str]") -> None:
+            nonlocal t
+            t = t[:match.start()] + " " * (match.end() - match.start()) + t[match.end():]
+
+        operation = next((op for op, pattern in _OPERATION_PATTERNS if pattern.search(t)), None)
+        if operation is None:
+            raise UnsupportedExpressionError("Finansal islem taninmadi")
+
+        # Nakit akislari: [-1000, 300, 400] veya [[...], [...]] ya da "cash flows -1000, 300, 400"
+        cash_flows: List[List[Decimal]] = []
+        match = re.search(r"\[\s*\[.*?\]\s*\]|\[[^\[\]]*\]", t)
+        if match:
+            cash_flows = _parse_flows(match.group(0))
+            cut(match)
+        else:
+            match = re.search(r"(?:cash ?flows?|nakit akis\w*|flows?)\s*:?\s*((?:[-+]?\d[\d.]*\s*(?:,\s*|\s+)?)+)", t)
+            if match:
+                cash_flows = [[_decimal(x) for x in re.findall(r"[-+]?\d+(?:\.\d+)?", match.group(1))]]
+                cut(match)
+        if operation in (NPV, IRR) and not cash_flows:
+            raise UnsupportedExpressionError("Nakit akislari bulunamadi")
+
+        rates: List[Decimal] = []
+        match = _PERCENT_RANGE.search(t)
+        if match:
+            start = _decimal(match.group(1) or match.group(2))
+            end = _decimal(match.group(3) or match.group(4))
+            step = _decimal(match.group(5) or match.group(6) or match.group(7) or match.group(8) or "1")
+            if step <= 0 or end < start or (end - start) / step > 1000:
+                raise CalculationError("Oran araligi gecersiz")
+            rates = [(start + step * i) / 100 for i in range(int((end - start) / step) + 1)]
+            rate_span = match.span()
+            cut(match)
+        else:
+            rate_span = None
+            for match in _PERCENT.finditer(t):
+                rates.append(_decimal(match.group(1) or match.group(2) or match.group(3)) / 100)
+                rate_span = rate_span or match.span()
+            for match in list(_PERCENT.finditer(t)):
+                cut(match)
+            if not rates:
+                match = re.search(r"\b(?:rate|oran\w*|faiz\w*)\s*(?:=|:)?\s*(0?\.\d+)", t)
+                if match:
+                    rates.append(_decimal(match.group(1)))
+                    rate_span = match.span()
+                    cut(match)
+        if not rates and operation != IRR:
+            raise UnsupportedExpressionError("Faiz/iskonto orani bulunamadi")
+        quoted_rates = [f"%{_percent_text(rate)}" for rate in rates]
+
+        # Oranin hemen onundeki/arkasindaki "aylik" orani niteler; digerleri odeme sikligini
+        monthly_rate = False
+        if rate_span:
+            before = re.search(r"(?:aylik|monthly)\s*(?:faiz\w*\s*)?(?:oran\w*\s*)?$", t[:rate_span[0]])
+            after = re.match(r"\s*(?:aylik|monthly|per month|/ay\b|/month\b)", t[rate_span[1]:])
+            monthly_rate = bool(before or after)
+
+        periods: Optional[Decimal] = None
+        months = None
+        match = _TERM.search(t)
+        if match:
+            count = _decimal(match.group(1))
+            months = match.group(2) in ("ay", "month", "months")
+            periods = count
+            cut(match)
+
+        monthly = bool(months) or bool(_MONTHLY.search(t)) or (operation == PMT and not _ANNUAL.search(t))
+        periods_per_year = 12 if monthly else 1
+        if periods is not None:
+            if months and periods_per_year == 1:
+                periods = periods / 12
+            elif not months:
+                periods = periods * periods_per_year
+
+        # Oran donem oranina cevrilir (yillik nominal / donem sayisi)
+        if monthly_rate:
+            rates = [rate if periods_per_year == 12 else rate * 12 for rate in rates]
+        else:
+            rates = [rate / periods_per_year for rate in rates]
+
+        payment = Decimal(0)
+        match = re.search(rf"(?:aylik|monthly|yillik|annual)?\s*(?:katki\w*|contribution\w*|ek odeme|deposits? of)\s*({_NUM})", t)
+        if match and operation in (FV, PV):
+            payment = _decimal(match.group(1))
+            cut(match)
+
+        amounts = [_amount(m) for m in _AMOUNT.finditer(t) if m.group(1)]
+        if operation in (PMT, FV, PV):
+            if not amounts:
+                raise UnsupportedExpressionError("Tutar bulunamadi")
+            if periods is None:
+                raise UnsupportedExpressionError("Vade bulunamadi")
+            if periods <= 0:
+                raise CalculationError("Vade pozitif olmali")
+
+        simple = bool(re.search(r"\b(?:basit faiz|simple interest)\b", t))
+        return FinancialQuery(
+            operation, amounts, rates, periods, periods_per_year, cash_flows, payment, simple, quoted_rates
+        )
+
+    # ------------------------------------------------------------------
+    # Hesaplama
+    # ------------------------------------------------------------------
+
+    def solve(self, text: str, currency: str = "TRY") -> Dict[str, Any]:
+        """Girdiyi hesaplayip Gemini yaniti formatinda dondurur
+
+        Args:
+            text: Kullanici girdisi
+            currency: Para birimi
+
+        Returns:
+            result, steps, confidence_score, currency ve metadata iceren dict
+
+        Raises:
+            UnsupportedExpressionError: Girdi yerel olarak yorumlanamadi
+            CalculationError: Tanimsiz sonuc (ornek: isaret degisimi olmayan IRR)
+        """
+        query = self.parse_query(text)
+        scenario = len(query.rates) > 1 or len(query.cash_flows) > 1 or (
+            query.operation in (PMT, FV, PV) and len(query.amounts) > 1
+        )
+
+        try:
+            with localcontext(Context(prec=self.precision)):
+                if scenario:
+                    result, steps = self._scenarios(query, currency)
+                else:
+                    handler = {
+                        NPV: self._npv,
+                        IRR: self._irr,
+                        PMT: self._pmt,
+                        FV: self._fv,
+                        PV: self._pv,
+                    }[query.operation]
+                    result, steps = handler(query, currency)
+        except (InvalidOperation, Overflow) as e:
+            raise CalculationError(f"Finansal hesaplama tanimsiz: {type(e).__name__}")
+
+        return {
+            "result": result,
+            "steps": steps,
+            "visualization_needed": False,
+            "domain": "financial",
+            "confidence_score": 1.0,
+            "currency": currency,
+            "metadata": {
+                "engine": "local",
+                "operation": query.operation,
+                "mode": "scenarios" if scenario else "decimal",
+            },
+        }
+
+    def _npv(self, query: FinancialQuery, currency: str) -> Tuple[Decimal, List[str]]:
+        """Net bugunku deger: Σ CF_t / (1 + r)^t (CF_0 iskontosuz)"""
+        rate, flows = query.rates[0], query.cash_flows[0]
+        steps = [
+            f"Nakit akislari: {', '.join(_money_text(cf) for cf in flows)} {currency}",
+            f"Iskonto orani: %{_percent_text(rate)} (donem basina)",
+            "NPV = Σ CF_t / (1 + r)^t, t = 0 ilk akis (iskontosuz)",
+        ]
+        total = Decimal(0)
+        for t, flow in enumerate(flows):
+            present = flow / (1 + rate) ** t
+            total += present
+            if len(flows) <= 12:
+                steps.append(f"t={t}: {_money_text(flow)} / {_rate_text(1 + rate)}^{t} = {_money_text(present)}")
+        value = _money(total)
+        steps.append(f"NPV = {_money_text(value)} {currency}")
+        steps.append("Proje kabul edilebilir (NPV > 0)" if value > 0 else "Proje deger yaratmiyor (NPV <= 0)")
+        return value, steps
+
+    def _irr(self, query: FinancialQuery, currency: str) -> Tuple[Decimal, List[str]]:
+        """Ic verim orani (NPV(r) = 0), yuzde olarak"""
+        flows = query.cash_flows[0]
+        steps = [f"Nakit akislari: {', '.join(_money_text(cf) for cf in flows)} {currency}"]
+        rate, method, iterations = self.irr(flows)
+        sign_changes = _sign_changes(flows)
+        steps.append(f"NPV(r) = Σ CF_t / (1 + r)^t = 0 denklemi {method} ile cozuldu ({iterations} adim)")
+        if sign_changes > 1:
+            steps.append(f"Uyari: nakit akislari {sign_changes} kez isaret degistiriyor, birden fazla IRR olabilir")
+        percent = (rate * 100).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
+        steps.append(f"IRR = %{percent}")
+        return percent, steps
+
+    def _pmt(self, query: FinancialQuery, currency: str) -> Tuple[Decimal, List[str]]:
+        """Esit taksit: PMT = P · r / (1 - (1 + r)^-n)"""
+        principal, rate, n = query.amounts[0], query.rates[0], query.periods
+        period = "ay" if query.periods_per_year == 12 else "yil"
+        steps = [
+            f"Anapara: {_money_text(principal)} {currency}, donem faizi: %{_percent_text(rate)} ({period}lik), "
+            f"vade: {_number_text(n)} {period}",
+        ]
+        if rate == 0:
+            payment = principal / n
+            steps.append(f"Faizsiz: taksit = P / n = {_money_text(payment)}")
+        else:
+            factor = (1 + rate) ** n
+            payment = principal * rate * factor / (factor - 1)
+            steps.append("Formul: PMT = P · r · (1 + r)^n / ((1 + r)^n - 1)")
+            steps.append(f"(1 + r)^n = {_rate_text(factor)}")
+            first_interest = principal * rate
+            steps.append(
+                f"Ilk taksitte faiz: {_money_text(first_interest)}, anapara: {_money_text(payment - first_interest)}"
+            )
+        value = _money(payment)
+        total = payment * n
+        steps.append(f"{period.capitalize()}lik taksit = {_money_text(value)} {currency}")
+        steps.append(f"Toplam odeme: {_money_text(total)}, toplam faiz: {_money_text(total - principal)} {currency}")
+        return value, steps
+
+    def _fv(self, query: FinancialQuery, currency: str) -> Tuple[Decimal, List[str]]:
+        """Gelecek deger (bilesik veya basit faiz, istege bagli donemsel katki)"""
+        principal, rate, n = query.amounts[0], query.rates[0], query.periods
+        steps = [f"Anapara: {_money_text(principal)} {currency}, donem faizi: %{_percent_text(rate)}, "
+                 f"donem sayisi: {_number_text(n)}"]
+        if query.simple:
+            future = principal * (1 + rate * n)
+            steps.append("Basit faiz: FV = P · (1 + r · n)")
+        else:
+            factor = (1 + rate) ** n
+            future = principal * factor
+            steps.append(f"Bilesik faiz: FV = P · (1 + r)^n, (1 + r)^n = {_rate_text(factor)}")
+            if query.payment:
+                annuity = query.payment * ((factor - 1) / rate if rate else n)
+                future += annuity
+                steps.append(
+                    f"Donemsel katki {_money_text(query.payment)}: PMT · ((1 + r)^n - 1) / r = {_money_text(annuity)}"
+                )
+        value = _money(future)
+        invested = principal + query.payment * n
+        steps.append(f"Gelecek deger = {_money_text(value)} {currency}")
+        steps.append(f"Faiz getirisi: {_money_text(value - invested)} {currency}")
+        return value, steps
+
+    def _pv(self, query: FinancialQuery, currency: str) -> Tuple[Decimal, List[str]]:
+        """Bugunku deger: PV = FV / (1 + r)^n"""
+        future, rate, n = query.amounts[0], query.rates[0], query.periods
+        factor = (1 + rate) ** n
+        value = _money(future / factor)
+        steps = [
+            f"Gelecek tutar: {_money_text(future)} {currency}, donem faizi: %{_percent_text(rate)}, "
+            f"donem sayisi: {_number_text(n)}",
+            f"PV = FV / (1 + r)^n, (1 + r)^n = {_rate_text(factor)}",
+            f"Bugunku deger = {_money_text(value)} {currency}",
+        ]
+        return value, steps
+
+    def irr(self, flows: Sequence[Decimal]) -> Tuple[Decimal, str, int]:
+        """IRR'yi Newton-Raphson ile, basarisiz olursa ikiye bolme ile bulur
+
+        Returns:
+            (oran, yontem, adim sayisi)
+
+        Raises:
+            CalculationError: Nakit akislarinda isaret degisimi yok veya kok bulunamadi
+        """
+        flows = [Decimal(flow) for flow in flows]
+        if _sign_changes(flows) == 0:
+            raise CalculationError("IRR tanimsiz: nakit akislarinda isaret degisimi yok")
+        tolerance = Decimal(10) ** -(self.precision - 8)
+
+        def npv(rate: Decimal) -> Decimal:
+            return sum((flow / (1 + rate) ** t for t, flow in enumerate(flows)), Decimal(0))
+
+        rate = Decimal("0.1")
+        for iteration in range(1, self.max_irr_iterations + 1):
+            base = 1 + rate
+            value = npv(rate)
+            slope = sum((-t * flow / base ** (t + 1) for t, flow in enumerate(flows)), Decimal(0))
+            if slope == 0:
+                break
+            step = value / slope
+            rate -= step
+            if rate <= -1 or rate > 1000:
+                break
+            if abs(step) <= tolerance:
+                return rate, "Newton-Raphson", iteration
+
+        # Ikiye bolme: isaret degisimi olan ilk araligi tara
+        grid = [Decimal(x) for x in ("-0.99", "-0.9", "-0.5", "-0.2", "0", "0.05", "0.1", "0.2", "0.5",
+                                     "1", "2", "5", "10", "100", "1000")]
+        values = [npv(point) for point in grid]
+        bracket = next(
+            ((grid[i], grid[i + 1], values[i]) for i in range(len(grid) - 1) if values[i] * values[i + 1] <= 0),
+            None
+        )
+        if bracket is None:
+            raise CalculationError("IRR bulunamadi (-%99 ile %100000 arasinda kok yok)")
+        low, high, low_value = bracket
+        # 200 yarilama en genis araligi (1000) bile toleransin altina indirir
+        for iteration in range(1, 201):
+            middle = (low + high) / 2
+            value = npv(middle)
+            if value == 0 or (high - low) / 2 <= tolerance:
+                return middle, "ikiye bolme (Newton yakinsamadi)", iteration
+            if (value > 0) == (low_value > 0):
+                low, low_value = middle, value
+            else:
+                high = middle
+        return (low + high) / 2, "ikiye bolme (Newton yakinsamadi)", iteration
+
+    # ------------------------------------------------------------------
+    # Senaryo modu (NumPy)
+    # ------------------------------------------------------------------
+
+    def _scenarios(self, query: FinancialQuery, currency: str) -> Tuple[Dict[str, float], List[str]]:
+        """Birden fazla oran/tutar/nakit akisi satirini tek vektorize cagrida hesaplar"""
+        rates = np.array([float(rate) for rate in query.rates]) if query.rates else np.zeros(1)
+        rate_labels = query.quoted_rates or [""]
+        results: Dict[str, float] = {}
+
+        if query.operation in (NPV, IRR):
+            flows = _flow_matrix(query.cash_flows)
+            if query.operation == NPV:
+                values = npv_many(rates, flows)
+                for i in range(flows.shape[0]):
+                    for j, label in enumerate(rate_labels):
+                        results[_scenario_label(i, flows.shape[0], label)] = round(float(values[i, j]), 2)
+            else:
+                values = irr_many(flows) * 100
+                for i in range(flows.shape[0]):
+                    results[f"akis {i + 1}"] = None if np.isnan(values[i]) else round(float(values[i]), 4)
+            count = len(results)
+        else:
+            amounts = np.array([float(amount) for amount in query.amounts])[:, None]
+            periods = float(query.periods)
+            if query.operation == PMT:
+                values = pmt_many(rates[None, :], periods, amounts)
+            elif query.operation == FV:
+                values = fv_many(rates[None, :], periods, amounts, float(query.payment), simple=query.simple)
+            else:
+                values = pv_many(rates[None, :], periods, amounts)
+            for i in range(amounts.shape[0]):
+                for j, label in enumerate(rate_labels):
+                    amount_label = f"{_money_text(query.amounts[i])} {currency}" if amounts.shape[0] > 1 else ""
+                    key = " @ ".join(part for part in (amount_label, label) if part)
+                    results[key] = round(float(values[i, j]), 2)
+            count = values.size
+
+        finite = [value for value in results.values() if value is not None]
+        steps = [
+            f"Senaryo modu: {count} senaryo NumPy ile tek seferde (vektorize) hesaplandi",
+            f"Islem: {query.operation.upper()}"
+            + (f", donem sayisi: {_number_text(query.periods)}" if query.periods is not None else ""),
+        ]
+        if finite:
+            steps.append(f"En dusuk: {min(finite):.2f}, en yuksek: {max(finite):.2f}")
+        return results, steps
+
+
+# ----------------------------------------------------------------------
+# Vektorize fonksiyonlar (oran izgaralari, kredi portfoyleri)
+# ----------------------------------------------------------------------
+
+def npv_many(rates: np.ndarray, cash_flows: np.ndarray) -> np.ndarray:
+    """Her nakit akisi satiri x her oran icin NPV
+
+    Args:
+        rates: (R,) donem oranlari
+        cash_flows: (S, T) nakit akislari (t = 0 iskontosuz)
+
+    Returns:
+        (S, R) NPV matrisi
+    """
+    rates = np.atleast_1d(np.asarray(rates, dtype=float))
+    cash_flows = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+    discount = (1.0 + rates)[:, None] ** -np.arange(cash_flows.shape[1])
+    return cash_flows @ discount.T
+
+
+def irr_many(cash_flows: np.ndarray, tolerance: float = 1e-12, max_iterations: int = 100) -> np.ndarray:
+    """Her nakit akisi satiri icin IRR (vektorize Newton + ikiye bolme yedegi)
+
+    Returns:
+        (S,) oranlar; isaret degisimi olmayan veya kok bulunamayan satirlarda NaN
+    """
+    flows = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+    t = np.arange(flows.shape[1])
+    rate = np.full(flows.shape[0], 0.1)
+    converged = np.zeros(flows.shape[0], dtype=bool)
+
+    with np.errstate(all="ignore"):
+        for _ in range(max_iterations):
+            base = 1.0 + rate
+            value = (flows * base[:, None] ** -t).sum(axis=1)
+            slope = (-t * flows * base[:, None] ** (-t - 1)).sum(axis=1)
+            step = np.where(slope != 0, value / slope, 0.0)
+            rate = np.where(converged, rate, rate - step)
+            converged |= np.abs(step) <= tolerance * np.maximum(1.0, np.abs(rate))
+            if converged.all():
+                break
+
+        valid = converged & np.isfinite(rate) & (rate > -1)
+        if not valid.all():
+            # Yakinsamayan satirlar: [-0.99, 1000] araliginda vektorize ikiye bolme
+            low = np.full(flows.shape[0], -0.99)
+            high = np.full(flows.shape[0], 1000.0)
+            f_low = (flows * (1.0 + low)[:, None] ** -t).sum(axis=1)
+            f_high = (flows * (1.0 + high)[:, None] ** -t).sum(axis=1)
+            bracketed = np.sign(f_low) * np.sign(f_high) <= 0
+            for _ in range(200):
+                middle = 0.5 * (low + high)
+                f_middle = (flows * (1.0 + middle)[:, None] ** -t).sum(axis=1)
+                move_low = np.sign(f_middle) == np.sign(f_low)
+                low = np.where(move_low, middle, low)
+                f_low = np.where(move_low, f_middle, f_low)
+                high = np.where(move_low, high, middle)
+            rate = np.where(valid, rate, np.where(bracketed, 0.5 * (low + high), np.nan))
+
+    signs = np.sign(flows)
+    has_change = (signs.max(axis=1) > 0) & (signs.min(axis=1) < 0)
+    return np.where(has_change, rate, np.nan)
+
+
+def pmt_many(rate: Any, nper: Any, pv: Any) -> np.ndarray:
+    """Esit taksit (donem sonu odeme), broadcast edilen dizilerle"""
+    rate, nper, pv = (np.asarray(x, dtype=float) for x in (rate, nper, pv))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factor = (1.0 + rate) ** nper
+        payment = pv * rate * factor / (factor - 1.0)
+    return np.where(rate == 0, pv / nper, payment)
+
+
+def fv_many(rate: Any, nper: Any, pv: Any, pmt: Any = 0.0, simple: bool = False) -> np.ndarray:
+    """Gelecek deger (bilesik/basit faiz + donemsel katki), broadcast edilen dizilerle"""
+    rate, nper, pv, pmt = (np.asarray(x, dtype=float) for x in (rate, nper, pv, pmt))
+    if simple:
+        return pv * (1.0 + rate * nper)
+    factor = (1.0 + rate) ** nper
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuity = np.where(rate == 0, pmt * nper, pmt * (factor - 1.0) / rate)
+    return pv * factor + annuity
+
+
+def pv_many(rate: Any, nper: Any, fv: Any) -> np.ndarray:
+    """Bugunku deger, broadcast edilen dizilerle"""
+    rate, nper, fv = (np.asarray(x, dtype=float) for x in (rate, nper, fv))
+    return fv / (1.0 + rate) ** nper
+
+
+# ----------------------------------------------------------------------
+# Yardimcilar
+# ----------------------------------------------------------------------
+
+def _decimal(text: str) -> Decimal:
+    """Sayi metnini Decimal'e cevirir ("1,5" -> 1.5)"""
+    try:
+        return Decimal(text.replace(",", "."))
+    except InvalidOperation:
+        raise UnsupportedExpressionError(f"Gecersiz sayi: {text}")
+
+
+def _amount(match: "re.Match[str]") -> Decimal:
+    """Tutar metnini Decimal'e cevirir (100.000 TL -> 100000, 100 bin -> 100000)"""
+    text = match.group(1)
+    if re.fullmatch(r"\d{1,3}(?:[.,]\d{3})+", text):
+        # Binlik ayiraclari (TR "100.000", EN "100,000")
+        value = Decimal(re.sub(r"[.,]", "", text))
+    else:
+        value = _decimal(text)
+    if match.group(2):
+        value *= _SCALE[match.group(2)]
+    return value
+
+
+def _parse_flows(text: str) -> List[List[Decimal]]:
+    """Koseli parantezli nakit akisi listesini (tek veya cok satirli) ayristirir"""
+    rows = re.findall(r"\[([^\[\]]*)\]", text)
+    flows = [[_decimal(x) for x in re.findall(r"[-+]?\d+(?:\.\d+)?", row)] for row in rows]
+    flows = [row for row in flows if row]
+    if not flows or any(len(row) < 2 for row in flows):
+        raise UnsupportedExpressionError("Nakit akisi en az iki donem icermeli")
+    return flows
+
+
+def _flow_matrix(flows: List[List[Decimal]]) -> np.ndarray:
+    """Farkli uzunluktaki nakit akisi satirlarini sifirla doldurup matrise cevirir"""
+    width = max(len(row) for row in flows)
+    return np.array([[float(x) for x in row] + [0.0] * (width - len(row)) for row in flows])
+
+
+def _sign_changes(flows: Sequence[Decimal]) -> int:
+    """Sifir olmayan nakit akislarindaki isaret degisimi sayisi"""
+    signs = [flow > 0 for flow in flows if flow != 0]
+    return sum(1 for a, b in zip(signs, signs[1:]) if a != b)
+
+
+def _scenario_label(index: int, rows: int, rate_label: str) -> str:
+    """Senaryo sonuc anahtari (akis no ve oran)"""
+    return " @ ".join(part for part in ((f"akis {index + 1}" if rows > 1 else ""), rate_label) if part)
+
+
+def _money(value: Decimal) -> Decimal:
+    """Kurus hassasiyetine yuvarlar"""
+    return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def _money_text(value: Decimal) -> str:
+    """Tutari gosterir (binlik ayiracli, 2 basamak)"""
+    return f"{_money(Decimal(value)):,.2f}"
+
+
+def _round_text(value: Decimal, exponent: str) -> str:
+    """Degeri verilen basamaga yuvarlayip gosterir
+
+    Yuvarlama, tam sayi kismi ile istenen ondalik basamaklara yetecek
+    hassasiyetteki yerel bir baglamda yapilir; 28 basamakli varsayilan
+    baglamda buyuk carpanlarin quantize'i InvalidOperation verir.
+    """
+    value = Decimal(value)
+    if not value.is_finite():
+        raise CalculationError("Sonuc sonlu degil")
+    quantum = Decimal(exponent)
+    digits = max(value.adjusted(), 0) - quantum.as_tuple().exponent + 2
+    with localcontext(Context(prec=max(28, digits))):
+        return f"{value.quantize(quantum, rounding=ROUND_HALF_UP).normalize():f}"
+
+
+def _percent_text(rate: Decimal) -> str:
+    """Orani yuzde olarak gosterir (0.015 -> 1.5)"""
+    return _round_text(Decimal(rate) * 100, "1e-4")
+
+
+def _rate_text(value: Decimal) -> str:
+    """Carpan/oran degerini 10 basamakla gosterir"""
+    return _round_text(value, "1e-10")
+
+
+def _number_text(value: Optional[Decimal]) -> str:
+    """Donem sayisini gosterir (12 veya 1.5)"""
+    return f"{Decimal(value).normalize():f}" if value is not None else "-"
@@ -0,0 +1,1027 @@
+"""NumPy-backed linear algebra engine with cached factorizations"""
+
+import math
+import re
+import threading
+import warnings
+from collections import OrderedDict
+from fractions import Fraction
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from src.utils.exceptions import CalculationError, UnsupportedExpressionError
+from src.utils.helpers import parse_matrix_string
+
+_TURKISH_CHARS = str.maketrans("çğıöşüÇĞİÖŞÜ", "cgiosuCGIOSU")
+
+# Dogal dil islem kelimeleri (EN/TR) -> fonksiyon adi
+_KEYWORDS: List[Tuple[str, "re.Pattern[str]"]] = [
+    ("det", re.compile(r"det|determinant\w*")),
+    ("inv", re.compile(r"inv|inverse|invert|ters(?:i|ini)?")),
+    ("transpose", re.compile(r"transpose\w*|transpoz\w*|devrik\w*")),
+    ("rank", re.compile(r"rank\w*")),
+    ("eig", re.compile(r"eig|eigvals|eigen\w*|ozdeger\w*")),
+    ("trace", re.compile(r"trace|iz(?:i|ini)?")),
+    ("norm", re.compile(r"norm\w*")),
+    ("solve", re.compile(r"solve|coz\w*")),
+]
+
+_FILLER = re.compile(
+    r"the|of|a|an|and|ve|for|icin|find|compute|calculate|evaluate|what|is|please|"
+    r"hesapla|bul|nedir|matrix|matrices|matris\w*|vector|vektor\w*|system|sistem\w*|"
+    r"denklem\w*|value|values|deger\w*"
+)
+# Turkce ek ("[[1,2],[3,4]]'in determinanti"); transpoz isaretiyle karismasin
+_SUFFIX = re.compile(r"'(?:n?[iu]n|n?[iu]|n?[ae]|d[ae]|t[ae])\b")
+_TOKEN = re.compile(r"(?P<number>\d+(?:\.\d*)?(?:e[+-]?\d+)?|\.\d+(?:e[+-]?\d+)?)|(?P<word>[a-z_]+)|(?P<op>\*\*|[-+*/@^(),'=])")
+_NORM_ORDERS = {"inf": np.inf, "fro": "fro", "nuc": "nuc"}
+
+_EPS = np.finfo(float).eps
+_OVERFLOW_MESSAGE = "Sonuc sayisal sinirlari asti (sonsuz veya tanimsiz deger)"
+
+
+class Operand(NamedTuple):
+    """Degerlendirme sirasindaki ara deger
+
+    `exact` kucuk rasyonel matrislerde Fraction elemanli object dizisidir;
+    None ise deger yalnizca float64 `approx` ile temsil edilir.
+    """
+
+    approx: np.ndarray
+    exact: Optional[np.ndarray]
+    label: str
+
+
+class _ExactLU(NamedTuple):
+    """Rasyonel (Fraction) LU ayrisimi: P·A = L·U"""
+
+    lower: List[List[Fraction]]
+    upper: List[List[Fraction]]
+    perm: List[int]
+    swaps: int
+    rank: int
+
+
+def _get_scipy_linalg():
+    """Ilk cagrida scipy.linalg import eder"""
+    if 'scipy_linalg' in globals():
+        return globals()['scipy_linalg']
+    import scipy.linalg as scipy_linalg
+    globals()['scipy_linalg'] = scipy_linalg
+    return scipy_linalg
+
+
+class LinearAlgebraEngine:
+    """Matris ifadelerini NumPy/SciPy ile yerel olarak hesaplar
+
+    Desteklenen islemler: `+`, `-`, `*`/`@` (matris carpimi veya skaler),
+    skalerle bolme, `^n`/`^-1`, transpoz (`^T`, `'`), det, inv, rank, eig,
+    trace, norm ve solve (`solve(A, b)` veya `A x = b`). Islemler fonksiyon
+    cagrisi (`det([[1,2],[3,4]])`) ya da dogal dil (`[[1,2],[3,4]]
+    determinanti`) ile yazilabilir.
+
+    Boyutu `exact_max_size`'i asmayan matrisler Fraction ile tam olarak
+    hesaplanir (det/inv/solve/rank rasyonel LU ile); daha buyuk matrisler
+    float64 LU/QR ile. LU, QR ve ozdeger ayrisimlari matris icerigine gore
+    sinirli bir LRU cache'te tutulur; ayni matris uzerindeki tekrar eden
+    islemler ayrisimi yeniden hesaplamaz. Ozdegerler sayisal hesaplanir,
+    tam sayi/rasyonel adaylar det(A - λI) = 0 ile tam olarak dogrulanir.
+
+    Taninmayan girisler UnsupportedExpressionError ile LLM'e birakilir;
+    boyut uyusmazligi ve tekil matris gibi matematiksel hatalar
+    CalculationError firlatir.
+    """
+
+    def __init__(
+        self,
+        cache_size: int = 128,
+        exact_max_size: int = 12,
+        max_elements: int = 250000,
+        max_power: int = 64
+    ):
+        """Motoru baslatir
+
+        Args:
+            cache_size: Ayrisim cache'inin maksimum eleman sayisi
+            exact_max_size: Tam (rasyonel) aritmetik yapilacak en buyuk boyut
+            max_elements: Bir matristeki maksimum eleman sayisi
+            max_power: Tam aritmetikte izin verilen en buyuk us
+        """
+        self.cache_size = cache_size
+        self.exact_max_size = exact_max_size
+        self.max_elements = max_elements
+        self.max_power = max_power
+        self._factorizations: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Girdi ayristirma
+    # ------------------------------------------------------------------
+
+    def tokenize(self, text: str) -> List[Tuple[str, Any]]:
+        """Girdiyi (tur, deger) token'larina ayirir
+
+        Turler: matrix (liste), number, func, word (t/inf/fro/nuc), x, op.
+
+        Raises:
+            UnsupportedExpressionError: Taninmayan kelime veya karakter
+        """
+        t = text.translate(_TURKISH_CHARS).lower()
+        t = t.replace("×", "*").replace("·", "*").replace("⁻¹", "^-1").replace("ᵀ", "^t")
+        t = _SUFFIX.sub(" ", t)
+
+        tokens: List[Tuple[str, Any]] = []
+        pos = 0
+        while pos < len(t):
+            if t[pos].isspace():
+                pos += 1
+                continue
+            if t[pos] == "[":
+                end = _matching_bracket(t, pos)
+                tokens.append(("matrix", t[pos:end]))
+                pos = end
+                continue
+
+            match = _TOKEN.match(t, pos)
+            if match is None:
+                raise UnsupportedExpressionError(f"Taninmayan karakter: {t[pos]!r}")
+            pos = match.end()
+            if match.group("number"):
+                tokens.append(("number", match.group("number")))
+            elif match.group("op"):
+                tokens.append(("op", match.group("op")))
+            else:
+                word = match.group("word")
+                name = next((name for name, pattern in _KEYWORDS if pattern.fullmatch(word)), None)
+                if name:
+                    tokens.append(("func", name))
+                elif word in ("t", "inf", "fro", "nuc"):
+                    tokens.append(("word", word))
+                elif word == "x":
+                    tokens.append(("x", word))
+                elif not _FILLER.fullmatch(word):
+                    raise UnsupportedExpressionError(f"Taninmayan kelime: {word}")
+
+        return _rewrite(tokens)
+
+    def parse_literal(self, text: str, label: str) -> Operand:
+        """Matris/vektor literal'ini Operand'a cevirir
+
+        Raises:
+            UnsupportedExpressionError: Sayisal olmayan veya duzensiz matris
+        """
+        try:
+            rows = parse_matrix_string(text)
+        except ValueError as e:
+            raise UnsupportedExpressionError(str(e))
+
+        if rows and all(_is_number(item) for item in rows):
+            flat, shape = rows, (len(rows),)
+        elif rows and all(isinstance(row, list) and row for row in rows) \
+                and len({len(row) for row in rows}) == 1 \
+                and all(_is_number(item) for row in rows for item in row):
+            flat, shape = [item for row in rows for item in row], (len(rows), len(rows[0]))
+        else:
+            raise UnsupportedExpressionError("Matris sayisal ve duzenli olmali")
+
+        if len(flat) > self.max_elements:
+            raise UnsupportedExpressionError(f"Matris cok buyuk ({len(flat)} eleman)")
+        approx = np.array(flat, dtype=float).reshape(shape)
+        if max(shape) > self.exact_max_size:
+            return self._operand(approx=approx, label=label)
+        # Ondalik literal'ler yazildigi gibi (0.1 -> 1/10) tam kabul edilir
+        exact = np.array([Fraction(repr(item)) for item in flat], dtype=object).reshape(shape)
+        return self._operand(exact=exact, approx=approx, label=label)
+
+    # ------------------------------------------------------------------
+    # Hesaplama
+    # ------------------------------------------------------------------
+
+    def solve(self, text: str) -> Dict[str, Any]:
+        """Girdiyi hesaplayip Gemini yaniti formatinda dondurur
+
+        Args:
+            text: Kullanici girdisi (ornek: "[[1,2],[3,4]] * [[5],[6]]")
+
+        Returns:
+            result, steps, confidence_score ve metadata iceren dict
+
+        Raises:
+            UnsupportedExpressionError: Girdi yerel olarak cozulemedi
+            CalculationError: Boyut uyusmazligi, tekil matris vb.
+        """
+        tokens = self.tokenize(text)
+        if not any(kind == "matrix" for kind, _ in tokens):
+            raise UnsupportedExpressionError("Girdide matris bulunamadi")
+
+        steps: List[str] = []
+        # Tasma/NaN RuntimeWarning'leri sizmasin; _operand sonlu olmayan sonucu reddeder
+        with np.errstate(all="ignore"):
+            value = _Parser(self, tokens, steps).parse()
+        operation = next((name for kind, name in tokens if kind == "func"), "arithmetic")
+
+        if isinstance(value, _Eigen):
+            result, exact = value.result, value.exact
+            shape: Tuple[int, ...] = (len(value.values),)
+        else:
+            result, exact, shape = _as_result(value), value.exact is not None, value.approx.shape
+            steps.append(f"Sonuc: {_format(value)}")
+
+        return {
+            "result": result,
+            "steps": steps,
+            "visualization_needed": False,
+            "domain": "linear_algebra",
+            "confidence_score": 1.0,
+            "metadata": {
+                "engine": "local",
+                "operation": operation,
+                "exact": exact,
+                "shape": list(shape),
+            },
+        }
+
+    def _operand(
+        self,
+        exact: Optional[np.ndarray] = None,
+        approx: Optional[np.ndarray] = None,
+        label: str = ""
+    ) -> Operand:
+        """Operand olusturur; buyuk matrislerde tam temsili birakir"""
+        if exact is not None:
+            exact = np.asarray(exact, dtype=object)
+            if exact.ndim and max(exact.shape) > self.exact_max_size:
+                if approx is None:
+                    approx = _to_float(exact)
+                exact = None
+            elif approx is None:
+                approx = _to_float(exact)
+        approx = np.asarray(approx, dtype=float)
+        if not np.all(np.isfinite(approx)):
+            raise CalculationError(_OVERFLOW_MESSAGE)
+        return Operand(approx, exact, label)
+
+    # ------------------------------------------------------------------
+    # Aritmetik
+    # ------------------------------------------------------------------
+
+    def add(self, left: Operand, right: Operand, sign: int, steps: List[str]) -> Operand:
+        """Toplama/cikarma (boyutlar ayni olmali)"""
+        if left.approx.shape != right.approx.shape:
+            raise CalculationError(
+                f"{'Toplama' if sign > 0 else 'Cikarma'} icin boyutlar uyusmuyor: "
+                f"{_shape(left)} ve {_shape(right)}"
+            )
+        label = f"{left.label} {'+' if sign > 0 else '-'} {right.label}"
+        if left.exact is not None and right.exact is not None:
+            value = self._operand(exact=left.exact + sign * right.exact, label=label)
+        else:
+            value = self._operand(approx=left.approx + sign * right.approx, label=label)
+        if value.approx.ndim:
+            steps.append(f"{label} = {_format(value)} (eleman eleman)")
+        return value
+
+    def multiply(self, left: Operand, right: Operand, steps: List[str]) -> Operand:
+        """Skaler carpim veya matris carpimi"""
+        label = f"{left.label}·{right.label}"
+        exact = left.exact is not None and right.exact is not None
+        if left.approx.ndim == 0 or right.approx.ndim == 0:
+            if exact:
+                return self._operand(exact=left.exact * right.exact, label=label)
+            return self._operand(approx=left.approx * right.approx, label=label)
+
+        inner_left = left.approx.shape[-1]
+        inner_right = right.approx.shape[0]
+        if inner_left != inner_right:
+            raise CalculationError(
+                f"Matris carpimi icin boyutlar uyusmuyor: {_shape(left)} ve {_shape(right)} "
+                f"(sol matrisin sutun sayisi sag matrisin satir sayisina esit olmali)"
+            )
+        if exact:
+            value = self._operand(exact=np.matmul(left.exact, right.exact), label=label)
+        else:
+            value = self._operand(approx=np.matmul(left.approx, right.approx), label=label)
+        steps.append(
+            f"Matris carpimi {_shape(left)} x {_shape(right)}: her eleman satir·sutun "
+            f"ic carpimi, {label} = {_format(value)}"
+        )
+        return value
+
+    def divide(self, left: Operand, right: Operand) -> Operand:
+        """Skalerle bolme"""
+        if right.approx.ndim:
+            raise UnsupportedExpressionError("Matrise bolme tanimli degil; inv() kullanin")
+        if right.approx == 0 and (right.exact is None or right.exact == 0):
+            raise CalculationError("Sifira bolme hatasi")
+        label = f"{left.label}/{right.label}"
+        if left.exact is not None and right.exact is not None:
+            return self._operand(exact=left.exact / right.exact, label=label)
+        return self._operand(approx=left.approx / right.approx, label=label)
+
+    def negate(self, value: Operand) -> Operand:
+        """Isaret degistirir"""
+        if value.exact is not None:
+            return self._operand(exact=-value.exact, label=f"-{value.label}")
+        return self._operand(approx=-value.approx, label=f"-{value.label}")
+
+    def power(self, base: Operand, exponent: int, steps: List[str]) -> Operand:
+        """Tam sayi us (negatif us matrislerde tersin kuvveti)"""
+        label = f"{base.label}^{exponent}"
+        if base.approx.ndim == 0:
+            if exponent < 0 and base.approx == 0:
+                raise CalculationError("Sifirin negatif kuvveti tanimsiz")
+            if base.exact is not None and abs(exponent) <= self.max_power:
+                return self._operand(exact=base.exact.item() ** exponent, label=label)
+            return self._operand(approx=base.approx ** float(exponent), label=label)
+
+        self._require_square(base, "Matris kuvveti")
+        if exponent < 0:
+            base = self.inverse(base, steps)
+            exponent = -exponent
+        if base.exact is not None and exponent <= self.max_power:
+            result = _exact_identity(base.exact.shape[0])
+            square, n = base.exact, exponent
+            # Tekrarli kare alma: O(log n) matris carpimi
+            while n:
+                if n & 1:
+                    result = np.matmul(result, square)
+                square = np.matmul(square, square)
+                n >>= 1
+            value = self._operand(exact=result, label=label)
+        else:
+            value = self._operand(approx=np.linalg.matrix_power(base.approx, exponent), label=label)
+        steps.append(f"{label} = {_format(value)}")
+        return value
+
+    def transpose(self, value: Operand, steps: List[str]) -> Operand:
+        """Transpoz (vektor sutun kabul edilir, transpozu satir matrisidir)"""
+        label = f"{value.label}^T"
+        if value.approx.ndim == 1:
+            approx = value.approx.reshape(1, -1)
+            exact = value.exact.reshape(1, -1) if value.exact is not None else None
+        else:
+            approx = value.approx.T
+            exact = value.exact.T if value.exact is not None else None
+        result = self._operand(exact=exact, approx=approx, label=label)
+        steps.append(f"Transpoz (satirlar sutun olur): {label} = {_format(result)}")
+        return result
+
+    # ------------------------------------------------------------------
+    # Ayrisim tabanli islemler
+    # ------------------------------------------------------------------
+
+    def determinant(self, value: Operand, steps: List[str]) -> Operand:
+        """Determinant (LU ayrisimi: det = (-1)^k · ∏ U_ii)"""
+        self._require_square(value, "Determinant")
+        label = f"det({value.label})"
+        n = value.approx.shape[0]
+
+        if value.exact is not None:
+            lu = self._exact_lu(value)
+            if n == 2:
+                (a, b), (c, d) = value.exact.tolist()
+                steps.append(f"2x2 determinant formulu ad - bc: {_num(a)}·{_num(d)} - {_num(b)}·{_num(c)}")
+            det = _exact_det(lu)
+            steps.append(
+                f"LU ayrisimi (P·A = L·U, {lu.swaps} satir degisimi): "
+                f"U kosegeni = [{', '.join(_num(lu.upper[i][i]) for i in range(n))}]"
+                if lu.rank == n else
+                f"Eliminasyonda pivotsuz sutun kaldi (rank {lu.rank} < {n}): matris tekil"
+            )
+            result = self._operand(exact=np.asarray(det, dtype=object), label=label)
+        else:
+            lu, piv = self._float_lu(value)
+            swaps = int(np.count_nonzero(piv != np.arange(n)))
+            det = float(np.prod(np.diag(lu))) * (-1) ** swaps
+            steps.append(f"LU ayrisimi (P·A = L·U, {swaps} satir degisimi), det = (-1)^{swaps} · ∏ U_ii")
+            result = self._operand(approx=np.asarray(det), label=label)
+
+        steps.append(f"{label} = {_format(result)}")
+        return result
+
+    def inverse(self, value: Operand, steps: List[str]) -> Operand:
+        """Ters matris (LU ile A·X = I cozulur)"""
+        self._require_square(value, "Ters matris")
+        label = f"inv({value.label})"
+        n = value.approx.shape[0]
+
+        if value.exact is not None:
+            lu = self._exact_lu(value)
+            if lu.rank < n:
+                raise CalculationError(f"{value.label} tekil (det = 0), tersi yok")
+            result = self._operand(exact=_exact_lu_solve(lu, _exact_identity(n)), label=label)
+        else:
+            lu_piv = self._float_lu(value)
+            self._check_singular(value, lu_piv[0])
+            result = self._operand(
+                approx=_get_scipy_linalg().lu_solve(lu_piv, np.eye(n)), label=label
+            )
+
+        steps.append(f"LU ayrisimi ile A·X = I cozuldu: {label} = {_format(result)}")
+        return result
+
+    def solve_system(self, matrix: Operand, rhs: Operand, steps: List[str]) -> Operand:
+        """A·x = b sistemini cozer (kare: LU, fazla belirli: QR en kucuk kareler)"""
+        if matrix.approx.ndim != 2:
+            raise CalculationError("Katsayi matrisi iki boyutlu olmali")
+        m, n = matrix.approx.shape
+        if rhs.approx.ndim == 0 or rhs.approx.shape[0] != m:
+            raise CalculationError(
+                f"Sag taraf boyutu uyusmuyor: {_shape(matrix)} katsayi matrisi icin {m} satir gerekli"
+            )
+        label = "x"
+
+        if m == n:
+            if matrix.exact is not None and rhs.exact is not None:
+                lu = self._exact_lu(matrix)
+                if lu.rank < n:
+                    raise CalculationError("Katsayi matrisi tekil; sistemin tek cozumu yok")
+                steps.append("LU ayrisimi (P·A = L·U): once L·y = P·b, sonra U·x = y cozuldu")
+                result = self._operand(exact=_exact_lu_solve(lu, rhs.exact), label=label)
+            else:
+                lu_piv = self._float_lu(matrix)
+                self._check_singular(matrix, lu_piv[0])
+                steps.append("LU ayrisimi (P·A = L·U): once L·y = P·b, sonra U·x = y cozuldu")
+                result = self._operand(approx=_get_scipy_linalg().lu_solve(lu_piv, rhs.approx), label=label)
+        elif m > n:
+            q, r = self._qr(matrix)
+            if np.abs(np.diag(r)).min() <= max(m, n) * _EPS * np.abs(r).max():
+                raise CalculationError("Katsayi matrisinin sutunlari dogrusal bagimli; tek cozum yok")
+            steps.append(f"Fazla belirli sistem ({m} denklem, {n} bilinmeyen): QR ile en kucuk kareler, R·x = Q^T·b")
+            x = _get_scipy_linalg().solve_triangular(r, q.T @ rhs.approx)
+            result = self._operand(approx=x, label=label)
+        else:
+            raise CalculationError(f"Bilinmeyen sayisi ({n}) denklem sayisindan ({m}) fazla; tek cozum yok")
+
+        steps.append(f"x = {_format(result)}")
+        return result
+
+    def rank(self, value: Operand, steps: List[str]) -> Operand:
+        """Rank (tam: rasyonel eliminasyon, float: sutun pivotlu QR)"""
+        if value.approx.ndim != 2:
+            raise CalculationError("Rank icin iki boyutlu matris gerekli")
+        label = f"rank({value.label})"
+        if value.exact is not None:
+            rank = self._exact_lu(value).rank
+            steps.append(f"Gauss eliminasyonu: {rank} pivot satiri kaldi")
+        else:
+            r, _ = self._pivoted_qr(value)
+            diag = np.abs(np.diag(r))
+            tol = max(value.approx.shape) * _EPS * (diag[0] if diag.size else 0.0)
+            rank = int(np.count_nonzero(diag > tol))
+            steps.append(f"Sutun pivotlu QR: |R_ii| > {tol:.3g} olan {rank} kosegen eleman")
+        result = self._operand(exact=np.asarray(Fraction(rank), dtype=object), label=label)
+        steps.append(f"{label} = {rank}")
+        return result
+
+    def trace(self, value: Operand, steps: List[str]) -> Operand:
+        """Iz (kosegen elemanlarinin toplami)"""
+        self._require_square(value, "Iz")
+        label = f"trace({value.label})"
+        if value.exact is not None:
+            result = self._operand(exact=np.asarray(sum(np.diagonal(value.exact), Fraction(0)), dtype=object), label=label)
+        else:
+            result = self._operand(approx=np.asarray(np.trace(value.approx)), label=label)
+        steps.append(f"Kosegen elemanlari toplandi: {label} = {_format(result)}")
+        return result
+
+    def norm(self, value: Operand, order: Any, steps: List[str]) -> Operand:
+        """Vektor/matris normu (varsayilan: Frobenius / Oklid)"""
+        label = f"norm({value.label})"
+        try:
+            norm = float(np.linalg.norm(value.approx, order))
+        except (ValueError, np.linalg.LinAlgError) as e:
+            raise CalculationError(f"Norm hesaplanamadi: {e}")
+        name = {None: "Frobenius/Oklid", 1: "1-norm", 2: "2-norm", np.inf: "sonsuz norm",
+                "fro": "Frobenius", "nuc": "nukleer"}.get(order, f"{order}-norm")
+
+        exact = None
+        if value.exact is not None and order in (None, "fro", 1, np.inf):
+            exact = _exact_norm(value.exact, order)
+        result = self._operand(exact=exact, approx=np.asarray(norm), label=label)
+        steps.append(f"{name}: {label} = {_format(result)}")
+        return result
+
+    def eigen(self, value: Operand, steps: List[str]) -> "_Eigen":
+        """Ozdegerler (simetrik: eigh, genel: eig); rasyonel adaylar tam dogrulanir"""
+        self._require_square(value, "Ozdeger")
+        n = value.approx.shape[0]
+        symmetric = bool(np.array_equal(value.approx, value.approx.T))
+        values, vectors = self._cached(
+            "eigh" if symmetric else "eig", value,
+            lambda a: np.linalg.eigh(a) if symmetric else np.linalg.eig(a)
+        )
+        if not np.all(np.isfinite(values)):
+            raise CalculationError(_OVERFLOW_MESSAGE)
+        steps.append(
+            f"{'Simetrik matris: eigh' if symmetric else 'Genel matris: eig'} ile "
+            f"det({value.label} - λI) = 0 cozuldu"
+        )
+
+        exact_values: List[Optional[Fraction]] = []
+        for eigenvalue in values:
+            candidate = None
+            if value.exact is not None and abs(np.imag(eigenvalue)) <= 1e-9 * max(1.0, abs(eigenvalue)):
+                guess = Fraction(float(np.real(eigenvalue))).limit_denominator(1000)
+                if abs(float(guess) - float(np.real(eigenvalue))) <= 1e-8 * max(1.0, abs(eigenvalue)):
+                    shifted = value.exact - guess * _exact_identity(n)
+                    if _exact_lu(shifted).rank < n:
+                        candidate = guess
+            exact_values.append(candidate)
+
+        order = sorted(range(n), key=lambda i: (-np.real(values[i]), -np.imag(values[i])))
+        shown = [
+            _num(exact_values[i]) if exact_values[i] is not None else _complex(values[i])
+            for i in order
+        ]
+        steps.append("Ozdegerler: " + ", ".join(f"λ{k + 1} = {text}" for k, text in enumerate(shown)))
+        if n <= 6 and np.all(np.abs(np.imag(values)) <= 1e-9):
+            for k, i in enumerate(order):
+                vector = np.real(vectors[:, i])
+                vector = vector * np.sign(vector[np.argmax(np.abs(vector) > 1e-12)])
+                steps.append(f"λ{k + 1} icin birim ozvektor: [{', '.join(f'{x:.6g}' for x in vector)}]")
+
+        exact = all(candidate is not None for candidate in exact_values)
+        if np.all(np.abs(np.imag(values)) <= 1e-9):
+            result: Any = [
+                float(exact_values[i]) if exact_values[i] is not None else _clean(float(np.real(values[i])))
+                for i in order
+            ]
+        else:
+            result = "[" + ", ".join(shown) + "]"
+        return _Eigen(values=[values[i] for i in order], result=result, exact=exact)
+
+    # ------------------------------------------------------------------
+    # Ayrisim cache'i
+    # ------------------------------------------------------------------
+
+    def _cached(self, kind: str, value: Operand, compute: Callable[[Any], Any]) -> Any:
+        """Ayrisimi matris icerigine gore cache'ten okur veya hesaplar
+
+        Anahtar (tur, boyut, icerik); tam matrislerde Fraction elemanlari,
+        float matrislerde ham bayt icerigi kullanilir.
+        """
+        if kind.startswith("exact"):
+            key = (kind, value.exact.shape, tuple(value.exact.flat))
+            source = value.exact
+        else:
+            key = (kind, value.approx.shape, value.approx.tobytes())
+            source = value.approx
+        with self._lock:
+            cached = self._factorizations.get(key)
+            if cached is not None:
+                self._factorizations.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        result = compute(source)
+        with self._lock:
+            self._factorizations[key] = result
+            while len(self._factorizations) > self.cache_size:
+                self._factorizations.popitem(last=False)
+        return result
+
+    def _exact_lu(self, value: Operand) -> _ExactLU:
+        """Rasyonel LU ayrisimi (cache'li)"""
+        return self._cached("exact_lu", value, _exact_lu)
+
+    def _float_lu(self, value: Operand) -> Tuple[np.ndarray, np.ndarray]:
+        """SciPy LU ayrisimi (lu, piv) (cache'li)"""
+        def factor(a: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            with warnings.catch_warnings():
+                # Tekil matris uyarisi; tekillik _check_singular ile raporlanir
+                warnings.simplefilter("ignore")
+                return _get_scipy_linalg().lu_factor(a, check_finite=False)
+        return self._cached("lu", value, factor)
+
+    def _qr(self, value: Operand) -> Tuple[np.ndarray, np.ndarray]:
+        """Indirgenmis QR ayrisimi (cache'li)"""
+        return self._cached("qr", value, lambda a: np.linalg.qr(a, mode="reduced"))
+
+    def _pivoted_qr(self, value: Operand) -> Tuple[np.ndarray, np.ndarray]:
+        """Sutun pivotlu QR'nin (R, P) kismi (cache'li)"""
+        return self._cached(
+            "qr_pivoted", value,
+            lambda a: _get_scipy_linalg().qr(a, mode="r", pivoting=True, check_finite=False)
+        )
+
+    @staticmethod
+    def _check_singular(value: Operand, lu: np.ndarray) -> None:
+        """Float LU'da sifira yakin pivot varsa tekil matris hatasi firlatir"""
+        diag = np.abs(np.diag(lu))
+        if diag.min() <= diag.size * _EPS * max(np.abs(lu).max(), 1e-300):
+            raise CalculationError(f"{value.label} tekil (veya tekile cok yakin), tersi yok")
+
+    @staticmethod
+    def _require_square(value: Operand, operation: str) -> None:
+        """Kare matris kontrolu"""
+        shape = value.approx.shape
+        if len(shape) != 2 or shape[0] != shape[1]:
+            raise CalculationError(f"{operation} icin kare matris gerekli, verilen: {_shape(value)}")
+
+    def apply(self, name: str, args: List[Any], steps: List[str]) -> Any:
+        """Fonksiyon adini ilgili isleme yonlendirir
+
+        Raises:
+            UnsupportedExpressionError: Arguman sayisi gecersiz
+        """
+        arity = {"solve": (2, 2), "norm": (1, 2)}.get(name, (1, 1))
+        if not arity[0] <= len(args) <= arity[1]:
+            raise UnsupportedExpressionError(f"{name} icin gecersiz arguman sayisi: {len(args)}")
+        if any(isinstance(arg, _Eigen) for arg in args):
+            raise UnsupportedExpressionError("Ozdeger sonucu baska islemde kullanilamaz")
+        if name == "solve":
+            return self.solve_system(args[0], args[1], steps)
+        if name == "norm":
+            return self.norm(args[0], args[1] if len(args) > 1 else None, steps)
+        handler = {
+            "det": self.determinant,
+            "inv": self.inverse,
+            "transpose": self.transpose,
+            "rank": self.rank,
+            "eig": self.eigen,
+            "trace": self.trace,
+        }[name]
+        return handler(args[0], steps)
+
+    def stats(self) -> Dict[str, Any]:
+        """Ayrisim cache sayaclarini dondurur"""
+        return {
+            "factorization_cache": {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._factorizations),
+            }
+        }
+
+
+class _Eigen(NamedTuple):
+    """Ozdeger isleminin sonucu (baska islemlere girdi olamaz)"""
+
+    values: List[complex]
+    result: Any
+    exact: bool
+
+
+class _Parser:
+    """Token listesini oncelik sirasina gore degerlendiren recursive descent parser
+
+    expr := term (('+'|'-') term)*
+    term := unary (('*'|'@'|'/') unary)*
+    unary := '-' unary | power
+    power := postfix (('^'|'**') (T | ['-'] sayi | '(' ['-'] sayi ')'))*
+    postfix := primary "'"*
+    primary := matris | sayi | '(' expr ')' | fonk '(' args ')' | fonk unary
+    """
+
+    def __init__(self, engine: LinearAlgebraEngine, tokens: List[Tuple[str, Any]], steps: List[str]):
+        self.engine = engine
+        self.tokens = tokens
+        self.steps = steps
+        self.pos = 0
+        self.labels = 0
+
+    def peek(self, kind: str, value: Any = None) -> bool:
+        """Siradaki token verilen tur/degerde mi"""
+        if self.pos >= len(self.tokens):
+            return False
+        token_kind, token_value = self.tokens[self.pos]
+        return token_kind == kind and (value is None or token_value == value)
+
+    def take(self, kind: str, value: Any = None) -> Any:
+        """Siradaki token'i tuketir; beklenen degilse UnsupportedExpressionError"""
+        if not self.peek(kind, value):
+            raise UnsupportedExpressionError("Ifade ayristirilamadi")
+        self.pos += 1
+        return self.tokens[self.pos - 1][1]
+
+    def parse(self) -> Any:
+        """Tum ifadeyi degerlendirir"""
+        value = self.expr()
+        if self.pos != len(self.tokens):
+            raise UnsupportedExpressionError("Ifadenin sonu ayristirilamadi")
+        return value
+
+    def expr(self) -> Any:
+        value = self.term()
+        while self.peek("op", "+") or self.peek("op", "-"):
+            sign = 1 if self.take("op") == "+" else -1
+            value = self.engine.add(self._matrix(value), self._matrix(self.term()), sign, self.steps)
+        return value
+
+    def term(self) -> Any:
+        value = self.unary()
+        while self.peek("op", "*") or self.peek("op", "@") or self.peek("op", "/"):
+            op = self.take("op")
+            right = self._matrix(self.unary())
+            if op == "/":
+                value = self.engine.divide(self._matrix(value), right)
+            else:
+                value = self.engine.multiply(self._matrix(value), right, self.steps)
+        return value
+
+    def unary(self) -> Any:
+        if self.peek("op", "-"):
+            self.take("op")
+            return self.engine.negate(self._matrix(self.unary()))
+        if self.peek("op", "+"):
+            self.take("op")
+            return self.unary()
+        return self.power()
+
+    def power(self) -> Any:
+        value = self.postfix()
+        while self.peek("op", "^") or self.peek("op", "**"):
+            self.take("op")
+            if self.peek("word", "t"):
+                self.take("word")
+                value = self.engine.transpose(self._matrix(value), self.steps)
+                continue
+            parens = self.peek("op", "(")
+            if parens:
+                self.take("op")
+            negative = self.peek("op", "-")
+            if negative:
+                self.take("op")
+            number = self.take("number")
+            if parens:
+                self.take("op", ")")
+            if not number.isdigit():
+                raise UnsupportedExpressionError("Yalnizca tam sayi usler destekleniyor")
+            exponent = -int(number) if negative else int(number)
+            if exponent == -1 and self._matrix(value).approx.ndim:
+                value = self.engine.inverse(value, self.steps)
+            else:
+                value = self.engine.power(self._matrix(value), exponent, self.steps)
+        return value
+
+    def postfix(self) -> Any:
+        value = self.primary()
+        while self.peek("op", "'"):
+            self.take("op")
+            value = self.engine.transpose(self._matrix(value), self.steps)
+        return value
+
+    def primary(self) -> Any:
+        if self.peek("matrix"):
+            label = chr(ord("A") + self.labels) if self.labels < 26 else f"M{self.labels + 1}"
+            self.labels += 1
+            value = self.engine.parse_literal(self.take("matrix"), label)
+            self.steps.append(f"{'Vektor' if value.approx.ndim == 1 else 'Matris'} {label} tanimlandi: "
+                              f"{_format(value)} ({_shape(value)})")
+            return value
+        if self.peek("number"):
+            number = self.take("number")
+            return self.engine._operand(exact=np.asarray(Fraction(number), dtype=object), label=number)
+        if self.peek("op", "("):
+            self.take("op")
+            value = self.expr()
+            self.take("op", ")")
+            return value
+        if self.peek("func"):
+            name = self.take("func")
+            if self.peek("op", "("):
+                self.take("op")
+                args = [self.expr()]
+                while self.peek("op", ","):
+                    self.take("op")
+                    args.append(self._norm_order() if name == "norm" else self.expr())
+                self.take("op", ")")
+            else:
+                # Dogal dil: "determinant [[1,2],[3,4]]", "solve A b"
+                args = [self.unary()]
+                if name == "solve":
+                    if self.peek("op", ","):
+                        self.take("op")
+                    args.append(self.unary())
+            return self.engine.apply(name, args, self.steps)
+        raise UnsupportedExpressionError("Ifade ayristirilamadi")
+
+    def _norm_order(self) -> Any:
+        """norm() ikinci argumani: 1, 2, inf, fro veya nuc"""
+        if self.peek("word"):
+            word = self.take("word")
+            if word in _NORM_ORDERS:
+                return _NORM_ORDERS[word]
+        elif self.peek("number"):
+            number = self.take("number")
+            if number.isdigit():
+                return int(number)
+        raise UnsupportedExpressionError("Gecersiz norm turu")
+
+    @staticmethod
+    def _matrix(value: Any) -> Operand:
+        """Ozdeger sonucunun aritmetikte kullanilmasini engeller"""
+        if isinstance(value, _Eigen):
+            raise UnsupportedExpressionError("Ozdeger sonucu baska islemde kullanilamaz")
+        return value
+
+
+def _rewrite(tokens: List[Tuple[str, Any]]) -> List[Tuple[str, Any]]:
+    """Dogal dil kaliplarini fonksiyon cagrisina cevirir
+
+    "A x = b" -> solve(A, b); sonda gelen islem kelimeleri ("A determinanti")
+    basa alinir (ic ice olanlar ters sirayla: "A transpoz determinant" ->
+    det transpose A).
+    """
+    if ("op", "=") in tokens:
+        index = tokens.index(("op", "="))
+        if index < 1 or tokens[index - 1][0] != "x" or index == len(tokens) - 1:
+            raise UnsupportedExpressionError("Denklem 'A x = b' formatinda olmali")
+        left = [token for token in tokens[:index - 1] if token != ("func", "solve")]
+        right = tokens[index + 1:]
+        tokens = [("func", "solve"), ("op", "(")] + left + [("op", ",")] + right + [("op", ")")]
+    if any(kind == "x" for kind, _ in tokens):
+        raise UnsupportedExpressionError("Taninmayan degisken: x")
+    # "eigenvalues and eigenvectors" gibi tekrarlar tek isleme indirgenir
+    tokens = [token for i, token in enumerate(tokens)
+              if not (token[0] == "func" and i and tokens[i - 1] == token)]
+
+    if tokens and tokens[0][0] != "func":
+        trailing: List[Tuple[str, Any]] = []
+        while tokens and tokens[-1][0] == "func":
+            trailing.append(tokens.pop())
+        tokens = trailing + tokens
+    return tokens
+
+
+def _matching_bracket(text: str, start: int) -> int:
+    """text[start] '[' iken eslesen ']' sonrasindaki pozisyonu dondurur"""
+    depth = 0
+    for i in range(start, len(text)):
+        if text[i] == "[":
+            depth += 1
+        elif text[i] == "]":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    raise UnsupportedExpressionError("Kapanmamis koseli parantez")
+
+
+def _is_number(item: Any) -> bool:
+    """Matris elemani gecerli (sonlu int/float) mi"""
+    return isinstance(item, (int, float)) and not isinstance(item, bool) and np.isfinite(item)
+
+
+def _exact_identity(n: int) -> np.ndarray:
+    """Fraction elemanli birim matris"""
+    identity = np.full((n, n), Fraction(0), dtype=object)
+    for i in range(n):
+        identity[i, i] = Fraction(1)
+    return identity
+
+
+def _exact_lu(a: np.ndarray) -> _ExactLU:
+    """Kismi pivotlamali rasyonel LU / basamak formu (rank dahil)
+
+    Sifir olmayan ilk eleman pivot secilir; pivotsuz sutunlar atlanir, bu
+    yuzden kare olmayan ve tekil matrislerde de rank dogru bulunur.
+    """
+    rows, cols = a.shape
+    upper = [list(row) for row in a.tolist()]
+    lower = [[Fraction(int(i == j)) for j in range(rows)] for i in range(rows)]
+    perm = list(range(rows))
+    swaps = 0
+    rank = 0
+
+    for col in range(cols):
+        if rank == rows:
+            break
+        pivot = next((i for i in range(rank, rows) if upper[i][col] != 0), None)
+        if pivot is None:
+            continue
+        if pivot != rank:
+            upper[pivot], upper[rank] = upper[rank], upper[pivot]
+            perm[pivot], perm[rank] = perm[rank], perm[pivot]
+            for j in range(rank):
+                lower[pivot][j], lower[rank][j] = lower[rank][j], lower[pivot][j]
+            swaps += 1
+        for i in range(rank + 1, rows):
+            factor = upper[i][col] / upper[rank][col]
+            if factor:
+                lower[i][rank] = factor
+                upper[i] = [x - factor * y for x, y in zip(upper[i], upper[rank])]
+        rank += 1
+
+    return _ExactLU(lower, upper, perm, swaps, rank)
+
+
+def _exact_det(lu: _ExactLU) -> Fraction:
+    """Tam LU'dan determinant"""
+    n = len(lu.upper)
+    if lu.rank < n:
+        return Fraction(0)
+    det = Fraction(-1 if lu.swaps % 2 else 1)
+    for i in range(n):
+        det *= lu.upper[i][i]
+    return det
+
+
+def _exact_lu_solve(lu: _ExactLU, rhs: np.ndarray) -> np.ndarray:
+    """Tam LU ile L·y = P·b ve U·x = y (ileri/geri yerine koyma)"""
+    n = len(lu.upper)
+    vector = rhs.ndim == 1
+    b = rhs.reshape(n, -1).tolist()
+    y = [list(b[p]) for p in lu.perm]
+    for i in range(n):
+        for j in range(i):
+            if lu.lower[i][j]:
+                y[i] = [u - lu.lower[i][j] * v for u, v in zip(y[i], y[j])]
+    x: List[List[Fraction]] = [[] for _ in range(n)]
+    for i in reversed(range(n)):
+        row = y[i]
+        for j in range(i + 1, n):
+            if lu.upper[i][j]:
+                row = [u - lu.upper[i][j] * v for u, v in zip(row, x[j])]
+        x[i] = [u / lu.upper[i][i] for u in row]
+    result = np.array(x, dtype=object)
+    return result.reshape(n) if vector else result
+
+
+def _exact_norm(a: np.ndarray, order: Any) -> Optional[np.ndarray]:
+    """Rasyonel olarak ifade edilebilen normlar (1, sonsuz, tam kare Frobenius)"""
+    if order in (1, np.inf):
+        if a.ndim == 1:
+            values = [abs(x) for x in a] if order == np.inf else [sum((abs(x) for x in a), Fraction(0))]
+        else:
+            lines = a.T if order == 1 else a
+            values = [sum((abs(x) for x in line), Fraction(0)) for line in lines]
+        return np.asarray(max(values), dtype=object)
+
+    square = sum((x * x for x in a.flat), Fraction(0))
+    numerator, denominator = _isqrt(square.numerator), _isqrt(square.denominator)
+    if numerator is None or denominator is None:
+        return None
+    return np.asarray(Fraction(numerator, denominator), dtype=object)
+
+
+def _to_float(exact: np.ndarray) -> np.ndarray:
+    """Tam (Fraction) diziyi float64'e cevirir; float araligini asan deger hata verir"""
+    try:
+        return np.array(exact, dtype=float)
+    except OverflowError:
+        raise CalculationError(_OVERFLOW_MESSAGE) from None
+
+
+def _isqrt(n: int) -> Optional[int]:
+    """Tam kare ise karekoku, degilse None"""
+    root = math.isqrt(n)
+    return root if root * root == n else None
+
+
+def _clean(x: float) -> float:
+    """Float gurultusunu temizler (12 anlamli basamak, -0.0 -> 0.0)"""
+    return float(f"{x:.12g}") + 0.0
+
+
+def _num(x: Any) -> str:
+    """Tam veya float sayiyi gosterir (1/2, 3, 0.333333)"""
+    if isinstance(x, Fraction):
+        return str(x.numerator) if x.denominator == 1 else f"{x.numerator}/{x.denominator}"
+    return f"{_clean(float(x)):.10g}"
+
+
+def _complex(z: complex) -> str:
+    """Karmasik ozdegeri gosterir (a + bi)"""
+    real, imag = _clean(float(np.real(z))), _clean(float(np.imag(z)))
+    if abs(imag) <= 1e-9 * max(1.0, abs(real)):
+        return f"{real:.10g}"
+    return f"{real:.10g} {'+' if imag > 0 else '-'} {abs(imag):.10g}i"
+
+
+def _shape(value: Operand) -> str:
+    """Boyutu 'satir x sutun' olarak gosterir"""
+    shape = value.approx.shape
+    if not shape:
+        return "skaler"
+    if len(shape) == 1:
+        return f"{shape[0]} elemanli vektor"
+    return f"{shape[0]}x{shape[1]}"
+
+
+def _format(value: Operand, max_elements: int = 36) -> str:
+    """Degeri gosterir (tam ise kesirli); buyuk matrislerde sadece boyut"""
+    source = value.exact if value.exact is not None else value.approx
+    if source.ndim == 0:
+        return _num(source.item())
+    if source.size > max_elements:
+        return f"({_shape(value)} matris)"
+    if source.ndim == 1:
+        return "[" + ", ".join(_num(x) for x in source) + "]"
+    return "[" + ", ".join("[" + ", ".join(_num(x) for x in row) + "]" for row in source) + "]"
+
+
+def _as_result(value: Operand) -> Any:
+    """Degeri CalculationResult'a uygun tipe cevirir (float, liste, matris)"""
+    approx = value.approx
+    if value.exact is not None:
+        approx = np.array(value.exact, dtype=float)
+    if approx.ndim == 0:
+        return _clean(float(approx))
+    if approx.ndim == 1:
+        return [_clean(float(x)) for x in approx]
+    return [[_clean(float(x)) for x in row] for row in approx]
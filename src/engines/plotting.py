@@ -0,0 +1,586 @@
+"""Compiled, cached vectorized expression evaluator for plotting"""
+
+import base64
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.engines.calculus import CalculusEngine, _get_sympy, _show
+from src.utils.exceptions import UnsupportedExpressionError
+
+_TURKISH_CHARS = str.maketrans("çğıöşüÇĞİÖŞÜ", "cgiosuCGIOSU")
+
+# "y = ...", "f(x) = ...", "z(x, y) = ..." gibi sol taraflar
+_LHS_RE = re.compile(r"^\s*(?:[a-z]\s*(?:\(\s*[a-z](?:\s*,\s*[a-z])*\s*\))?)\s*=(?!=)\s*")
+# LLM'in urettigi "np.sin(x)", "math.exp(x)" gibi modul onekleri
+_MODULE_PREFIX_RE = re.compile(r"\b(?:np|numpy|math)\.")
+# Polar grafiklerde aci degiskeni parser'in tek harfli sembolune (t) cevrilir
+_THETA_RE = re.compile(r"θ|(?<![a-z])theta(?![a-z])")
+
+
+class CurveSample(NamedTuple):
+    """Uyarlamali ornekleme sonucu
+
+    `y` icindeki NaN degerleri cizgiyi boler (tanim disi bolgeler ve
+    tekillik noktalari); `evaluations` fonksiyonun kac noktada
+    degerlendirildigidir. Degerler asimptotlarda patlarsa `y_limits`
+    ilk esit aralikli izgaradan hesaplanan gorunur y araligidir.
+    """
+    x: np.ndarray
+    y: np.ndarray
+    evaluations: int
+    singularities: int
+    y_limits: Optional[Tuple[float, float]] = None
+
+
+class CompiledExpression:
+    """Derlenmis, NumPy ile vektorel calisan ifade
+
+    Attributes:
+        canonical: SymPy'nin kanonik yazimi (cache anahtari)
+        variables: Argumanlarin sirasi
+        expr: SymPy ifadesi
+    """
+
+    __slots__ = ("canonical", "variables", "expr", "_function")
+
+    def __init__(self, canonical: str, variables: Tuple[str, ...], expr: Any, function: Callable[..., Any]):
+        self.canonical = canonical
+        self.variables = variables
+        self.expr = expr
+        self._function = function
+
+    def __call__(self, *values: Any) -> np.ndarray:
+        """Ifadeyi verilen dizilerde degerlendirir
+
+        Tanimsiz noktalar (log(-1), 1/0 vb.) NaN olur; sabit ifadeler
+        girdinin seklinde bir diziye genisletilir.
+
+        Returns:
+            float dizisi
+        """
+        arrays = [np.asarray(value, dtype=float) for value in values]
+        with np.errstate(all="ignore"):
+            result = np.asarray(self._function(*arrays))
+        shape = np.broadcast_shapes(*(array.shape for array in arrays)) if arrays else ()
+        if np.iscomplexobj(result):
+            result = np.where(np.abs(result.imag) <= 1e-12 * np.maximum(1.0, np.abs(result.real)), result.real, np.nan)
+        result = np.broadcast_to(result.astype(float, copy=False), shape).copy()
+        result[~np.isfinite(result)] = np.nan
+        return result
+
+    def at(self, *point: float) -> float:
+        """Tek noktadaki deger (vurgulanan noktalar icin)"""
+        return float(self(*(np.array([value]) for value in point))[0])
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.canonical!r}, variables={self.variables})"
+
+
+class ExpressionCompiler:
+    """Grafik ifadelerini bir kez dogrulayip vektorel NumPy fonksiyonuna derler
+
+    Ifade kalkulus motorunun beyaz listeli parser'i ile SymPy agacina
+    cevrilir (ham metin hicbir zaman `eval` edilmez), sonra `lambdify` ile
+    NumPy fonksiyonuna derlenir. Derlenmis fonksiyonlar kanonik SymPy
+    yazimina gore sinirli bir LRU cache'te tutulur; "x^2", "x**2" ve "x*x"
+    ayni fonksiyonu paylasir, ayni ifadenin tekrar cizimi, vurgulanan
+    noktalar ve aralik degisiklikleri yeniden derleme yapmaz.
+
+    Ayristirilamayan veya izin verilmeyen degiskenler iceren ifadeler
+    UnsupportedExpressionError ile reddedilir.
+    """
+
+    def __init__(self, cache_size: int = 256):
+        """Derleyiciyi baslatir
+
+        Args:
+            cache_size: Derlenmis ifade cache'inin maksimum eleman sayisi
+        """
+        self.cache_size = cache_size
+        self.parser = CalculusEngine(cache_size=cache_size)
+        self._compiled: "OrderedDict[Tuple[str, Tuple[str, ...]], CompiledExpression]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def compile(
+        self,
+        text: str,
+        variables: Optional[Sequence[str]] = None,
+        max_variables: int = 1
+    ) -> CompiledExpression:
+        """Ifadeyi derler (veya cache'ten dondurur)
+
+        Args:
+            text: Ifade (ornek: "x^2 + 2x + 1", "y = sin(x)/x")
+            variables: Arguman sirasi; verilmezse ifadedeki serbest
+                degiskenler alfabetik sirayla kullanilir
+            max_variables: variables verilmediginde izin verilen en fazla degisken
+
+        Returns:
+            CompiledExpression
+
+        Raises:
+            UnsupportedExpressionError: Ifade ayristirilamadi veya degiskenler uyusmuyor
+        """
+        expr = self.parser.parse_expression(normalize_expression(text))
+        free = tuple(sorted(symbol.name for symbol in expr.free_symbols))
+        if variables is None:
+            if len(free) > max_variables:
+                raise UnsupportedExpressionError(f"Cok fazla degisken: {', '.join(free)}")
+            variables = free or ("x",)
+        else:
+            variables = tuple(variables)
+            unknown = set(free) - set(variables)
+            if unknown:
+                raise UnsupportedExpressionError(f"Bilinmeyen degisken: {', '.join(sorted(unknown))}")
+
+        key = (_show(expr), variables)
+        with self._lock:
+            compiled = self._compiled.get(key)
+            if compiled is not None:
+                self._compiled.move_to_end(key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        sympy = _get_sympy()
+        symbols = [sympy.Symbol(name) for name in variables]
+        compiled = CompiledExpression(key[0], variables, expr, sympy.lambdify(symbols, expr, modules="numpy"))
+        with self._lock:
+            self._compiled[key] = compiled
+            while len(self._compiled) > self.cache_size:
+                self._compiled.popitem(last=False)
+        return compiled
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache sayaclarini dondurur"""
+        return {
+            "compiled_cache": {"hits": self.hits, "misses": self.misses, "size": len(self._compiled)},
+            **{name: info for name, info in self.parser.stats().items() if name == "parse_cache"},
+        }
+
+
+def normalize_expression(text: str) -> str:
+    """Grafik ifadesini parser'in bekledigi bicime getirir
+
+    Sol taraf ("y =", "f(x) =") ve "np."/"math." onekleri atilir,
+    Turkce karakterler ve buyuk harfler sadelestirilir.
+    """
+    text = text.translate(_TURKISH_CHARS).lower().strip()
+    text = _MODULE_PREFIX_RE.sub("", text)
+    text = text.replace("**", "^")
+    return _LHS_RE.sub("", text, count=1)
+
+
+def sample_curve(
+    function: Callable[[np.ndarray], np.ndarray],
+    x_min: float,
+    x_max: float,
+    max_points: int = 2000,
+    initial_points: int = 129,
+    max_depth: int = 12,
+    tolerance: float = 1e-3
+) -> CurveSample:
+    """Tek bir egriyi uyarlamali olarak ornekler (bkz. sample_curves)"""
+    return sample_curves([function], x_min, x_max, max_points, initial_points, max_depth, tolerance)[0]
+
+
+def sample_curves(
+    functions: Sequence[Callable[[np.ndarray], np.ndarray]],
+    x_min: float,
+    x_max: float,
+    max_points: int = 2000,
+    initial_points: int = 129,
+    max_depth: int = 12,
+    tolerance: float = 1e-3
+) -> List[CurveSample]:
+    """Egrileri ortak bir x izgarasinda uyarlamali olarak ornekler
+
+    Kaba bir esit aralikli izgaradan baslanir; her turda yalnizca orta
+    noktasi dogrusal enterpolasyondan `tolerance * gorunur y araligi`
+    kadar sapan (egrilik, dar tepe) veya bir ucu tanimsiz olan araliklar
+    ikiye bolunur. Orta noktalar her turda tek vektorel cagri ile
+    hesaplanir. Butce yetmezse en cok sapan araliklar once incelir.
+
+    Birden fazla fonksiyon ayni x noktalarini paylasir: bir araligi
+    herhangi bir egri gerektiriyorsa aralik hepsi icin bolunur. Butce
+    x noktasi basinadir.
+
+    Inceltmeye ragmen kapanmayan buyuk sicramalar (tan(x), 1/x
+    asimptotlari) tekillik sayilir ve araya NaN konarak cizgi bolunur;
+    ayni noktada kirilmayan egriler icin ara deger enterpolasyonla
+    doldurulur.
+
+    Args:
+        functions: Vektorel fonksiyonlar (CompiledExpression)
+        x_min: Aralik baslangici
+        x_max: Aralik sonu
+        max_points: Toplam degerlendirme butcesi
+        initial_points: Ilk izgaradaki nokta sayisi
+        max_depth: Bir araligin en fazla kac kez bolunebilecegi
+        tolerance: Gorunur y araligina gore izin verilen sapma
+
+    Returns:
+        Her fonksiyon icin ayni x dizisini paylasan CurveSample listesi
+    """
+    def evaluate(points: np.ndarray) -> np.ndarray:
+        return np.vstack([function(points) for function in functions])
+
+    max_points = max(int(max_points), 3)
+    initial_points = min(max(int(initial_points), 3), max_points)
+    x = np.linspace(float(x_min), float(x_max), initial_points)
+    y = evaluate(x)
+    if x_max <= x_min:
+        return [CurveSample(x, row, len(x), 0) for row in y]
+
+    # Asimptotlardaki dev degerler olcegi bozmasin diye her egri icin %2-%98 araligi
+    low, high, extent = (np.zeros(len(functions)) for _ in range(3))
+    for index, row in enumerate(y):
+        finite = row[np.isfinite(row)]
+        if finite.size:
+            low[index], high[index] = np.percentile(finite, [2, 98])
+            extent[index] = np.ptp(finite)
+    span = high - low
+    # Dar bir tepe disinda sabit egrilerde (exp(-100x^2)) bant neredeyse sifirdir
+    scale = np.maximum(span, 1e-2 * extent)
+    scale[scale == 0] = 1.0
+    threshold = tolerance * scale
+
+    # Tekillik kontrolu icin butcenin kucuk bir kismi ayrilir
+    reserve = min(16, max_points // 20)
+    xs, ys = [x], [y]
+    left, right = x[:-1], x[1:]
+    y_left, y_right = y[:, :-1], y[:, 1:]
+    evaluations = len(x)
+    waiting = []
+
+    for _ in range(max_depth):
+        budget = max_points - reserve - evaluations
+        if budget <= 0 or len(left) == 0:
+            break
+        if len(left) > budget:
+            # Butce yetmiyorsa en buyuk sicramali araliklar once; digerleri acik kalir
+            jump = np.max(np.abs(np.nan_to_num(y_right - y_left, nan=np.inf)) / scale[:, None], axis=0)
+            keep = np.zeros(len(left), dtype=bool)
+            keep[np.argsort(-jump, kind="stable")[:budget]] = True
+            waiting.append((left[~keep], right[~keep], y_left[:, ~keep], y_right[:, ~keep]))
+            left, right, y_left, y_right = left[keep], right[keep], y_left[:, keep], y_right[:, keep]
+        middle = (left + right) / 2
+        y_middle = evaluate(middle)
+        evaluations += len(middle)
+        xs.append(middle)
+        ys.append(y_middle)
+
+        deviation = np.abs(y_middle - (y_left + y_right) / 2)
+        nan_count = np.isnan(y_left).astype(int) + np.isnan(y_right).astype(int) + np.isnan(y_middle).astype(int)
+        # Tamamen tanimsiz araliklar bolunmez; tanim sinirlari (kismi NaN) bolunur
+        refine = ((deviation > threshold[:, None]) | ((nan_count > 0) & (nan_count < 3))).any(axis=0)
+
+        left, right = np.concatenate([left[refine], middle[refine]]), np.concatenate([middle[refine], right[refine]])
+        y_left = np.concatenate([y_left[:, refine], y_middle[:, refine]], axis=1)
+        y_right = np.concatenate([y_middle[:, refine], y_right[:, refine]], axis=1)
+
+    for pending_left, pending_right, pending_y_left, pending_y_right in waiting:
+        left, right = np.concatenate([left, pending_left]), np.concatenate([right, pending_right])
+        y_left = np.concatenate([y_left, pending_y_left], axis=1)
+        y_right = np.concatenate([y_right, pending_y_right], axis=1)
+
+    # Kapanmayan, gorunur araliktan buyuk sicrayan ve bir ucu gorunur bandin disinda
+    # kalan araliklar tekillik adayidir: isaret degistirenler (tan, 1/x) veya orta
+    # noktasi uclarin disina tasanlar (1/x^2) bolunur
+    jump = np.abs(y_right - y_left)
+    outside = (np.maximum(y_left, y_right) > high[:, None]) | (np.minimum(y_left, y_right) < low[:, None])
+    candidate = np.isfinite(jump) & (jump > np.maximum(span, threshold)[:, None]) & outside
+    broken = candidate & (np.sign(y_left) != np.sign(y_right))
+    undecided = candidate & ~broken
+    # Orta nokta kontrolu once en buyuk degerli (kutba en yakin) araliklara
+    check = np.flatnonzero(undecided.any(axis=0))
+    magnitude = np.where(undecided, np.minimum(np.abs(y_left), np.abs(y_right)), -np.inf).max(axis=0)
+    check = check[np.argsort(-magnitude[check], kind="stable")]
+    check = np.sort(check[:max(max_points - evaluations, 0)])
+    if len(check):
+        y_middle = evaluate((left[check] + right[check]) / 2)
+        evaluations += len(check)
+        lower, upper = np.minimum(y_left[:, check], y_right[:, check]), np.maximum(y_left[:, check], y_right[:, check])
+        broken[:, check] |= undecided[:, check] & ~((y_middle >= lower) & (y_middle <= upper))
+
+    x = np.concatenate(xs)
+    y = np.concatenate(ys, axis=1)
+    order = np.argsort(x, kind="stable")
+    x, y = x[order], y[:, order]
+    gap = broken.any(axis=0)
+    if gap.any():
+        filler = (y_left[:, gap] + y_right[:, gap]) / 2
+        filler[broken[:, gap]] = np.nan
+        gaps = np.searchsorted(x, left[gap]) + 1
+        x = np.insert(x, gaps, (left[gap] + right[gap]) / 2)
+        y = np.insert(y, gaps, filler, axis=1)
+
+    # Tekillik varsa veya inceltme ilk izgaranin cok otesinde degerler bulduysa
+    # eksen esit aralikli izgaranin %2-%98 bandina sinirlanir
+    samples = []
+    for index, row in enumerate(y):
+        y_limits = None
+        refined = row[np.isfinite(row)]
+        if span[index] > 0 and (broken[index].any() or np.ptp(refined) > 100 * extent[index]):
+            y_limits = (float(low[index] - 0.25 * span[index]), float(high[index] + 0.25 * span[index]))
+        samples.append(CurveSample(x, row, evaluations, int(broken[index].sum()), y_limits))
+    return samples
+
+
+def split_components(text: str) -> List[str]:
+    """Parametrik ifadeyi bilesenlerine ayirir
+
+    "x = cos(t), y = sin(t)", "(cos(t), sin(t))" ve "cos(t); sin(t)"
+    bicimleri desteklenir; parantez icindeki virguller bolunmez.
+
+    Returns:
+        Sol taraflari atilmis bilesen ifadeleri
+    """
+    text = text.strip()
+    if text[:1] in "([" and text[-1:] in ")]":
+        depth = 0
+        for index, char in enumerate(text):
+            depth += char in "(["
+            depth -= char in ")]"
+            if depth == 0 and index < len(text) - 1:
+                break
+        else:
+            text = text[1:-1]
+
+    components, depth, current = [], 0, ""
+    for char in text:
+        depth += char in "(["
+        depth -= char in ")]"
+        if char in ",;" and depth == 0:
+            components.append(current)
+            current = ""
+        else:
+            current += char
+    components.append(current)
+    return [_LHS_RE.sub("", part.strip(), count=1) for part in components if part.strip()]
+
+
+def normalize_polar(text: str) -> str:
+    """r(θ) ifadesinde aci degiskenini ("θ", "theta") t'ye cevirir"""
+    return _THETA_RE.sub("t", text.strip().lower())
+
+
+def level_of_detail(
+    function: Callable[..., np.ndarray],
+    ranges: Sequence[Sequence[float]],
+    pixels: int,
+    pixels_per_sample: float,
+    time_budget: float,
+    max_resolution: int,
+    min_resolution: int = 8
+) -> int:
+    """Eksen basina ornek sayisini cikti boyutu ve zaman butcesinden secer
+
+    Pikselden daha sik ornek gozle gorulmez; bu yuzden ust sinir
+    `pixels / pixels_per_sample`'dir. Fonksiyon once kucuk bir izgarada
+    olculur ve tahmini degerlendirme suresi `time_budget`'i asmayacak
+    cozunurluk secilir; pahali ifadeler isciyi kilitlemez.
+
+    Args:
+        function: Vektorel fonksiyon
+        ranges: Her degisken icin [min, max]
+        pixels: Ciktinin ilgili eksendeki piksel sayisi
+        pixels_per_sample: Bir ornegin kapladigi piksel
+        time_budget: Degerlendirme icin ayrilan sure (saniye)
+        max_resolution: Eksen basina ust sinir
+        min_resolution: Eksen basina alt sinir
+
+    Returns:
+        Eksen basina ornek sayisi
+    """
+    dimensions = len(ranges)
+    probe = 16
+    axes = [np.linspace(low, high, probe) for low, high in ranges]
+    started = time.perf_counter()
+    function(*np.meshgrid(*axes))
+    per_sample = max((time.perf_counter() - started) / probe ** dimensions, 1e-9)
+
+    pixel_cap = int(pixels / pixels_per_sample)
+    time_cap = int((time_budget / per_sample) ** (1 / dimensions))
+    return max(min_resolution, min(pixel_cap, time_cap, max_resolution))
+
+
+def sample_surface(
+    function: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    x_range: Sequence[float],
+    y_range: Sequence[float],
+    resolution: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """z = f(x, y) yuzeyini meshgrid uzerinde tek cagrida degerlendirir
+
+    Asimptotlardaki dev degerler (1/(x^2+y^2)) yuzeyi ezmesin diye %2-%98
+    bandinin cok disindaki degerler NaN yapilir.
+
+    Returns:
+        (X, Y, Z) dizileri
+    """
+    x = np.linspace(x_range[0], x_range[1], resolution)
+    y = np.linspace(y_range[0], y_range[1], resolution)
+    grid_x, grid_y = np.meshgrid(x, y)
+    grid_z = function(grid_x, grid_y)
+
+    finite = grid_z[np.isfinite(grid_z)]
+    if finite.size:
+        low, high = np.percentile(finite, [2, 98])
+        span = high - low
+        if span > 0 and np.ptp(finite) > 10 * span:
+            grid_z[(grid_z < low - span) | (grid_z > high + span)] = np.nan
+    return grid_x, grid_y, grid_z
+
+
+def sample_polar(
+    function: Callable[[np.ndarray], np.ndarray],
+    theta_range: Sequence[float],
+    resolution: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """r(θ) egrisini degerlendirir; negatif r ters yone (θ + π) cevrilir
+
+    Returns:
+        (theta, r) dizileri
+    """
+    theta = np.linspace(theta_range[0], theta_range[1], resolution)
+    radius = function(theta)
+    negative = radius < 0
+    return np.where(negative, theta + np.pi, theta), np.abs(radius)
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Largest-Triangle-Three-Buckets ile egriyi `threshold` noktaya indirir
+
+    Ilk ve son nokta korunur; aradaki her kovadan, onceki secilen nokta ve
+    sonraki kovanin ortalamasiyla en buyuk ucgeni olusturan nokta secilir.
+    Boylece tepe ve cukurlar esit aralikli seyreltmeye gore cok daha iyi
+    korunur. NaN ile ayrilmis parcalar (tekillikler, tanim disi bolgeler)
+    ayri ayri, uzunluklariyla orantili butceyle seyreltilir ve aralarindaki
+    NaN korunur (ayiraclar dahil toplam `threshold`'u asmaz; cok sayida
+    parcada her parcanin iki ucu korunur).
+
+    Returns:
+        (x, y) seyreltilmis diziler
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if threshold >= len(x) or threshold < 3:
+        return x, y
+
+    finite = np.isfinite(y)
+    if not finite.all():
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], finite.astype(int), [0]))))
+        runs = list(zip(edges[::2], edges[1::2]))
+        total = sum(end - start for start, end in runs)
+        # Parcalar arasindaki NaN ayiraclari da butceden sayilir
+        budget = max(threshold - (len(runs) - 1), 2 * len(runs))
+        xs, ys = [], []
+        for start, end in runs:
+            share = max(2, int(budget * (end - start) / total))
+            part_x, part_y = _lttb(x[start:end], y[start:end], share)
+            xs.extend([part_x, [np.nan]])
+            ys.extend([part_y, [np.nan]])
+        if not xs:
+            return x[:0], y[:0]
+        return np.concatenate(xs[:-1]), np.concatenate(ys[:-1])
+    return _lttb(x, y, threshold)
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> Tuple[np.ndarray, np.ndarray]:
+    """NaN icermeyen tek parca icin LTTB"""
+    if threshold >= len(x) or len(x) <= 2:
+        return x, y
+    if threshold <= 2:
+        return x[[0, -1]], y[[0, -1]]
+
+    # Ilk ve son nokta disindaki noktalar threshold - 2 kovaya bolunur
+    bounds = np.linspace(1, len(x) - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0], selected[-1] = 0, len(x) - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = bounds[bucket], max(bounds[bucket + 1], bounds[bucket] + 1)
+        next_start, next_end = end, bounds[bucket + 2] if bucket + 2 < len(bounds) else len(x)
+        next_x = x[next_start:max(next_end, next_start + 1)].mean()
+        next_y = y[next_start:max(next_end, next_start + 1)].mean()
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    return x[selected], y[selected]
+
+
+def encode_array(values: Any) -> Dict[str, Any]:
+    """Diziyi JSON icin kompakt bicime (base64, little-endian float32) cevirir
+
+    NaN degerleri korunur (istemci cizgiyi orada boler). float32 ekran
+    cozunurlugu icin fazlasiyla yeterlidir ve JSON sayi listesine gore
+    kabaca 3-4 kat daha kucuktur.
+    """
+    array = np.ascontiguousarray(values, dtype="<f4")
+    return {
+        "dtype": "<f4",
+        "shape": list(array.shape),
+        "data": base64.b64encode(array.tobytes()).decode("ascii"),
+    }
+
+
+def decode_array(encoded: Dict[str, Any]) -> np.ndarray:
+    """encode_array ciktisini NumPy dizisine geri cevirir"""
+    data = np.frombuffer(base64.b64decode(encoded["data"]), dtype=encoded["dtype"])
+    return data.reshape(encoded["shape"]).astype(float)
+
+
+def encode_plot_data(spec: Dict[str, Any], target_points: int) -> Dict[str, Any]:
+    """Cizim tarifini istemci tarafinda cizilecek kompakt veriye cevirir
+
+    Egriler LTTB ile `target_points` noktaya, yuzeyler eksen basina
+    sqrt(target_points) noktaya seyreltilir; diziler encode_array ile
+    kodlanir. PNG uretilmez, matplotlib hic kullanilmaz.
+
+    Args:
+        spec: render_figure'a verilecek cizim tarifi
+        target_points: Egri basina (yuzeyde toplam) hedef nokta sayisi
+
+    Returns:
+        JSON'a cevrilebilir dict
+    """
+    data: Dict[str, Any] = {
+        "projection": spec.get("projection") or "2d",
+        "title": spec.get("title", ""),
+        "series": [],
+    }
+    for series in spec.get("series", []):
+        series_x, series_y = lttb(series["x"], series["y"], target_points)
+        data["series"].append({
+            "label": series.get("label"),
+            "points": int(len(series_x)),
+            "x": encode_array(series_x),
+            "y": encode_array(series_y),
+        })
+    surface = spec.get("surface")
+    if surface is not None:
+        step = max(1, int(np.ceil(surface["z"].shape[0] / max(2, int(np.sqrt(target_points))))))
+        data["surface"] = {
+            "x": encode_array(surface["x"][0, ::step]),
+            "y": encode_array(surface["y"][::step, 0]),
+            "z": encode_array(surface["z"][::step, ::step]),
+        }
+    if spec.get("points"):
+        data["points"] = [
+            {"x": float(point["x"]), "y": float(point["y"]), "label": point.get("label"), "name": point.get("name")}
+            for point in spec["points"]
+        ]
+    if spec.get("y_limits"):
+        data["y_limits"] = list(spec["y_limits"])
+    return data
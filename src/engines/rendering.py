@@ -0,0 +1,256 @@
+"""Off-event-loop plot rendering with matplotlib's object-oriented API"""
+
+import asyncio
+import io
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional
+
+from src.utils.exceptions import CalculationError
+from src.utils.logger import setup_logger
+
+logger = setup_logger()
+
+
+def _prewarm() -> None:
+    """Isci sureci baslatici: matplotlib'i ve font cache'ini bir kez yukler"""
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(1, 1))
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
+    axes.plot([0, 1], [0, 1], label="x")
+    axes.legend()
+    figure.savefig(io.BytesIO(), format="png")
+
+
+def _ping() -> int:
+    """Surecin ayakta oldugunu dogrulayan bos is"""
+    return os.getpid()
+
+
+_local = threading.local()
+
+
+def _warm_figure() -> Any:
+    """Thread'e (isci surecte surece) ozel, tekrar kullanilan Figure
+
+    Figure/canvas ve font/metin cache'leri her cizimde yeniden
+    olusturulmaz; her cizimden once figur temizlenir.
+    """
+    figure = getattr(_local, "figure", None)
+    if figure is None:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        _local.figure = figure
+    figure.clear()
+    return figure
+
+
+def render_figure(spec: Dict[str, Any]) -> str:
+    """Cizim tarifini PNG dosyasina cizer
+
+    pyplot'un global durumu kullanilmaz; her thread kendi Figure'unu
+    kullanir, bu yuzden fonksiyon hem isci sureclerinde hem thread'lerde
+    guvenlidir. Dosya once gecici isimle yazilir, sonra atomik olarak
+    yerine tasinir.
+
+    Args:
+        spec: Cizim tarifi:
+            path: Hedef PNG yolu
+            projection: None (2D), "3d" veya "polar"
+            series: [{"x", "y", "label", "style"}] cizgiler (polar'da x aci, y yaricap)
+            surface: {"x", "y", "z"} meshgrid yuzeyi (projection="3d")
+            points: [{"x", "y", "label", "name", "color"}] vurgulanan noktalar
+            title, xlabel, ylabel, zlabel, y_limits, equal_aspect, figsize, dpi
+
+    Returns:
+        Yazilan PNG dosyasinin yolu
+    """
+    figure = _warm_figure()
+    figure.set_size_inches(spec.get("figsize", (10, 6)))
+    projection = spec.get("projection")
+    axes = figure.add_subplot(projection=projection)
+
+    surface = spec.get("surface")
+    if surface is not None:
+        axes.plot_surface(
+            surface["x"], surface["y"], surface["z"],
+            cmap="viridis", rstride=1, cstride=1, linewidth=0, antialiased=False,
+        )
+    for series in spec.get("series", []):
+        axes.plot(series["x"], series["y"], series.get("style", "-"), linewidth=2, label=series.get("label"))
+    if spec.get("y_limits"):
+        axes.set_ylim(*spec["y_limits"])
+    for point in spec.get("points", []):
+        axes.plot(point["x"], point["y"], "o", color=point.get("color", "red"), markersize=10, label=point.get("label"))
+        axes.annotate(
+            (f"{point['name']} " if point.get("name") else "") + f"({point['x']}, {point['y']:.2f})",
+            (point["x"], point["y"]),
+            xytext=(10, 10),
+            textcoords="offset points",
+            arrowprops=dict(arrowstyle="->"),
+        )
+
+    if spec.get("equal_aspect"):
+        axes.set_aspect("equal", adjustable="datalim")
+
+    axes.grid(True, alpha=0.3)
+    if projection != "polar":
+        axes.set_xlabel(spec.get("xlabel", "x"))
+        axes.set_ylabel(spec.get("ylabel", "y"))
+    if projection == "3d":
+        axes.set_zlabel(spec.get("zlabel", "z"))
+    axes.set_title(spec.get("title", ""))
+    if axes.get_legend_handles_labels()[0]:
+        axes.legend()
+
+    path = spec["path"]
+    temporary = f"{path}.{os.getpid()}.tmp"
+    figure.savefig(temporary, format="png", dpi=spec.get("dpi", 150), bbox_inches="tight")
+    os.replace(temporary, path)
+    return path
+
+
+def render_batch(specs: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """Bir grup cizimi tek iste, ayni sicak Figure ile cizer
+
+    Bir cizimin hatasi digerlerini etkilemez.
+
+    Returns:
+        Her tarif icin {"path": ...} veya {"error": ...}
+    """
+    results = []
+    for spec in specs:
+        try:
+            results.append({"path": render_figure(spec)})
+        except Exception as e:
+            results.append({"error": f"{type(e).__name__}: {e}"})
+    return results
+
+
+class PlotRenderer:
+    """Grafikleri event loop disinda, sinirli bir surec havuzunda cizer
+
+    Havuz ilk kullanimda (veya `prewarm` ile) "spawn" baglamiyla kurulur;
+    her isci baslarken matplotlib'i ve font cache'ini yukler. Her cizim
+    `timeout` ile sinirlanir: sure asilirsa veya bir isci cokerse havuz
+    yeniden kurulur ve CalculationError firlatilir. `workers=0` ise cizim
+    varsayilan thread havuzunda yapilir (OO API thread-safe'dir).
+    """
+
+    def __init__(self, workers: int = 2, timeout: float = 20.0):
+        """Renderer'i baslatir
+
+        Args:
+            workers: Isci surec sayisi (0 ise thread havuzu kullanilir)
+            timeout: Tek bir cizim icin izin verilen sure (saniye)
+        """
+        self.workers = max(0, workers)
+        self.timeout = timeout
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.renders = 0
+        self.timeouts = 0
+        self.restarts = 0
+
+    def _get_pool(self) -> Optional[Executor]:
+        """Surec havuzunu (gerekirse kurarak) dondurur"""
+        if self.workers == 0:
+            return None
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_prewarm,
+                )
+            return self._pool
+
+    def prewarm(self) -> None:
+        """Isci sureclerini simdiden baslatir (beklemeden)
+
+        Surecler matplotlib'i arka planda yukler; ilk cizim soguk
+        baslangic maliyetini odemez.
+        """
+        pool = self._get_pool()
+        if pool is not None:
+            for _ in range(self.workers):
+                pool.submit(_ping)
+
+    async def render(
+        self,
+        function: Callable[[Any], Any],
+        spec: Any,
+        timeout: Optional[float] = None
+    ) -> Any:
+        """Cizimi havuzda calistirir, event loop'u bloklamaz
+
+        Args:
+            function: Modul seviyesinde (picklable) cizim fonksiyonu
+            spec: Cizim tarifi (render_batch icin tarif listesi)
+            timeout: Bu is icin sure siniri (varsayilan: self.timeout)
+
+        Returns:
+            Cizim fonksiyonunun sonucu (render_figure icin dosya yolu)
+
+        Raises:
+            CalculationError: Zaman asimi veya isci hatasi
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        timeout = timeout or self.timeout
+        try:
+            path = await asyncio.wait_for(loop.run_in_executor(pool, function, spec), timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            logger.warning(f"Plot render timed out after {timeout}s")
+            self._reset(pool)
+            raise CalculationError(f"Grafik cizimi {timeout:g} saniyede tamamlanamadi")
+        except BrokenProcessPool as e:
+            logger.error(f"Plot render worker crashed: {e}")
+            self._reset(pool)
+            raise CalculationError("Grafik cizim sureci beklenmedik sekilde sonlandi")
+        self.renders += 1
+        return path
+
+    def _reset(self, pool: Optional[Executor]) -> None:
+        """Takilan veya coken havuzu kapatir; sonraki cizim yenisini kurar"""
+        if not isinstance(pool, ProcessPoolExecutor):
+            return
+        with self._lock:
+            if self._pool is not pool:
+                return
+            self._pool = None
+            self.restarts += 1
+        # Calisan isler iptal edilemez; takilan isciler sonlandirilir
+        processes = list((getattr(pool, "_processes", None) or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    def shutdown(self) -> None:
+        """Havuzu kapatir"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Renderer sayaclarini dondurur"""
+        return {
+            "workers": self.workers,
+            "renders": self.renders,
+            "timeouts": self.timeouts,
+            "restarts": self.restarts,
+        }
@@ -0,0 +1,353 @@
+"""Local dataset/operation extractor and single-pass statistics for statistics queries"""
+
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.engines.streaming import (
+    MULTIVARIATE_OPERATIONS,
+    RunningCovariance,
+    StreamingSummary,
+    iter_columns,
+    resolve_data_path,
+    summarize,
+)
+from src.utils.exceptions import CalculationError, UnsupportedExpressionError
+
+_TURKISH_CHARS = str.maketrans("çğıöşüÇĞİÖŞÜ", "cgiosuCGIOSU")
+
+_NUMBER = r"[-+]?(?:\d+(?:[.,]\d+)?|[.,]\d+)(?:e[-+]?\d+)?"
+_NUMBER_RE = re.compile(rf"^{_NUMBER}$")
+# Koseli/normal/suslu parantez icindeki liste: "[10, 20, 30]", "(1; 2,5; 4)"
+_LIST_RE = re.compile(r"[\[({]([^\[\](){}]*)[\])}]")
+# Satir listesi (her ic liste bir gozlem): "[[1, 2], [2, 4], [3, 7]]"
+_NESTED_RE = re.compile(r"\[\s*\[[^\[\]]*\](?:\s*,?\s*\[[^\[\]]*\])*\s*\]")
+# Liste adi: "x = [1, 2, 3]", "boy: [170, 180]"
+_LIST_NAME_RE = re.compile(r"([a-z_][\w-]*)\s*[:=]\s*$")
+# Parantezsiz sayi dizisi: "10, 20, 30", "1 2 3 ve 4", "5; 7; 9"
+_SEQUENCE_RE = re.compile(
+    rf"(?<![\w.]){_NUMBER}(?:(?:\s*[,;]\s*|\s+(?:(?:ve|and)\s+)?){_NUMBER})+(?![\w.])"
+)
+
+# Dosya referansi: "veriler.csv", "'olcumler/2024.npy'"
+_FILE_RE = re.compile(r"[\"']?((?:[\w.-]+[/\\])*[\w.-]+\.(?:csv|tsv|npy))\b[\"']?", re.IGNORECASE)
+# Sutun secimi: "fiyat sutunu", "x ve y sutunlari", "column price", "sutun: fiyat", "3. sutun"
+_NAME = r"[\"']?[\w-]+[\"']?"
+_NAMES = rf"{_NAME}(?:\s*(?:,|\bve\b|\band\b)\s*{_NAME})*"
+_COLUMN_PATTERNS = [
+    r"(\d+)\s*\.?\s*(?:sutun|kolon|column)\w*",
+    rf"(?:sutun|kolon)\w*\s*[:=]\s*({_NAMES})",
+    rf"({_NAMES})\s+(?:sutun|kolon)\w*",
+    rf"\bcolumns?(?:\s*[:=]\s*|\s+(?:no\s*|#\s*)?)({_NAMES})",
+    rf"({_NAMES})\s+columns?\b",
+]
+# Persentil: "90. persentil", "%95 yuzdelik", "p99", "75th percentile"
+_PERCENTILE_PATTERNS = [
+    r"%\s*(\d+(?:[.,]\d+)?)\s*(?:'?[a-z]*\s+)?(?:persentil|percentile|yuzdelik)\w*",
+    r"(\d+(?:[.,]\d+)?)\s*(?:\.|'?[a-z]{1,4}\b)?\s*(?:persentil|percentile|yuzdelik)\w*",
+    r"\bp(\d{1,2}(?:\.\d+)?)\b",
+]
+_COLUMN_STOPWORDS = {"of", "in", "the", "from", "for", "icin", "ve", "and", "dosya", "dosyasi", "dosyasindaki"}
+
+# Islem anahtar kelimeleri (Turkce karakterler ASCII'ye cevrilmis, kucuk harf);
+# liste sirasi cok islemli sonuclarin sirasidir
+_OPERATION_PATTERNS: List[Tuple[str, str]] = [
+    ("describe", r"\bdescribe\b|\bozet\w*|\bbetimsel\b|\btanimlayici\b|\bsummary\b|\btum\s+istatistik\w*"),
+    ("count", r"\bkac\s+(?:deger|veri|satir|eleman)\w*|\bcount\b"),
+    ("mean", r"\bortalama\w*|\bort\b|\bmean\b|\baverage\b|\bavg\b"),
+    ("std", r"\bstandart\s+sapma\w*|\bstandard\s+deviation\b|\bstd(?:ev)?\b|\bsapma\w*"),
+    ("variance", r"\bvaryans\w*|\bvariance\b"),
+    ("min", r"\bmin(?:imum\w*)?\b|\ben\s+(?:kucu\w*|dusu\w*)(?!\s+kare)|\bsmallest\b|\blowest\b"),
+    ("max", r"\bmax(?:imum\w*)?\b|\ben\s+(?:buyu\w*|yuksek\w*)|\blargest\b|\bhighest\b"),
+    ("sum", r"\btoplam\w*|\bsum\b|\btotal\b"),
+    ("median", r"\bmedyan\w*|\bortanca\w*|\bmedian\b"),
+    ("quartiles", r"\bceyrek\w*|\bquartiles?\b"),
+    ("skewness", r"\bcarpikli\w*|\bskew(?:ness)?\b"),
+    ("kurtosis", r"\bbasikli\w*|\bkurtosis\b"),
+    ("mode", r"\bmod(?:u|unu|udur|e)?\b|\ben\s+sik\b|\btepe\s+deger\w*"),
+    ("correlation", r"\bkorelasyon\w*|\bcorrelation\b|\bcorr\b"),
+    ("covariance", r"\bkovaryans\w*|\bcovariance\b|\bcov\b"),
+    ("regression", r"\bregresyon\w*|\bregression\b|\btrend\s+(?:dogru\w*|line)|\bbest\s+fit\b"),
+]
+_OPERATION_RES = [(operation, re.compile(pattern)) for operation, pattern in _OPERATION_PATTERNS]
+
+# Bu kelimeler desteklenen islemlerin farkli bir turunu ister (agirlikli
+# ortalama, karekok ortalama vb.); yanlis cevap vermek yerine LLM'e birakilir
+_UNSUPPORTED_RE = re.compile(
+    r"agirlik|weighted|geometri|harmoni|kirpilmis|trimmed|hareketli|moving|kare\w*\s+ortalama|"
+    r"mutlak\s+sapma|absolute\s+deviation|olasilik|probability|guven\s+aralig|confidence"
+)
+
+
+class StatisticsQuery(NamedTuple):
+    """Kullanici girdisinden cikarilan veri seti ve islemler"""
+
+    data: List[List[float]]
+    operations: Tuple[str, ...]
+    source: Optional[str] = None
+    columns: Tuple[str, ...] = ()
+    percentiles: Tuple[float, ...] = ()
+
+
+class StatisticsEngine:
+    """Istatistik sorgularini ag cagrisi yapmadan cikarir ve tek geciste hesaplar
+
+    Veri seti once parantez icindeki literal listeden ("[10, 20, 30]"),
+    yoksa metindeki en az iki elemanli sayi dizisinden ("10, 20 ve 30")
+    alinir. Liste `;` ile ayrilmissa virgul ondalik ayirici sayilir
+    ("1,5; 2,5"). Birden fazla liste ("x = [..], y = [..]") sutun, ic ice
+    liste ("[[1, 2], [2, 4]]") satir olarak okunur. Islemler
+    Ingilizce/Turkce anahtar kelimelerden eslenir; istenen tum islemler
+    (veya "ozet"/"describe" ile hepsi) ayni akumulatorlerle tek geciste
+    hesaplanir.
+
+    Girdi bir CSV/TSV/NPY dosyasina referans veriyorsa ("olcumler.csv
+    fiyat sutununun medyani") veri metinden degil dosyadan okunur: dosya
+    parcalar halinde (NPY icin memmap ile) tek geciste islenir, bellek
+    kullanimi dosya boyutundan bagimsiz kalir. Dosyalar yalnizca
+    `data_dir` altindan okunabilir.
+
+    Veri seti veya islem bulunamayan, belirsiz ya da desteklenmeyen bir
+    istatistik (agirlikli ortalama vb.) iceren girisler
+    UnsupportedExpressionError ile LLM'e birakilir.
+    """
+
+    def __init__(
+        self,
+        data_dir: str = "data",
+        chunk_size: int = 65536,
+        exact_quantile_limit: int = 1_000_000
+    ):
+        """Motoru baslatir
+
+        Args:
+            data_dir: Dosya referanslarinin cozulecegi (ve sinirlandigi) dizin
+            chunk_size: Dosya okumada parca basina satir sayisi
+            exact_quantile_limit: Medyan/persentilin tam hesaplandigi en fazla deger sayisi
+        """
+        self.data_dir = data_dir
+        self.chunk_size = chunk_size
+        self.exact_quantile_limit = exact_quantile_limit
+
+    def extract(self, text: str) -> StatisticsQuery:
+        """Girdiden veri setini ve islemleri cikarir
+
+        Args:
+            text: Kullanici girdisi (ornek: "[10, 20, 30] ortalamasi")
+
+        Returns:
+            StatisticsQuery
+
+        Raises:
+            UnsupportedExpressionError: Veri seti veya islem belirsiz
+        """
+        t = text.translate(_TURKISH_CHARS).lower()
+        if _UNSUPPORTED_RE.search(t):
+            raise UnsupportedExpressionError("Desteklenmeyen istatistik islemi")
+
+        file_match = _FILE_RE.search(text)
+        if file_match:
+            t = _FILE_RE.sub(" ", t)
+        percentiles, t = _take_percentiles(t)
+        if file_match:
+            source = file_match.group(1)
+            columns, rest = _take_columns(t)
+            data: List[List[float]] = []
+        else:
+            source = None
+            data, columns, rest = self._extract_data(t)
+
+        operations = [operation for operation, pattern in _OPERATION_RES if pattern.search(rest)]
+        if percentiles:
+            operations.append("percentile")
+        if "describe" in operations:
+            # Ozet tum tek sutunlu istatistikleri zaten icerir
+            operations = ["describe"] + [op for op in operations if op in MULTIVARIATE_OPERATIONS]
+        if not operations:
+            raise UnsupportedExpressionError("Istatistik islemi belirlenemedi")
+        return StatisticsQuery(data, tuple(operations), source, columns, percentiles)
+
+    def compute(self, query: StatisticsQuery) -> Tuple[Any, List[str]]:
+        """Sorgudaki tum islemleri tek geciste hesaplar
+
+        Args:
+            query: extract ile uretilmis (veya elle kurulmus) StatisticsQuery
+
+        Returns:
+            (sonuc, adimlar); tek islemde deger, birden fazla islemde
+            islem adina gore dict
+
+        Raises:
+            SecurityViolationError: Dosya veri dizininin disinda
+            CalculationError: Dosya/sutun bulunamadi, veri yok veya islem tanimsiz
+        """
+        multivariate = any(op in MULTIVARIATE_OPERATIONS for op in query.operations)
+        options = {"exact_limit": self.exact_quantile_limit}
+        if query.source:
+            path = resolve_data_path(query.source, self.data_dir)
+            all_numeric = multivariate or "describe" in query.operations
+            labels, chunks = iter_columns(path, query.columns, self.chunk_size, all_numeric=all_numeric)
+            summaries, covariance = summarize(chunks, len(labels), query.operations, **options)
+            steps = [f"Veri kaynagi: {path.name} ({', '.join(labels)})"]
+        else:
+            if not query.data or not all(query.data):
+                raise CalculationError("Veri seti bos")
+            labels = list(query.columns) or [f"sutun {i + 1}" for i in range(len(query.data))]
+            if len({len(column) for column in query.data}) == 1:
+                rows = np.column_stack(query.data)
+                summaries, covariance = summarize([rows], len(labels), query.operations, **options)
+            elif multivariate:
+                raise CalculationError("Cok sutunlu islemler icin sutunlar ayni uzunlukta olmali")
+            else:
+                summaries = [summarize([column], 1, query.operations, **options)[0][0] for column in query.data]
+                covariance = None
+            if len(query.data) == 1:
+                steps = [f"Veri seti: {query.data[0]}"]
+            else:
+                steps = [f"Veri seti: {len(labels)} sutun ({', '.join(labels)})"]
+
+        counts = ", ".join(str(summary.moments.count) for summary in summaries)
+        missing = sum(summary.missing for summary in summaries)
+        steps.append(f"Okunan deger sayisi: {counts}" + (f", atlanan eksik deger: {missing}" if missing else ""))
+        steps.append("Islem: " + ", ".join(query.operations) + " (tek gecis)")
+        result = self._results(summaries, covariance, labels, query.operations, query.percentiles)
+
+        sketched = [s.quantiles for s in summaries if s.quantiles is not None and not s.quantiles.exact]
+        if sketched:
+            steps.append(f"Kantiller sketch ile hesaplandi (goreli hata <= %{sketched[0].relative_accuracy * 100:g})")
+        if any(op in ("std", "variance", "covariance", "describe") for op in query.operations):
+            steps.append("Standart sapma, varyans ve kovaryans populasyon formuluyle (n'e bolunerek) hesaplandi")
+        if covariance is not None and covariance.missing:
+            steps.append(f"Cok sutunlu islemlerde eksik degerli {covariance.missing} satir atlandi")
+        if "regression" in query.operations:
+            steps.append(_regression_text(result if len(query.operations) == 1 else result["regression"]))
+        steps.append(f"Sonuc: {result}")
+        return result, steps
+
+    @staticmethod
+    def _results(
+        summaries: List[StreamingSummary],
+        covariance: Optional[RunningCovariance],
+        labels: List[str],
+        operations: Sequence[str],
+        percentiles: Sequence[float]
+    ) -> Any:
+        """Akumulatorlerden istenen islemlerin sonuclarini toplar"""
+        results: Dict[str, Any] = {}
+        for operation in operations:
+            if operation in MULTIVARIATE_OPERATIONS:
+                if covariance is None or len(labels) < 2:
+                    raise CalculationError(f"{operation} icin en az iki sutun gerekli")
+                if operation == "correlation":
+                    value: Any = covariance.correlation().tolist()
+                elif operation == "covariance":
+                    value = covariance.covariance().tolist()
+                else:
+                    value = {"dependent": labels[-1], "predictors": labels[:-1], **covariance.regression()}
+            else:
+                per_column = [_univariate(summary, operation, percentiles) for summary in summaries]
+                value = per_column[0] if len(per_column) == 1 else dict(zip(labels, per_column))
+            results[operation] = value
+        return results[operations[0]] if len(operations) == 1 else results
+
+    @staticmethod
+    def _extract_data(text: str) -> Tuple[List[List[float]], Tuple[str, ...], str]:
+        """Veri sutunlarini, sutun adlarini ve veri cikarildiktan sonra kalan metni dondurur"""
+        nested = _NESTED_RE.search(text)
+        if nested:
+            rows = [_parse_numbers(match.group(1)) for match in _LIST_RE.finditer(nested.group(0)[1:-1])]
+            if len({len(row) for row in rows}) != 1:
+                raise UnsupportedExpressionError("Satirlarin uzunluklari farkli")
+            columns = [list(column) for column in zip(*rows)]
+            return columns, (), text[:nested.start()] + " " + text[nested.end():]
+
+        lists = [match for match in _LIST_RE.finditer(text) if match.group(1).strip()]
+        if lists:
+            columns = [_parse_numbers(match.group(1)) for match in lists]
+            names = [_LIST_NAME_RE.search(text[:match.start()]) for match in lists]
+            labels = tuple(name.group(1) for name in names) if len(lists) > 1 and all(names) else ()
+            rest = text
+            for match in reversed(lists):
+                rest = rest[:match.start()] + " " + rest[match.end():]
+            return columns, labels, rest
+
+        sequences = list(_SEQUENCE_RE.finditer(text))
+        if len(sequences) != 1:
+            raise UnsupportedExpressionError("Veri seti bulunamadi")
+        match = sequences[0]
+        data = _parse_numbers(re.sub(r"\s+(?:ve|and)\s+", " ", match.group(0)))
+        return [data], (), text[:match.start()] + " " + text[match.end():]
+
+
+def _univariate(summary: StreamingSummary, operation: str, percentiles: Sequence[float]) -> Any:
+    """Tek sutunlu islemin sonucu"""
+    if operation == "describe":
+        return summary.describe(percentiles)
+    if operation == "quartiles":
+        return summary.quartiles()
+    if operation == "percentile":
+        if len(percentiles) == 1:
+            return summary.result("percentile", percentiles[0])
+        return {f"p{percentile:g}": summary.result("percentile", percentile) for percentile in percentiles}
+    return summary.result(operation)
+
+
+def _regression_text(regression: Dict[str, Any]) -> str:
+    """Regresyon denklemini metin olarak yazar"""
+    terms = " ".join(
+        f"{'-' if coefficient < 0 else '+'} {abs(coefficient):.6g}*{name}"
+        for coefficient, name in zip(regression["coefficients"], regression["predictors"])
+    )
+    return (
+        f"Regresyon: {regression['dependent']} = {regression['intercept']:.6g} {terms}"
+        f" (R^2 = {regression['r_squared']:.6g})"
+    )
+
+
+def _take_percentiles(text: str) -> Tuple[Tuple[float, ...], str]:
+    """Persentil ifadelerini bulur ve metinden cikarir"""
+    percentiles: List[float] = []
+    for pattern in _PERCENTILE_PATTERNS:
+        for match in reversed(list(re.finditer(pattern, text))):
+            value = float(match.group(1).replace(",", "."))
+            if not 0 <= value <= 100:
+                raise UnsupportedExpressionError("Persentil 0 ile 100 arasinda olmali")
+            percentiles.append(value)
+            text = text[:match.start()] + " " + text[match.end():]
+    return tuple(sorted(set(percentiles))), text
+
+
+def _take_columns(text: str) -> Tuple[Tuple[str, ...], str]:
+    """Sutun secimini bulur ve metinden cikarir"""
+    for pattern in _COLUMN_PATTERNS:
+        for match in re.finditer(pattern, text):
+            names = [
+                name.strip("\"'") for name in re.split(r"\s*(?:,|\bve\b|\band\b)\s*", match.group(1))
+                if name.strip("\"'")
+            ]
+            names = [name for name in names if name not in _COLUMN_STOPWORDS and not _is_operation(name)]
+            if names:
+                return tuple(names), text[:match.start()] + " " + text[match.end():]
+    return (), text
+
+
+def _is_operation(word: str) -> bool:
+    """Kelime bir islem anahtar kelimesi mi"""
+    return any(regex.fullmatch(word) for _, regex in _OPERATION_RES)
+
+
+def _parse_numbers(text: str) -> List[float]:
+    """Ayiricilarla yazilmis sayi listesini float listesine cevirir
+
+    Raises:
+        UnsupportedExpressionError: Listede sayi olmayan eleman var
+    """
+    if ";" in text:
+        items = [item.replace(",", ".") for item in text.split(";")]
+    else:
+        items = re.split(r"[,\s]+", text)
+    items = [item.strip() for item in items if item.strip()]
+    if not items or not all(_NUMBER_RE.match(item) for item in items):
+        raise UnsupportedExpressionError("Veri seti sayisal degil")
+    return [float(item.replace(",", ".")) for item in items]
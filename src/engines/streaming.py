@@ -0,0 +1,672 @@
+"""Single-pass streaming statistics over chunked and memory-mapped data"""
+
+import csv
+import math
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.utils.exceptions import CalculationError, SecurityViolationError
+
+_TURKISH_CHARS = str.maketrans("çğıöşüÇĞİÖŞÜ", "cgiosuCGIOSU")
+
+# Desteklenen dosya uzantilari
+DATA_FILE_SUFFIXES = (".csv", ".tsv", ".npy")
+
+# Tek sutunlu ve cok sutunlu islemler
+UNIVARIATE_OPERATIONS = (
+    "count", "mean", "std", "variance", "min", "max", "sum", "median",
+    "quartiles", "percentile", "skewness", "kurtosis", "mode",
+)
+MULTIVARIATE_OPERATIONS = ("correlation", "covariance", "regression")
+
+# Islemlerin ihtiyac duydugu akumulatorler
+_QUANTILE_OPERATIONS = {"median", "percentile", "quartiles", "describe"}
+_FREQUENCY_OPERATIONS = {"mode", "describe"}
+
+
+class RunningMoments:
+    """Tek gecisli ortalama/varyans/carpiklik/basiklik/min/max/toplam
+
+    Her parcanin ortalamasi ve merkezi moment toplamlari (M2, M3, M4) NumPy
+    ile hesaplanir, sonra Chan/Pebay birlestirme formulleriyle genel
+    toplama eklenir; bu, eleman eleman Welford guncellemesiyle ayni sayisal
+    kararliligi vektorel hizla saglar. Bellek kullanimi veri boyutundan
+    bagimsizdir.
+    """
+
+    __slots__ = ("count", "mean", "m2", "m3", "m4", "total", "minimum", "maximum")
+
+    def __init__(self):
+        """Bos akumulator olusturur"""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def update(self, chunk: np.ndarray) -> None:
+        """Bir veri parcasini ekler"""
+        n = chunk.size
+        if n == 0:
+            return
+        chunk_mean = float(chunk.mean())
+        centered = chunk - chunk_mean
+        squared = np.square(centered)
+        chunk_m2 = float(squared.sum())
+        chunk_m3 = float((squared * centered).sum())
+        chunk_m4 = float(np.square(squared).sum())
+
+        count = self.count
+        combined = count + n
+        delta = chunk_mean - self.mean
+        delta_n = delta / combined
+        self.m4 += (
+            chunk_m4
+            + delta * delta_n ** 3 * count * n * (count * count - count * n + n * n)
+            + 6 * delta_n * delta_n * (count * count * chunk_m2 + n * n * self.m2)
+            + 4 * delta_n * (count * chunk_m3 - n * self.m3)
+        )
+        self.m3 += (
+            chunk_m3
+            + delta * delta_n * delta_n * count * n * (count - n)
+            + 3 * delta_n * (count * chunk_m2 - n * self.m2)
+        )
+        self.m2 += chunk_m2 + delta * delta_n * count * n
+        self.mean += delta_n * n
+        self.count = combined
+        self.total += float(chunk.sum())
+        self.minimum = min(self.minimum, float(chunk.min()))
+        self.maximum = max(self.maximum, float(chunk.max()))
+
+    def variance(self, ddof: int = 0) -> float:
+        """Varyans (varsayilan: populasyon varyansi, np.var ile ayni)"""
+        if self.count - ddof <= 0:
+            raise CalculationError("Varyans icin yeterli veri yok")
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof: int = 0) -> float:
+        """Standart sapma"""
+        return math.sqrt(self.variance(ddof))
+
+    def skewness(self) -> float:
+        """Carpiklik (scipy.stats.skew ile ayni, yanli tahmin)
+
+        Raises:
+            CalculationError: Varyans sifir
+        """
+        if self.count == 0 or self.m2 <= 0:
+            raise CalculationError("Carpiklik tanimsiz: varyans sifir")
+        return math.sqrt(self.count) * self.m3 / self.m2 ** 1.5
+
+    def kurtosis(self) -> float:
+        """Fazlalik basiklik (scipy.stats.kurtosis ile ayni, Fisher tanimi)
+
+        Raises:
+            CalculationError: Varyans sifir
+        """
+        if self.count == 0 or self.m2 <= 0:
+            raise CalculationError("Basiklik tanimsiz: varyans sifir")
+        return self.count * self.m4 / (self.m2 * self.m2) - 3.0
+
+
+class RunningCovariance:
+    """Cok sutunlu tek gecisli ortalama vektoru ve ortak moment matrisi
+
+    Korelasyon, kovaryans ve dogrusal regresyon ayni ortak moment
+    matrisinden turetilir; parcalar RunningMoments ile ayni birlestirme
+    formuluyle eklenir. Eksik (NaN) deger iceren satirlar atlanir.
+    """
+
+    def __init__(self, dimensions: int):
+        """Akumulatoru olusturur
+
+        Args:
+            dimensions: Sutun sayisi
+        """
+        self.count = 0
+        self.missing = 0
+        self.mean = np.zeros(dimensions)
+        self.comoment = np.zeros((dimensions, dimensions))
+
+    def update(self, rows: np.ndarray) -> None:
+        """(satir, sutun) seklinde bir parca ekler"""
+        complete = ~np.isnan(rows).any(axis=1)
+        if not complete.all():
+            self.missing += int(rows.shape[0] - np.count_nonzero(complete))
+            rows = rows[complete]
+        n = rows.shape[0]
+        if n == 0:
+            return
+        chunk_mean = rows.mean(axis=0)
+        centered = rows - chunk_mean
+        combined = self.count + n
+        delta = chunk_mean - self.mean
+        self.comoment += centered.T @ centered + np.outer(delta, delta) * self.count * n / combined
+        self.mean += delta * n / combined
+        self.count = combined
+
+    def covariance(self) -> np.ndarray:
+        """Populasyon kovaryans matrisi (kosegeni varyanslarla ayni)
+
+        Raises:
+            CalculationError: Veri yok
+        """
+        if self.count == 0:
+            raise CalculationError("Kovaryans icin eksiksiz satir yok")
+        return self.comoment / self.count
+
+    def correlation(self) -> np.ndarray:
+        """Pearson korelasyon matrisi
+
+        Raises:
+            CalculationError: Sabit sutun (varyans sifir)
+        """
+        scale = np.sqrt(np.diag(self.comoment))
+        if self.count == 0 or np.any(scale == 0):
+            raise CalculationError("Korelasyon tanimsiz: sabit sutun var")
+        correlation = np.clip(self.comoment / np.outer(scale, scale), -1.0, 1.0)
+        np.fill_diagonal(correlation, 1.0)
+        return correlation
+
+    def regression(self) -> Dict[str, Any]:
+        """Son sutunun digerlerine en kucuk kareler regresyonu
+
+        Returns:
+            intercept, coefficients ve r_squared iceren dict
+
+        Raises:
+            CalculationError: Yetersiz veri veya tekil (dogrusal bagimli) tahminciler
+        """
+        k = self.mean.size - 1
+        if k < 1 or self.count <= k:
+            raise CalculationError("Regresyon icin yeterli veri yok")
+        sxx, sxy, syy = self.comoment[:k, :k], self.comoment[:k, k], self.comoment[k, k]
+        try:
+            coefficients = np.linalg.solve(sxx, sxy)
+        except np.linalg.LinAlgError:
+            raise CalculationError("Regresyon tanimsiz: tahmin degiskenleri dogrusal bagimli")
+        intercept = self.mean[k] - coefficients @ self.mean[:k]
+        r_squared = float(coefficients @ sxy / syy) if syy > 0 else 1.0
+        return {
+            "intercept": float(intercept),
+            "coefficients": [float(c) for c in coefficients],
+            "r_squared": r_squared,
+        }
+
+
+class QuantileSketch:
+    """Sinirli bellekli akan kantil tahmincisi
+
+    Ilk `exact_limit` deger oldugu gibi tutulur ve kantiller np.quantile ile
+    tam hesaplanir. Bu sinir asilinca degerler logaritmik kovalara
+    (DDSketch) aktarilir: her deger gamma = (1 + a) / (1 - a) tabanli kovaya
+    sayilir, bellek yalnizca deger araliginin logaritmasiyla buyur ve her
+    kantil `relative_accuracy` goreli hata icinde kalir.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.005, exact_limit: int = 1_000_000):
+        """Sketch'i baslatir
+
+        Args:
+            relative_accuracy: Sketch moduna gecildiginde kantil goreli hatasi
+            exact_limit: Tam hesaplama icin tutulacak en fazla deger sayisi
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy 0 ile 1 arasinda olmali")
+        self.relative_accuracy = relative_accuracy
+        self.exact_limit = exact_limit
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buffer: Optional[List[np.ndarray]] = []
+        self._buffered = 0
+        self._positive: Tuple[np.ndarray, np.ndarray] = (np.empty(0, dtype=np.int64), np.empty(0))
+        self._negative: Tuple[np.ndarray, np.ndarray] = (np.empty(0, dtype=np.int64), np.empty(0))
+        self._zeros = 0
+        self.count = 0
+
+    @property
+    def exact(self) -> bool:
+        """Kantiller hala tam hesaplaniyor mu"""
+        return self._buffer is not None
+
+    def update(self, chunk: np.ndarray) -> None:
+        """Bir veri parcasini ekler"""
+        if chunk.size == 0:
+            return
+        self.count += chunk.size
+        if self._buffer is not None:
+            self._buffer.append(np.array(chunk, dtype=float))
+            self._buffered += chunk.size
+            if self._buffered <= self.exact_limit:
+                return
+            chunk = np.concatenate(self._buffer)
+            self._buffer = None
+        self._add(chunk)
+
+    def _add(self, values: np.ndarray) -> None:
+        """Degerleri logaritmik kovalara sayar"""
+        self._zeros += int(np.count_nonzero(values == 0))
+        self._positive = self._merge(self._positive, values[values > 0])
+        self._negative = self._merge(self._negative, -values[values < 0])
+
+    def _merge(self, store: Tuple[np.ndarray, np.ndarray], magnitudes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Kova sayaclarina yeni degerleri ekler (sirali anahtar dizisi)"""
+        if magnitudes.size == 0:
+            return store
+        keys = np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+        all_keys = np.concatenate([store[0], keys])
+        all_counts = np.concatenate([store[1], np.ones(keys.size)])
+        unique, inverse = np.unique(all_keys, return_inverse=True)
+        return unique, np.bincount(inverse, weights=all_counts)
+
+    def quantile(self, q: float) -> float:
+        """q-kantilini dondurur (0 <= q <= 1)
+
+        Raises:
+            CalculationError: Veri yok
+        """
+        if self.count == 0:
+            raise CalculationError("Kantil icin veri yok")
+        if self._buffer is not None:
+            return float(np.quantile(np.concatenate(self._buffer), q))
+
+        rank = q * (self.count - 1)
+        negative_keys, negative_counts = self._negative
+        # Negatif degerler: buyuk anahtar = buyuk mutlak deger = kucuk deger
+        cumulative = 0.0
+        for key, count in zip(negative_keys[::-1], negative_counts[::-1]):
+            cumulative += count
+            if cumulative > rank:
+                return -self._value(key)
+        cumulative += self._zeros
+        if cumulative > rank:
+            return 0.0
+        positive_keys, positive_counts = self._positive
+        for key, count in zip(positive_keys, positive_counts):
+            cumulative += count
+            if cumulative > rank:
+                return self._value(key)
+        return self._value(positive_keys[-1]) if positive_keys.size else 0.0
+
+    def _value(self, key: int) -> float:
+        """Kovanin temsil degeri (goreli hatayi esitleyen orta nokta)"""
+        return 2 * self._gamma ** int(key) / (self._gamma + 1)
+
+
+class FrequencyCounter:
+    """Mod icin farkli deger sayaci (sinirli sayida farkli deger)
+
+    Sayaclar sirali NumPy dizilerinde tutulur ve her parca np.unique ile
+    birlestirilir. Farkli deger sayisi `max_distinct` sinirini asarsa (surekli
+    veri) mod anlamsiz kabul edilir ve bellek sinirli kalir.
+    """
+
+    def __init__(self, max_distinct: int = 100_000):
+        """Sayaci baslatir
+
+        Args:
+            max_distinct: Izlenecek en fazla farkli deger sayisi
+        """
+        self.max_distinct = max_distinct
+        self._values = np.empty(0)
+        self._counts = np.empty(0, dtype=np.int64)
+        self.overflow = False
+
+    def update(self, chunk: np.ndarray) -> None:
+        """Bir veri parcasini sayar"""
+        if self.overflow or chunk.size == 0:
+            return
+        values, counts = np.unique(chunk, return_counts=True)
+        merged, inverse = np.unique(np.concatenate([self._values, values]), return_inverse=True)
+        if merged.size > self.max_distinct:
+            self.overflow = True
+            self._values, self._counts = np.empty(0), np.empty(0, dtype=np.int64)
+            return
+        self._counts = np.bincount(inverse, weights=np.concatenate([self._counts, counts])).astype(np.int64)
+        self._values = merged
+
+    def mode(self) -> Tuple[float, int]:
+        """En sik degeri ve tekrar sayisini dondurur (esitlikte en kucuk deger)
+
+        Raises:
+            CalculationError: Veri yok veya farkli deger siniri asildi
+        """
+        if self.overflow:
+            raise CalculationError(
+                f"Mod hesaplanamadi: {self.max_distinct} farkli degerden fazlasi var (surekli veri)"
+            )
+        if self._values.size == 0:
+            raise CalculationError("Mod icin veri yok")
+        index = int(np.argmax(self._counts))
+        return float(self._values[index]), int(self._counts[index])
+
+
+class StreamingSummary:
+    """Istenen islemler icin gereken akumulatorleri tek geciste gunceller"""
+
+    def __init__(
+        self,
+        operations: Iterable[str],
+        relative_accuracy: float = 0.005,
+        exact_limit: int = 1_000_000,
+        max_distinct: int = 100_000
+    ):
+        """Ozet nesnesini olusturur
+
+        Args:
+            operations: Hesaplanacak islemler (mean, median, mode, ...)
+            relative_accuracy: Kantil sketch'i goreli hatasi
+            exact_limit: Kantillerin tam hesaplandigi en fazla deger sayisi
+            max_distinct: Mod icin izlenecek en fazla farkli deger
+        """
+        operations = set(operations)
+        self.moments = RunningMoments()
+        self.quantiles = (
+            QuantileSketch(relative_accuracy, exact_limit) if operations & _QUANTILE_OPERATIONS else None
+        )
+        self.frequencies = FrequencyCounter(max_distinct) if operations & _FREQUENCY_OPERATIONS else None
+        self.missing = 0
+
+    def update(self, chunk: np.ndarray) -> None:
+        """Bir parcayi ekler; NaN degerler eksik veri sayilip atlanir"""
+        chunk = np.asarray(chunk, dtype=float).ravel()
+        finite = ~np.isnan(chunk)
+        if not finite.all():
+            self.missing += int(chunk.size - np.count_nonzero(finite))
+            chunk = chunk[finite]
+        self.moments.update(chunk)
+        if self.quantiles is not None:
+            self.quantiles.update(chunk)
+        if self.frequencies is not None:
+            self.frequencies.update(chunk)
+
+    def result(self, operation: str, percentile: Optional[float] = None) -> float:
+        """Islemin sonucunu dondurur
+
+        Raises:
+            CalculationError: Veri yok veya islem bilinmiyor
+        """
+        moments = self.moments
+        if moments.count == 0:
+            raise CalculationError("Dosyada sayisal veri bulunamadi")
+        if operation == "count":
+            return float(moments.count)
+        if operation == "mean":
+            return moments.mean
+        if operation == "sum":
+            return moments.total
+        if operation == "min":
+            return moments.minimum
+        if operation == "max":
+            return moments.maximum
+        if operation == "variance":
+            return moments.variance()
+        if operation == "std":
+            return moments.std()
+        if operation == "skewness":
+            return moments.skewness()
+        if operation == "kurtosis":
+            return moments.kurtosis()
+        if operation == "median" and self.quantiles is not None:
+            return self.quantiles.quantile(0.5)
+        if operation == "percentile" and self.quantiles is not None:
+            return self.quantiles.quantile((50.0 if percentile is None else percentile) / 100.0)
+        if operation == "mode" and self.frequencies is not None:
+            return self.frequencies.mode()[0]
+        raise CalculationError(f"Bilinmeyen islem: {operation}")
+
+    def quartiles(self) -> Dict[str, float]:
+        """Birinci, ikinci (medyan) ve ucuncu ceyreklikler ile IQR"""
+        q1, q2, q3 = (self.result("percentile", p) for p in (25.0, 50.0, 75.0))
+        return {"q1": q1, "median": q2, "q3": q3, "iqr": q3 - q1}
+
+    def describe(self, percentiles: Sequence[float] = ()) -> Dict[str, Optional[float]]:
+        """Tum ozet istatistikleri tek sozlukte dondurur
+
+        Varyans sifir oldugu icin tanimsiz kalan carpiklik/basiklik ve
+        farkli deger siniri asildigi icin hesaplanamayan mod None olur.
+
+        Args:
+            percentiles: Ek olarak raporlanacak persentiller (0-100)
+        """
+        summary: Dict[str, Optional[float]] = {
+            "count": self.result("count"),
+            "mean": self.result("mean"),
+            "std": self.result("std"),
+            "variance": self.result("variance"),
+            "min": self.result("min"),
+        }
+        quartiles = self.quartiles()
+        summary.update(q1=quartiles["q1"], median=quartiles["median"], q3=quartiles["q3"])
+        summary["max"] = self.result("max")
+        for percentile in percentiles:
+            summary[f"p{percentile:g}"] = self.result("percentile", percentile)
+        for operation in ("skewness", "kurtosis", "mode"):
+            try:
+                summary[operation] = self.result(operation)
+            except CalculationError:
+                summary[operation] = None
+        return summary
+
+
+def resolve_data_path(name: str, data_dir: str) -> Path:
+    """Dosya referansini veri dizini icinde cozer
+
+    Args:
+        name: Kullanicinin verdigi dosya yolu (veri dizinine gore)
+        data_dir: Okunmasina izin verilen kok dizin
+
+    Returns:
+        Mutlak dosya yolu
+
+    Raises:
+        SecurityViolationError: Yol veri dizininin disina cikiyor
+        CalculationError: Dosya bulunamadi veya desteklenmiyor
+    """
+    root = Path(data_dir).resolve()
+    path = (root / name).resolve()
+    if root != path and root not in path.parents:
+        raise SecurityViolationError(f"Veri dizini disindaki dosyalara erisilemez: {name}")
+    if path.suffix.lower() not in DATA_FILE_SUFFIXES:
+        raise CalculationError(f"Desteklenmeyen dosya turu: {path.suffix}")
+    if not path.is_file():
+        raise CalculationError(f"Dosya bulunamadi: {name}")
+    return path
+
+
+def iter_columns(
+    path: Path,
+    columns: Sequence[str] = (),
+    chunk_size: int = 65536,
+    all_numeric: bool = False
+) -> Tuple[List[str], Iterator[np.ndarray]]:
+    """Dosyadaki sutunlari parca parca (satir, sutun) float dizileri olarak okur
+
+    Args:
+        path: CSV/TSV/NPY dosyasi
+        columns: Sutun adlari veya 1 tabanli sira numaralari
+        chunk_size: Parca basina satir sayisi
+        all_numeric: Sutun verilmezse tum sayisal sutunlari al (aksi halde
+            dosyada tek sayisal sutun olmali)
+
+    Returns:
+        (sutun etiketleri, parca iteratoru)
+
+    Raises:
+        CalculationError: Sutun bulunamadi veya belirsiz
+    """
+    if path.suffix.lower() == ".npy":
+        return _npy_chunks(path, columns, chunk_size, all_numeric)
+    return _csv_chunks(path, columns, chunk_size, all_numeric)
+
+
+def _npy_chunks(
+    path: Path, columns: Sequence[str], chunk_size: int, all_numeric: bool
+) -> Tuple[List[str], Iterator[np.ndarray]]:
+    """NPY dosyasini bellege almadan (memmap) parcalar halinde okur"""
+    array = np.load(path, mmap_mode="r", allow_pickle=False)
+    if array.dtype.names:
+        names = list(array.dtype.names)
+        fields = [names[i] for i in _select_columns(columns, names, list(range(len(names))), all_numeric)]
+
+        def read(start: int, stop: int) -> np.ndarray:
+            block = array[start:stop]
+            return np.column_stack([np.asarray(block[name], dtype=float) for name in fields])
+
+        return fields, _slices(array.shape[0], chunk_size, read)
+    if array.ndim == 1:
+        _select_columns(columns, ["1"], [0], all_numeric)
+        return [path.name], _slices(array.shape[0], chunk_size, lambda a, b: np.asarray(array[a:b], dtype=float)[:, None])
+    if array.ndim == 2:
+        names = [str(i + 1) for i in range(array.shape[1])]
+        indices = _select_columns(columns, names, list(range(array.shape[1])), all_numeric)
+        labels = [f"sutun {i + 1}" for i in indices]
+        return labels, _slices(array.shape[0], chunk_size, lambda a, b: np.asarray(array[a:b, indices], dtype=float))
+    raise CalculationError(f"Desteklenmeyen dizi boyutu: {array.ndim}")
+
+
+def _slices(length: int, chunk_size: int, read: Callable[[int, int], np.ndarray]) -> Iterator[np.ndarray]:
+    """[0, length) araligini parcalar halinde okur"""
+    for start in range(0, length, chunk_size):
+        yield read(start, min(start + chunk_size, length))
+
+
+def _csv_chunks(
+    path: Path, columns: Sequence[str], chunk_size: int, all_numeric: bool
+) -> Tuple[List[str], Iterator[np.ndarray]]:
+    """CSV dosyasini satir parcalari halinde okur (tum dosya bellege alinmaz)"""
+    handle = open(path, newline="", encoding="utf-8-sig")
+    try:
+        sample = handle.read(65536)
+        handle.seek(0)
+        delimiter = "\t" if path.suffix.lower() == ".tsv" else _sniff_delimiter(sample)
+        reader = csv.reader(handle, delimiter=delimiter)
+        first = next(reader, None)
+        if first is None:
+            raise CalculationError(f"Dosya bos: {path.name}")
+        # Noktali virgul/sekme ayiricili dosyalarda virgul ondalik ayirici olabilir
+        decimal_comma = delimiter != ","
+        has_header = not all(_is_number(cell, decimal_comma) for cell in first if cell.strip())
+        if has_header:
+            names = [cell.strip() for cell in first]
+            sample_row = next(reader, [])
+            pending = [sample_row] if sample_row else []
+        else:
+            names = [str(i + 1) for i in range(len(first))]
+            sample_row = first
+            pending = [first]
+
+        numeric = [i for i, cell in enumerate(sample_row) if _is_number(cell, decimal_comma)]
+        indices = _select_columns(columns, names, numeric, all_numeric)
+        labels = [names[i] if has_header else f"sutun {i + 1}" for i in indices]
+    except Exception:
+        handle.close()
+        raise
+
+    def chunks() -> Iterator[np.ndarray]:
+        with handle:
+            rows = pending
+            while True:
+                rows = rows + list(islice(reader, chunk_size - len(rows)))
+                if not rows:
+                    return
+                yield np.column_stack([
+                    _to_floats([row[i] if i < len(row) else "" for row in rows], decimal_comma)
+                    for i in indices
+                ])
+                rows = []
+
+    return labels, chunks()
+
+
+def _select_columns(columns: Sequence[str], names: List[str], numeric: List[int], all_numeric: bool) -> List[int]:
+    """Istenen sutunlarin indekslerini dondurur; sutun verilmezse sayisal sutunlardan secer"""
+    if columns:
+        return [_column_index(column, names) for column in columns]
+    if len(numeric) == 1 or (all_numeric and numeric):
+        return numeric
+    raise CalculationError(
+        f"Dosyada {len(numeric)} sayisal sutun var, sutun belirtin: " + ", ".join(names[i] for i in numeric)
+    )
+
+
+def _sniff_delimiter(sample: str) -> str:
+    """Ornek metinden CSV ayiricisini tahmin eder"""
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=",;\t|").delimiter
+    except csv.Error:
+        return ","
+
+
+def _column_index(column: str, names: List[str]) -> int:
+    """Sutun adini (buyuk/kucuk harf ve Turkce karakter duyarsiz) veya 1 tabanli numarayi indekse cevirir"""
+    wanted = column.strip().translate(_TURKISH_CHARS).lower()
+    normalized = [name.translate(_TURKISH_CHARS).lower() for name in names]
+    if wanted in normalized:
+        return normalized.index(wanted)
+    if wanted.isdigit() and 1 <= int(wanted) <= len(names):
+        return int(wanted) - 1
+    raise CalculationError(f"Sutun bulunamadi: {column} (mevcut: {', '.join(names)})")
+
+
+def _is_number(cell: str, decimal_comma: bool) -> bool:
+    """Hucre sayi mi"""
+    text = cell.strip()
+    if decimal_comma:
+        text = text.replace(",", ".")
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _to_floats(cells: List[str], decimal_comma: bool) -> np.ndarray:
+    """Hucreleri float dizisine cevirir; bos/sayisal olmayan hucreler NaN olur"""
+    if decimal_comma:
+        cells = [cell.replace(",", ".") for cell in cells]
+    try:
+        return np.array(cells, dtype=float)
+    except ValueError:
+        values = np.full(len(cells), np.nan)
+        for i, cell in enumerate(cells):
+            try:
+                values[i] = float(cell)
+            except ValueError:
+                pass
+        return values
+
+
+def summarize(
+    chunks: Iterable[np.ndarray],
+    dimensions: int,
+    operations: Iterable[str],
+    **options
+) -> Tuple[List[StreamingSummary], Optional[RunningCovariance]]:
+    """(satir, sutun) parcalarini tek geciste ozetler
+
+    Args:
+        chunks: Float dizisi parcalari
+        dimensions: Sutun sayisi
+        operations: Hesaplanacak islemler
+        **options: StreamingSummary parametreleri
+
+    Returns:
+        (sutun basina StreamingSummary listesi, cok sutunlu islem varsa RunningCovariance)
+    """
+    operations = set(operations)
+    summaries = [StreamingSummary(operations, **options) for _ in range(dimensions)]
+    covariance = RunningCovariance(dimensions) if operations & set(MULTIVARIATE_OPERATIONS) else None
+    for chunk in chunks:
+        chunk = np.asarray(chunk, dtype=float).reshape(-1, dimensions)
+        for index, summary in enumerate(summaries):
+            summary.update(chunk[:, index])
+        if covariance is not None:
+            covariance.update(chunk)
+    return summaries, covariance
@@ -4,13 +4,14 @@ import asyncio
 import sys
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, Optional, Tuple
 
 # Proje root'unu Python path'ine ekle (src klasöründen çalıştırılabilmesi için)
 project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 from src.core.agent import GeminiAgent
+from src.core.backends import LLMBackend
 from src.core.parser import CommandParser
 from src.core.validator import InputValidator
 from src.modules.basic_math import BasicMathModule
@@ -21,6 +22,7 @@ from src.modules.equation_solver import EquationSolverModule
 from src.modules.graph_plotter import GraphPlotterModule
 from src.modules.statistics import StatisticsModule
 from src.config.settings import settings
+from src.schemas.models import CalculationResult, StreamEvent
 from src.utils.exceptions import (
     CalculationError,
     InvalidInputError,
@@ -38,15 +40,20 @@ APP_VERSION = "1.0.0"
 class CalculatorAgent:
     """Ana calculator agent orchestrator"""
     
-    def __init__(self):
-        """Agent'i baslatir"""
-        try:
-            settings.validate()
-        except ValueError as e:
-            logger.error(f"Settings validation error: {e}")
-            raise
+    def __init__(self, backend: Optional[LLMBackend] = None):
+        """Agent'i baslatir
+        
+        Args:
+            backend: Kullanilacak LLM backend'i (None ise LLM_BACKEND ayarindan)
+        """
+        if backend is None:
+            try:
+                settings.validate()
+            except ValueError as e:
+                logger.error(f"Settings validation error: {e}")
+                raise
         
-        self.gemini_agent = GeminiAgent()
+        self.gemini_agent = GeminiAgent(backend=backend)
         self.parser = CommandParser()
         self.validator = InputValidator()
         
@@ -72,6 +79,66 @@ class CalculatorAgent:
         Returns:
             Sonuc string'i veya None
         """
+        output, _ = await self._execute(user_input)
+        return output
+    
+    async def stream_command(
+        self,
+        user_input: str,
+        **calculate_kwargs: Any
+    ) -> AsyncIterator[StreamEvent]:
+        """Kullanici komutunu isler, cozum adimlarini geldikce yayinlar
+        
+        Args:
+            user_input: Kullanici girdisi
+            **calculate_kwargs: Modulun calculate metoduna iletilecek parametreler
+                (ornek: plot_output="data")
+            
+        Yields:
+            Her adim icin 'step' olayi, en sonda formatlanmis ciktiyi ve
+            CalculationResult'i tasiyan 'final' olayi
+        """
+        steps: asyncio.Queue = asyncio.Queue()
+        task = asyncio.ensure_future(
+            self._execute(user_input, on_step=steps.put_nowait, **calculate_kwargs)
+        )
+        step_index = 0
+        
+        try:
+            while not task.done() or not steps.empty():
+                if steps.empty():
+                    getter = asyncio.ensure_future(steps.get())
+                    await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+                    if not getter.done():
+                        getter.cancel()
+                        continue
+                    step = getter.result()
+                else:
+                    step = steps.get_nowait()
+                
+                step_index += 1
+                yield StreamEvent(kind="step", text=step, index=step_index)
+            
+            output, result = task.result()
+            yield StreamEvent(kind="final", text=output, result=result)
+        finally:
+            if not task.done():
+                task.cancel()
+    
+    async def _execute(
+        self,
+        user_input: str,
+        **calculate_kwargs: Any
+    ) -> Tuple[str, Optional[CalculationResult]]:
+        """Komutu ilgili module yonlendirir ve hatalari mesaja cevirir
+        
+        Args:
+            user_input: Kullanici girdisi
+            **calculate_kwargs: Modulun calculate metoduna iletilecek parametreler
+            
+        Returns:
+            (formatlanmis cikti, CalculationResult veya None) tuple'i
+        """
         try:
             # Parse komutu
             module_name, expression = self.parser.parse(user_input)
@@ -79,7 +146,7 @@ class CalculatorAgent:
             
    
             if module_name == "general_chat":
-                return "Merhaba! Ben bir Matematik Asistanıyım. Size sadece matematik, geometri, istatistik ve finans konularında yardımcı olabilirim."
+                return "Merhaba! Ben bir Matematik Asistanıyım. Size sadece matematik, geometri, istatistik ve finans konularında yardımcı olabilirim.", None
 
             if module_name not in self.modules:
                 raise ModuleNotFoundError(f"Modul bulunamadi: {module_name}")
@@ -88,36 +155,37 @@ class CalculatorAgent:
             
 
             logger.info(f"Processing: {module_name} - {expression}")
-            result = await module.calculate(expression)
+            result = await module.calculate(expression, **calculate_kwargs)
             
 
-            return self._format_output(result)
+            return self._format_output(result), result
             
         except SecurityViolationError as e:
             logger.warning(f"Security violation: {e}")
-            return f"❌ Guvenlik hatasi: {e}"
+            return f"❌ Guvenlik hatasi: {e}", None
             
         except InvalidInputError as e:
             logger.warning(f"Invalid input: {e}")
-            return f"❌ Gecersiz giris: {e}"
+            return f"❌ Gecersiz giris: {e}", None
             
         except ModuleNotFoundError as e:
             logger.warning(f"Module not found: {e}")
-            return f"❌ Modul bulunamadi: {e}"
+            return f"❌ Modul bulunamadi: {e}", None
             
         except CalculationError as e:
             logger.error(f"Calculation error: {e}")
-            return f"❌ Hesaplama hatasi: {e}"
+            return f"❌ Hesaplama hatasi: {e}", None
             
         except Exception as e:
             logger.error(f"Unexpected error: {e}", exc_info=True)
-            return f"❌ Beklenmeyen hata: {e}"
+            return f"❌ Beklenmeyen hata: {e}", None
     
-    def _format_output(self, result) -> str:
+    def _format_output(self, result, include_steps: bool = True) -> str:
         """Sonucu kullanici dostu formatta gosterir
         
         Args:
             result: CalculationResult objesi
+            include_steps: False ise adimlar yazilmaz (streaming'de zaten gosterildiyse)
             
         Returns:
             Formatlanmis string
@@ -137,7 +205,7 @@ class CalculatorAgent:
                     output_lines.append(f"[SONUC]: {format_result_for_display(res_data['result'])}")
                 
                 # steps key'i varsa adimlari goster
-                if "steps" in res_data and isinstance(res_data["steps"], list):
+                if include_steps and "steps" in res_data and isinstance(res_data["steps"], list):
                     output_lines.append("\n[ADIMLAR]:")
                     for i, step in enumerate(res_data["steps"], 1):
                         output_lines.append(f"  {i}. {step}")
@@ -157,7 +225,7 @@ class CalculatorAgent:
             output_lines.append(f"[SONUC]: {format_result_for_display(result.result)}")
         
         # Adımları göster (CalculationResult objesindeki steps - eger yukarida gosterilmediyse)
-        if result.steps and not (isinstance(result.result, dict) and "steps" in result.result):
+        if include_steps and result.steps and not (isinstance(result.result, dict) and "steps" in result.result):
             output_lines.append("\n[ADIMLAR]:")
             for i, step in enumerate(result.steps, 1):
                 output_lines.append(f"  {i}. {step}")
@@ -173,6 +241,13 @@ class CalculatorAgent:
             plot_paths = result.visual_data["plot_paths"]
             if "png" in plot_paths:
                 output_lines.append(f"\n[GRAFIK]: {plot_paths['png']}")
+        if result.visual_data and "plot_data" in result.visual_data:
+            plot_data = result.visual_data["plot_data"]
+            points = sum(series["points"] for series in plot_data.get("series", []))
+            output_lines.append(
+                f"\n[GRAFIK VERISI]: {plot_data['projection']}, "
+                f"{len(plot_data.get('series', []))} seri, {points} nokta"
+            )
         
         return "\n".join(output_lines)
 
@@ -180,6 +255,8 @@ class CalculatorAgent:
 async def interactive_mode():
     """Interaktif mod"""
     agent = CalculatorAgent()
+    # Grafik iscileri kullanici yazarken matplotlib'i yukler
+    agent.modules["graph_plotter"].renderer.prewarm()
     
     print("=" * 60)
     print(f"🧮 Calculator Agent - AI Builder Challenge")
@@ -207,10 +284,20 @@ async def interactive_mode():
             if not user_input:
                 continue
             
-            result = await agent.process_command(user_input)
-            if result:
-                print(result)
-                print()  
+            streamed_steps = False
+            async for event in agent.stream_command(user_input):
+                if event.kind == "step":
+                    if not streamed_steps:
+                        print("[ADIMLAR]:")
+                        streamed_steps = True
+                    print(f"  {event.index}. {event.text}", flush=True)
+                elif streamed_steps and event.result is not None:
+                    print()
+                    print(agent._format_output(event.result, include_steps=False))
+                    print()
+                elif event.text:
+                    print(event.text)
+                    print()
             
         except KeyboardInterrupt:
             print("\n\nGule gule!")
@@ -1,18 +1,50 @@
 """Abstract base class for all calculation modules"""
 
+import asyncio
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
 from src.schemas.models import CalculationResult
+from src.config.settings import settings
 from src.core.agent import GeminiAgent
 from src.core.validator import InputValidator
+from src.utils.exceptions import CircuitOpenError, UnsupportedExpressionError
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
 
+# Yerel motorlar varsayilan executor'dan ayri, sinirli bir havuzda calisir;
+# slot is gercekten bitene kadar (zaman asimindan sonra da) tutulur
+_engine_executor: Optional[ThreadPoolExecutor] = None
+_engine_slots: Optional[threading.BoundedSemaphore] = None
+_engine_lock = threading.Lock()
+
+
+def _engine_pool() -> tuple:
+    """Yerel motor havuzunu ve slot semaforunu ilk kullanimda olusturur"""
+    global _engine_executor, _engine_slots
+    with _engine_lock:
+        if _engine_executor is None:
+            workers = max(1, settings.LOCAL_ENGINE_WORKERS)
+            _engine_executor = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="local-engine"
+            )
+            _engine_slots = threading.BoundedSemaphore(workers)
+        return _engine_executor, _engine_slots
+
 
 class BaseModule(ABC):
     """Tum hesaplama modulleri icin abstract base class"""
     
+    # Cache TTL secimi ve sonuc etiketleri icin modul domain'i
+    domain: str = "general"
+    # True ise BATCH_ENABLED acikken cagrilar micro-batcher'dan gecer
+    batchable: bool = False
+    # JSON_MODE acikken Gemini'den istenecek yanit semasi (None ise yalnizca JSON MIME tipi)
+    response_schema: Optional[Dict[str, Any]] = None
+    
     def __init__(self, gemini_agent: GeminiAgent):
         """Modul baslatir
         
@@ -68,23 +100,140 @@ class BaseModule(ABC):
     async def _call_gemini(
         self,
         expression: str,
+        use_cache: bool = True,
+        on_step: Optional[Callable[[str], Any]] = None,
         **prompt_kwargs
     ) -> Dict[str, Any]:
         """Gemini API'yi cagirir
         
         Args:
             expression: Hesaplanacak ifade
+            use_cache: False ise response cache atlanir
+            on_step: Verilirse yanit streaming ile alinir ve her adim bu
+                callback'e iletilir
             **prompt_kwargs: Prompt template'e gonderilecek ek parametreler
             
         Returns:
             Parse edilmis JSON response
+            
+        Raises:
+            CircuitOpenError: Backend devre disi ve modulun yerel motoru yok
+        """
+        try:
+            return await self._request_gemini(expression, use_cache, on_step, **prompt_kwargs)
+        except CircuitOpenError:
+            local_response = self._local_response(expression, **prompt_kwargs)
+            if local_response is None:
+                raise
+            logger.warning(f"Backend devre disi, {self.domain} yerel motorla hesaplandi")
+            return local_response
+    
+    def _local_response(self, expression: str, **prompt_kwargs) -> Optional[Dict[str, Any]]:
+        """Backend kullanilamadiginda yerel motorla Gemini formatinda yanit uretir
+        
+        Yerel motoru olan moduller override eder.
+        
+        Args:
+            expression: Hesaplanacak ifade
+            **prompt_kwargs: Prompt template parametreleri
+            
+        Returns:
+            Gemini yaniti formatinda dict, yerel motor yoksa None
         """
+        return None
+    
+    async def _run_local_engine(
+        self,
+        solve: Callable[..., Dict[str, Any]],
+        *args: Any
+    ) -> Optional[Dict[str, Any]]:
+        """CPU-yogun yerel motoru event loop disinda, sure limitiyle calistirir
+        
+        Motorlar LOCAL_ENGINE_WORKERS boyutlu ayri bir havuzda calisir. Zaman
+        asimi yalnizca beklemeyi birakir, hesaplamayi durdurmaz: thread bitene
+        kadar slotunu tutar. Tum slotlar doluysa yeni is yerelde baslatilmaz.
+        
+        Args:
+            solve: Gemini yaniti formatinda dict donduren motor fonksiyonu
+            *args: Fonksiyon argumanlari
+            
+        Returns:
+            Motor yaniti; ifade desteklenmiyorsa, havuz doluysa veya
+            LOCAL_ENGINE_TIMEOUT_SECONDS asilirsa None (LLM'e dusulur)
+            
+        Raises:
+            CalculationError: Motor ifadeyi tanidi ama sonuc tanimsiz
+        """
+        executor, slots = _engine_pool()
+        if not slots.acquire(blocking=False):
+            logger.warning("Yerel motor havuzu dolu, LLM kullanilacak")
+            return None
+        
+        def run() -> Dict[str, Any]:
+            try:
+                return solve(*args)
+            finally:
+                slots.release()
+        
+        loop = asyncio.get_running_loop()
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(executor, run),
+                settings.LOCAL_ENGINE_TIMEOUT_SECONDS or None
+            )
+        except UnsupportedExpressionError as e:
+            logger.info(f"Yerel motor ifadeyi cozemedi, LLM kullanilacak: {e}")
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Yerel motor {settings.LOCAL_ENGINE_TIMEOUT_SECONDS}s icinde bitmedi, LLM kullanilacak"
+            )
+        return None
+    
+    @staticmethod
+    def _emit_steps(response: Dict[str, Any], on_step: Optional[Callable[[str], Any]]) -> None:
+        """Yerel yanitin adimlarini streaming callback'ine iletir"""
+        if on_step is not None:
+            for step in response.get("steps", []):
+                on_step(str(step))
+    
+    async def _request_gemini(
+        self,
+        expression: str,
+        use_cache: bool,
+        on_step: Optional[Callable[[str], Any]],
+        **prompt_kwargs
+    ) -> Dict[str, Any]:
+        """Yaniti streaming, batch veya tekil cagriyla Gemini'den alir"""
+        if on_step is not None:
+            return await self.gemini_agent.stream_json_response(
+                self.domain_prompt.format(expression=expression, **prompt_kwargs),
+                on_step,
+                use_cache=use_cache,
+                domain=self.domain,
+                response_schema=self.response_schema
+            )
+        
+        if self.batchable and settings.BATCH_ENABLED:
+            return await self.gemini_agent.generate_json_batched(
+                self.domain_prompt,
+                expression,
+                use_cache=use_cache,
+                domain=self.domain,
+                response_schema=self.response_schema,
+                **prompt_kwargs
+            )
+        
         prompt = self.domain_prompt.format(
             expression=expression,
             **prompt_kwargs
         )
         
-        return await self.gemini_agent.generate_json_response(prompt)
+        return await self.gemini_agent.generate_json_response(
+            prompt,
+            use_cache=use_cache,
+            domain=self.domain,
+            response_schema=self.response_schema
+        )
     
     def _create_result(
         self,
@@ -1,36 +1,52 @@
 """Basic math module for Calculator Agent"""
 
+from typing import Any, Dict, Optional
 from src.modules.base_module import BaseModule
 from src.schemas.models import CalculationResult
-from src.config.prompts import BASIC_MATH_PROMPT
+from src.config.prompts import BASIC_MATH_PROMPT, BASIC_MATH_SCHEMA
+from src.config.settings import settings
+from src.engines.arithmetic import ArithmeticEngine, safe_divide  # noqa: F401 (geriye uyumluluk)
+from src.utils.exceptions import UnsupportedExpressionError
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
 
 
-
-def safe_divide(a: float, b: float) -> float:
-    """Güvenli bölme işlemi
+class BasicMathModule(BaseModule):
+    """Temel matematik modulu
     
-    Args:
-        a: Bölünen
-        b: Bölen
-        
-    Returns:
-        Bölüm sonucu
+    Ifadeler once yerel ArithmeticEngine ile hesaplanir; yalnizca yerel
+    olarak ayristirilamayan girisler (dogal dil vb.) Gemini'ye gider.
     """
-    if b == 0:
-        raise ValueError("Sifira bolme hatasi")
-    return a / b
-
-
-class BasicMathModule(BaseModule):
-    """Temel matematik modulu"""
+    
+    domain = "basic_math"
+    batchable = True
+    response_schema = BASIC_MATH_SCHEMA
+    
+    def __init__(self, gemini_agent):
+        """Basic math modulunu baslatir"""
+        super().__init__(gemini_agent)
+        self.engine = ArithmeticEngine()
     
     def _get_domain_prompt(self) -> str:
         """Basic math prompt'unu dondurur"""
         return BASIC_MATH_PROMPT
     
+    def _local_response(self, expression: str, **prompt_kwargs) -> Optional[Dict[str, Any]]:
+        """Ifadeyi yerel aritmetik motoruyla hesaplar
+        
+        Returns:
+            Gemini yaniti formatinda dict, ifade yerel olarak ayristirilamazsa None
+            
+        Raises:
+            CalculationError: Sifira bolme, tanim kumesi veya limit hatasi
+        """
+        try:
+            return self.engine.to_response(expression, domain=self.domain)
+        except UnsupportedExpressionError as e:
+            logger.info(f"Yerel motor ifadeyi ayristiramadi, LLM kullanilacak: {e}")
+            return None
+    
     async def calculate(
         self,
         expression: str,
@@ -43,15 +59,27 @@ class BasicMathModule(BaseModule):
             **kwargs: Ek parametreler
             
         Returns:
-            CalculationResult objesi
+            CalculationResult objesi (metadata["engine"] "local" veya "llm")
         """
         self.validate_input(expression)
         
         logger.info(f"Basic math calculation: {expression}")
         
         try:
-            response = await self._call_gemini(expression)
+            response = None
+            if settings.LOCAL_ENGINES_ENABLED:
+                response = self._local_response(expression)
+            
+            if response is not None:
+                self._emit_steps(response, kwargs.get("on_step"))
+            else:
+                response = await self._call_gemini(
+                    expression,
+                    use_cache=kwargs.get("use_cache", True),
+                    on_step=kwargs.get("on_step")
+                )
             result = self._create_result(response, "basic_math")
+            result.metadata = {"engine": "llm", **(result.metadata or {})}
             
             logger.info(f"Calculation successful: {result.result}")
             return result
@@ -59,5 +87,3 @@ class BasicMathModule(BaseModule):
         except Exception as e:
             logger.error(f"Basic math calculation error: {e}")
             raise
-            
-
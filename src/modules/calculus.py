@@ -1,28 +1,48 @@
 """Calculus module for Calculator Agent"""
 
+from typing import Any, Dict, Optional
 from src.modules.base_module import BaseModule
 from src.schemas.models import CalculationResult
 from src.config.prompts import CALCULUS_PROMPT
+from src.config.settings import settings
+from src.engines.calculus import CalculusEngine
+from src.utils.exceptions import UnsupportedExpressionError
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
 
-def _get_sympy():
-    """İlk çağrıda sympy import eder"""
-    if 'sympy' in globals():
-        return globals()['sympy']
-    import sympy
-    globals()['sympy'] = sympy
-    return sympy
-
 
 class CalculusModule(BaseModule):
-    """Kalkulus modulu (limit, turev, integral, seri)"""
+    """Kalkulus modulu (limit, turev, integral, seri)
+    
+    Turev, integral, limit ve Taylor serisi once yerel SymPy motoruyla
+    hesaplanir; motorun tanimadigi veya kapali formda cozemedigi girisler
+    Gemini'ye gider.
+    """
+    
+    domain = "calculus"
+    batchable = True
+    
+    def __init__(self, gemini_agent):
+        """Calculus modulunu baslatir"""
+        super().__init__(gemini_agent)
+        self.engine = CalculusEngine(cache_size=settings.CALCULUS_CACHE_SIZE)
     
     def _get_domain_prompt(self) -> str:
         """Calculus prompt'unu dondurur"""
         return CALCULUS_PROMPT
     
+    def _local_response(self, expression: str, **prompt_kwargs) -> Optional[Dict[str, Any]]:
+        """Ifadeyi yerel SymPy motoruyla hesaplar
+        
+        Returns:
+            Gemini yaniti formatinda dict, motor cozemezse None
+        """
+        try:
+            return self.engine.solve(expression)
+        except UnsupportedExpressionError:
+            return None
+    
     async def calculate(
         self,
         expression: str,
@@ -35,15 +55,30 @@ class CalculusModule(BaseModule):
             **kwargs: Ek parametreler
             
         Returns:
-            CalculationResult objesi
+            CalculationResult objesi (metadata["engine"] "local" veya "llm")
         """
         self.validate_input(expression)
         
         logger.info(f"Calculus calculation: {expression}")
         
         try:
-            response = await self._call_gemini(expression)
+            response = None
+            if settings.LOCAL_ENGINES_ENABLED:
+                # Cache'teki sonuc icin thread'e gecmeye gerek yok
+                response = self.engine.lookup(expression)
+                if response is None:
+                    response = await self._run_local_engine(self.engine.solve, expression)
+            
+            if response is not None:
+                self._emit_steps(response, kwargs.get("on_step"))
+            else:
+                response = await self._call_gemini(
+                    expression,
+                    use_cache=kwargs.get("use_cache", True),
+                    on_step=kwargs.get("on_step")
+                )
             result = self._create_result(response, "calculus")
+            result.metadata = {"engine": "llm", **(result.metadata or {})}
             
             logger.info(f"Calculus calculation successful: {result.result}")
             return result
@@ -51,4 +86,3 @@ class CalculusModule(BaseModule):
         except Exception as e:
             logger.error(f"Calculus calculation error: {e}")
             raise
-
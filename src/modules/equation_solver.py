@@ -1,20 +1,47 @@
 """Equation solver module for Calculator Agent"""
 
+from typing import Any, Dict, Optional
 from src.modules.base_module import BaseModule
 from src.schemas.models import CalculationResult
 from src.config.prompts import EQUATION_SOLVER_PROMPT
+from src.config.settings import settings
+from src.engines.equation import EquationEngine
+from src.utils.exceptions import UnsupportedExpressionError
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
 
 
 class EquationSolverModule(BaseModule):
-    """Denklem cozucu modulu"""
+    """Denklem cozucu modulu
+    
+    Tek degiskenli polinom, rasyonel ve transandantal denklemler once yerel
+    motorla (sembolik, companion matris, sayisal kok arama) cozulur;
+    sistemler ve motorun cozemedigi denklemler Gemini'ye gider.
+    """
+    
+    domain = "equation_solver"
+    
+    def __init__(self, gemini_agent):
+        """Equation solver modulunu baslatir"""
+        super().__init__(gemini_agent)
+        self.engine = EquationEngine(cache_size=settings.CALCULUS_CACHE_SIZE)
     
     def _get_domain_prompt(self) -> str:
         """Equation solver prompt'unu dondurur"""
         return EQUATION_SOLVER_PROMPT
     
+    def _local_response(self, expression: str, **prompt_kwargs) -> Optional[Dict[str, Any]]:
+        """Denklemi yerel motorla cozer
+        
+        Returns:
+            Gemini yaniti formatinda dict, motor cozemezse None
+        """
+        try:
+            return self.engine.solve(expression)
+        except UnsupportedExpressionError:
+            return None
+    
     async def calculate(
         self,
         expression: str,
@@ -27,14 +54,28 @@ class EquationSolverModule(BaseModule):
             **kwargs: Ek parametreler
             
         Returns:
-            CalculationResult objesi
+            CalculationResult objesi (metadata["engine"] "local" veya "llm")
         """
         self.validate_input(expression)
         logger.info(f"Equation solving: {expression}")
         
         try:
-            response = await self._call_gemini(expression)
+            response = None
+            if settings.LOCAL_ENGINES_ENABLED:
+                response = self.engine.lookup(expression)
+                if response is None:
+                    response = await self._run_local_engine(self.engine.solve, expression)
+            
+            if response is not None:
+                self._emit_steps(response, kwargs.get("on_step"))
+            else:
+                response = await self._call_gemini(
+                    expression,
+                    use_cache=kwargs.get("use_cache", True),
+                    on_step=kwargs.get("on_step")
+                )
             result = self._create_result(response, "equation_solver")
+            result.metadata = {"engine": "llm", **(result.metadata or {})}
             
             logger.info(f"Equation solving successful: {result.result}")
             return result
@@ -42,4 +83,3 @@ class EquationSolverModule(BaseModule):
         except Exception as e:
             logger.error(f"Equation solving error: {e}")
             raise
-
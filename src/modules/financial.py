@@ -1,10 +1,13 @@
 """Financial module for Calculator Agent"""
 
 from decimal import Decimal, getcontext
+from typing import Any, Dict, Optional
 from src.modules.base_module import BaseModule
 from src.schemas.models import CalculationResult
 from src.config.prompts import FINANCIAL_PROMPT
 from src.config.settings import settings
+from src.engines.financial import FinancialEngine
+from src.utils.exceptions import UnsupportedExpressionError
 from src.utils.logger import setup_logger
 
 
@@ -15,12 +18,36 @@ getcontext().prec = 28
 
 
 class FinancialModule(BaseModule):
-    """Finansal modul (NPV, IRR, faiz, kredi)"""
+    """Finansal modul (NPV, IRR, faiz, kredi)
+    
+    NPV, IRR, kredi taksiti, gelecek/bugunku deger once yerel Decimal
+    motoruyla hesaplanir; birden fazla oran/tutar verilirse senaryolar
+    NumPy ile tek seferde hesaplanir. Motorun yorumlayamadigi (belirsiz)
+    ifadeler Gemini'ye gider.
+    """
+    
+    domain = "financial"
+    
+    def __init__(self, gemini_agent):
+        """Financial modulunu baslatir"""
+        super().__init__(gemini_agent)
+        self.engine = FinancialEngine()
     
     def _get_domain_prompt(self) -> str:
         """Financial prompt'unu dondurur"""
         return FINANCIAL_PROMPT
     
+    def _local_response(self, expression: str, **prompt_kwargs) -> Optional[Dict[str, Any]]:
+        """Ifadeyi yerel finans motoruyla hesaplar
+        
+        Returns:
+            Gemini yaniti formatinda dict, motor yorumlayamazsa None
+        """
+        try:
+            return self.engine.solve(expression, prompt_kwargs.get("currency") or settings.DEFAULT_CURRENCY)
+        except UnsupportedExpressionError:
+            return None
+    
     async def calculate(
         self,
         expression: str,
@@ -35,7 +62,7 @@ class FinancialModule(BaseModule):
             **kwargs: Ek parametreler
             
         Returns:
-            CalculationResult objesi
+            CalculationResult objesi (metadata["engine"] "local" veya "llm")
         """
         self.validate_input(expression)
         
@@ -44,7 +71,19 @@ class FinancialModule(BaseModule):
         logger.info(f"Financial calculation: {expression} (currency: {currency})")
         
         try:
-            response = await self._call_gemini(expression, currency=currency)
+            response = None
+            if settings.LOCAL_ENGINES_ENABLED:
+                response = await self._run_local_engine(self.engine.solve, expression, currency)
+            
+            if response is not None:
+                self._emit_steps(response, kwargs.get("on_step"))
+            else:
+                response = await self._call_gemini(
+                    expression,
+                    use_cache=kwargs.get("use_cache", True),
+                    on_step=kwargs.get("on_step"),
+                    currency=currency
+                )
             
             # Decimal conversion for precision
             result_value = response.get("result", 0  )
@@ -53,6 +92,7 @@ class FinancialModule(BaseModule):
             
             result = self._create_result(response, "financial")
             result.result = result_value
+            result.metadata = {"engine": "llm", **(result.metadata or {})}
             
             logger.info(f"Financial calculation successful: {result.result}")
             return result
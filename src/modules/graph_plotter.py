@@ -1,33 +1,70 @@
 """Graph plotter module for Calculator Agent"""
 
+import asyncio
 import os
 import re
 import json
-import uuid
-from pathlib import Path
-from typing import Dict, Any, Optional
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend
-import matplotlib.pyplot as plt
+from typing import Dict, Any, List, Optional, Tuple
 import numpy as np
 from src.modules.base_module import BaseModule
 from src.schemas.models import CalculationResult
-from src.config.prompts import GRAPH_PLOTTER_PROMPT
+from src.config.prompts import GRAPH_PLOTTER_PROMPT, GRAPH_PLOTTER_SCHEMA
+from src.config.settings import settings
+from src.core.cache import PlotCache
+from src.engines.plotting import (
+    CompiledExpression,
+    ExpressionCompiler,
+    encode_plot_data,
+    level_of_detail,
+    normalize_expression,
+    normalize_polar,
+    sample_curves,
+    sample_polar,
+    sample_surface,
+    split_components,
+)
+from src.engines.rendering import PlotRenderer, render_batch, render_figure
 from src.utils.logger import setup_logger
-from src.utils.exceptions import CalculationError
+from src.utils.exceptions import CalculationError, UnsupportedExpressionError
 
 logger = setup_logger()
 
+# Cizim ciktisi degistiginde eski cache kayitlarini gecersiz kilmak icin artirilir
+PLOT_CACHE_VERSION = 2
+# Cizimi etkileyen visual_data alanlari (cache anahtarina girer)
+PLOT_KEY_FIELDS = (
+    "plot_type", "x_range", "y_range", "t_range", "highlight_point", "highlight_points",
+    "max_points", "quality", "output_size", "plot_output", "target_points",
+)
+# calculate'e verilip visual_data'ya tasinan cizim secenekleri
+PLOT_OPTIONS = ("max_points", "quality", "output_size", "plot_output", "target_points")
+# "png": dosya, "data": istemci tarafinda cizilecek seyreltilmis veri, "both": ikisi
+PLOT_OUTPUTS = ("png", "data", "both")
+
+# Level-of-detail: bir ornegin kapladigi piksel (daha siki gozle ayirt edilmez)
+SURFACE_PIXELS_PER_CELL = 6
+CURVE_PIXELS_PER_SAMPLE = 0.5
+# "preview" kalitesinde hizli taslak sinirlari
+PREVIEW_DPI = 72
+PREVIEW_SURFACE_GRID = 40
+PREVIEW_CURVE_POINTS = 400
+
 
 class GraphPlotterModule(BaseModule):
     """Grafik cizim modulu (2D/3D plotlar)"""
     
+    domain = "graph_plotter"
+    response_schema = GRAPH_PLOTTER_SCHEMA
+    
     def __init__(self, gemini_agent):
         """Graph plotter baslatir"""
         super().__init__(gemini_agent)
-        self.cache_dir = Path("cache/plots")
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.plot_cache: Dict[str, str] = {}
+        self.plot_cache = PlotCache(settings.PLOT_CACHE_DIR, settings.PLOT_CACHE_MAX_BYTES)
+        self.compiler = ExpressionCompiler(cache_size=settings.CALCULUS_CACHE_SIZE)
+        self.renderer = PlotRenderer(
+            workers=settings.PLOT_RENDER_WORKERS,
+            timeout=settings.PLOT_RENDER_TIMEOUT_SECONDS
+        )
     
     def _get_domain_prompt(self) -> str:
         """Graph plotter prompt'unu dondurur"""
@@ -42,7 +79,10 @@ class GraphPlotterModule(BaseModule):
         
         Args:
             expression: Cizilecek fonksiyon (ornek: "x^2 + 2x + 1")
-            **kwargs: Ek parametreler
+            **kwargs: Ek parametreler (max_points: egri basina nokta butcesi,
+                quality: "preview" veya "full", output_size: (genislik, yukseklik) piksel,
+                plot_output: "png", "data" veya "both", target_points: "data"
+                ciktisinda egri basina nokta sayisi)
             
         Returns:
             CalculationResult objesi (visual_data icerir)
@@ -51,15 +91,27 @@ class GraphPlotterModule(BaseModule):
         
         logger.info(f"Graph plotting: {expression}")
         
-        # Cache check
-        cache_key = expression.lower().strip()
-        if cache_key in self.plot_cache:
+        options = {option: kwargs.get(option) for option in PLOT_OPTIONS}
+        options["plot_output"] = options["plot_output"] or settings.PLOT_OUTPUT
+        if options["plot_output"] not in PLOT_OUTPUTS:
+            raise CalculationError(
+                f"Gecersiz grafik ciktisi: {options['plot_output']} ({', '.join(PLOT_OUTPUTS)})"
+            )
+        
+        # Ayni istek daha once cizildiyse LLM'e gitmeden diskten donulur
+        loop = asyncio.get_running_loop()
+        request_key = PlotCache.make_key(request=expression.lower().strip(), **options)
+        cached = await loop.run_in_executor(None, self.plot_cache.lookup, request_key)
+        if cached is not None:
             logger.info("Using cached plot")
-            cached_path = self.plot_cache[cache_key]
-            return self._load_cached_result(cached_path)
+            return self._load_cached_result(*cached)
         
         try:
-            response = await self._call_gemini(expression)
+            response = await self._call_gemini(
+                expression,
+                use_cache=kwargs.get("use_cache", True),
+                on_step=kwargs.get("on_step")
+            )
             result = self._create_result(response, "graph_plotter")
             
             # Grafik olustur
@@ -69,26 +121,43 @@ class GraphPlotterModule(BaseModule):
             # Use function from visual_data if available (cleaned by LLM), otherwise use raw expression
             plot_expression = result.visual_data.get("function", expression)
 
-            # Check for specific point request (e.g., x=3) in the original expression
+            # Check for specific point requests (e.g., x=3, x=-1) in the original expression
             # Regex to find x=<number> or x = <number>
-            x_match = re.search(r'x\s*=\s*(-?\d+\.?\d*)', expression, re.IGNORECASE)
-            if x_match:
-                try:
-                    x_val = float(x_match.group(1))
-                    result.visual_data["highlight_point"] = x_val
-                    logger.info(f"Identified point to plot at x={x_val}")
-                except ValueError:
-                    pass
+            x_values = [
+                float(value) for value in re.findall(r'x\s*=\s*(-?\d+\.?\d*)', expression, re.IGNORECASE)
+            ]
+            if len(x_values) == 1:
+                result.visual_data["highlight_point"] = x_values[0]
+                logger.info(f"Identified point to plot at x={x_values[0]}")
+            elif x_values:
+                named = result.visual_data.setdefault("highlight_points", [])
+                known = {point["x"] if isinstance(point, dict) else point for point in named}
+                named.extend(value for value in x_values if value not in known)
+                logger.info(f"Identified points to plot at x={x_values}")
+
+            self._apply_defaults(result.visual_data, options)
 
-            # Default values if missing
-            if "plot_type" not in result.visual_data:
-                result.visual_data["plot_type"] = "2d"
-            if "x_range" not in result.visual_data:
-                result.visual_data["x_range"] = [-10, 10]
+            # Ayni grafik (farkli yazilmis istekten) zaten varsa yeniden cizilmez
+            content_key = await loop.run_in_executor(
+                None, self._content_key, result.visual_data, plot_expression
+            )
+            cached_payload = await loop.run_in_executor(
+                None, self.plot_cache.get, content_key, request_key
+            )
+            if cached_payload is not None:
+                logger.info("Using cached plot (same content)")
+                return self._load_cached_result(content_key, cached_payload)
 
-            plot_paths = await self._create_plot(result.visual_data, plot_expression)
-            result.visual_data["plot_paths"] = plot_paths
-            self.plot_cache[cache_key] = plot_paths["png"]
+            plot_paths = await self._create_plot(
+                result.visual_data,
+                plot_expression,
+                str(self.plot_cache.path_for(content_key))
+            )
+            if plot_paths:
+                result.visual_data["plot_paths"] = plot_paths
+            await loop.run_in_executor(
+                None, self.plot_cache.put, content_key, result.model_dump(mode="json"), request_key
+            )
             
             logger.info(f"Graph plotting successful")
             return result
@@ -97,165 +166,507 @@ class GraphPlotterModule(BaseModule):
             logger.error(f"Graph plotting error: {e}")
             raise
     
+    async def plot_batch(
+        self,
+        items: List[Dict[str, Any]],
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """Birbirinden bagimsiz grafikleri LLM'e gitmeden toplu cizer
+        
+        Her oge visual_data bicimindedir ("function" veya "functions",
+        "plot_type", "x_range", ... ve calculate'in cizim secenekleri).
+        Cache'te olan grafikler diskten doner; kalan tarifler thread
+        havuzunda hazirlanir ve isci basina tek bir isle, isci surecteki
+        sicak Figure yeniden kullanilarak cizilir.
+        
+        Args:
+            items: Cizilecek grafiklerin visual_data sozlukleri
+            return_exceptions: True ise hatali ogenin yerine istisna
+                dondurulur; False ise ilk hata firlatilir
+            
+        Returns:
+            Her oge icin (ayni sirayla) CalculationResult veya istisna
+        """
+        loop = asyncio.get_running_loop()
+        prepared = await asyncio.gather(
+            *(self._prepare_batch_item(item) for item in items),
+            return_exceptions=True
+        )
+        
+        results: List[Any] = list(prepared)
+        pending = [
+            (index, item) for index, item in enumerate(prepared)
+            if isinstance(item, tuple) and item[2] is not None
+        ]
+        if pending:
+            # Isler iscilere esit dagitilir; her isci kendi payini tek cagrida cizer
+            chunk_count = min(len(pending), max(1, self.renderer.workers))
+            chunks = [pending[offset::chunk_count] for offset in range(chunk_count)]
+            rendered = await asyncio.gather(
+                *(
+                    self.renderer.render(
+                        render_batch,
+                        [spec for _, (_, _, spec) in chunk],
+                        timeout=self.renderer.timeout * len(chunk)
+                    )
+                    for chunk in chunks
+                ),
+                return_exceptions=True
+            )
+            for chunk, outcome in zip(chunks, rendered):
+                for position, (index, (result, key, _)) in enumerate(chunk):
+                    if isinstance(outcome, BaseException):
+                        results[index] = outcome
+                    elif "error" in outcome[position]:
+                        results[index] = CalculationError(f"Grafik olusturulamadi: {outcome[position]['error']}")
+                    else:
+                        result.visual_data["plot_paths"] = {"png": outcome[position]["path"]}
+        
+        for index, item in enumerate(results):
+            if isinstance(item, tuple):
+                result, key, _ = item
+                await loop.run_in_executor(None, self.plot_cache.put, key, result.model_dump(mode="json"))
+                results[index] = result
+            elif isinstance(item, BaseException) and not return_exceptions:
+                raise item
+        
+        logger.info(f"Batch plotted {len(items)} graphs ({len(pending)} rendered)")
+        return results
+    
+    async def _prepare_batch_item(self, item: Dict[str, Any]) -> Any:
+        """Toplu cizim ogesini cache'ten dondurur veya cizim tarifini hazirlar
+        
+        Returns:
+            Cache isabetinde CalculationResult; aksi halde
+            (sonuc, cache anahtari, PNG tarifi veya None) uclusu
+        """
+        visual_data = dict(item)
+        expression = visual_data.get("function") or ", ".join(visual_data.get("functions") or [])
+        if not expression:
+            raise CalculationError("Toplu cizim ogesinde fonksiyon yok")
+        options = {option: visual_data.pop(option, None) for option in PLOT_OPTIONS}
+        options["plot_output"] = options["plot_output"] or settings.PLOT_OUTPUT
+        if options["plot_output"] not in PLOT_OUTPUTS:
+            raise CalculationError(
+                f"Gecersiz grafik ciktisi: {options['plot_output']} ({', '.join(PLOT_OUTPUTS)})"
+            )
+        self._apply_defaults(visual_data, options)
+        
+        loop = asyncio.get_running_loop()
+        key = await loop.run_in_executor(None, self._content_key, visual_data, expression)
+        cached = await loop.run_in_executor(None, self.plot_cache.get, key)
+        if cached is not None:
+            return self._load_cached_result(key, cached)
+        
+        try:
+            spec = await self._prepare_output(visual_data, expression, str(self.plot_cache.path_for(key)))
+        except CalculationError:
+            raise
+        except Exception as e:
+            logger.error(f"Plot error: {e}")
+            raise CalculationError(f"Grafik olusturulamadi: {e}")
+        result = CalculationResult(
+            result="Grafik olusturuldu",
+            steps=[f"{visual_data['plot_type']} grafik cizildi: {expression}"],
+            visual_data=visual_data,
+            domain="graph_plotter",
+        )
+        return result, key, spec if self._wants_png(visual_data) else None
+    
+    def _apply_defaults(self, visual_data: Dict[str, Any], options: Dict[str, Any]) -> None:
+        """Cizim seceneklerini ve varsayilan tip/araligi visual_data'ya yazar"""
+        for option, value in options.items():
+            if value:
+                visual_data[option] = value
+
+        # Default values if missing
+        if "plot_type" not in visual_data:
+            visual_data["plot_type"] = "2d"
+        if "x_range" not in visual_data:
+            visual_data["x_range"] = [-10, 10]
+    
+    def _content_key(self, visual_data: Dict[str, Any], expression: str) -> str:
+        """Grafigi belirleyen icerikten cache anahtari uretir
+        
+        Fonksiyon kanonik SymPy yazimiyla temsil edilir; "x^2" ve "x**2"
+        ayni grafigi paylasir. LLM'in aciklama alanlari anahtara girmez.
+        """
+        functions = []
+        for text in self._functions(visual_data, expression):
+            try:
+                functions.append(self.compiler.compile(text, max_variables=3).canonical)
+            except UnsupportedExpressionError:
+                # Cizim asamasi anlamli hatayi uretir
+                functions.append(normalize_expression(text))
+        return PlotCache.make_key(
+            version=PLOT_CACHE_VERSION,
+            function=functions[0] if len(functions) == 1 else functions,
+            **{name: visual_data.get(name) for name in PLOT_KEY_FIELDS}
+        )
+    
+    def _functions(self, visual_data: Dict[str, Any], expression: str) -> List[str]:
+        """Ayni grafikte cizilecek fonksiyonlari dondurur
+        
+        2D'de "functions" listesi veya virgulle ayrilmis ifade ("x^2, 2x")
+        birden fazla egri verir; diger tiplerde ifade tek parcadir.
+        """
+        if visual_data.get("plot_type", "2d") in ("3d", "parametric", "polar"):
+            return [expression]
+        if visual_data.get("functions"):
+            return [str(function) for function in visual_data["functions"]]
+        return split_components(expression) or [expression]
+    
     async def _create_plot(
         self,
         visual_data: Dict[str, Any],
-        expression: str
+        expression: str,
+        output_path: str
     ) -> Dict[str, str]:
         """Grafik olusturur
         
+        "data" ciktisinda seyreltilmis seriler visual_data["plot_data"]'ya
+        yazilir ve matplotlib hic calismaz; "png" ciktisi surec havuzunda
+        cizilir. Event loop hicbir asamada bloklanmaz.
+        
         Args:
             visual_data: Gemini'den gelen visual data
             expression: Fonksiyon ifadesi
+            output_path: PNG'nin yazilacagi yol
             
         Returns:
-            Plot dosya yollari dict'i
+            Plot dosya yollari dict'i ("data" ciktisinda bos)
         """
+        try:
+            spec = await self._prepare_output(visual_data, expression, output_path)
+            plot_paths = {}
+            if self._wants_png(visual_data):
+                plot_paths["png"] = await self.renderer.render(render_figure, spec)
+            return plot_paths
+            
+        except CalculationError:
+            raise
+        except Exception as e:
+            logger.error(f"Plot error: {e}")
+            raise CalculationError(f"Grafik olusturulamadi: {e}")
+    
+    async def _prepare_output(
+        self,
+        visual_data: Dict[str, Any],
+        expression: str,
+        output_path: str
+    ) -> Dict[str, Any]:
+        """Cizim tarifini thread havuzunda hazirlar, istenirse veriyi kodlar"""
+        loop = asyncio.get_running_loop()
+        spec = await loop.run_in_executor(None, self._prepare_plot, visual_data, expression, output_path)
+        if visual_data.get("plot_output", "png") in ("data", "both"):
+            visual_data["plot_data"] = await loop.run_in_executor(
+                None,
+                encode_plot_data,
+                spec,
+                visual_data.get("target_points") or settings.PLOT_DATA_TARGET_POINTS
+            )
+        return spec
+    
+    def _wants_png(self, visual_data: Dict[str, Any]) -> bool:
+        """PNG dosyasi istenip istenmedigini dondurur"""
+        return visual_data.get("plot_output", "png") in ("png", "both")
+    
+    def _prepare_plot(
+        self,
+        visual_data: Dict[str, Any],
+        expression: str,
+        output_path: str
+    ) -> Dict[str, Any]:
+        """Grafik tipine gore cizim tarifini hazirlar"""
         plot_type = visual_data.get("plot_type", "2d")
         x_range = visual_data.get("x_range", [-10, 10])
         
-        if plot_type == "2d":
-            return await self._plot_2d(visual_data, expression, x_range)
-        elif plot_type == "3d":
-            return await self._plot_3d(visual_data, expression)
+        if plot_type == "3d":
+            return self._prepare_3d(visual_data, expression, output_path)
         elif plot_type == "parametric":
-            return await self._plot_parametric(visual_data, expression)
+            return self._prepare_parametric(visual_data, expression, output_path)
         elif plot_type == "polar":
-            return await self._plot_polar(visual_data, expression)
+            return self._prepare_polar(visual_data, expression, output_path)
+        else:
+            return self._prepare_2d(visual_data, expression, x_range, output_path)
+    
+    def _compile(self, expression: str, variables: Optional[tuple] = None) -> CompiledExpression:
+        """Ifadeyi derler; desteklenmeyen ifadeyi CalculationError'a cevirir"""
+        try:
+            return self.compiler.compile(expression, variables=variables)
+        except UnsupportedExpressionError as e:
+            raise CalculationError(f"Ifade cizilemedi: {e}")
+    
+    def _figure_options(self, visual_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Kalite ve istenen cikti boyutundan figur boyutu, dpi ve pikselleri secer
+        
+        "preview" kalitesi dusuk dpi ve kaba izgara ile hizli bir taslak uretir.
+        """
+        preview = visual_data.get("quality") == "preview"
+        dpi = PREVIEW_DPI if preview else 150
+        if visual_data.get("output_size"):
+            width, height = visual_data["output_size"]
+            figsize = (width / dpi, height / dpi)
         else:
-            return await self._plot_2d(visual_data, expression, x_range)
+            figsize = (10, 6)
+            width, height = figsize[0] * dpi, figsize[1] * dpi
+        return {"figsize": figsize, "dpi": dpi, "width": int(width), "height": int(height), "preview": preview}
     
-    async def _plot_2d(
+    def _prepare_2d(
         self,
         visual_data: Dict[str, Any],
         expression: str,
-        x_range: list
-    ) -> Dict[str, str]:
-        """2D grafik cizer"""
-        try:
-            # Basit eval (guvenli) - production'da daha guvenli parser gerekli
-            # Check if single point (x=3 case)
-            is_single_point = abs(x_range[1] - x_range[0]) < 1e-6
-            
-            if is_single_point:
-                # Expand range to show context
-                center_x = x_range[0]
-                view_range = [center_x - 5, center_x + 5]
-                x = np.linspace(view_range[0], view_range[1], 1000)
-            else:
-                x = np.linspace(x_range[0], x_range[1], 1000)
-            
-            # Safe evaluation environment
-            safe_dict = {
-                "x": x,
-                "sin": np.sin,
-                "cos": np.cos,
-                "tan": np.tan,
-                "exp": np.exp,
-                "log": np.log,
-                "sqrt": np.sqrt,
-                "pi": np.pi,
-                "abs": np.abs,
-                "np": np
-            }
-            
-            # Clean expression for eval
-            # Replace ^ with ** for python syntax
-            eval_expr = expression.replace("^", "**")
-            
-            # Evaluate
+        x_range: list,
+        output_path: str
+    ) -> Dict[str, Any]:
+        """Fonksiyonlari derleyip ortak x izgarasinda ornekler ve tek figurun tarifini olusturur"""
+        # Ifadeler bir kez dogrulanip derlenir; ayni ifade cache'ten gelir
+        texts = self._functions(visual_data, expression)
+        functions = [self._compile(text) for text in texts]
+        options = self._figure_options(visual_data)
+        
+        # Check if single point (x=3 case)
+        is_single_point = abs(x_range[1] - x_range[0]) < 1e-6
+        
+        if is_single_point:
+            # Expand range to show context
+            center_x = x_range[0]
+            view_range = [center_x - 5, center_x + 5]
+        else:
+            view_range = x_range
+        
+        # Duz bolgelerde seyrek, egrilik/sureksizliklerde sik ornekleme;
+        # tum egriler ayni x noktalarinda tek vektorel cagriyla degerlendirilir
+        max_points = visual_data.get("max_points", settings.PLOT_MAX_POINTS)
+        if options["preview"]:
+            max_points = min(max_points, PREVIEW_CURVE_POINTS)
+        samples = sample_curves(functions, view_range[0], view_range[1], max_points=max_points)
+        logger.info(
+            f"Sampled {samples[0].evaluations} points for {len(functions)} functions, "
+            f"{sum(sample.singularities for sample in samples)} singularities"
+        )
+        
+        if len(texts) == 1:
+            labels = [f"f(x)={texts[0]}"]
+            title = f"f(x) = {texts[0]}"
+        else:
+            labels = [f"f{index}(x) = {text}" for index, text in enumerate(texts, 1)]
+            title = ", ".join(labels)
+        
+        # Highlight the single point and/or the explicitly requested points
+        candidates = [{"x": center_x}] if is_single_point else []
+        candidates.extend(self._highlight_points(visual_data))
+        points = []
+        for candidate in candidates:
+            point_x = candidate["x"]
+            targets = self._point_targets(candidate.get("function"), texts, functions)
+            label = f"{candidate['name']} (x={point_x})" if candidate.get("name") else f"x={point_x}"
+            for index in targets:
+                point_y = functions[index].at(point_x)
+                if np.isnan(point_y):
+                    logger.warning(f"Could not plot specific point: f({point_x}) tanimsiz")
+                    continue
+                points.append({
+                    "x": point_x,
+                    "y": point_y,
+                    "name": candidate.get("name"),
+                    # Ayni nokta birden fazla egride isaretlenirse lejantta bir kez gorunur
+                    "label": None if any(point["label"] == label for point in points) else label,
+                    "color": "red" if len(functions) == 1 else f"C{index}",
+                })
+                logger.info(f"Plotted specific point ({point_x}, {point_y})")
+        
+        return {
+            "path": output_path,
+            "series": [
+                {"x": sample.x, "y": sample.y, "label": label}
+                for sample, label in zip(samples, labels)
+            ],
+            "points": points,
+            "y_limits": self._combined_limits(samples),
+            "title": title,
+            "figsize": options["figsize"],
+            "dpi": options["dpi"],
+        }
+    
+    def _highlight_points(self, visual_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """highlight_point ve highlight_points'i {"x", "name", "function"} listesine cevirir"""
+        raw = list(visual_data.get("highlight_points") or [])
+        if visual_data.get("highlight_point") is not None:
+            raw.insert(0, visual_data["highlight_point"])
+        points = []
+        for point in raw:
+            if not isinstance(point, dict):
+                point = {"x": point}
             try:
-                y = eval(eval_expr, {"__builtins__": {}}, safe_dict)
-                
-                # Handle constant result (e.g. y = 5)
-                if isinstance(y, (int, float)):
-                    y = np.full_like(x, y)
-            except Exception as eval_error:
-                logger.warning(f"Eval failed for '{expression}': {eval_error}. Fallback to x^2")
-                y = x ** 2  # Fallback only on error
-            
-            plt.figure(figsize=(10, 6))
-            plt.plot(x, y, 'b-', linewidth=2, label=f'f(x)={expression}')
-            
-            # If single point, highlight it
-            if is_single_point:
-                # Calculate y for the specific point
-                # We can reuse the eval logic or just pick the center index if we were careful, 
-                # but let's re-eval for precision
-                try:
-                    point_val = eval(eval_expr, {"__builtins__": {}}, {**safe_dict, "x": center_x})
-                    plt.plot(center_x, point_val, 'ro', markersize=10, label=f'x={center_x}')
-                    plt.annotate(f'({center_x}, {point_val:.2f})', 
-                                 (center_x, point_val),
-                                 xytext=(10, 10), textcoords='offset points',
-                                 arrowprops=dict(arrowstyle='->'))
-                except:
-                    pass
-            
-            # Check for explicitly requested point via highlight_point
-            if "highlight_point" in visual_data:
-                try:
-                    hp_x = visual_data["highlight_point"]
-                    hp_y = eval(eval_expr, {"__builtins__": {}}, {**safe_dict, "x": hp_x})
-                    plt.plot(hp_x, hp_y, 'ro', markersize=10, label=f'x={hp_x}')
-                    plt.annotate(f'({hp_x}, {hp_y:.2f})', 
-                                 (hp_x, hp_y),
-                                 xytext=(10, 10), textcoords='offset points',
-                                 arrowprops=dict(arrowstyle='->'))
-                    logger.info(f"Plotted specific point ({hp_x}, {hp_y})")
-                except Exception as e:
-                    logger.warning(f"Could not plot specific point: {e}")
-
-            plt.grid(True, alpha=0.3)
-            plt.xlabel('x')
-            plt.ylabel('y')
-            plt.title(f'f(x) = {expression}')
-            plt.legend()
-            
-            # Use UUID to prevent browser caching issues in web apps
-            png_path = self.cache_dir / f"{uuid.uuid4().hex}.png"
-            plt.savefig(png_path, dpi=150, bbox_inches='tight')
-            plt.close()
-            
-            return {"png": str(png_path)}
-            
-        except Exception as e:
-            logger.error(f"2D plot error: {e}")
-            raise CalculationError(f"Grafik olusturulamadi: {e}")
+                points.append({
+                    "x": float(point["x"]),
+                    "name": point.get("name") or point.get("label"),
+                    "function": point.get("function"),
+                })
+            except (KeyError, TypeError, ValueError):
+                logger.warning(f"Gecersiz vurgu noktasi atlandi: {point}")
+        return points
+    
+    def _point_targets(
+        self,
+        function: Any,
+        texts: List[str],
+        functions: List[CompiledExpression]
+    ) -> List[int]:
+        """Vurgu noktasinin isaretlenecegi egrilerin indekslerini dondurur
+        
+        Fonksiyon verilmezse nokta her egride isaretlenir; "f2" bicimi,
+        1'den baslayan sira numarasi veya esdeger ifade kabul edilir.
+        """
+        if function is None or function == "":
+            return list(range(len(functions)))
+        name = str(function).strip()
+        match = re.fullmatch(r'f?(\d+)', name)
+        if match and 1 <= int(match.group(1)) <= len(functions):
+            return [int(match.group(1)) - 1]
+        try:
+            canonical = self.compiler.compile(name).canonical
+        except UnsupportedExpressionError:
+            canonical = None
+        targets = [
+            index for index, compiled in enumerate(functions)
+            if compiled.canonical == canonical or texts[index] == name
+        ]
+        if not targets:
+            logger.warning(f"Vurgu noktasinin fonksiyonu bulunamadi: {name}; tum egrilerde isaretleniyor")
+            return list(range(len(functions)))
+        return targets
+    
+    def _combined_limits(self, samples: list) -> Optional[Tuple[float, float]]:
+        """Asimptotlu egrilerin gorunur araligini diger egrileri kirpmadan birlestirir"""
+        if not any(sample.y_limits for sample in samples):
+            return None
+        lows, highs = [], []
+        for sample in samples:
+            if sample.y_limits:
+                lows.append(sample.y_limits[0])
+                highs.append(sample.y_limits[1])
+                continue
+            finite = sample.y[np.isfinite(sample.y)]
+            if finite.size:
+                lows.append(float(finite.min()))
+                highs.append(float(finite.max()))
+        return min(lows), max(highs)
     
-    async def _plot_3d(
+    def _prepare_3d(
         self,
         visual_data: Dict[str, Any],
-        expression: str
-    ) -> Dict[str, str]:
-        """3D grafik cizer"""
-        # Placeholder - 3D plot implementasyonu
-        return await self._plot_2d(visual_data, expression, [-10, 10])
+        expression: str,
+        output_path: str
+    ) -> Dict[str, Any]:
+        """Yuzeyi izgara cozunurlugunu secerek meshgrid uzerinde degerlendirir"""
+        body = normalize_expression(expression)
+        function = self._compile(body, variables=("x", "y"))
+        options = self._figure_options(visual_data)
+        x_range = visual_data.get("x_range") or [-5, 5]
+        y_range = visual_data.get("y_range") or x_range
+        
+        # Gorunmeyecek kadar sik veya isciyi kilitleyecek kadar buyuk izgara secilmez
+        resolution = level_of_detail(
+            function,
+            [x_range, y_range],
+            pixels=min(options["width"], options["height"]),
+            pixels_per_sample=SURFACE_PIXELS_PER_CELL,
+            time_budget=settings.PLOT_LOD_TIME_BUDGET_SECONDS,
+            max_resolution=PREVIEW_SURFACE_GRID if options["preview"] else settings.PLOT_MAX_SURFACE_GRID,
+        )
+        grid_x, grid_y, grid_z = sample_surface(function, x_range, y_range, resolution)
+        logger.info(f"Sampled {resolution}x{resolution} surface grid")
+        
+        return {
+            "path": output_path,
+            "projection": "3d",
+            "surface": {"x": grid_x, "y": grid_y, "z": grid_z},
+            "title": f"z = {body}",
+            "figsize": options["figsize"],
+            "dpi": options["dpi"],
+        }
     
-    async def _plot_parametric(
+    def _prepare_parametric(
         self,
         visual_data: Dict[str, Any],
-        expression: str
-    ) -> Dict[str, str]:
-        """Parametrik grafik cizer"""
-        # Placeholder
-        return await self._plot_2d(visual_data, expression, [-10, 10])
+        expression: str,
+        output_path: str
+    ) -> Dict[str, Any]:
+        """Iki bileseni t uzerinde vektorel olarak degerlendirir"""
+        components = split_components(expression)
+        if len(components) != 2:
+            raise CalculationError(f"Parametrik ifade iki bilesen icermeli: {expression}")
+        x_function, y_function = (self._compile(part, variables=("t",)) for part in components)
+        options = self._figure_options(visual_data)
+        t_range = visual_data.get("t_range") or [0, 2 * np.pi]
+        
+        resolution = self._curve_resolution(x_function, t_range, options, visual_data)
+        t = np.linspace(t_range[0], t_range[1], resolution)
+        logger.info(f"Sampled {resolution} parametric points")
+        
+        return {
+            "path": output_path,
+            "series": [{"x": x_function(t), "y": y_function(t), "label": f"({components[0]}, {components[1]})"}],
+            "equal_aspect": True,
+            "title": f"x(t) = {components[0]}, y(t) = {components[1]}",
+            "figsize": options["figsize"],
+            "dpi": options["dpi"],
+        }
     
-    async def _plot_polar(
+    def _prepare_polar(
         self,
         visual_data: Dict[str, Any],
-        expression: str
-    ) -> Dict[str, str]:
-        """Polar grafik cizer"""
-        # Placeholder
-        return await self._plot_2d(visual_data, expression, [-10, 10])
+        expression: str,
+        output_path: str
+    ) -> Dict[str, Any]:
+        """r(θ)'yi aci araliginda vektorel olarak degerlendirir"""
+        body = normalize_expression(normalize_polar(expression))
+        function = self._compile(body, variables=("t",))
+        options = self._figure_options(visual_data)
+        theta_range = visual_data.get("t_range") or [0, 2 * np.pi]
+        
+        resolution = self._curve_resolution(function, theta_range, options, visual_data)
+        theta, radius = sample_polar(function, theta_range, resolution)
+        logger.info(f"Sampled {resolution} polar points")
+        
+        return {
+            "path": output_path,
+            "projection": "polar",
+            "series": [{"x": theta, "y": radius, "label": f"r = {body}"}],
+            "title": f"r(t) = {body}  (t = θ)",
+            "figsize": options["figsize"],
+            "dpi": options["dpi"],
+        }
     
-    def _load_cached_result(self, cached_path: str) -> CalculationResult:
-        """Cache'den sonuc yukler"""
-        return CalculationResult(
-            result="Grafik olusturuldu (cache)",
-            steps=["Cache'den yuklendi"],
-            visual_data={"plot_paths": {"png": cached_path}},
-            confidence_score=1.0,
-            domain="graph_plotter",
+    def _curve_resolution(
+        self,
+        function: CompiledExpression,
+        t_range: list,
+        options: Dict[str, Any],
+        visual_data: Dict[str, Any]
+    ) -> int:
+        """Parametrik/polar egriler icin ornek sayisini secer"""
+        max_points = visual_data.get("max_points", settings.PLOT_MAX_POINTS)
+        if options["preview"]:
+            max_points = min(max_points, PREVIEW_CURVE_POINTS)
+        return level_of_detail(
+            function,
+            [t_range],
+            pixels=options["width"],
+            pixels_per_sample=CURVE_PIXELS_PER_SAMPLE,
+            time_budget=settings.PLOT_LOD_TIME_BUDGET_SECONDS,
+            max_resolution=max_points,
         )
+    
+    def _load_cached_result(self, key: str, payload: Dict[str, Any]) -> CalculationResult:
+        """Cache'teki orijinal sonucu (adimlar ve visual_data dahil) dondurur"""
+        result = CalculationResult(**payload)
+        if result.visual_data is None:
+            result.visual_data = {}
+        # Dizin baska bir calisma dizininden paylasiliyor olabilir
+        if result.visual_data.get("plot_paths"):
+            result.visual_data["plot_paths"] = {"png": str(self.plot_cache.path_for(key))}
+        result.metadata = {**(result.metadata or {}), "plot_cache": "hit"}
+        return result
@@ -1,20 +1,47 @@
 """Linear algebra module for Calculator Agent"""
 
+from typing import Any, Dict, Optional
 from src.modules.base_module import BaseModule
 from src.schemas.models import CalculationResult
 from src.config.prompts import LINEAR_ALGEBRA_PROMPT
+from src.config.settings import settings
+from src.engines.linalg import LinearAlgebraEngine
+from src.utils.exceptions import UnsupportedExpressionError
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
 
 
 class LinearAlgebraModule(BaseModule):
-    """Lineer cebir modulu (matris, vektor, determinant)"""
+    """Lineer cebir modulu (matris, vektor, determinant)
+    
+    Satir ici yazilan matris ifadeleri (carpim, toplam, transpoz, ters,
+    det, rank, ozdeger, sistem cozumu, norm) once yerel NumPy motoruyla
+    hesaplanir; motorun tanimadigi girisler Gemini'ye gider.
+    """
+    
+    domain = "linear_algebra"
+    
+    def __init__(self, gemini_agent):
+        """Linear algebra modulunu baslatir"""
+        super().__init__(gemini_agent)
+        self.engine = LinearAlgebraEngine(cache_size=settings.LINALG_CACHE_SIZE)
     
     def _get_domain_prompt(self) -> str:
         """Linear algebra prompt'unu dondurur"""
         return LINEAR_ALGEBRA_PROMPT
     
+    def _local_response(self, expression: str, **prompt_kwargs) -> Optional[Dict[str, Any]]:
+        """Ifadeyi yerel lineer cebir motoruyla hesaplar
+        
+        Returns:
+            Gemini yaniti formatinda dict, motor cozemezse None
+        """
+        try:
+            return self.engine.solve(expression)
+        except UnsupportedExpressionError:
+            return None
+    
     async def calculate(
         self,
         expression: str,
@@ -27,15 +54,27 @@ class LinearAlgebraModule(BaseModule):
             **kwargs: Ek parametreler
             
         Returns:
-            CalculationResult objesi
+            CalculationResult objesi (metadata["engine"] "local" veya "llm")
         """
         self.validate_input(expression)
         
         logger.info(f"Linear algebra calculation: {expression}")
         
         try:
-            response = await self._call_gemini(expression)
+            response = None
+            if settings.LOCAL_ENGINES_ENABLED:
+                response = await self._run_local_engine(self.engine.solve, expression)
+            
+            if response is not None:
+                self._emit_steps(response, kwargs.get("on_step"))
+            else:
+                response = await self._call_gemini(
+                    expression,
+                    use_cache=kwargs.get("use_cache", True),
+                    on_step=kwargs.get("on_step")
+                )
             result = self._create_result(response, "linear_algebra")
+            result.metadata = {"engine": "llm", **(result.metadata or {})}
             
             logger.info(f"Linear algebra calculation successful: {result.result}")
             return result
@@ -1,26 +1,63 @@
 
-import numpy as np
-from scipy import stats
-from typing import Dict, Any, List, Union
+import asyncio
+from typing import Dict, Any, List, Optional, Union
 from src.modules.base_module import BaseModule
 from src.schemas.models import CalculationResult
+from src.config.prompts import STATISTICS_SCHEMA
+from src.config.settings import settings
+from src.engines.statistics import StatisticsEngine, StatisticsQuery
+from src.engines.streaming import UNIVARIATE_OPERATIONS
+from src.utils.exceptions import UnsupportedExpressionError
 
 class StatisticsModule(BaseModule):
-    """Istatistiksel hesaplamalar modulu"""
+    """Istatistiksel hesaplamalar modulu
     
-    async def calculate(self, expression: str) -> CalculationResult:
+    Veri seti ve islemler once yerel olarak girdiden cikarilir; yalnizca
+    cikarim basarisiz olursa (belirsiz veya dogal dilde veri) Gemini'ye
+    sorulur. Istenen tum islemler ("ortalama ve standart sapma", "ozet")
+    ayni veri uzerinden tek geciste hesaplanir; birden fazla sutun icin
+    korelasyon, kovaryans ve dogrusal regresyon desteklenir.
+    
+    CSV/TSV/NPY dosya referanslari (orn: "olcumler.csv fiyat sutununun
+    medyani") STATISTICS_DATA_DIR altindan parcalar halinde, tek geciste
+    ve event loop disinda islenir.
+    """
+    
+    domain = "statistics"
+    response_schema = STATISTICS_SCHEMA
+    
+    def __init__(self, gemini_agent):
+        """Statistics modulunu baslatir"""
+        super().__init__(gemini_agent)
+        self.engine = StatisticsEngine(
+            data_dir=settings.STATISTICS_DATA_DIR,
+            chunk_size=settings.STATISTICS_CHUNK_SIZE,
+            exact_quantile_limit=settings.STATISTICS_EXACT_QUANTILE_LIMIT
+        )
+    
+    async def calculate(self, expression: str, **kwargs) -> CalculationResult:
         """Istatistiksel hesaplamalari yapar
         
         Args:
             expression: Kullanici ifadesi (orn: "[1, 2, 3] ortalamasi")
+            **kwargs: Ek parametreler (use_cache)
             
         Returns:
-            CalculationResult objesi
+            CalculationResult objesi (metadata["engine"] "local" veya "llm")
         """
         try:
-            # Once Gemini'den ne yapilmasi gerektigini ve veriyi ayiklamasini iste
+            query = self._extract_locally(expression)
+            if query is not None:
+                return await self._calculate_local(query)
+            
+            # Yerel cikarim basarisiz: Gemini'den veriyi ve islemi ayiklamasini iste
             prompt = self._get_domain_prompt(expression)
-            response = await self.gemini_agent.generate_json_response(prompt)
+            response = await self.gemini_agent.generate_json_response(
+                prompt,
+                use_cache=kwargs.get("use_cache", True),
+                domain=self.domain,
+                response_schema=self.response_schema
+            )
             
             if not response:
                 raise ValueError("Gemini'den yanit alinamadi")
@@ -47,7 +84,8 @@ class StatisticsModule(BaseModule):
                     f"Sonuc: {result_value}"
                 ],
                 confidence_score=1.0,
-                domain="statistics"
+                domain="statistics",
+                metadata={"engine": "llm"}
             )
             
         except Exception as e:
@@ -58,29 +96,41 @@ class StatisticsModule(BaseModule):
                 domain="statistics"
             )
 
-    def _perform_calculation(self, data: List[float], operation: str) -> Union[float, List[float], str]:
-        """Istatistiksel islemi gerceklestirir"""
-        data_array = np.array(data)
+    async def _calculate_local(self, query: StatisticsQuery) -> CalculationResult:
+        """Yerel sorgunun tum islemlerini tek geciste hesaplar
         
-        if operation == "mean":
-            return float(np.mean(data_array))
-        elif operation == "median":
-            return float(np.median(data_array))
-        elif operation == "mode":
-            mode_result = stats.mode(data_array, keepdims=True)
-            return float(mode_result.mode[0])
-        elif operation == "std":
-            return float(np.std(data_array))
-        elif operation == "variance":
-            return float(np.var(data_array))
-        elif operation == "min":
-            return float(np.min(data_array))
-        elif operation == "max":
-            return float(np.max(data_array))
-        elif operation == "sum":
-            return float(np.sum(data_array))
+        Dosya referanslari event loop'u bloklamamak icin executor'da okunur.
+        """
+        metadata = {"engine": "local"}
+        if query.source:
+            loop = asyncio.get_running_loop()
+            result_value, steps = await loop.run_in_executor(None, self.engine.compute, query)
+            metadata["source"] = query.source
         else:
+            result_value, steps = self.engine.compute(query)
+        return CalculationResult(
+            result=result_value,
+            steps=steps,
+            confidence_score=1.0,
+            domain="statistics",
+            metadata=metadata
+        )
+
+    def _extract_locally(self, expression: str) -> Optional[StatisticsQuery]:
+        """Veri setini ve islemi yerel olarak cikarir, basarisizsa None dondurur"""
+        if not settings.LOCAL_ENGINES_ENABLED:
+            return None
+        try:
+            return self.engine.extract(expression)
+        except UnsupportedExpressionError:
+            return None
+
+    def _perform_calculation(self, data: List[float], operation: str) -> Union[float, Dict[str, Any], str]:
+        """Istatistiksel islemi gerceklestirir (yerel motorun tek gecisli akumulatorleriyle)"""
+        if operation not in UNIVARIATE_OPERATIONS + ("describe",):
             return "Bilinmeyen islem"
+        result_value, _ = self.engine.compute(StatisticsQuery([list(data)], (operation,)))
+        return result_value
 
     def _get_domain_prompt(self, expression: str = "") -> str:
         """Istatistik icin prompt olusturur"""
@@ -95,7 +145,7 @@ class StatisticsModule(BaseModule):
         Lutfen asagidaki JSON formatinda yanit ver:
         {{
             "data": [sayisal_liste],
-            "operation": "mean" | "median" | "mode" | "std" | "variance" | "min" | "max" | "sum",
+            "operation": "mean" | "median" | "mode" | "std" | "variance" | "min" | "max" | "sum" | "skewness" | "kurtosis" | "describe",
             "explanation": "kisa_aciklama"
         }}
         
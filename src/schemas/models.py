@@ -7,7 +7,7 @@ from pydantic import BaseModel, Field
 class CalculationResult(BaseModel):
     """Hesaplama sonucu modeli"""
     
-    result: Optional[Union[float, List[float], Dict[str, Any], str]] = Field(
+    result: Optional[Union[float, List[float], List[List[float]], Dict[str, Any], str]] = Field(
         None, description="Hesaplama sonucu"
     )
     steps: List[str] = Field(
@@ -36,3 +36,16 @@ class CalculationRequest(BaseModel):
         default_factory=dict, description="Ek parametreler"
     )
 
+
+
+class StreamEvent(BaseModel):
+    """Streaming sirasinda yayinlanan olay modeli"""
+    
+    kind: str = Field(..., description="Olay tipi: 'step' veya 'final'")
+    text: str = Field("", description="Adim metni veya formatlanmis sonuc")
+    index: Optional[int] = Field(
+        None, description="Adim sirasi (1'den baslar, sadece 'step' icin)"
+    )
+    result: Optional[CalculationResult] = Field(
+        None, description="Nihai hesaplama sonucu (sadece 'final' icin)"
+    )
@@ -2,11 +2,13 @@ import streamlit as st
 import asyncio
 import os
 import sys
+import numpy as np
 
 # Add the project root to the python path to ensure imports work
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.main import CalculatorAgent
+from src.engines.plotting import decode_array
 
 # Page Configuration
 st.set_page_config(
@@ -36,6 +38,56 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+def render_plot_data(plot_data):
+    """Seyreltilmis grafik verisini tarayicida (Vega-Lite) cizer; PNG gerekmez"""
+    rows = []
+    for series in plot_data.get("series", []):
+        xs, ys = decode_array(series["x"]), decode_array(series["y"])
+        if plot_data["projection"] == "polar":
+            # Kartezyen duzleme cevrilir (x aci, y yaricap)
+            xs, ys = ys * np.cos(xs), ys * np.sin(xs)
+        for order, (x, y) in enumerate(zip(xs, ys)):
+            # NaN'lar cizgiyi boler; Vega-Lite null degerleri atlar
+            rows.append({
+                "x": float(x) if np.isfinite(x) else None,
+                "y": float(y) if np.isfinite(y) else None,
+                "order": order,
+                "seri": series.get("label") or "f",
+            })
+    
+    if "surface" in plot_data:
+        surface = plot_data["surface"]
+        xs, ys, zs = decode_array(surface["x"]), decode_array(surface["y"]), decode_array(surface["z"])
+        cells = [
+            {"x": float(x), "y": float(y), "z": float(zs[i, j]) if np.isfinite(zs[i, j]) else None}
+            for i, y in enumerate(ys) for j, x in enumerate(xs)
+        ]
+        st.vega_lite_chart({
+            "title": plot_data.get("title", ""),
+            "data": {"values": cells},
+            "mark": "rect",
+            "encoding": {
+                "x": {"field": "x", "type": "ordinal", "axis": {"format": ".2f", "labelOverlap": True}},
+                "y": {"field": "y", "type": "ordinal", "sort": "descending", "axis": {"format": ".2f", "labelOverlap": True}},
+                "color": {"field": "z", "type": "quantitative", "scale": {"scheme": "viridis"}},
+            },
+        }, use_container_width=True)
+        return
+    
+    y_scale = {"domain": plot_data["y_limits"], "clamp": True} if plot_data.get("y_limits") else {"zero": False}
+    st.vega_lite_chart({
+        "title": plot_data.get("title", ""),
+        "data": {"values": rows},
+        "mark": {"type": "line", "clip": True},
+        "encoding": {
+            "x": {"field": "x", "type": "quantitative", "scale": {"zero": False}},
+            "y": {"field": "y", "type": "quantitative", "scale": y_scale},
+            "order": {"field": "order", "type": "quantitative"},
+            "color": {"field": "seri", "type": "nominal"},
+        },
+    }, use_container_width=True)
+
+
 # Initialize Session State
 if "messages" not in st.session_state:
     st.session_state.messages = []
@@ -66,6 +118,8 @@ for message in st.session_state.messages:
         st.markdown(message["content"])
         if "image" in message:
             st.image(message["image"])
+        if "plot_data" in message:
+            render_plot_data(message["plot_data"])
 
 # Handle User Input
 if prompt := st.chat_input("Bir işlem yazın (örn: x^2 grafiğini çiz)..."):
@@ -78,19 +132,35 @@ if prompt := st.chat_input("Bir işlem yazın (örn: x^2 grafiğini çiz)..."):
     with st.chat_message("assistant"):
         with st.spinner("Hesaplanıyor..."):
             try:
+                placeholder = st.empty()
+
                 # Define a wrapper to run the agent in the new loop
                 async def run_agent_task(user_prompt):
                     # Instantiate agent HERE so it binds to the correct loop
                     agent = CalculatorAgent()
-                    return await agent.process_command(user_prompt)
+                    step_lines = []
+                    final_text = ""
+                    final_result = None
+                    # Grafikler PNG yerine veri olarak istenir ve tarayicida cizilir
+                    async for event in agent.stream_command(user_prompt, plot_output="data"):
+                        if event.kind == "step":
+                            # Adimlari geldikce goster
+                            if not step_lines:
+                                step_lines.append("**[ADIMLAR]:**")
+                            step_lines.append(f"{event.index}. {event.text}")
+                            placeholder.markdown("\n\n".join(step_lines))
+                        else:
+                            final_text = event.text
+                            final_result = event.result
+                    return final_text, final_result
 
                 # Run the wrapper
-                response_data = asyncio.run(run_agent_task(prompt))
+                response_data, final_result = asyncio.run(run_agent_task(prompt))
                 
                 # Extract result and steps
                 output_text = response_data
                 
-                st.markdown(output_text)
+                placeholder.markdown(output_text)
                 
                 # Check for graph image in the output text
                 image_path = None
@@ -102,10 +172,18 @@ if prompt := st.chat_input("Bir işlem yazın (örn: x^2 grafiğini çiz)..."):
                             st.image(potential_path)
                             image_path = potential_path
                 
+                plot_data = None
+                if final_result is not None and final_result.visual_data:
+                    plot_data = final_result.visual_data.get("plot_data")
+                if plot_data:
+                    render_plot_data(plot_data)
+                
                 # Add assistant message to history
                 message_data = {"role": "assistant", "content": output_text}
                 if image_path:
                     message_data["image"] = image_path
+                if plot_data:
+                    message_data["plot_data"] = plot_data
                 st.session_state.messages.append(message_data)
 
             except Exception as e:
@@ -25,3 +25,23 @@ class ModuleNotFoundError(Exception):
     """Modul bulunamadi"""
     pass
 
+
+
+class CassetteMissError(GeminiAPIError):
+    """Replay modunda cassette'te karsiligi olmayan istek"""
+    pass
+
+
+class CircuitOpenError(GeminiAPIError):
+    """Circuit breaker acik: backend cagrisi yapilmadan reddedildi"""
+    pass
+
+
+class UnsupportedExpressionError(CalculationError):
+    """Ifade yerel motorda degerlendirilemiyor (LLM'e yonlendirilmeli)"""
+    pass
+
+
+class EvaluationLimitError(CalculationError):
+    """Ifade yerel motorun kaynak limitlerini asiyor"""
+    pass
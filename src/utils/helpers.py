@@ -1,9 +1,15 @@
 """Common helper functions for Calculator Agent"""
 
 import json
+import math
 import re
 import ast
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.utils.json_extract import extract_json
+
+# Kesik (onarilmis) model yanitlari bu guven skorunu asamaz
+REPAIRED_CONFIDENCE_CAP = 0.5
 
 
 def parse_matrix_string(matrix_str: str) -> List[List[float]]:
@@ -83,3 +89,100 @@ def format_result_for_display(result: Any) -> str:
     else:
         return str(result)
 
+
+
+def percentile(values: Iterable[float], q: float) -> float:
+    """Degerlerin q. yuzdeligini (nearest-rank) dondurur
+
+    Args:
+        values: Sayisal degerler
+        q: Yuzdelik (0-100)
+
+    Returns:
+        Yuzdelik degeri, bos girdide 0.0
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, math.ceil(q / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def extract_completed_steps(partial_json: str) -> List[str]:
+    """Yarim (streaming) JSON metninden tamamlanmis "steps" elemanlarini cikarir
+
+    Args:
+        partial_json: Henuz tamamlanmamis olabilecek JSON metni
+
+    Returns:
+        Su ana kadar tamamen gelmis adimlar
+    """
+    match = re.search(r'"steps"\s*:\s*\[', partial_json)
+    if not match:
+        return []
+
+    decoder = json.JSONDecoder()
+    steps: List[str] = []
+    pos = match.end()
+    while pos < len(partial_json):
+        char = partial_json[pos]
+        if char in " \t\r\n,":
+            pos += 1
+            continue
+        if char == "]":
+            break
+        try:
+            value, end = decoder.raw_decode(partial_json, pos)
+        except ValueError:
+            break
+        # String disi degerler (sayi vb.) ayirici gelmeden tamamlanmis sayilmaz
+        if not isinstance(value, str) and not partial_json[end:].strip():
+            break
+        steps.append(value if isinstance(value, str) else json.dumps(value, ensure_ascii=False))
+        pos = end
+    return steps
+
+
+def _capped_confidence(score: Any) -> float:
+    """Onarilan yanitin guven skorunu REPAIRED_CONFIDENCE_CAP ile sinirlar"""
+    try:
+        score = float(score)
+    except (TypeError, ValueError):
+        return REPAIRED_CONFIDENCE_CAP
+    if not math.isfinite(score):
+        return REPAIRED_CONFIDENCE_CAP
+    return max(0.0, min(score, REPAIRED_CONFIDENCE_CAP))
+
+
+def parse_json_response(response_text: str) -> Tuple[Dict[str, Any], bool]:
+    """Model metninden JSON objesini cikarir
+
+    Kesilmis (ornek: MAX_OUTPUT_TOKENS'a takilmis) JSON kapatilarak onarilir,
+    metadata'ya "json_repaired" eklenir ve guven skoru en fazla
+    REPAIRED_CONFIDENCE_CAP olur.
+
+    Args:
+        response_text: Model yaniti
+
+    Returns:
+        (yanit dict'i, JSON basariyla parse edildi mi) tuple'i. Parse
+        edilemezse ham metin "result" ve "steps" icinde, sifir guven skoru
+        ve "json_parse_error" metadata'si ile dondurulur.
+    """
+    value, repaired = extract_json(response_text, dict)
+    if value is not None:
+        if repaired:
+            metadata = value.get("metadata")
+            if not isinstance(metadata, dict):
+                metadata = value["metadata"] = {}
+            metadata["json_repaired"] = True
+            value["confidence_score"] = _capped_confidence(value.get("confidence_score"))
+        return value, True
+
+    # Fallback: structured response
+    return {
+        "result": response_text,
+        "steps": [response_text],
+        "confidence_score": 0.0,
+        "metadata": {"json_parse_error": True},
+    }, False
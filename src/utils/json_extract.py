@@ -0,0 +1,136 @@
+"""Single-pass JSON extraction from model output with truncation repair"""
+
+import json
+from typing import Any, List, Optional, Tuple
+
+_OPENERS = {"{": "}", "[": "]"}
+_CLOSERS = {"}": "{", "]": "["}
+_LITERALS = ("true", "false", "null")
+
+# Kesik JSON onariminda denenecek maksimum kesme noktasi
+_MAX_REPAIR_ATTEMPTS = 16
+
+
+def _close(stack: str) -> str:
+    """Acik parantez yiginini kapatan karakterleri dondurur"""
+    return "".join(_OPENERS[opener] for opener in reversed(stack))
+
+
+def _at_boundary(fragment: str, stack: str, in_string: bool) -> bool:
+    """Parca tamamlanmis bir degerin sonunda mi bitiyor
+
+    Sayi veya literal ayirici gelmeden bittiyse eksik olabilir ("12345" ->
+    "123"). Dizi icindeki yarim string (adim metni) korunur; obje anahtari
+    veya degeri olan yarim string tamamlanmis sayilmaz.
+    """
+    if in_string:
+        return stack.endswith("[")
+    trimmed = fragment.rstrip()
+    if trimmed != fragment or trimmed.endswith(","):
+        return True
+    return trimmed.endswith(("}", "]", '"')) or trimmed.endswith(_LITERALS)
+
+
+def _repair(fragment: str, stack: str, in_string: bool, checkpoints: List[Tuple[int, str]]) -> Optional[Any]:
+    """Kesik JSON parcasini kapatip parse etmeyi dener
+
+    Parca bir deger sinirinda bitiyorsa once tamami (acik string kapatilarak)
+    denenir; olmazsa en son tamamlanan elemanin sonuna kadar geri gidilip
+    tekrar denenir.
+
+    Args:
+        fragment: '{' veya '[' ile baslayan, kapanmamis metin
+        stack: Parca sonundaki acik parantez yigini
+        in_string: Parca bir string'in icinde mi bitiyor
+        checkpoints: (kesme pozisyonu, o noktadaki yigin) listesi
+
+    Returns:
+        Onarilmis deger veya None
+    """
+    candidates = []
+    if _at_boundary(fragment, stack, in_string):
+        head = fragment
+        if in_string:
+            if head.endswith("\\"):
+                head = head[:-1]
+            head += '"'
+        candidates.append((head.rstrip().rstrip(","), stack))
+    candidates += [(fragment[:pos].rstrip().rstrip(","), cut_stack)
+                   for pos, cut_stack in reversed(checkpoints[-_MAX_REPAIR_ATTEMPTS:])]
+
+    for text, cut_stack in candidates:
+        try:
+            return json.loads(text + _close(cut_stack))
+        except json.JSONDecodeError:
+            continue
+    return None
+
+
+def extract_json(text: str, expected_type: type = dict) -> Tuple[Optional[Any], bool]:
+    """Metindeki ilk gecerli JSON objesini/dizisini tek geciste bulur
+
+    Parantezler string ve escape durumu takip edilerek dengelenir; ilk
+    dengelenen ve parse edilebilen `expected_type` degeri dondurulur. Metin
+    acik bir yapi icinde biterse (ornek: MAX_OUTPUT_TOKENS'ta kesilmis cikti)
+    yapi kapatilarak onarilir.
+
+    Args:
+        text: Model ciktisi
+        expected_type: Beklenen tip (dict veya list)
+
+    Returns:
+        (deger veya None, onarim yapildi mi) tuple'i
+    """
+    opener = "{" if expected_type is dict else "["
+    start = text.find(opener)
+
+    while start != -1:
+        stack = ""
+        in_string = False
+        escaped = False
+        checkpoints: List[Tuple[int, str]] = []
+        end = None
+
+        for i in range(start, len(text)):
+            char = text[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+                continue
+
+            if char == '"':
+                in_string = True
+            elif char in _OPENERS:
+                stack += char
+                checkpoints.append((i + 1, stack))
+            elif char in _CLOSERS:
+                if not stack or stack[-1] != _CLOSERS[char]:
+                    break
+                stack = stack[:-1]
+                if not stack:
+                    end = i + 1
+                    break
+            elif char == ",":
+                checkpoints.append((i, stack))
+
+        if end is not None:
+            try:
+                value = json.loads(text[start:end])
+                if isinstance(value, expected_type):
+                    return value, False
+            except json.JSONDecodeError:
+                pass
+        elif stack:
+            # Metin sonuna kadar kapanmadi: kesik cikti
+            value = _repair(text[start:], stack, in_string, checkpoints)
+            if isinstance(value, expected_type):
+                return value, True
+            return None, False
+
+        start = text.find(opener, start + 1)
+
+    return None, False
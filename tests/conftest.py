@@ -1,8 +1,10 @@
 """Pytest configuration and fixtures"""
 
+import os
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from src.core.agent import GeminiAgent
+from src.core.cassette import CassetteBackend
 
 
 @pytest.fixture
@@ -31,3 +33,11 @@ def sample_calculus_expression():
     """Ornek kalkulus ifadesi"""
     return "derivative x^2 at x=2"
 
+
+@pytest.fixture
+def cassette_backend():
+    """TEST_CASSETTE_PATH'teki kayittan gecikmesiz oynatan backend"""
+    path = os.getenv("TEST_CASSETTE_PATH")
+    if not path or not os.path.exists(path):
+        pytest.skip("TEST_CASSETTE_PATH ile cassette tanimlanmadi")
+    return CassetteBackend(path, mode="replay", latency_mode="zero")
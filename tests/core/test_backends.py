@@ -0,0 +1,52 @@
+"""Tests for pluggable LLM backends"""
+
+import pytest
+from src.core.agent import GeminiAgent
+from src.core.backends import LocalBackend, SimulatedBackendError
+from src.utils.exceptions import GeminiAPIError
+
+
+@pytest.mark.asyncio
+async def test_local_backend_is_deterministic():
+    """Ayni tohum ve prompt ayni yaniti ve hata kararini uretmeli"""
+    results = []
+    for _ in range(2):
+        backend = LocalBackend(latency=0, error_rate=0.5, seed=7)
+        outcome = []
+        for _ in range(5):
+            try:
+                outcome.append(await backend.generate_text("Ifade: 2 + 2", {}))
+            except SimulatedBackendError:
+                outcome.append("error")
+        results.append(outcome)
+
+    assert results[0] == results[1]
+    assert "error" in results[0]
+
+
+@pytest.mark.asyncio
+async def test_agent_retries_through_local_backend_errors(monkeypatch):
+    """Backend hatalari retry ile denenmeli, sonunda GeminiAPIError olmali"""
+    monkeypatch.setattr("src.core.agent.asyncio.sleep", _no_sleep)
+    agent = GeminiAgent(backend=LocalBackend(latency=0, error_rate=1.0))
+
+    with pytest.raises(GeminiAPIError):
+        await agent.generate_with_retry("Ifade: 1 + 1", max_retries=3)
+
+    assert agent.backend.stats() == {"calls": 3, "errors": 3}
+
+
+@pytest.mark.asyncio
+async def test_calculator_runs_offline_with_local_backend():
+    """CalculatorAgent network'suz yerel backend ile calismali"""
+    from src.main import CalculatorAgent
+
+    calculator = CalculatorAgent(backend=LocalBackend(latency=0))
+    output = await calculator.process_command("!solve x^2 - 4 = 0")
+
+    assert output.startswith("[SONUC]:")
+    assert calculator.gemini_agent.get_stats()["backend"] == "local"
+
+
+async def _no_sleep(_delay):
+    return None
@@ -0,0 +1,67 @@
+"""Tests for the Gemini micro-batcher"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.core.batcher import MicroBatcher
+
+TEMPLATE = "Hesapla ve JSON dondur. Ifade: {expression}"
+
+
+@pytest.mark.asyncio
+async def test_batcher_combines_requests_into_one_call():
+    """Pencere icindeki ifadeler tek cagrida gonderilmeli"""
+    agent = MagicMock()
+    agent.generate_with_retry = AsyncMock(
+        return_value=json.dumps([{"result": 2}, {"result": 4}, {"result": 6}])
+    )
+    batcher = MicroBatcher(agent, window_seconds=0.01, max_batch_size=8)
+
+    results = await asyncio.gather(
+        *[batcher.submit(TEMPLATE, expr) for expr in ["1 + 1", "2 + 2", "3 + 3"]]
+    )
+
+    assert [r["result"] for r in results] == [2, 4, 6]
+    assert agent.generate_with_retry.await_count == 1
+    prompt = agent.generate_with_retry.await_args.args[0]
+    assert "3. 3 + 3" in prompt
+    assert batcher.stats()["batched_items"] == 3
+
+
+@pytest.mark.asyncio
+async def test_batcher_falls_back_on_malformed_response():
+    """Bozuk batch yaniti tek tek cagrilara donmeli"""
+    agent = MagicMock()
+    agent.generate_with_retry = AsyncMock(return_value='[{"result": 2}]')
+    agent.generate_json_response = AsyncMock(
+        side_effect=lambda prompt, **kwargs: {"result": prompt[-5:]}
+    )
+    batcher = MicroBatcher(agent, window_seconds=0.01, max_batch_size=2)
+
+    results = await asyncio.gather(
+        batcher.submit(TEMPLATE, "1 + 1"), batcher.submit(TEMPLATE, "2 + 2")
+    )
+
+    assert [r["result"] for r in results] == ["1 + 1", "2 + 2"]
+    assert agent.generate_json_response.await_count == 2
+    assert batcher.stats()["fallbacks"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batcher_keeps_completed_items_of_truncated_response():
+    """Kesik batch yanitinda yalnizca eksik ifadeler tek tek sorulmali"""
+    agent = MagicMock()
+    agent.generate_with_retry = AsyncMock(
+        return_value='[{"result": 2}, {"result": 4}, {"result": 6, "steps": ["3 +'
+    )
+    agent.generate_json_response = AsyncMock(return_value={"result": 6})
+    batcher = MicroBatcher(agent, window_seconds=0.01, max_batch_size=3)
+
+    results = await asyncio.gather(
+        *[batcher.submit(TEMPLATE, expr) for expr in ["1 + 1", "2 + 2", "3 + 3"]]
+    )
+
+    assert [r["result"] for r in results] == [2, 4, 6]
+    assert agent.generate_json_response.await_count == 1
+    assert batcher.stats()["partial"] == 1
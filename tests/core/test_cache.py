@@ -0,0 +1,134 @@
+"""Tests for the Gemini response cache"""
+
+import pytest
+from unittest.mock import AsyncMock
+from src.core.agent import GeminiAgent
+from src.core.cache import PlotCache, ResponseCache
+
+
+def test_cache_lru_eviction():
+    """En eski kullanilan kayit silinmeli"""
+    cache = ResponseCache(max_entries=2, default_ttl=60)
+    cache.set("a", {"result": 1})
+    cache.set("b", {"result": 2})
+    cache.get("a")
+    cache.set("c", {"result": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"result": 1}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_domain_ttl(monkeypatch):
+    """Suresi dolan kayit miss sayilmali, TTL 0 olan domain cache'lenmemeli"""
+    now = [1000.0]
+    monkeypatch.setattr("src.core.cache.time.monotonic", lambda: now[0])
+
+    cache = ResponseCache(max_entries=10, default_ttl=60, domain_ttls={"financial": 0})
+    cache.set("a", {"result": 1})
+    cache.set("b", {"result": 2}, domain="financial")
+
+    assert cache.get("b") is None
+    now[0] += 61
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_cache_key_normalizes_whitespace():
+    """Bosluk farklari ayni anahtari uretmeli"""
+    config = {"temperature": 0.1}
+    key1 = ResponseCache.make_key("model", config, "Ifade:  2 + 2 \n")
+    key2 = ResponseCache.make_key("model", config, "Ifade: 2 + 2")
+    assert key1 == key2
+    assert key1 != ResponseCache.make_key("other-model", config, "Ifade: 2 + 2")
+
+
+@pytest.mark.asyncio
+async def test_agent_json_response_cached():
+    """Ayni prompt ikinci kez network'e gitmemeli, use_cache=False atlamali"""
+    agent = GeminiAgent(api_key="test-key")
+    agent.generate_with_retry = AsyncMock(return_value='{"result": 4, "steps": []}')
+
+    first = await agent.generate_json_response("2 + 2", domain="basic_math")
+    second = await agent.generate_json_response("2 + 2", domain="basic_math")
+    await agent.generate_json_response("2 + 2", use_cache=False)
+
+    assert first == second == {"result": 4, "steps": []}
+    assert agent.generate_with_retry.await_count == 2
+    assert agent.get_stats()["cache"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_repaired_json_response_not_cached():
+    """Onarilan kesik yanit cache'lenmemeli; JSON modu config'e eklenmeli"""
+    agent = GeminiAgent(api_key="test-key")
+    agent.generate_with_retry = AsyncMock(return_value='{"result": 4, "steps": ["2 +')
+    schema = {"type": "object", "properties": {"result": {"type": "number"}}}
+
+    first = await agent.generate_json_response("2 + 2", response_schema=schema)
+    await agent.generate_json_response("2 + 2", response_schema=schema)
+
+    assert first["result"] == 4
+    assert first["metadata"]["json_repaired"]
+    assert agent.generate_with_retry.await_count == 2
+    config = agent.generate_with_retry.await_args.kwargs["generation_config"]
+    assert config["response_mime_type"] == "application/json"
+    assert config["response_schema"] == schema
+
+
+def _store_plot(cache, key, size, alias=None):
+    cache.path_for(key).write_bytes(b"p" * size)
+    cache.put(key, {"result": key, "steps": [f"{key} cizildi"]}, alias=alias)
+
+
+def test_plot_cache_survives_restart(tmp_path):
+    """Indeks ve alias'lar yeni bir cache ornegine (yeniden baslatma) tasinmali"""
+    cache = PlotCache(str(tmp_path), max_bytes=10_000)
+    _store_plot(cache, "a" * 64, 100, alias="istek")
+
+    reopened = PlotCache(str(tmp_path), max_bytes=10_000)
+    key, payload = reopened.lookup("istek")
+
+    assert key == "a" * 64
+    assert payload["steps"] == [f"{'a' * 64} cizildi"]
+    assert reopened.stats()["hits"] == 1
+
+
+def test_plot_cache_evicts_lru_under_byte_budget(tmp_path, monkeypatch):
+    """Bayt butcesi asilinca en eski kullanilan grafik ve alias'i silinmeli"""
+    now = [1000.0]
+    monkeypatch.setattr("src.core.cache.time.time", lambda: now[0])
+    cache = PlotCache(str(tmp_path), max_bytes=700)
+
+    for key in ("a", "b"):
+        now[0] += 1
+        _store_plot(cache, key, 300, alias=f"istek-{key}")
+    now[0] += 1
+    assert cache.get("a") is not None
+    now[0] += 1
+    _store_plot(cache, "c", 300)
+
+    assert not cache.path_for("b").exists()
+    assert cache.lookup("istek-b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_plot_cache_adopts_orphan_files(tmp_path):
+    """Indekste olmayan eski PNG'ler butceye dahil edilip silinebilmeli"""
+    (tmp_path / "eski.png").write_bytes(b"p" * 500)
+
+    cache = PlotCache(str(tmp_path), max_bytes=100)
+
+    assert not (tmp_path / "eski.png").exists()
+    assert cache.stats()["evictions"] == 1
+
+
+def test_plot_cache_shared_between_instances(tmp_path):
+    """Bir surecin yazdigi grafik digerinde de bulunmali"""
+    first = PlotCache(str(tmp_path), max_bytes=10_000)
+    second = PlotCache(str(tmp_path), max_bytes=10_000)
+
+    _store_plot(first, "k", 10, alias="ortak")
+
+    assert second.lookup("ortak")[0] == "k"
@@ -0,0 +1,40 @@
+"""Tests for the record/replay cassette backend"""
+
+import pytest
+from src.core.backends import LocalBackend
+from src.core.cassette import CassetteBackend
+from src.main import CalculatorAgent
+from src.utils.exceptions import CassetteMissError
+
+
+@pytest.mark.asyncio
+async def test_cassette_record_then_replay(tmp_path):
+    """Kaydedilen trafik replay'de ayni ciktiyi uretmeli"""
+    path = tmp_path / "session.jsonl.gz"
+    commands = ["!solve toplami 10 farki 2 olan iki sayi", "!finance kredi mi kira mi daha mantikli"]
+
+    recorder = CalculatorAgent(
+        backend=CassetteBackend(str(path), mode="record", inner=LocalBackend(latency=0.01))
+    )
+    recorded = [await recorder.process_command(c) for c in commands]
+
+    replay_backend = CassetteBackend(str(path), mode="replay", latency_mode="zero")
+    player = CalculatorAgent(backend=replay_backend)
+    replayed = [await player.process_command(c) for c in commands]
+
+    assert replayed == recorded
+    assert replay_backend.stats()["replayed"] == len(commands)
+
+
+@pytest.mark.asyncio
+async def test_cassette_replay_miss(tmp_path):
+    """Kayitta olmayan istek CassetteMissError vermeli"""
+    path = tmp_path / "empty.jsonl"
+    recorder = CassetteBackend(str(path), mode="record", inner=LocalBackend(latency=0))
+    await recorder.generate_text("Ifade: 1 + 1", {})
+
+    player = CassetteBackend(str(path), mode="replay", latency_mode="zero")
+    expected = await recorder.inner.generate_text("Ifade: 1 + 1", {})
+    assert await player.generate_text("Ifade: 1 + 1", {}) == expected
+    with pytest.raises(CassetteMissError):
+        await player.generate_text("Ifade: 2 + 2", {})
@@ -0,0 +1,77 @@
+"""Tests for deadlines, hedged requests and cancellation"""
+
+import asyncio
+import pytest
+from src.config.settings import settings
+from src.core.agent import GeminiAgent
+from src.core.backends import LLMBackend
+from src.utils.exceptions import GeminiAPIError
+
+
+class ScriptedBackend(LLMBackend):
+    """Her cagri icin sirayla verilen gecikmeyi uygulayan test backend'i"""
+
+    name = "scripted"
+    model_name = "scripted"
+
+    def __init__(self, delays):
+        self.delays = list(delays)
+        self.started = 0
+        self.cancelled = 0
+
+    async def generate_text(self, prompt, generation_config):
+        call_index = self.started
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delays[call_index])
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return f'{{"result": {call_index}}}'
+
+    async def stream_text(self, prompt, generation_config):
+        yield await self.generate_text(prompt, generation_config)
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_hung_call():
+    """Takilan cagri deadline'da iptal edilip hata donmeli"""
+    backend = ScriptedBackend([10])
+    agent = GeminiAgent(backend=backend)
+
+    with pytest.raises(GeminiAPIError, match="zaman asimi"):
+        await agent.generate_with_retry("Ifade: 1", timeout=0.05)
+
+    assert backend.cancelled == 1
+    assert agent.get_stats()["timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_wins_over_slow_primary(monkeypatch):
+    """Ilk deneme p95'i asarsa hedge istegi sonucu vermeli"""
+    monkeypatch.setattr(type(settings), "HEDGE_ENABLED", True)
+    monkeypatch.setattr(type(settings), "HEDGE_MIN_DELAY_MS", 20)
+    backend = ScriptedBackend([10, 0.01])
+    agent = GeminiAgent(backend=backend)
+    agent._latencies.extend([0.01] * settings.HEDGE_MIN_SAMPLES)
+
+    text = await agent.generate_with_retry("Ifade: 1", timeout=1)
+
+    assert text == '{"result": 1}'
+    assert agent.get_stats()["hedge_wins"] == 1
+    assert backend.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_caller_cancellation_cancels_attempts():
+    """Caller iptal edilirse devam eden deneme de iptal edilmeli"""
+    backend = ScriptedBackend([10])
+    agent = GeminiAgent(backend=backend)
+
+    task = asyncio.create_task(agent.generate_with_retry("Ifade: 1"))
+    await asyncio.sleep(0.01)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert backend.cancelled == 1
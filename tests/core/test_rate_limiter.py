@@ -0,0 +1,59 @@
+"""Tests for the token bucket rate limiter"""
+
+import asyncio
+import time
+import pytest
+from src.core.agent import RateLimiter, _get_retry_after
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_allows_burst_then_throttles():
+    """Burst kadar cagri beklemeden gecmeli, sonrakiler token beklemeli"""
+    limiter = RateLimiter(calls_per_minute=600, burst=3)
+
+    waits = [await limiter.acquire() for _ in range(4)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert 0.05 < waits[3] <= 0.1
+    assert limiter.stats()["throttled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_caps_concurrency():
+    """Eszamanli slot sayisi max_in_flight'i gecmemeli"""
+    limiter = RateLimiter(calls_per_minute=6000, burst=10, max_in_flight=2)
+    peak = 0
+
+    async def worker():
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*[worker() for _ in range(6)])
+
+    assert peak == 2
+    assert limiter.stats()["queue_wait_ms"]["max"] > 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_penalize_delays_next_call():
+    """Kota asiminda sonraki cagri Retry-After kadar beklemeli"""
+    limiter = RateLimiter(calls_per_minute=6000, burst=5)
+    limiter.penalize(0.05)
+
+    start = time.monotonic()
+    await limiter.acquire()
+
+    assert time.monotonic() - start >= 0.045
+
+
+def test_retry_after_parsing():
+    """Kota hatalarindan bekleme suresi cikarilmali"""
+
+    class ResourceExhausted(Exception):
+        code = 429
+
+    assert _get_retry_after(ResourceExhausted("Please retry in 12.5s.")) == 12.5
+    assert _get_retry_after(Exception("quota exceeded, retry_delay { seconds: 7 }")) == 7.0
+    assert _get_retry_after(ValueError("bos yanit")) is None
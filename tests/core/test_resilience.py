@@ -0,0 +1,187 @@
+"""Tests for adaptive concurrency and the circuit breaker"""
+
+import asyncio
+import pytest
+from src.config.settings import settings
+from src.core.agent import GeminiAgent
+from src.core.backends import LLMBackend
+from src.core.resilience import AdaptiveConcurrencyLimiter, CircuitBreaker
+from src.utils.exceptions import CircuitOpenError, GeminiAPIError
+
+
+class FailingBackend(LLMBackend):
+    """Her cagrida hata veren test backend'i"""
+
+    name = "failing"
+    model_name = "failing"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_text(self, prompt, generation_config):
+        self.calls += 1
+        raise RuntimeError("503 Service Unavailable")
+
+    async def stream_text(self, prompt, generation_config):
+        yield await self.generate_text(prompt, generation_config)
+
+
+class SlowBackend(LLMBackend):
+    """Deadline'dan uzun suren test backend'i"""
+
+    name = "slow"
+    model_name = "slow"
+
+    async def generate_text(self, prompt, generation_config):
+        await asyncio.sleep(10)
+        return "{}"
+
+    async def stream_text(self, prompt, generation_config):
+        yield await self.generate_text(prompt, generation_config)
+
+
+class QuickBackend(LLMBackend):
+    """Hemen yanit veren test backend'i"""
+
+    name = "quick"
+    model_name = "quick"
+
+    async def generate_text(self, prompt, generation_config):
+        return "{}"
+
+    async def stream_text(self, prompt, generation_config):
+        yield await self.generate_text(prompt, generation_config)
+
+
+@pytest.mark.asyncio
+async def test_limiter_decreases_on_error_and_grows_back():
+    """Hata limiti carpimsal dusurmeli, basarilar toplamsal artirmali"""
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+
+    with pytest.raises(RuntimeError):
+        async with limiter.slot():
+            raise RuntimeError("hata")
+    assert limiter.stats()["limit"] == 4
+
+    for _ in range(20):
+        async with limiter.slot():
+            pass
+    assert limiter.stats()["limit"] > 4
+    assert limiter.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_queues_beyond_limit():
+    """Limit doluyken yeni cagri slot bosalana kadar beklemeli"""
+    limiter = AdaptiveConcurrencyLimiter(max_limit=1)
+    release = asyncio.Event()
+
+    async def holder():
+        async with limiter.slot():
+            await release.wait()
+
+    task = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    with pytest.raises(asyncio.TimeoutError):
+        async with limiter.slot(timeout=0.02):
+            pass
+
+    release.set()
+    await task
+    assert limiter.stats()["in_flight"] == 0
+
+
+def test_breaker_opens_and_recovers_through_half_open():
+    """Esik asilinca acilmali, sure dolunca tek deneme ile kapanmali"""
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.recovery_timeout = 0.0
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_agent_fails_fast_while_circuit_open(monkeypatch):
+    """Devre acikken backend'e gitmeden ve beklemeden hata donmeli"""
+    monkeypatch.setattr(type(settings), "CIRCUIT_FAILURE_THRESHOLD", 2)
+    monkeypatch.setattr(GeminiAgent, "_backoff_delay", staticmethod(lambda attempt: 0))
+    backend = FailingBackend()
+    agent = GeminiAgent(backend=backend)
+
+    with pytest.raises(GeminiAPIError):
+        await agent.generate_with_retry("Ifade: 1", max_retries=2)
+    calls = backend.calls
+
+    with pytest.raises(CircuitOpenError):
+        await agent.generate_with_retry("Ifade: 1", max_retries=3)
+
+    assert backend.calls == calls
+    stats = agent.get_stats()
+    assert stats["circuit_breaker"]["state"] == "open"
+    assert stats["circuit_breaker"]["rejected"] == 1
+    assert stats["concurrency"]["errors"] == 2
+
+
+@pytest.mark.asyncio
+async def test_half_open_rejection_spends_no_token_or_limit():
+    """Sigortanin reddettigi cagri token harcamamali ve limiti kucultmemeli"""
+    agent = GeminiAgent(backend=FailingBackend())
+    breaker = agent.circuit_breaker
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    breaker.recovery_timeout = 0.0
+    breaker.before_call()  # Tek deneme hakki baskasinda
+
+    with pytest.raises(CircuitOpenError):
+        await agent.generate_with_retry("Ifade: 1", max_retries=1)
+
+    assert agent.backend.calls == 0
+    assert agent.rate_limiter.acquired == 0
+    assert agent.get_stats()["concurrency"]["errors"] == 0
+
+
+@pytest.mark.asyncio
+async def test_only_backend_timeouts_count_against_breaker():
+    """Limiter kuyrugunda dolan deadline sigortaya sayilmamali, backend'de dolan sayilmali"""
+    queued = GeminiAgent(backend=SlowBackend())
+    queued.rate_limiter.penalize(10)
+    with pytest.raises(GeminiAPIError):
+        await queued.generate_with_retry("Ifade: 1", timeout=0.05)
+    assert queued.circuit_breaker.consecutive_failures == 0
+
+    slow = GeminiAgent(backend=SlowBackend())
+    with pytest.raises(GeminiAPIError):
+        await slow.generate_with_retry("Ifade: 1", timeout=0.05)
+    assert slow.circuit_breaker.consecutive_failures == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_waits_do_not_lower_concurrency_limit():
+    """Token beklemesi gecikme sicramasi, token zaman asimi hata sayilmamali"""
+    agent = GeminiAgent(backend=QuickBackend())
+    # Sabit taban gecikme: 0.2s token beklemesi sayilsaydi sicrama olurdu
+    agent.concurrency.baseline_latency = 0.05
+    limit = agent.concurrency.limit
+
+    agent.rate_limiter.penalize(0.2)
+    await agent._timed_call("Ifade: 1", {})
+    agent.rate_limiter.penalize(10)
+    with pytest.raises(asyncio.TimeoutError):
+        async with agent._call_slot(timeout=0.05):
+            pass
+
+    stats = agent.get_stats()["concurrency"]
+    assert agent.concurrency.limit >= limit
+    assert stats["latency_spikes"] == 0
+    assert stats["errors"] == 0
+    assert stats["in_flight"] == 0
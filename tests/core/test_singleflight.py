@@ -0,0 +1,50 @@
+"""Tests for single-flight request coalescing"""
+
+import asyncio
+import pytest
+from src.core.agent import GeminiAgent
+from src.core.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_agent_coalesces_identical_requests():
+    """Eszamanli ozdes istekler tek API cagrisi yapmali"""
+    agent = GeminiAgent(api_key="test-key")
+    calls = []
+
+    async def fake_generate(prompt, max_retries=None, **kwargs):
+        calls.append(prompt)
+        await asyncio.sleep(0.01)
+        return '{"result": 100, "steps": ["25 * 4 = 100"]}'
+
+    agent.generate_with_retry = fake_generate
+
+    results = await asyncio.gather(
+        *[agent.generate_json_response("25 * 4", use_cache=False) for _ in range(5)]
+    )
+
+    assert len(calls) == 1
+    assert all(r["result"] == 100 for r in results)
+    assert results[0] is not results[1]
+    assert agent.get_stats()["single_flight"]["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    """Bir bekleyenin iptali diger bekleyenleri etkilememeli"""
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def work():
+        started.set()
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    first = asyncio.create_task(flight.do("key", work))
+    second = asyncio.create_task(flight.do("key", work))
+    await started.wait()
+    first.cancel()
+
+    assert await second == "ok"
+    assert first.cancelled()
+    assert flight.stats() == {"executions": 1, "coalesced": 1, "in_flight": 0}
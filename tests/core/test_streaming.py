@@ -0,0 +1,72 @@
+"""Tests for streaming result delivery"""
+
+import pytest
+from src.core.agent import GeminiAgent
+from src.utils.helpers import extract_completed_steps
+
+CHUNKS = ['{"result": 100, "ste', 'ps": ["25 * 4 = 100", "10', '0 + 10 = 110"', '], "confidence_score": 1.0}']
+
+
+class _FakeChunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class _FakeStream:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self.chunks:
+            yield _FakeChunk(chunk)
+
+
+class _FakeModel:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def generate_content_async(self, prompt, generation_config=None, stream=False):
+        return _FakeStream(self.chunks)
+
+
+def test_extract_completed_steps_partial_json():
+    """Sadece tamamlanmis adimlar dondurulmeli"""
+    assert extract_completed_steps('{"steps": ["a", "b') == ["a"]
+    assert extract_completed_steps('{"result": 1') == []
+    assert extract_completed_steps('{"steps": ["a", "b"], "x": 1}') == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_stream_json_response_emits_steps_incrementally():
+    """Adimlar parca parca gelirken bildirilmeli, sonuc parse edilmeli"""
+    agent = GeminiAgent(api_key="test-key")
+    agent.backend.model = _FakeModel(CHUNKS)
+    seen = []
+
+    response = await agent.stream_json_response("25 * 4 + 10", seen.append)
+
+    assert seen == ["25 * 4 = 100", "100 + 10 = 110"]
+    assert response["result"] == 100
+
+
+@pytest.mark.asyncio
+async def test_calculator_stream_command(monkeypatch):
+    """stream_command once adim, sonra final olayi yayinlamali"""
+    from src.config.settings import settings
+    from src.main import CalculatorAgent
+
+    monkeypatch.setattr(type(settings), "GEMINI_API_KEY", "test-key")
+    # Gemini streaming yolunu test et (yerel kalkulus motoru devre disi)
+    monkeypatch.setattr(type(settings), "LOCAL_ENGINES_ENABLED", False)
+    calculator = CalculatorAgent()
+    calculator.gemini_agent.backend.model = _FakeModel(CHUNKS)
+
+    events = [event async for event in calculator.stream_command("!calculus x^2 turevi")]
+
+    assert [e.kind for e in events] == ["step", "step", "final"]
+    assert events[1].index == 2
+    assert events[-1].result.domain == "calculus"
+    assert "[SONUC]: 100" in events[-1].text
@@ -0,0 +1 @@
+"""Engines tests package"""
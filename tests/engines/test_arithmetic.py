@@ -0,0 +1,56 @@
+"""Tests for the local arithmetic engine"""
+
+import time
+import pytest
+from src.engines.arithmetic import ArithmeticEngine
+from src.utils.exceptions import (
+    CalculationError,
+    EvaluationLimitError,
+    UnsupportedExpressionError,
+)
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("25 * 4 + 10", 110),
+    ("2^10", 1024),
+    ("-2^2", -4),
+    ("2(3 + 4)", 14),
+    ("(1 + 2)(3 + 4)", 21),
+    ("3sin(pi/2)", 3.0),
+    ("5!", 120),
+    ("√16 + 1", 5.0),
+    ("log(8, 2)", 3.0),
+    ("0.1 + 0.2", 0.3),
+    ("10 ÷ 4", 2.5),
+])
+def test_evaluates_supported_expressions(expression, expected):
+    """Desteklenen ifadeler yerel olarak dogru hesaplanmali"""
+    engine = ArithmeticEngine()
+
+    value, steps = engine.evaluate(expression)
+
+    assert engine.to_result(value) == pytest.approx(expected)
+    assert steps[-1].startswith("Sonuc:")
+
+
+@pytest.mark.parametrize("expression", ["25 carpi 4 nedir", "x + 1", "2 3", "__import__('os')"])
+def test_natural_language_is_unsupported(expression):
+    """Taninmayan kelime/sozdizimi LLM'e birakilmali"""
+    with pytest.raises(UnsupportedExpressionError):
+        ArithmeticEngine().evaluate(expression)
+
+
+def test_huge_power_is_rejected_quickly():
+    """9^9^9 hesaplanmaya calisilmadan reddedilmeli"""
+    start = time.perf_counter()
+
+    with pytest.raises(EvaluationLimitError):
+        ArithmeticEngine().evaluate("9^9^9")
+
+    assert time.perf_counter() - start < 0.1
+
+
+def test_division_by_zero_is_calculation_error():
+    """Sifira bolme yerel hesaplama hatasi olmali"""
+    with pytest.raises(CalculationError, match="Sifira"):
+        ArithmeticEngine().evaluate("1 / (2 - 2)")
@@ -0,0 +1,68 @@
+"""Tests for the SymPy calculus engine"""
+
+import pytest
+from src.engines.calculus import CalculusEngine
+from src.utils.exceptions import CalculationError, UnsupportedExpressionError
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("x^2 turevi", "2*x"),
+    ("second derivative of x^4", "12*x^2"),
+    ("limit sin(x)/x as x->0", 1.0),
+    ("x sonsuza giderken (1+1/x)^x limiti", pytest.approx(2.718281828)),
+    ("sin(x) taylor serisi order 3", "-x^3/6 + x"),
+    ("integral of exp(-x^2) from -oo to oo", pytest.approx(1.7724538509)),
+])
+def test_solves_operations(text, expected):
+    """Turev, limit, seri ve integral yerel olarak hesaplanmali"""
+    response = CalculusEngine().solve(text)
+
+    assert response["result"] == expected
+    assert response["metadata"]["engine"] == "local"
+    assert len(response["steps"]) >= 2
+
+
+def test_parse_query_extracts_parameters():
+    """Nokta, sinir ve derece parametreleri cikarilmali"""
+    engine = CalculusEngine()
+
+    query = engine.parse_query("taylor series of e^x around x=1 order 4")
+
+    assert query.operation == "series"
+    assert query.expression == "e^x"
+    assert (query.variable, query.point, query.order) == ("x", "1", 4)
+
+
+@pytest.mark.parametrize("text", [
+    "derivative of __import__('os')",
+    "derivative of foo(x)",
+    "integral of x^x",
+])
+def test_unsupported_input_is_left_to_llm(text):
+    """Beyaz liste disi isim veya kapali formu olmayan islem reddedilmeli"""
+    with pytest.raises(UnsupportedExpressionError):
+        CalculusEngine().solve(text)
+
+
+@pytest.mark.parametrize("text", [
+    "limit abs(x)/x as x->0",
+    "limit of e^(1/x) as x->0",
+    "limit 1/x as x->0",
+    "derivative of 1/0",
+    "derivative 1/x at x=0",
+    "derivative sqrt(x) at x=0",
+    "derivative abs(x) at x=0",
+])
+def test_undefined_results_raise(text):
+    """Var olmayan limit veya tanimsiz ifade sayi/'z∞' olarak donmemeli"""
+    with pytest.raises(CalculationError):
+        CalculusEngine().solve(text)
+
+
+def test_cache_is_bounded():
+    """Sonuc cache'i sinirli kalmali"""
+    engine = CalculusEngine(cache_size=2)
+    for power in range(2, 6):
+        engine.solve(f"derivative x^{power}")
+
+    assert engine.stats()["result_cache"]["size"] == 2
@@ -0,0 +1,58 @@
+"""Tests for the local equation solver"""
+
+import pytest
+from src.engines.equation import EquationEngine
+from src.utils.exceptions import UnsupportedExpressionError
+
+
+@pytest.mark.parametrize("text, expected, method", [
+    ("x^2 - 4 = 0", [-2.0, 2.0], "symbolic"),
+    ("denklemi coz: 2x^2 - 5x + 3 = 0", [1.0, 1.5], "symbolic"),
+    ("(x^2 - 1)/(x - 1) = 0", [-1.0], "symbolic"),
+    ("x^3 - x = 0 in [0, 2]", [0.0, 1.0], "symbolic"),
+    ("cos(x) = x", [pytest.approx(0.7390851332)], "bracketed_multistart"),
+    ("e^x = 3x between 0 and 2", [pytest.approx(0.6190612867), pytest.approx(1.5121345517)], "bracketed_multistart"),
+])
+def test_solves_equations(text, expected, method):
+    """Polinom, rasyonel ve transandantal denklemler yerel cozulmeli"""
+    response = EquationEngine().solve(text)
+
+    assert response["result"] == expected
+    assert response["metadata"]["method"] == method
+    assert response["metadata"]["verified"] is True
+
+
+def test_high_degree_polynomial_uses_companion_matrix():
+    """Kapali formu olmayan polinom companion matris ile cozulmeli"""
+    response = EquationEngine().solve("x^5 - x - 1 = 0")
+
+    assert response["metadata"]["method"] == "companion_matrix"
+    assert response["result"]["real"] == [pytest.approx(1.1673039783)]
+    assert len(response["result"]["complex"]) == 4
+
+
+def test_poles_are_not_reported_as_roots():
+    """tan(x)'in kutuplarindaki isaret degisimi kok sayilmamali"""
+    response = EquationEngine().solve("tan(x) = 0 in [-4, 4]")
+
+    assert response["result"] == [pytest.approx(-3.14159265359), 0.0, pytest.approx(3.14159265359)]
+
+
+def test_underflow_is_not_reported_as_root():
+    """exp(x) float'ta sifira alt tasan noktalar kok sayilmamali"""
+    assert EquationEngine().solve("exp(x) = 0 in [-2000, 0]")["result"] == []
+    assert EquationEngine().solve("(x - 1)^2 * exp(x) = 0 in [-2000, 5]")["result"] == [pytest.approx(1.0)]
+
+
+@pytest.mark.parametrize("text", [
+    "x + y = 2",
+    "x^2 = x^2",
+    "exp(x) = -1",
+    "exp(x) = 0",
+    "abs(x) = 3",
+    "abs(x - 1) = 2",
+])
+def test_unsupported_input_is_left_to_llm(text):
+    """Sistemler, ozdeslikler, NumPy'ye cevrilemeyen (abs) ve kok bulunamayan denklemler LLM'e birakilmali"""
+    with pytest.raises(UnsupportedExpressionError):
+        EquationEngine().solve(text)
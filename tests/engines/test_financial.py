@@ -0,0 +1,67 @@
+"""Tests for the local financial engine"""
+
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from src.engines.financial import FinancialEngine, irr_many, npv_many
+from src.utils.exceptions import CalculationError, UnsupportedExpressionError
+
+
+@pytest.mark.parametrize("text, expected, operation", [
+    ("npv %10 [-1000, 300, 400, 500]", Decimal("-21.04"), "npv"),
+    ("IRR [-1000, 300, 400, 500]", Decimal("8.8963"), "irr"),
+    ("100.000 TL kredi aylik %1,5 faiz 12 ay taksit", Decimal("9168.00"), "pmt"),
+    ("loan 200000 at 5% for 30 years monthly payment", Decimal("1073.64"), "pmt"),
+    ("1000 TL anapara %10 faiz 1 yil", Decimal("1100.00"), "fv"),
+    ("1000 %10 faiz 1 yil", Decimal("1100.00"), "fv"),
+    ("50000 %3 kredi 12 ay", Decimal("4234.68"), "pmt"),
+    ("fv 1000 %5 10 yil aylik katki 100", Decimal("17175.24"), "fv"),
+])
+def test_decimal_results(text, expected, operation):
+    """Tekil sorgular Decimal ile kurusuna kadar dogru hesaplanmali"""
+    response = FinancialEngine().solve(text)
+
+    assert response["result"] == expected
+    assert isinstance(response["result"], Decimal)
+    assert response["metadata"]["operation"] == operation
+    assert response["metadata"]["mode"] == "decimal"
+
+
+def test_irr_falls_back_to_bisection_when_newton_diverges():
+    """Newton yakinsamazsa IRR bisection ile bulunmali"""
+    engine = FinancialEngine(max_irr_iterations=1)
+    rate, method, _ = engine.irr([Decimal(-1000), Decimal(300), Decimal(400), Decimal(500)])
+
+    assert method.startswith("ikiye bolme")
+    assert float(rate) == pytest.approx(0.088963, abs=1e-6)
+
+
+def test_irr_without_sign_change_raises():
+    """Isaret degismeyen nakit akisinin IRR'i tanimsiz olmali"""
+    with pytest.raises(CalculationError):
+        FinancialEngine().solve("IRR [1000, 500]")
+
+
+def test_rate_range_produces_scenarios():
+    """Oran araligi tek seferde vektorel senaryolara donusmeli"""
+    response = FinancialEngine().solve("%5 ile %15 arasi %5 adimla NPV [-1000, 300, 400, 500]")
+
+    assert response["metadata"]["mode"] == "scenarios"
+    assert response["result"] == {"%5": 80.44, "%10": -21.04, "%15": -107.91}
+
+
+def test_vectorized_helpers_match_decimal_engine():
+    """npv_many/irr_many Decimal motoruyla ayni sonucu vermeli"""
+    flows = np.array([[-1000.0, 300.0, 400.0, 500.0], [100.0, 100.0, 100.0, 100.0]])
+
+    assert npv_many(np.array([0.10]), flows[:1])[0, 0] == pytest.approx(-21.04, abs=5e-3)
+    irr = irr_many(flows)
+    assert irr[0] == pytest.approx(0.088963, abs=1e-6)
+    assert np.isnan(irr[1])
+
+
+def test_ambiguous_query_is_unsupported():
+    """Sayisal veri icermeyen sorular LLM'e birakilmali"""
+    with pytest.raises(UnsupportedExpressionError):
+        FinancialEngine().solve("faiz nedir")
@@ -0,0 +1,93 @@
+"""Tests for the NumPy linear algebra engine"""
+
+import warnings
+import numpy as np
+import pytest
+from src.engines.linalg import LinearAlgebraEngine
+from src.utils.exceptions import CalculationError, UnsupportedExpressionError
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("[[1,2],[3,4]] * [[5],[6]]", [[17.0], [39.0]]),
+    ("[[1, 2], [3, 4]] determinant", -2.0),
+    ("inverse of [[1,2],[3,4]]", [[-2.0, 1.0], [1.5, -0.5]]),
+    ("[[2,1],[1,3]] x = [3,5]", [0.8, 1.4]),
+    ("rank([[1,2],[2,4]])", 1.0),
+    ("[[2,1],[1,2]] matrisinin ozdegerleri", [3.0, 1.0]),
+    ("[[1,2],[3,4]]^T + 2*[[1,0],[0,1]]", [[3.0, 3.0], [2.0, 6.0]]),
+    ("norm([3,4])", 5.0),
+])
+def test_solves_operations(text, expected):
+    """Matris islemleri tam olarak hesaplanmali"""
+    response = LinearAlgebraEngine().solve(text)
+
+    assert response["result"] == expected
+    assert response["metadata"]["engine"] == "local"
+    assert response["metadata"]["exact"] is True
+
+
+def test_exact_rational_steps():
+    """Ondalik girdiler rasyonel olarak islenmeli, adimlar kesirli gosterilmeli"""
+    response = LinearAlgebraEngine().solve("[[0.1,0.2],[0.3,0.4]] determinanti")
+
+    assert response["result"] == pytest.approx(-0.02)
+    assert "det(A) = -1/50" in response["steps"]
+
+
+def test_large_matrix_uses_cached_float_factorization():
+    """Buyuk matrislerde LU ayrisimi bir kez hesaplanip tekrar kullanilmali"""
+    engine = LinearAlgebraEngine(exact_max_size=4)
+    matrix = (np.eye(6) * 4 + np.arange(36).reshape(6, 6) % 3).tolist()
+
+    det = engine.solve(f"det({matrix})")
+    inverse = engine.solve(f"inv({matrix})")
+
+    assert det["metadata"]["exact"] is False
+    assert det["result"] == pytest.approx(np.linalg.det(matrix))
+    assert np.allclose(np.array(inverse["result"]) @ matrix, np.eye(6))
+    assert engine.stats()["factorization_cache"] == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_complex_eigenvalues_are_not_marked_exact():
+    """Karmasik ozdegerler metin olarak donmeli"""
+    response = LinearAlgebraEngine().solve("eig([[0,-1],[1,0]])")
+
+    assert response["result"] == "[0 + 1i, 0 - 1i]"
+    assert response["metadata"]["exact"] is False
+
+
+@pytest.mark.parametrize("text", [
+    "[[1,2],[2,4]]^-1",
+    "[[1,2],[3,4]] * [[1,2,3]]",
+    "det([[1,2,3],[4,5,6]])",
+])
+def test_math_errors_raise_calculation_error(text):
+    """Tekil matris ve boyut uyusmazligi hata vermeli"""
+    with pytest.raises(CalculationError):
+        LinearAlgebraEngine().solve(text)
+
+
+@pytest.mark.parametrize("text", [
+    "gradient of x y",
+    "[['a', 'b']] determinant",
+    "lu decomposition of [[1,2],[3,4]]",
+])
+def test_unsupported_input_is_left_to_llm(text):
+    """Taninmayan girisler LLM'e birakilmali"""
+    with pytest.raises(UnsupportedExpressionError):
+        LinearAlgebraEngine().solve(text)
+
+
+@pytest.mark.parametrize("text", [
+    "[[1e308, 1e308],[1,1]] * [[10],[10]]",
+    "[[1e308]] * 10",
+    "det([[1e200,0],[0,1e200]])",
+    "[[1.5,0],[0,2]]^5000",
+    "eig([[1e308,1e308],[1e308,1e308]])",
+])
+def test_float_overflow_raises_calculation_error(text):
+    """Float araligini asan sonuc ham OverflowError/RuntimeWarning yerine hata vermeli"""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with pytest.raises(CalculationError, match="sayisal sinirlari"):
+            LinearAlgebraEngine().solve(text)
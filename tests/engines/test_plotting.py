@@ -0,0 +1,184 @@
+"""Tests for compiled plot expressions"""
+
+import json
+
+import numpy as np
+import pytest
+from src.engines.plotting import (
+    ExpressionCompiler,
+    decode_array,
+    encode_plot_data,
+    level_of_detail,
+    lttb,
+    normalize_expression,
+    normalize_polar,
+    sample_curve,
+    sample_curves,
+    sample_polar,
+    sample_surface,
+    split_components,
+)
+from src.utils.exceptions import UnsupportedExpressionError
+
+
+@pytest.fixture
+def compiler():
+    return ExpressionCompiler(cache_size=8)
+
+
+def test_compiled_function_is_vectorized(compiler):
+    """Tum dizi tek cagrida degerlendirilmeli"""
+    function = compiler.compile("x^2 + 2x + 1")
+    x = np.array([-1.0, 0.0, 2.0])
+    
+    np.testing.assert_allclose(function(x), [0.0, 1.0, 9.0])
+    assert function.at(3) == pytest.approx(16.0)
+
+
+def test_equivalent_spellings_share_cache_entry(compiler):
+    """"x^2" ve "x**2" ayni derlenmis fonksiyonu kullanmali"""
+    first = compiler.compile("x^2")
+    second = compiler.compile("y = x**2")
+    
+    assert first is second
+    assert compiler.stats()["compiled_cache"] == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_undefined_points_become_nan(compiler):
+    """Tanimsiz noktalar hata yerine NaN olmali"""
+    values = compiler.compile("log(x)")(np.array([-1.0, 1.0]))
+    
+    assert np.isnan(values[0])
+    assert values[1] == pytest.approx(0.0)
+    assert np.isnan(compiler.compile("1/x").at(0))
+
+
+def test_constant_expression_broadcasts(compiler):
+    """Sabit ifade girdinin boyutunda dizi dondurmeli"""
+    assert compiler.compile("5")(np.zeros(4)).tolist() == [5.0] * 4
+
+
+@pytest.mark.parametrize("text", ["__import__('os')", "foo(x)", "x + y"])
+def test_rejects_unsafe_or_unknown_expressions(compiler, text):
+    """Beyaz listede olmayan ifadeler reddedilmeli"""
+    with pytest.raises(UnsupportedExpressionError):
+        compiler.compile(text)
+
+
+def test_normalize_strips_prefixes():
+    """Sol taraf ve np. onekleri atilmali"""
+    assert normalize_expression("f(x) = np.sin(x)") == "sin(x)"
+    assert normalize_expression("Y = X**2") == "x^2"
+
+
+def test_adaptive_sampling_spends_few_points_on_smooth_curves(compiler):
+    """Duz egriler butcenin cok altinda kalmali"""
+    sample = sample_curve(compiler.compile("x^2"), -10, 10, max_points=2000)
+    
+    assert sample.evaluations < 500
+    assert sample.singularities == 0
+    assert sample.y_limits is None
+
+
+def test_adaptive_sampling_breaks_at_asymptotes(compiler):
+    """tan(x) asimptotlarinda cizgi NaN ile bolunmeli"""
+    sample = sample_curve(compiler.compile("tan(x)"), -5, 5, max_points=600)
+    gaps = sample.x[np.isnan(sample.y)]
+    
+    assert sample.evaluations <= 600
+    assert sample.singularities == 4
+    np.testing.assert_allclose(sorted(gaps), [-3 * np.pi / 2, -np.pi / 2, np.pi / 2, 3 * np.pi / 2], atol=1e-2)
+    assert sample.y_limits is not None
+
+
+def test_adaptive_sampling_finds_narrow_peak(compiler):
+    """Dar tepe inceltme ile yakalanmali"""
+    sample = sample_curve(compiler.compile("exp(-100*x^2)"), -10, 10.5)
+    
+    assert np.nanmax(sample.y) == pytest.approx(1.0, abs=1e-3)
+
+
+
+def test_sample_curves_share_one_grid(compiler):
+    """Egriler ortak x izgarasini paylasmali; bir egrinin asimptotu digerini bolmemeli"""
+    smooth, singular = compiler.compile("x^2"), compiler.compile("tan(x)")
+    alone = sample_curve(smooth, -5, 5)
+    together = sample_curves([smooth, singular], -5, 5)
+    
+    assert together[0].x is together[1].x
+    assert together[1].singularities >= 3
+    assert together[0].singularities == 0 and not np.isnan(together[0].y).any()
+    assert together[0].evaluations > alone.evaluations
+
+
+@pytest.mark.parametrize("text", ["x = cos(t), y = sin(t)", "(cos(t), sin(t))", "x(t)=cos(t); y(t)=sin(t)"])
+def test_split_parametric_components(text):
+    """Parametrik bilesenler sol taraflari atilarak ayrilmali"""
+    assert split_components(text) == ["cos(t)", "sin(t)"]
+
+
+def test_normalize_polar_maps_theta():
+    """theta ve θ parser'in t sembolune cevrilmeli"""
+    assert normalize_expression(normalize_polar("r(theta) = sin(2theta) + cos(θ)")) == "sin(2t) + cos(t)"
+
+
+def test_level_of_detail_respects_pixels_and_time_budget(compiler):
+    """Cozunurluk piksel ve zaman butcesiyle sinirlanmali"""
+    function = compiler.compile("sin(x*y)", variables=("x", "y"))
+    ranges = [(-1, 1), (-1, 1)]
+    
+    assert level_of_detail(function, ranges, 300, 6, 10.0, 500) == 50
+    assert level_of_detail(function, ranges, 300, 6, 1e-9, 500) == 8
+
+
+def test_surface_is_evaluated_on_grid(compiler):
+    """Yuzey meshgrid uzerinde degerlendirilmeli, asimptot degerleri maskelenmeli"""
+    grid_x, grid_y, grid_z = sample_surface(compiler.compile("1/(x^2+y^2)", variables=("x", "y")), (-2, 2), (-2, 2), 41)
+    
+    assert grid_z.shape == (41, 41)
+    assert grid_z[0, 0] == pytest.approx(1 / 8)
+    assert np.isnan(grid_z[20, 20])
+
+
+def test_polar_negative_radius_is_flipped(compiler):
+    """Negatif yaricap ters yone cizilmeli"""
+    theta, radius = sample_polar(compiler.compile("-1", variables=("t",)), (0, np.pi), 3)
+    
+    np.testing.assert_allclose(radius, [1, 1, 1])
+    np.testing.assert_allclose(theta, [np.pi, 1.5 * np.pi, 2 * np.pi])
+
+
+def test_lttb_keeps_endpoints_and_extremes():
+    """LTTB ilk/son noktayi ve dar tepeyi korumali"""
+    x = np.linspace(0, 10, 10000)
+    y = np.zeros_like(x)
+    y[4321] = 5.0
+    
+    small_x, small_y = lttb(x, y, 100)
+    
+    assert len(small_x) == 100
+    assert small_x[0] == 0 and small_x[-1] == 10
+    assert small_y.max() == 5.0
+
+
+def test_lttb_preserves_nan_gaps():
+    """Tekillik bosluklari seyreltmeden sonra da kalmali"""
+    x = np.linspace(-1, 1, 2001)
+    y = 1 / np.where(np.abs(x) < 0.01, np.nan, x)
+    
+    small_x, small_y = lttb(x, y, 200)
+    
+    assert np.isnan(small_y).sum() == 1
+    assert len(small_x) <= 202
+
+
+def test_encode_plot_data_is_compact_and_roundtrips():
+    """Seriler seyreltilip float32 base64 olarak kodlanmali"""
+    x = np.linspace(0, 1, 5000)
+    data = encode_plot_data({"series": [{"x": x, "y": x ** 2, "label": "f"}], "title": "t"}, 500)
+    series = data["series"][0]
+    
+    assert data["projection"] == "2d"
+    assert series["points"] == 500
+    np.testing.assert_allclose(decode_array(series["y"]), decode_array(series["x"]) ** 2, rtol=1e-6)
+    assert json.dumps(data)
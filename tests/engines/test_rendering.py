@@ -0,0 +1,79 @@
+"""Tests for off-event-loop plot rendering"""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+from src.engines.rendering import PlotRenderer, render_batch, render_figure
+from src.utils.exceptions import CalculationError
+
+
+def _spec(path):
+    x = np.linspace(-1, 1, 50)
+    return {
+        "path": str(path),
+        "series": [{"x": x, "y": x ** 2, "label": "f(x)=x^2"}],
+        "points": [{"x": 0.5, "y": 0.25, "label": "x=0.5"}],
+        "title": "f(x) = x^2",
+    }
+
+
+def test_render_figure_writes_png(tmp_path):
+    """OO API ile pyplot kullanmadan PNG yazilmali"""
+    path = render_figure(_spec(tmp_path / "plot.png"))
+    
+    with open(path, "rb") as f:
+        assert f.read(8) == b"\x89PNG\r\n\x1a\n"
+    assert list(tmp_path.iterdir()) == [tmp_path / "plot.png"]
+
+
+def test_render_batch_reports_errors_per_plot(tmp_path):
+    """Toplu cizimde hatali tarif digerlerini engellememeli"""
+    broken = {"path": str(tmp_path / "missing" / "broken.png"), "series": []}
+    results = render_batch([_spec(tmp_path / "a.png"), broken, _spec(tmp_path / "b.png")])
+    
+    assert [result.get("path") for result in results] == [str(tmp_path / "a.png"), None, str(tmp_path / "b.png")]
+    assert "error" in results[1]
+    assert (tmp_path / "b.png").read_bytes()[:4] == b"\x89PNG"
+
+
+@pytest.mark.asyncio
+async def test_process_pool_keeps_event_loop_responsive(tmp_path):
+    """Cizim surerken event loop diger isleri calistirmaya devam etmeli"""
+    renderer = PlotRenderer(workers=1, timeout=60)
+    ticks = 0
+    
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+    
+    task = asyncio.ensure_future(ticker())
+    try:
+        renderer.prewarm()
+        path = await renderer.render(render_figure, _spec(tmp_path / "pool.png"))
+    finally:
+        task.cancel()
+        renderer.shutdown()
+    
+    assert (tmp_path / "pool.png").exists() and path.endswith("pool.png")
+    assert ticks > 0
+    assert renderer.stats()["renders"] == 1
+
+
+@pytest.mark.asyncio
+async def test_render_timeout_restarts_pool():
+    """Zaman asiminda CalculationError verilmeli ve havuz yenilenmeli"""
+    renderer = PlotRenderer(workers=1, timeout=0.2)
+    started = time.monotonic()
+    try:
+        with pytest.raises(CalculationError):
+            await renderer.render(time.sleep, 30)
+    finally:
+        renderer.shutdown()
+    
+    assert time.monotonic() - started < 10
+    assert renderer.stats()["timeouts"] == 1
+    assert renderer.stats()["restarts"] == 1
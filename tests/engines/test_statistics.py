@@ -0,0 +1,84 @@
+"""Tests for the local statistics query extractor"""
+
+import numpy as np
+import pytest
+from scipy import stats
+from src.engines.statistics import StatisticsEngine
+from src.utils.exceptions import CalculationError, UnsupportedExpressionError
+
+
+@pytest.mark.parametrize("text, data, operations", [
+    ("[10, 20, 30] ortalamasi", [[10.0, 20.0, 30.0]], ("mean",)),
+    ("10, 20 ve 30 sayılarının medyanı nedir?", [[10.0, 20.0, 30.0]], ("median",)),
+    ("Standart sapma: 2 4 4 4 5 5 7 9", [[2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0]], ("std",)),
+    ("(1,5; 2,5; 3) toplamı", [[1.5, 2.5, 3.0]], ("sum",)),
+    ("mode of [1, 2, 2, 3]", [[1.0, 2.0, 2.0, 3.0]], ("mode",)),
+    ("en küçük değer: 5, -3, 8", [[5.0, -3.0, 8.0]], ("min",)),
+    ("[1, 2, 3] ortalaması ve standart sapması", [[1.0, 2.0, 3.0]], ("mean", "std")),
+    ("[[1, 2], [2, 4], [3, 7]] regresyonu", [[1.0, 2.0, 3.0], [2.0, 4.0, 7.0]], ("regression",)),
+])
+def test_extracts_data_and_operations(text, data, operations):
+    """Literal listeler ve sayi dizileri EN/TR anahtar kelimelerle eslenmeli"""
+    query = StatisticsEngine().extract(text)
+
+    assert query.data == data
+    assert query.operations == operations
+
+
+@pytest.mark.parametrize("text", [
+    "standart sapma",
+    "ağırlıklı ortalama [1, 2, 3]",
+    "[a, b] ortalaması",
+    "ortalama mutlak sapma 1 2 3",
+])
+def test_ambiguous_queries_are_unsupported(text):
+    """Belirsiz girisler LLM'e birakilmali"""
+    with pytest.raises(UnsupportedExpressionError):
+        StatisticsEngine().extract(text)
+
+
+def test_extracts_file_reference_columns_and_percentiles():
+    """Dosya referansi, sutunlar ve persentiller girdiden ayrilmali"""
+    engine = StatisticsEngine()
+    query = engine.extract("olcumler/2024.csv dosyasindaki fiyat sutununun 90. persentili")
+
+    assert query.source == "olcumler/2024.csv"
+    assert query.columns == ("fiyat",)
+    assert query.operations == ("percentile",)
+    assert query.percentiles == (90.0,)
+    assert engine.extract("veri.csv boy ve kilo sütunlarının korelasyonu").columns == ("boy", "kilo")
+
+
+def test_describe_matches_numpy_and_scipy():
+    """Ozet tek geciste NumPy/SciPy ile ayni degerleri vermeli"""
+    data = [2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0, 12.5]
+    engine = StatisticsEngine()
+    result, _ = engine.compute(engine.extract(f"{data} özeti p90"))
+
+    assert result["count"] == 9
+    assert result["mean"] == pytest.approx(np.mean(data))
+    assert result["std"] == pytest.approx(np.std(data))
+    assert (result["q1"], result["median"], result["q3"]) == tuple(np.percentile(data, [25, 50, 75]))
+    assert result["p90"] == pytest.approx(np.percentile(data, 90))
+    assert result["skewness"] == pytest.approx(stats.skew(data))
+    assert result["kurtosis"] == pytest.approx(stats.kurtosis(data))
+    assert result["mode"] == 4.0
+
+
+def test_multi_column_correlation_and_regression():
+    """Korelasyon ve regresyon ayni ortak moment matrisinden hesaplanmali"""
+    engine = StatisticsEngine()
+    result, steps = engine.compute(engine.extract("x = [1, 2, 3, 4], y = [3, 5, 7, 9] korelasyon ve regresyon"))
+
+    assert result["correlation"] == [[1.0, pytest.approx(1.0)], [pytest.approx(1.0), 1.0]]
+    assert result["regression"]["dependent"] == "y"
+    assert result["regression"]["intercept"] == pytest.approx(1.0)
+    assert result["regression"]["coefficients"] == [pytest.approx(2.0)]
+    assert any(step.startswith("Regresyon: y = 1 + 2*x") for step in steps)
+
+
+def test_multivariate_operation_needs_two_columns():
+    """Tek sutunda korelasyon istenirse hata vermeli"""
+    engine = StatisticsEngine()
+    with pytest.raises(CalculationError):
+        engine.compute(engine.extract("[1, 2, 3] korelasyonu"))
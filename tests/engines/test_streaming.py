@@ -0,0 +1,100 @@
+"""Tests for single-pass streaming statistics"""
+
+import numpy as np
+import pytest
+from scipy import stats
+from src.engines.streaming import (
+    FrequencyCounter,
+    QuantileSketch,
+    RunningCovariance,
+    RunningMoments,
+    iter_columns,
+    resolve_data_path,
+    summarize,
+)
+from src.utils.exceptions import CalculationError, SecurityViolationError
+
+
+def test_running_moments_match_numpy_across_chunks():
+    """Parca birlestirmeli Welford tum veriyle ayni sonucu vermeli"""
+    data = np.random.default_rng(0).normal(1e6, 3.0, 10_000)
+    moments = RunningMoments()
+    for chunk in np.array_split(data, 7):
+        moments.update(chunk)
+
+    assert moments.mean == pytest.approx(np.mean(data), rel=1e-12)
+    assert moments.variance() == pytest.approx(np.var(data), rel=1e-9)
+    assert moments.skewness() == pytest.approx(stats.skew(data), abs=1e-9)
+    assert moments.kurtosis() == pytest.approx(stats.kurtosis(data), abs=1e-9)
+    assert (moments.minimum, moments.maximum) == (data.min(), data.max())
+
+
+def test_running_covariance_skips_incomplete_rows():
+    """Eksik degerli satirlar atlanip kovaryans NumPy ile ayni olmali"""
+    data = np.random.default_rng(2).normal(size=(500, 3))
+    with_missing = np.vstack([data, [[np.nan, 1.0, 2.0]]])
+    covariance = RunningCovariance(3)
+    for chunk in np.array_split(with_missing, 6):
+        covariance.update(chunk)
+
+    assert covariance.missing == 1
+    assert np.allclose(covariance.covariance(), np.cov(data.T, bias=True))
+    assert np.allclose(covariance.correlation(), np.corrcoef(data.T))
+
+
+def test_quantile_sketch_is_exact_then_bounded():
+    """Sinir altinda tam, ustunde goreli hata icinde kantil dondurmeli"""
+    data = np.random.default_rng(1).lognormal(size=50_000) - 0.5
+    exact = QuantileSketch(exact_limit=100_000)
+    sketch = QuantileSketch(relative_accuracy=0.01, exact_limit=1_000)
+    for chunk in np.array_split(data, 10):
+        exact.update(chunk)
+        sketch.update(chunk)
+
+    assert exact.exact and exact.quantile(0.5) == np.median(data)
+    assert not sketch.exact
+    for q in (0.1, 0.5, 0.9, 0.99):
+        assert sketch.quantile(q) == pytest.approx(np.quantile(data, q), rel=0.02)
+
+
+def test_frequency_counter_mode_and_overflow():
+    """Mod sayimla bulunmali, farkli deger siniri asilinca hata vermeli"""
+    counter = FrequencyCounter()
+    counter.update(np.array([3.0, 1.0, 3.0]))
+    counter.update(np.array([1.0, 1.0, 2.0]))
+    assert counter.mode() == (1.0, 3)
+
+    limited = FrequencyCounter(max_distinct=10)
+    limited.update(np.arange(20.0))
+    with pytest.raises(CalculationError):
+        limited.mode()
+
+
+def test_csv_column_is_read_in_chunks(tmp_path):
+    """Noktali virgullu CSV'de sutun adla secilip parca parca okunmali"""
+    rows = "".join(f"{i};{i},5;\n" for i in range(1, 101))
+    (tmp_path / "veri.csv").write_text("id;Fiyat;not\n" + rows + "101;;\n", encoding="utf-8")
+
+    path = resolve_data_path("veri.csv", str(tmp_path))
+    labels, chunks = iter_columns(path, ["fiyat"], chunk_size=16)
+    (summary,), _ = summarize(chunks, 1, ["median"])
+
+    assert labels == ["Fiyat"]
+    assert summary.moments.count == 100 and summary.missing == 1
+    assert summary.result("median") == 51.0
+
+
+def test_npy_is_memory_mapped(tmp_path):
+    """NPY dosyasinin istenen sutunu memmap uzerinden okunmali"""
+    np.save(tmp_path / "m.npy", np.column_stack([np.arange(10.0), np.arange(10.0) * 2]))
+
+    labels, chunks = iter_columns(tmp_path / "m.npy", ["2"], chunk_size=3)
+
+    assert labels == ["sutun 2"]
+    assert summarize(chunks, 1, ["sum"])[0][0].result("sum") == 90.0
+
+
+def test_paths_outside_data_dir_are_rejected(tmp_path):
+    """Veri dizini disina cikan yollar reddedilmeli"""
+    with pytest.raises(SecurityViolationError):
+        resolve_data_path("../disari.csv", str(tmp_path))
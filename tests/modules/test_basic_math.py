@@ -24,3 +24,24 @@ async def test_basic_sqrt(mock_gemini_agent):
     assert result is not None
     assert result.domain == "basic_math"
 
+
+
+@pytest.mark.asyncio
+async def test_local_engine_skips_gemini(mock_gemini_agent):
+    """Ayristirilabilen ifade Gemini'ye gitmeden yerel motorla hesaplanmali"""
+    module = BasicMathModule(mock_gemini_agent)
+    result = await module.calculate("25 * 4 + 10")
+    
+    assert result.result == 110
+    assert result.metadata["engine"] == "local"
+    mock_gemini_agent.generate_json_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_natural_language_falls_back_to_gemini(mock_gemini_agent):
+    """Dogal dil girisi LLM'e yonlendirilmeli"""
+    module = BasicMathModule(mock_gemini_agent)
+    result = await module.calculate("yirmi bes kere dort")
+    
+    assert result.result == 42.0
+    assert result.metadata["engine"] == "llm"
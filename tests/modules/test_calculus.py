@@ -1,6 +1,10 @@
 """Tests for calculus module"""
 
+import asyncio
+import threading
 import pytest
+from src.config.settings import settings
+from src.modules import base_module
 from src.modules.calculus import CalculusModule
 from src.utils.exceptions import InvalidInputError
 
@@ -34,3 +38,69 @@ async def test_calculus_integral(mock_gemini_agent):
     assert result is not None
     assert result.domain == "calculus"
 
+
+
+@pytest.mark.asyncio
+async def test_calculus_local_engine_answers_derivative(mock_gemini_agent):
+    """Turev Gemini'ye gitmeden yerel SymPy motoruyla hesaplanmali"""
+    module = CalculusModule(mock_gemini_agent)
+    result = await module.calculate("derivative x^3 at x=2")
+    
+    assert result.result == 12.0
+    assert result.metadata["engine"] == "local"
+    mock_gemini_agent.generate_json_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_calculus_turkish_keywords_and_cache(mock_gemini_agent):
+    """Turkce anahtar kelimeler taninmali, tekrar eden ifade cache'ten donmeli"""
+    module = CalculusModule(mock_gemini_agent)
+    first = await module.calculate("0'dan 1'e x^2 integrali")
+    second = await module.calculate("integral x**2 from 0 to 1")
+    
+    assert first.result == pytest.approx(1 / 3)
+    assert second.result == first.result
+    assert module.engine.stats()["result_cache"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_calculus_unrecognized_input_falls_back_to_gemini(mock_gemini_agent):
+    """Motorun tanimadigi giris LLM'e yonlendirilmeli"""
+    module = CalculusModule(mock_gemini_agent)
+    result = await module.calculate("gradient of f(x, y) = x y")
+    
+    assert result.metadata["engine"] == "llm"
+    mock_gemini_agent.generate_json_response.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_runaway_engine_holds_its_slot_until_it_finishes(mock_gemini_agent, monkeypatch):
+    """Zaman asimina ugrayan is bitene kadar slot tutmali, havuz doluysa LLM'e dusulmeli"""
+    monkeypatch.setattr(type(settings), "LOCAL_ENGINE_WORKERS", 1)
+    monkeypatch.setattr(type(settings), "LOCAL_ENGINE_TIMEOUT_SECONDS", 0.05)
+    monkeypatch.setattr(base_module, "_engine_executor", None)
+    monkeypatch.setattr(base_module, "_engine_slots", None)
+    module = CalculusModule(mock_gemini_agent)
+    release = threading.Event()
+    calls = []
+    
+    def runaway():
+        release.wait(5)
+        return {"result": 1}
+    
+    def quick():
+        calls.append("quick")
+        return {"result": 2}
+    
+    assert await module._run_local_engine(runaway) is None
+    assert await module._run_local_engine(quick) is None
+    assert calls == []
+    
+    release.set()
+    result = None
+    for _ in range(100):
+        result = await module._run_local_engine(quick)
+        if result is not None:
+            break
+        await asyncio.sleep(0.01)
+    assert result == {"result": 2}
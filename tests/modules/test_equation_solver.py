@@ -0,0 +1,26 @@
+"""Tests for equation solver module"""
+
+import pytest
+from src.modules.equation_solver import EquationSolverModule
+
+
+@pytest.mark.asyncio
+async def test_local_engine_solves_quadratic(mock_gemini_agent):
+    """Ikinci derece denklem Gemini'ye gitmeden cozulmeli"""
+    module = EquationSolverModule(mock_gemini_agent)
+    result = await module.calculate("x^2 - 4 = 0")
+    
+    assert result.result == [-2.0, 2.0]
+    assert result.domain == "equation_solver"
+    assert result.metadata["engine"] == "local"
+    mock_gemini_agent.generate_json_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_system_of_equations_falls_back_to_gemini(mock_gemini_agent):
+    """Denklem sistemleri LLM'e yonlendirilmeli"""
+    module = EquationSolverModule(mock_gemini_agent)
+    result = await module.calculate("x + y = 2, x - y = 0")
+    
+    assert result.metadata["engine"] == "llm"
+    mock_gemini_agent.generate_json_response.assert_awaited_once()
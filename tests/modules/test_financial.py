@@ -0,0 +1,28 @@
+"""Tests for financial module"""
+
+from decimal import Decimal
+
+import pytest
+from src.modules.financial import FinancialModule
+
+
+@pytest.mark.asyncio
+async def test_local_engine_computes_npv(mock_gemini_agent):
+    """NPV Gemini'ye gitmeden Decimal olarak hesaplanmali"""
+    module = FinancialModule(mock_gemini_agent)
+    result = await module.calculate("npv %10 [-1000, 300, 400, 500]")
+    
+    assert result.result == Decimal("-21.04")
+    assert result.domain == "financial"
+    assert result.metadata["engine"] == "local"
+    mock_gemini_agent.generate_json_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_conceptual_question_falls_back_to_gemini(mock_gemini_agent):
+    """Kavramsal sorular LLM'e yonlendirilmeli"""
+    module = FinancialModule(mock_gemini_agent)
+    result = await module.calculate("enflasyon nedir")
+    
+    assert result.metadata["engine"] == "llm"
+    mock_gemini_agent.generate_json_response.assert_awaited_once()
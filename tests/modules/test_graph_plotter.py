@@ -0,0 +1,151 @@
+"""Tests for graph plotter module"""
+
+import pytest
+from src.modules.graph_plotter import GraphPlotterModule
+from src.utils.exceptions import CalculationError
+
+
+@pytest.fixture
+def plotter(mock_gemini_agent, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    mock_gemini_agent.generate_json_response.return_value = {
+        "result": "Grafik",
+        "steps": ["Fonksiyon cizildi"],
+        "confidence_score": 1.0,
+        "domain": "graph_plotter",
+        "visual_data": {"function": "y = np.sin(x)/x", "x_range": [-10, 10], "highlight_point": 0},
+    }
+    module = GraphPlotterModule(mock_gemini_agent)
+    yield module
+    module.renderer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_plot_creates_png(plotter, tmp_path):
+    """Derlenmis ifade ile PNG uretilmeli (x=0'daki tanimsiz nokta atlanir)"""
+    result = await plotter.calculate("sin(x)/x ciz")
+    
+    png = result.visual_data["plot_paths"]["png"]
+    assert (tmp_path / png).exists()
+    assert plotter.compiler.stats()["compiled_cache"]["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalid_function_raises(plotter, mock_gemini_agent):
+    """Cizilemeyen ifade sessizce x^2'ye donusmemeli"""
+    mock_gemini_agent.generate_json_response.return_value["visual_data"]["function"] = "__import__('os')"
+    
+    with pytest.raises(CalculationError):
+        await plotter.calculate("kotu ifade ciz")
+
+
+@pytest.mark.asyncio
+async def test_repeated_request_served_from_disk_cache(plotter, mock_gemini_agent):
+    """Ayni istek LLM'e gitmeden orijinal adimlar ve visual_data ile donmeli"""
+    first = await plotter.calculate("sin(x)/x ciz")
+    # Yeniden baslatma: yeni modul ayni dizini kullanir
+    restarted = GraphPlotterModule(mock_gemini_agent)
+    second = await restarted.calculate("sin(x)/x ciz")
+    
+    assert mock_gemini_agent.generate_json_response.await_count == 1
+    assert second.steps == first.steps
+    assert second.visual_data == first.visual_data
+    assert second.metadata["plot_cache"] == "hit"
+    assert restarted.renderer.stats()["renders"] == 0
+
+
+@pytest.mark.asyncio
+async def test_equivalent_function_reuses_rendered_file(plotter, mock_gemini_agent):
+    """Farkli yazilan ayni fonksiyon yeniden cizilmemeli"""
+    first = await plotter.calculate("sin(x)/x ciz")
+    mock_gemini_agent.generate_json_response.return_value["visual_data"]["function"] = "sin(x) / x"
+    second = await plotter.calculate("sinx bolu x grafigi")
+    
+    assert second.visual_data["plot_paths"] == first.visual_data["plot_paths"]
+    assert plotter.renderer.stats()["renders"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("plot_type, function", [
+    ("3d", "z = sin(x) * cos(y)"),
+    ("parametric", "x = cos(3t), y = sin(2t)"),
+    ("polar", "r = 1 + cos(theta)"),
+])
+async def test_plot_types_render(plotter, mock_gemini_agent, tmp_path, plot_type, function):
+    """3D, parametrik ve polar grafikler 2D'ye dusmeden cizilmeli"""
+    mock_gemini_agent.generate_json_response.return_value["visual_data"] = {
+        "function": function, "x_range": [-3, 3], "plot_type": plot_type,
+    }
+    result = await plotter.calculate(f"{function} ciz")
+    
+    assert (tmp_path / result.visual_data["plot_paths"]["png"]).exists()
+
+
+def test_preview_quality_uses_coarse_grid(plotter, tmp_path):
+    """Onizleme kalitesi kucuk izgara ve dusuk dpi kullanmali"""
+    preview = plotter._prepare_3d({"x_range": [-3, 3], "quality": "preview"}, "x*y", str(tmp_path / "p.png"))
+    full = plotter._prepare_3d({"x_range": [-3, 3]}, "x*y", str(tmp_path / "f.png"))
+    
+    assert preview["surface"]["z"].shape[0] <= 40 < full["surface"]["z"].shape[0]
+    assert preview["dpi"] < full["dpi"]
+
+
+@pytest.mark.asyncio
+async def test_data_output_skips_png(plotter, mock_gemini_agent):
+    """"data" ciktisi PNG uretmeden seyreltilmis seri dondurmeli ve cache'lenmeli"""
+    result = await plotter.calculate("sin(x)/x ciz", plot_output="data", target_points=300)
+    again = await plotter.calculate("sin(x)/x ciz", plot_output="data", target_points=300)
+    
+    series = result.visual_data["plot_data"]["series"][0]
+    assert series["points"] <= 300
+    assert "plot_paths" not in result.visual_data
+    assert plotter.renderer.stats()["renders"] == 0
+    assert again.visual_data["plot_data"] == result.visual_data["plot_data"]
+    assert mock_gemini_agent.generate_json_response.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_invalid_plot_output_rejected(plotter):
+    """Bilinmeyen cikti turu reddedilmeli"""
+    with pytest.raises(CalculationError):
+        await plotter.calculate("x^2 ciz", plot_output="svg")
+
+
+@pytest.mark.asyncio
+async def test_multiple_functions_share_one_figure(plotter, mock_gemini_agent):
+    """Birden fazla fonksiyon ve adlandirilmis nokta tek istek ve tek figurde cizilmeli"""
+    mock_gemini_agent.generate_json_response.return_value["visual_data"] = {
+        "functions": ["x^2", "2*x + 1"],
+        "highlight_points": [{"x": 1, "name": "A", "function": "x**2"}, {"x": -1, "name": "B"}],
+        "x_range": [-3, 3],
+    }
+    result = await plotter.calculate("x^2 ve 2x+1 ciz", plot_output="both")
+    
+    series = result.visual_data["plot_data"]["series"]
+    assert [entry["label"] for entry in series] == ["f1(x) = x^2", "f2(x) = 2*x + 1"]
+    assert series[0]["x"] == series[1]["x"]
+    assert [(point["x"], point["y"]) for point in result.visual_data["plot_data"]["points"]] == [
+        (1.0, 1.0), (-1.0, 1.0), (-1.0, -1.0),
+    ]
+    assert result.visual_data["plot_paths"]["png"]
+    assert plotter.renderer.stats()["renders"] == 1
+    assert mock_gemini_agent.generate_json_response.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_plot_batch_renders_without_llm(plotter, mock_gemini_agent, tmp_path):
+    """Toplu cizim LLM'e gitmemeli, isci basina tek is gondermeli ve cache'lemeli"""
+    items = [{"function": f"sin({k}*x)", "x_range": [-3, 3]} for k in range(1, 6)]
+    items.append({"function": "__import__('os')"})
+    
+    results = await plotter.plot_batch(items, return_exceptions=True)
+    
+    assert isinstance(results[-1], CalculationError)
+    assert all((tmp_path / result.visual_data["plot_paths"]["png"]).exists() for result in results[:-1])
+    assert plotter.renderer.stats()["renders"] == max(1, min(5, plotter.renderer.workers))
+    assert mock_gemini_agent.generate_json_response.await_count == 0
+    
+    again = await plotter.plot_batch(items[:-1])
+    assert all(result.metadata["plot_cache"] == "hit" for result in again)
+    with pytest.raises(CalculationError):
+        await plotter.plot_batch(items[-1:])
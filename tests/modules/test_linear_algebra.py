@@ -23,3 +23,24 @@ async def test_determinant(mock_gemini_agent):
     assert result is not None
     assert result.domain == "linear_algebra"
 
+
+
+@pytest.mark.asyncio
+async def test_local_engine_answers_determinant(mock_gemini_agent):
+    """Determinant Gemini'ye gitmeden yerel motorla hesaplanmali"""
+    module = LinearAlgebraModule(mock_gemini_agent)
+    result = await module.calculate("[[1, 2], [3, 4]] determinant")
+    
+    assert result.result == -2.0
+    assert result.metadata["engine"] == "local"
+    mock_gemini_agent.generate_json_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unrecognized_input_falls_back_to_gemini(mock_gemini_agent):
+    """Motorun tanimadigi giris LLM'e yonlendirilmeli"""
+    module = LinearAlgebraModule(mock_gemini_agent)
+    result = await module.calculate("gram-schmidt on the columns of A")
+    
+    assert result.metadata["engine"] == "llm"
+    mock_gemini_agent.generate_json_response.assert_awaited_once()
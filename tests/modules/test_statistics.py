@@ -1,6 +1,7 @@
 
 import pytest
 import asyncio
+import numpy as np
 from unittest.mock import AsyncMock, MagicMock
 from src.modules.statistics import StatisticsModule
 from src.schemas.models import CalculationResult
@@ -53,6 +54,43 @@ async def test_statistics_std():
     # std of [2, 4, 4, 4, 5, 5, 7, 9] is 2.0
     assert result.result == 2.0
 
+@pytest.mark.asyncio
+async def test_statistics_local_extraction_skips_gemini():
+    mock_agent = MagicMock()
+    mock_agent.generate_json_response = AsyncMock()
+    
+    module = StatisticsModule(mock_agent)
+    result = await module.calculate("10, 20 ve 30 sayilarinin ortalamasi")
+    
+    assert result.result == 20.0
+    assert result.metadata["engine"] == "local"
+    mock_agent.generate_json_response.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_statistics_reads_data_file(tmp_path):
+    np.save(tmp_path / "olcum.npy", np.arange(1, 1001, dtype=float))
+    mock_agent = MagicMock()
+    mock_agent.generate_json_response = AsyncMock()
+    
+    module = StatisticsModule(mock_agent)
+    module.engine.data_dir = str(tmp_path)
+    result = await module.calculate("olcum.npy medyani")
+    
+    assert result.result == 500.5
+    assert result.metadata == {"engine": "local", "source": "olcum.npy"}
+    mock_agent.generate_json_response.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_statistics_multiple_operations_in_one_call():
+    mock_agent = MagicMock()
+    mock_agent.generate_json_response = AsyncMock()
+    
+    module = StatisticsModule(mock_agent)
+    result = await module.calculate("[2, 4, 4, 4, 5, 5, 7, 9] ortalamasi, medyani ve standart sapmasi")
+    
+    assert result.result == {"mean": 5.0, "std": 2.0, "median": 4.5}
+    mock_agent.generate_json_response.assert_not_called()
+
 if __name__ == "__main__":
     # Manual run for quick check
     async def run_manual():
@@ -50,3 +50,13 @@ async def test_command_parsing():
     module, expr = parser.parse("solve 2x + 3 = 0")
     assert module == "equation_solver" or module == "basic_math"
 
+
+@pytest.mark.asyncio
+async def test_verify_cases_against_cassette(cassette_backend):
+    """verify_all senaryolari kayitli Gemini trafigiyle calismali"""
+    from verify_all import VERIFY_CASES
+    
+    agent = CalculatorAgent(backend=cassette_backend)
+    for _, command in VERIFY_CASES:
+        output = await agent.process_command(command)
+        assert not output.startswith("❌"), output
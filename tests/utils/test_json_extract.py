@@ -0,0 +1,76 @@
+"""Tests for the incremental JSON extractor"""
+
+from src.utils.helpers import REPAIRED_CONFIDENCE_CAP, parse_json_response
+from src.utils.json_extract import extract_json
+
+
+def test_extracts_first_object_among_several():
+    """Birden fazla obje varsa ilk gecerli obje alinmali"""
+    text = 'Sonuc: {"result": 4, "steps": ["2 + 2 = 4"]} ve ek not {"x": 1}'
+
+    value, repaired = extract_json(text)
+
+    assert value == {"result": 4, "steps": ["2 + 2 = 4"]}
+    assert not repaired
+
+
+def test_braces_inside_strings_are_ignored():
+    """String icindeki parantez ve kacis karakterleri dengeyi bozmamali"""
+    text = '{"steps": ["f(x) = {x}", "\\"}\\" karakteri"], "result": 1}'
+
+    value, _ = extract_json(text)
+
+    assert value["result"] == 1
+    assert value["steps"][1] == '"}" karakteri'
+
+
+def test_repairs_truncated_output():
+    """Kesik cikti kapatilarak onarilmali"""
+    text = '```json\n{"result": 4, "steps": ["adim 1", "adim 2'
+
+    value, repaired = extract_json(text)
+
+    assert repaired
+    assert value == {"result": 4, "steps": ["adim 1", "adim 2"]}
+
+
+def test_repair_drops_incomplete_trailing_member():
+    """Yarim kalan anahtar/deger atilmali"""
+    value, repaired = extract_json('{"result": 4, "confidence_score": 0.')
+
+    assert repaired
+    assert value == {"result": 4}
+
+
+def test_repair_does_not_accept_number_cut_mid_value():
+    """Ayirici gelmeden biten sayi tamamlanmis sayilmamali ("12345" -> "123")"""
+    value, repaired = extract_json('{"steps": ["a"], "result": 123')
+
+    assert repaired
+    assert value == {"steps": ["a"]}
+
+
+def test_parse_failure_reports_zero_confidence():
+    """Parse edilemeyen yanit sahte guven skoru tasimamali"""
+    response, parsed = parse_json_response("Sonuc dorttur.")
+
+    assert not parsed
+    assert response["confidence_score"] == 0.0
+    assert response["metadata"]["json_parse_error"]
+
+
+def test_repaired_response_is_flagged():
+    """Onarilan yanit metadata ile isaretlenmeli"""
+    response, parsed = parse_json_response('{"result": 4, "steps": ["a"')
+
+    assert parsed
+    assert response["metadata"]["json_repaired"]
+
+
+def test_repaired_response_confidence_is_capped():
+    """Kesik yanit modelin orijinal guven skoruyla donmemeli"""
+    response, parsed = parse_json_response('{"confidence_score": 0.95, "result": 12')
+
+    assert parsed
+    assert "result" not in response
+    assert response["confidence_score"] == REPAIRED_CONFIDENCE_CAP
@@ -1,56 +1,83 @@
 
+import argparse
 import asyncio
 import os
+import time
+from src.core.backends import create_backend
+from src.core.cassette import CassetteBackend
 from src.main import CalculatorAgent
 
-async def run_verification():
+VERIFY_CASES = [
+    # 1. Basic Math
+    ("Basic Math", "25 * 4 + 10"),
+    
+    # 2. Calculus
+    ("Calculus", "!calculus x^2 turevi"),
+    
+    # 3. Linear Algebra
+    ("Linear Algebra", "!linalg [[1, 2], [3, 4]] determinant"),
+    
+    # 4. Financial
+    ("Financial", "!finance 1000 TL anapara %10 faiz 1 yil"),
+    
+    # 5. Equation Solver
+    ("Equation Solver", "!solve x^2 - 4 = 0"),
+    
+    # 6. Statistics (New!)
+    ("Statistics", "!stats [10, 20, 30, 40, 50] ortalamasi"),
+    
+    # 7. Graph Plotter
+    ("Graph Plotter", "!plot sin(x)"),
+]
+
+
+def build_backend(args):
+    """Komut satiri seceneklerine gore (opsiyonel) cassette backend'i olusturur"""
+    if args.replay:
+        latency_mode = "zero" if args.zero_latency else "recorded"
+        return CassetteBackend(args.replay, mode="replay", latency_mode=latency_mode)
+    if args.record:
+        return CassetteBackend(args.record, mode="record", inner=create_backend())
+    return None
+
+
+async def run_verification(backend=None):
     print("="*60)
     print("SYSTEM VERIFICATION STARTED")
     print("="*60)
     
-    agent = CalculatorAgent()
-    
-    test_cases = [
-        # 1. Basic Math
-        ("Basic Math", "25 * 4 + 10"),
-        
-        # 2. Calculus
-        ("Calculus", "!calculus x^2 turevi"),
-        
-        # 3. Linear Algebra
-        ("Linear Algebra", "!linalg [[1, 2], [3, 4]] determinant"),
-        
-        # 4. Financial
-        ("Financial", "!finance 1000 TL anapara %10 faiz 1 yil"),
-        
-        # 5. Equation Solver
-        ("Equation Solver", "!solve x^2 - 4 = 0"),
-        
-        # 6. Statistics (New!)
-        ("Statistics", "!stats [10, 20, 30, 40, 50] ortalamasi"),
-        
-        # 7. Graph Plotter
-        ("Graph Plotter", "!plot sin(x)"),
-    ]
-    
-    for module_name, command in test_cases:
+    agent = CalculatorAgent(backend=backend)
+    timings = []
+    
+    for module_name, command in VERIFY_CASES:
         print(f"\nTesting: {module_name}")
         print(f"Command: {command}")
+        start = time.perf_counter()
         try:
             result = await agent.process_command(command)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            timings.append((module_name, elapsed_ms))
             print("-" * 30)
             print(result)
             print("-" * 30)
-            print(f"{module_name}: PASSED")
+            print(f"{module_name}: PASSED ({elapsed_ms:.1f} ms)")
         except Exception as e:
             print(f"{module_name}: FAILED - {e}")
 
     print("\n" + "="*60)
     print("VERIFICATION COMPLETED")
+    for module_name, elapsed_ms in timings:
+        print(f"  {module_name:<16} {elapsed_ms:>10.1f} ms")
+    print(f"  {'TOTAL':<16} {sum(t for _, t in timings):>10.1f} ms")
     print("="*60)
 
 if __name__ == "__main__":
     import sys
     import io
+    parser = argparse.ArgumentParser(description="Calculator Agent system verification")
+    parser.add_argument("--record", metavar="PATH", help="Gemini trafigini cassette'e kaydet")
+    parser.add_argument("--replay", metavar="PATH", help="Cassette'ten oynat (network'suz)")
+    parser.add_argument("--zero-latency", action="store_true", help="Replay'de kayitli gecikmeyi atla")
+    args = parser.parse_args()
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    asyncio.run(run_verification())
+    asyncio.run(run_verification(build_backend(args)))